@@ -0,0 +1,65 @@
+"""add plan aggregate counters
+
+Revision ID: 2ed50dea3745
+Revises: a54b63eb5fc3
+Create Date: 2025-12-02 10:41:17.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2ed50dea3745'
+down_revision: Union[str, None] = 'a54b63eb5fc3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('plans', sa.Column('total_days', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('plans', sa.Column('subscription_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+
+    # Backfill the counters from the existing items and enrollments
+    op.execute(
+        """
+        UPDATE plans
+        SET total_days = COALESCE(item_counts.total_days, 0)
+        FROM (
+            SELECT plan_id, COUNT(*) AS total_days
+            FROM items
+            GROUP BY plan_id
+        ) AS item_counts
+        WHERE item_counts.plan_id = plans.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE plans
+        SET subscription_count = COALESCE(progress_counts.subscription_count, 0)
+        FROM (
+            SELECT plan_id, COUNT(*) AS subscription_count
+            FROM user_plan_progress
+            GROUP BY plan_id
+        ) AS progress_counts
+        WHERE progress_counts.plan_id = plans.id
+        """
+    )
+
+    op.create_index(
+        'idx_plans_published_listing',
+        'plans',
+        ['language', 'status', 'title'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL')
+    )
+    op.create_index('idx_plans_author_created', 'plans', ['author_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_plans_author_created', table_name='plans')
+    op.drop_index('idx_plans_published_listing', table_name='plans', postgresql_where=sa.text('deleted_at IS NULL'))
+    op.drop_column('plans', 'subscription_count')
+    op.drop_column('plans', 'total_days')
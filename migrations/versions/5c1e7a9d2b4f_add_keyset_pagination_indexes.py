@@ -0,0 +1,31 @@
+"""add keyset pagination indexes
+
+Revision ID: 5c1e7a9d2b4f
+Revises: bbc33ddc9e2d
+Create Date: 2025-12-08 11:22:40.164307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a9d2b4f'
+down_revision: Union[str, None] = 'bbc33ddc9e2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pages seek on (sort key, id), so the id tie-breaker belongs in the index
+    op.drop_index('idx_plans_author_created', table_name='plans')
+    op.create_index('idx_plans_author_created', 'plans', ['author_id', 'created_at', 'id'], unique=False)
+    op.create_index('idx_user_progress_user_started', 'user_plan_progress', ['user_id', 'started_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_progress_user_started', table_name='user_plan_progress')
+    op.drop_index('idx_plans_author_created', table_name='plans')
+    op.create_index('idx_plans_author_created', 'plans', ['author_id', 'created_at'], unique=False)
@@ -0,0 +1,47 @@
+"""add user plan progress tracking
+
+Revision ID: 9ae418c38b1b
+Revises: 2ed50dea3745
+Create Date: 2025-12-04 09:12:48.207316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9ae418c38b1b'
+down_revision: Union[str, None] = '2ed50dea3745'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_plan_progress', sa.Column('completed_days', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('user_plan_progress', sa.Column('last_completed_date', sa.Date(), nullable=True))
+
+    # Seed the day counters; streaks are rebuilt by the recompute-plan-progress script
+    op.execute(
+        """
+        UPDATE user_plan_progress
+        SET completed_days = day_counts.completed_days,
+            last_completed_date = day_counts.last_completed_date
+        FROM (
+            SELECT user_day_completion.user_id, items.plan_id,
+                   COUNT(*) AS completed_days,
+                   MAX((user_day_completion.completed_at AT TIME ZONE 'UTC')::date) AS last_completed_date
+            FROM user_day_completion
+            JOIN items ON items.id = user_day_completion.day_id
+            GROUP BY user_day_completion.user_id, items.plan_id
+        ) AS day_counts
+        WHERE day_counts.user_id = user_plan_progress.user_id
+          AND day_counts.plan_id = user_plan_progress.plan_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('user_plan_progress', 'last_completed_date')
+    op.drop_column('user_plan_progress', 'completed_days')
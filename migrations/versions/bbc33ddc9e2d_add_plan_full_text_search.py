@@ -0,0 +1,52 @@
+"""add plan full text search
+
+Revision ID: bbc33ddc9e2d
+Revises: 9ae418c38b1b
+Create Date: 2025-12-05 14:03:27.918245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bbc33ddc9e2d'
+down_revision: Union[str, None] = '9ae418c38b1b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_CONFIG = "CASE WHEN language = 'EN' THEN 'english'::regconfig ELSE 'simple'::regconfig END"
+SEARCH_VECTOR = (
+    f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce(description, '')), 'B') || "
+    f"setweight(jsonb_to_tsvector({SEARCH_CONFIG}, tags, '[\"string\"]'), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.drop_index('idx_plans_search', table_name='plans', postgresql_using='gin')
+    op.add_column(
+        'plans',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True)
+    )
+    op.create_index('idx_plans_search', 'plans', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'idx_plans_title_trgm',
+        'plans',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_plans_title_trgm', table_name='plans', postgresql_using='gin')
+    op.drop_index('idx_plans_search', table_name='plans', postgresql_using='gin')
+    op.drop_column('plans', 'search_vector')
+    op.create_index('idx_plans_search', 'plans', [sa.text("to_tsvector('english', title || ' ' || COALESCE(description, ''))")], unique=False, postgresql_using='gin')
@@ -0,0 +1,34 @@
+"""denormalize user recitation text
+
+Revision ID: d3a8f1c62e07
+Revises: 5c1e7a9d2b4f
+Create Date: 2025-12-10 09:14:52.731046
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a8f1c62e07'
+down_revision: Union[str, None] = '5c1e7a9d2b4f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Titles live in Mongo; existing rows stay NULL until backfill-user-recitation-titles fills them
+    op.add_column('user_recitations', sa.Column('title', sa.String(), nullable=True))
+    op.add_column('user_recitations', sa.Column('language', sa.String(length=10), nullable=True))
+    # The listing reads a user's rows in display order; the user_id prefix also serves the old single-column lookups
+    op.drop_index('idx_user_recitations_user_text_user', table_name='user_recitations')
+    op.create_index('idx_user_recitations_user_order', 'user_recitations', ['user_id', 'display_order'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_recitations_user_order', table_name='user_recitations')
+    op.create_index('idx_user_recitations_user_text_user', 'user_recitations', ['user_id'], unique=False)
+    op.drop_column('user_recitations', 'language')
+    op.drop_column('user_recitations', 'title')
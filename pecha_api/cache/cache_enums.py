@@ -27,4 +27,9 @@ class CacheType(Enum):
     # Collection-specific cache types
     COLLECTIONS = "collections"
     COLLECTION_DETAIL = "collection_detail"
-    
\ No newline at end of file
+
+    FEATURED_DAY = "featured_day"
+    PLAN_CATALOG = "plan_catalog"
+    RECITATION_CATALOG = "recitation_catalog"
+    
+    PHONETICS = "phonetics"
@@ -1,5 +1,5 @@
 import json
-from typing import Any, Optional, List
+from typing import Any, Dict, Optional, List
 
 from redis.asyncio import Redis
 
@@ -59,6 +59,57 @@ async def get_cache_data(hash_key: str) -> Optional[Any]:
         return None
 
 
+async def get_many_cache_data(hash_keys: List[str]) -> List[Optional[Any]]:
+    """Get many values from cache in one MGET round trip; misses are None"""
+    if not hash_keys:
+        return []
+    try:
+        client = get_client()
+        values = await client.mget([_build_key(hash_key) for hash_key in hash_keys])
+    except Exception:
+        logging.error("An error occurred in get_many_cache_data", exc_info=True)
+        return [None] * len(hash_keys)
+    cache_data = []
+    for value in values:
+        try:
+            cache_data.append(json.loads(value) if value is not None else None)
+        except json.JSONDecodeError:
+            logging.error("Failed to decode JSON from cache", exc_info=True)
+            cache_data.append(None)
+    return cache_data
+
+
+async def set_many_cache(values: Dict[str, Any], cache_time_out: int) -> bool:
+    """Set many values in cache with one pipelined round trip"""
+    if not values:
+        return True
+    try:
+        client = get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for hash_key, value in values.items():
+                if not isinstance(value, (str, bytes)):
+                    value = json.dumps(value, default=pydantic_encoder)
+                pipe.set(_build_key(hash_key), value, ex=cache_time_out)
+            await pipe.execute()
+        return True
+    except Exception:
+        logging.error("An error occurred in set_many_cache", exc_info=True)
+        return False
+
+
+async def delete_many_cache(hash_keys: List[str]) -> bool:
+    """Delete many values from cache with one DEL round trip"""
+    if not hash_keys:
+        return True
+    try:
+        client = get_client()
+        await client.delete(*[_build_key(hash_key) for hash_key in hash_keys])
+        return True
+    except Exception:
+        logging.error("An error occurred in delete_many_cache", exc_info=True)
+        return False
+
+
 async def delete_cache(hash_key: str) -> bool:
     """Delete key from cache"""
     try:
@@ -17,6 +17,7 @@ from .collections_cache_service import (
     delete_collection_cache
 )
 from pecha_api.cache.cache_enums import CacheType
+from pecha_api.recitations.recitations_cache_service import delete_recitation_catalog_cache
 from ..users.users_service import verify_admin_access
 from fastapi import HTTPException
 
@@ -78,6 +79,7 @@ async def create_new_collection(create_collection_request: CreateCollectionReque
     is_admin = verify_admin_access(token=token)
     if is_admin:
         new_collection = await create_collection(create_collection_request=create_collection_request)
+        await delete_recitation_catalog_cache()
         if language is None:
             language = get("DEFAULT_LANGUAGE")
         return CollectionModel(
@@ -136,6 +138,7 @@ async def update_existing_collection(collection_id: str, update_collection_reque
     is_admin = verify_admin_access(token=token)
     if is_admin:
         updated_collection = await update_collection_titles(collection_id=collection_id, update_collection_request=update_collection_request)
+        await delete_recitation_catalog_cache()
         if language is None:
             language = get("DEFAULT_LANGUAGE")
         return CollectionModel(
@@ -155,6 +158,7 @@ async def delete_existing_collection(collection_id: str, token: str):
     is_admin = verify_admin_access(token=token)
     if is_admin:
         await delete_collection(collection_id=collection_id)
+        await delete_recitation_catalog_cache()
         return collection_id
     
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=ErrorConstants.ADMIN_ERROR_MESSAGE)
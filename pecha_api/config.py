@@ -19,6 +19,9 @@ DEFAULTS = dict(
     DEPLOYMENT_MODE="DEBUG",
     DOMAIN_NAME="dev-pecha-esukhai.us.auth0.com",
     IMAGE_EXPIRATION_IN_SEC=3600,
+    PRESIGNED_URL_CACHE_MARGIN_IN_SEC=300,
+    PRESIGNED_URL_CACHE_SIZE=10000,
+    AWS_MAX_POOL_CONNECTIONS=20,
     JWT_ALGORITHM="HS256",
     JWT_AUD="https://pecha.org",
     JWT_ISSUER="https://pecha.org",
@@ -46,8 +49,24 @@ DEFAULTS = dict(
     CACHE_USER_TIMEOUT=900,         # 15 minutes for users (not frequently changed)
     CACHE_TOPIC_TIMEOUT=1800,       # 30 minutes for topics (not frequently changed)
     CACHE_SHEET_TIMEOUT=60,         # 1 minute for sheets (frequently edited by users)
+    CACHE_PLAN_CATALOG_TIMEOUT=1800, # 30 minutes for the published plan catalog (rebuilt on CMS changes)
+    PLAN_CATALOG_LOCAL_TTL_IN_SEC=30, # in-process copy of the catalog, bounds staleness across workers
+    CACHE_RECITATION_CATALOG_TIMEOUT=1800, # 30 minutes for the recitation catalog (dropped on text and collection changes)
+    RECITATION_CATALOG_LOCAL_TTL_IN_SEC=30, # in-process copy of the recitation catalog
+    CACHE_PHONETICS_TIMEOUT=86400, # 1 day for phonetics (keyed by content and converter version, never stale)
+    TEXT_VIEWS_FLUSH_INTERVAL_IN_SEC=60, # buffered text and sheet views are written to Mongo at this interval
 
     SHORT_URL_GENERATION_ENDPOINT="https://pech.as/api/v1",
+
+    # Share image rendering
+    SHARE_IMAGE_CACHE_DIR="/tmp/pecha-share-images",
+    SHARE_IMAGE_RENDER_WORKERS=2,
+    SHARE_IMAGE_CACHE_MAX_AGE=86400, # 1 day for crawlers and browsers
+    SHARE_IMAGE_CACHE_RETENTION_IN_SEC=604800, # prune-share-images deletes rendered images older than 7 days
+
+    # Tibetan phonetics
+    PHONETICS_WORKERS=2,
+    PHONETICS_BATCH_SIZE=200, # segments converted per process pool task
     
     # External Multilingual Search API Configuration
     EXTERNAL_SEARCH_API_URL="https://pecha-backend-dev.web.app/",  # Change this to your actual external API URL
@@ -60,6 +79,8 @@ DEFAULTS = dict(
     ELASTICSEARCH_CONTENT_INDEX = "pecha-texts",
     ELASTICSEARCH_SEGMENT_INDEX = "pecha-segments",
     ELASTICSEARCH_SHEET_INDEX = "pecha-sheets",
+    # index.max_result_window of the segment index; from + size beyond it is rejected by Elasticsearch
+    ELASTICSEARCH_MAX_RESULT_WINDOW = 10000,
 
     MAILTRAP_API_KEY = "",
     SENDER_EMAIL="",
@@ -36,4 +36,7 @@ class ErrorConstants:
     INVALID_UPDATE_REQUEST = "Invalid update request"
     TASK_NOT_FOUND = "Task not found"
     SUB_TASK_NOT_FOUND = "Sub task not found"
-    COLLECTION_NOT_FOUND = "Collection not found"
\ No newline at end of file
+    COLLECTION_NOT_FOUND = "Collection not found"
+    INVALID_SEARCH_CURSOR_MESSAGE = "Invalid or expired search cursor"
+    SEARCH_CURSOR_REQUIRES_TEXT_MESSAGE = "A search cursor can only be used together with text_id"
+    SEARCH_RESULT_WINDOW_EXCEEDED_MESSAGE = "skip + limit is beyond the searchable result window"
\ No newline at end of file
@@ -68,7 +68,8 @@ class AuthorPlansResponse(BaseModel):
     plans: List[AuthorPlanDTO]
     skip: int
     limit: int
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 class AuthorPlanAggregate(BaseModel):
     id: UUID
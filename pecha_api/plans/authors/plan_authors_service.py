@@ -29,6 +29,7 @@ from pecha_api.plans.shared.utils import convert_plan_model_to_dto
 from pecha_api.utils import Utils
 
 from pecha_api.plans.public.plan_repository import get_published_plans_by_author_id
+from pecha_api.plans.plans_pagination import decode_cursor, keyset_page, parse_datetime
 
 
 async def get_authors() -> AuthorsResponse:
@@ -134,10 +135,21 @@ async def get_selected_author_details(author_id: UUID) -> AuthorInfoPublicRespon
         social_profiles=social_media_profiles
     )
 
-async def get_plans_by_author(author_id: UUID,skip: int, limit: int) -> AuthorPlansResponse:
+async def get_plans_by_author(author_id: UUID,skip: int, limit: int, cursor: Optional[str] = None) -> AuthorPlansResponse:
     await _get_author_details_by_id(author_id=author_id)
+    keyset = cursor is not None
+    after = decode_cursor(cursor, parse_datetime, UUID) if cursor else None
+    next_cursor = None
     with SessionLocal() as db_session:
-        published_plans, total = get_published_plans_by_author_id(db=db_session, author_id=author_id, skip=skip, limit=limit)
+        if keyset:
+            published_plans, total = get_published_plans_by_author_id(
+                db=db_session, author_id=author_id, skip=0, limit=limit + 1, after=after, count_total=False
+            )
+            published_plans, next_cursor = keyset_page(
+                rows=published_plans, limit=limit, cursor_values=lambda aggregate: (aggregate.plan.created_at, aggregate.plan.id)
+            )
+        else:
+            published_plans, total = get_published_plans_by_author_id(db=db_session, author_id=author_id, skip=skip, limit=limit)
 
         author_plan_dtos = [
             AuthorPlanDTO(
@@ -154,9 +166,10 @@ async def get_plans_by_author(author_id: UUID,skip: int, limit: int) -> AuthorPl
 
         return AuthorPlansResponse(
             plans=author_plan_dtos,
-            skip=skip,
+            skip=0 if keyset else skip,
             limit=limit,
             total=total,
+            next_cursor=next_cursor,
         )
 
 async def _get_author_details_by_id(author_id: UUID) -> Author:
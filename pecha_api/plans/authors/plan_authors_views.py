@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends
@@ -33,5 +33,5 @@ async def get_author_information(author_id: UUID)  -> AuthorInfoPublicResponse:
     return await get_selected_author_details(author_id=author_id)
 
 @author_router.get("/{author_id}/plans", status_code=status.HTTP_200_OK)
-async def get_plans_for_selected_author(author_id: UUID, skip: int = 0, limit: int = 10)  -> AuthorPlansResponse:
-    return await get_plans_by_author(author_id=author_id, skip=skip, limit=limit)
\ No newline at end of file
+async def get_plans_for_selected_author(author_id: UUID, skip: int = 0, limit: int = 10, cursor: Optional[str] = None)  -> AuthorPlansResponse:
+    return await get_plans_by_author(author_id=author_id, skip=skip, limit=limit, cursor=cursor)
\ No newline at end of file
@@ -0,0 +1,21 @@
+import logging
+
+from pecha_api.db.database import SessionLocal
+from .cms_plans_repository import reconcile_plan_counters
+
+
+def reconcile_counters() -> int:
+    # Recompute total_days and subscription_count of every plan whose counters drifted
+    with SessionLocal() as db:
+        updated_plans = reconcile_plan_counters(db=db)
+    logging.info(f"Reconciled counters of {updated_plans} plans")
+    return updated_plans
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    reconcile_counters()
+
+
+if __name__ == "__main__":
+    main()
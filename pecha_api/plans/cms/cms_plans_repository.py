@@ -1,17 +1,39 @@
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import func, asc, desc
-from typing import Optional
+from sqlalchemy import func, asc, desc, select, update, insert, or_
+from typing import Optional, Dict, List
 from uuid import UUID
 from datetime import datetime, timezone
 from pecha_api.plans.authors.plan_authors_model import Author
 from pecha_api.plans.plans_models import Plan
+from pecha_api.plans.plans_enums import SortBy
+from pecha_api.plans.plans_search import plan_search_filter, plan_search_rank
 from pecha_api.plans.items.plan_items_models import PlanItem
+from pecha_api.plans.tasks.plan_tasks_models import PlanTask
+from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
 from pecha_api.plans.users.plan_users_models import UserPlanProgress
+from pecha_api.plans.auth.plan_auth_models import ResponseError
+from pecha_api.plans.response_message import BAD_REQUEST
 from fastapi import HTTPException
 from starlette import status
 from pecha_api.plans.plans_response_models import PlansRepositoryResponse, PlanWithAggregates
 
+def save_plan_tree(db: Session, plan_row: Dict, item_rows: List[Dict], task_rows: List[Dict], sub_task_rows: List[Dict]) -> None:
+    """Insert a whole plan with its days, tasks and sub tasks in one transaction, one executemany per table."""
+    try:
+        db.execute(insert(Plan), [plan_row])
+        for model, rows in ((PlanItem, item_rows), (PlanTask, task_rows), (PlanSubTask, sub_task_rows)):
+            if rows:
+                db.execute(insert(model), rows)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ResponseError(error=BAD_REQUEST, message=str(getattr(e, "orig", None) or e)).model_dump()
+        )
+
+
 def save_plan(db: Session, plan: Plan):
     try:
         db.add(plan)
@@ -39,24 +61,13 @@ def get_plans_by_author_id(
     if not is_admin:
         filters.append(Plan.author_id == author_id)
     if search:
-        filters.append(Plan.title.ilike(f"%{search}%"))
-
-    # Aggregates (matching provided SQL): SUM of item day_number and COUNT DISTINCT of subscribers
-    total_days_label = func.count(func.distinct(PlanItem.id)).label("total_days")
-    subscription_count_label = func.count(func.distinct(UserPlanProgress.user_id)).label("subscription_count")
+        filters.append(plan_search_filter(search=search))
 
-    # Base query with LEFT JOINs and GROUP BY
+    # Aggregates are denormalized on the plan row, so the listing is a plain page scan
     query = (
-        db.query(
-            Plan,
-            total_days_label,
-            subscription_count_label,
-        )
-        .outerjoin(PlanItem, PlanItem.plan_id == Plan.id)
-        .outerjoin(UserPlanProgress, UserPlanProgress.plan_id == Plan.id)
+        db.query(Plan)
         .options(selectinload(Plan.author))
         .filter(*filters)
-        .group_by(Plan.id)
     )
 
     # Sorting
@@ -64,27 +75,74 @@ def get_plans_by_author_id(
     sort_fields = {
         "created_at": Plan.created_at,
         "status": Plan.status,
-        "total_days": total_days_label,
+        "total_days": Plan.total_days,
     }
-    query = query.order_by(order(sort_fields.get(sort_by, Plan.created_at)))
+    if search and sort_by == SortBy.RELEVANCE.value:
+        query = query.order_by(desc(plan_search_rank(search=search)), asc(Plan.id))
+    else:
+        query = query.order_by(order(sort_fields.get(sort_by, Plan.created_at)), order(Plan.id))
 
     # Pagination
-    rows = query.offset(skip).limit(limit).all()
-    
-    # Transform tuples into PlanWithAggregates objects using list comprehension
+    plans = query.offset(skip).limit(limit).all()
+
     plan_aggregates = [
         PlanWithAggregates(
             plan=plan,
-            total_days=total_days,
-            subscription_count=subscription_count
+            total_days=plan.total_days,
+            subscription_count=plan.subscription_count
         )
-        for plan, total_days, subscription_count in rows
+        for plan in plans
     ]
-    
-    # Total count without pagination/joins
+
     total = db.query(func.count(Plan.id)).filter(*filters).scalar()
     return PlansRepositoryResponse(plan_info=plan_aggregates, total=total)
 
+
+def increment_plan_total_days(db: Session, plan_id: UUID, amount: int = 1) -> None:
+    """Adjust the plan's day counter; the caller commits it together with the item change."""
+    db.query(Plan).filter(Plan.id == plan_id).update(
+        {Plan.total_days: Plan.total_days + amount},
+        synchronize_session=False
+    )
+
+
+def increment_plan_subscription_count(db: Session, plan_id: UUID, amount: int = 1) -> None:
+    """Adjust the plan's subscriber counter; the caller commits it together with the enrollment change."""
+    db.query(Plan).filter(Plan.id == plan_id).update(
+        {Plan.subscription_count: Plan.subscription_count + amount},
+        synchronize_session=False
+    )
+
+
+def reconcile_plan_counters(db: Session) -> int:
+    """Recompute total_days and subscription_count for every plan whose counters drifted."""
+    total_days = (
+        select(func.count(PlanItem.id))
+        .where(PlanItem.plan_id == Plan.id)
+        .scalar_subquery()
+    )
+    subscription_count = (
+        select(func.count(UserPlanProgress.id))
+        .where(UserPlanProgress.plan_id == Plan.id)
+        .scalar_subquery()
+    )
+    try:
+        result = db.execute(
+            update(Plan)
+            .where(or_(Plan.total_days != total_days, Plan.subscription_count != subscription_count))
+            .values(total_days=total_days, subscription_count=subscription_count)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+    except Exception as e:
+        db.rollback()
+        print(f"Error reconciling plan counters: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to reconcile plan counters: {str(e)}"
+        )
+
 def get_plan_by_id(db: Session, plan_id: UUID) -> Plan:
     try:   
         return db.query(Plan).filter(Plan.id == plan_id).first()
@@ -1,17 +1,21 @@
 import py_compile
+import logging
 from typing import Optional, List, Dict
 from starlette import status
 from pecha_api.plans.plans_models import Plan
 from pecha_api.plans.items.plan_items_models import PlanItem
 from pecha_api.plans.users.plan_users_models import UserPlanProgress
-from pecha_api.plans.cms.cms_plans_repository import save_plan, get_plan_by_id, get_plans_by_author_id, update_plan
+from pecha_api.plans.cms.cms_plans_repository import save_plan, get_plan_by_id, get_plans_by_author_id, update_plan, save_plan_tree
 from pecha_api.plans.items.plan_items_repository import save_plan_items, get_plan_items_by_plan_id, get_plan_day_with_tasks_and_subtasks
 from pecha_api.plans.users.plan_users_progress_repository import get_plan_progress
 from pecha_api.plans.authors.plan_authors_model import Author
 from pecha_api.plans.authors.plan_authors_service import validate_and_extract_author_details
+from pecha_api.plans.featured.featured_day_service import invalidate_featured_day_cache
+from pecha_api.plans.public.plan_service import refresh_plan_catalog
 from pecha_api.plans.plans_enums import LanguageCode, PlanStatus, ContentType
 from pecha_api.plans.plans_response_models import PlansResponse, PlanDTO, CreatePlanRequest, TaskDTO, PlanDayDTO, \
-    PlanWithDays, UpdatePlanRequest, PlanStatusUpdate, PlansRepositoryResponse, PlanWithAggregates, AuthorDTO, SubTaskDTO
+    PlanWithDays, UpdatePlanRequest, PlanStatusUpdate, PlansRepositoryResponse, PlanWithAggregates, AuthorDTO, SubTaskDTO, \
+    ImportPlanRequest, PlanImportResponse, ImportedPlanDayDTO, ImportedTaskDTO
     
 from pecha_api.plans.tasks.plan_tasks_repository import get_tasks_by_item_ids
 from pecha_api.plans.tasks.plan_tasks_models import PlanTask
@@ -24,7 +28,8 @@ from pecha_api.uploads.S3_utils import generate_presigned_access_url
 from uuid import uuid4, UUID
 from fastapi import HTTPException
 from pecha_api.plans.auth.plan_auth_models import ResponseError
-from pecha_api.plans.response_message import BAD_REQUEST, PLAN_NOT_FOUND, FORBIDDEN, UNAUTHORIZED_PLAN_DELETE, PLAN_AUTHOR_MISMATCH, PLAN_MUST_HAVE_AT_LEAST_ONE_DAY_WITH_CONTENT_TO_BE_PUBLISHED
+from pecha_api.plans.response_message import BAD_REQUEST, PLAN_NOT_FOUND, FORBIDDEN, UNAUTHORIZED_PLAN_DELETE, PLAN_AUTHOR_MISMATCH, PLAN_MUST_HAVE_AT_LEAST_ONE_DAY_WITH_CONTENT_TO_BE_PUBLISHED, \
+    DUPLICATE_DAY_NUMBERS, PLAN_IMPORT_WITHOUT_DAYS, INVALID_DAY_NUMBER, INVALID_PLAN_LANGUAGE, MEDIA_SUB_TASK_WITHOUT_CONTENT
 from datetime import datetime, timezone
 from sqlalchemy import func
 
@@ -195,6 +200,91 @@ def create_new_plan(token: str, create_plan_request: CreatePlanRequest) -> PlanD
             subscription_count=total_subscription_count
         )
 
+MEDIA_CONTENT_TYPES = {ContentType.AUDIO, ContentType.VIDEO, ContentType.IMAGE}
+
+
+def _import_error(message: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=message).model_dump())
+
+
+def _validate_plan_import(import_plan_request: ImportPlanRequest) -> LanguageCode:
+    if not import_plan_request.days:
+        raise _import_error(PLAN_IMPORT_WITHOUT_DAYS)
+    day_numbers = [day.day_number for day in import_plan_request.days]
+    if min(day_numbers) < 1:
+        raise _import_error(INVALID_DAY_NUMBER)
+    if len(set(day_numbers)) != len(day_numbers):
+        raise _import_error(DUPLICATE_DAY_NUMBERS)
+    for day in import_plan_request.days:
+        for task in day.tasks:
+            if any(subtask.content_type in MEDIA_CONTENT_TYPES and not subtask.content for subtask in task.subtasks):
+                raise _import_error(MEDIA_SUB_TASK_WITHOUT_CONTENT)
+    try:
+        return LanguageCode(import_plan_request.language.upper())
+    except ValueError:
+        raise _import_error(INVALID_PLAN_LANGUAGE)
+
+
+def import_plan_service(token: str, import_plan_request: ImportPlanRequest) -> PlanImportResponse:
+    """Create a draft plan from a complete day -> task -> sub task tree in a single transaction"""
+    current_author = validate_and_extract_author_details(token=token)
+    language = _validate_plan_import(import_plan_request)
+
+    # Ids are assigned up front so every row can be built, and the id mapping returned, without round trips
+    plan_id = uuid4()
+    plan_row = {
+        "id": plan_id,
+        "title": import_plan_request.title,
+        "description": import_plan_request.description,
+        "image_url": import_plan_request.image_url,
+        "author_id": current_author.id,
+        "difficulty_level": import_plan_request.difficulty_level,
+        "tags": import_plan_request.tags or [],
+        "status": PlanStatus.DRAFT,
+        "featured": False,
+        "language": language,
+        "total_days": len(import_plan_request.days),
+        "subscription_count": 0,
+        "created_by": current_author.email
+    }
+    item_rows, task_rows, sub_task_rows = [], [], []
+    imported_days = []
+    for day in sorted(import_plan_request.days, key=lambda plan_day: plan_day.day_number):
+        day_id = uuid4()
+        item_rows.append({"id": day_id, "plan_id": plan_id, "day_number": day.day_number, "created_by": current_author.email})
+        imported_tasks = []
+        for task_order, task in enumerate(day.tasks, start=1):
+            task_id = uuid4()
+            task_rows.append({
+                "id": task_id,
+                "plan_item_id": day_id,
+                "title": task.title,
+                "estimated_time": task.estimated_time,
+                "display_order": task_order,
+                "created_by": current_author.email
+            })
+            subtask_ids = []
+            for subtask_order, subtask in enumerate(task.subtasks, start=1):
+                subtask_id = uuid4()
+                sub_task_rows.append({
+                    "id": subtask_id,
+                    "task_id": task_id,
+                    "content_type": subtask.content_type,
+                    "content": subtask.content,
+                    "duration": subtask.duration,
+                    "display_order": subtask_order,
+                    "created_by": current_author.email
+                })
+                subtask_ids.append(subtask_id)
+            imported_tasks.append(ImportedTaskDTO(id=task_id, display_order=task_order, subtask_ids=subtask_ids))
+        imported_days.append(ImportedPlanDayDTO(id=day_id, day_number=day.day_number, tasks=imported_tasks))
+
+    with SessionLocal() as db_session:
+        save_plan_tree(db=db_session, plan_row=plan_row, item_rows=item_rows, task_rows=task_rows, sub_task_rows=sub_task_rows)
+
+    return PlanImportResponse(id=plan_id, total_days=len(item_rows), days=imported_days)
+
+
 async def get_details_plan(token:str,plan_id: UUID) -> PlanWithDays:
     validate_and_extract_author_details(token=token)
     with SessionLocal() as db_session:
@@ -251,6 +341,7 @@ async def update_plan_details(token: str, plan_id: UUID, update_plan_request: Up
     author_details = validate_and_extract_author_details(token=token)
     with SessionLocal() as db:
         plan = _check_author_plan_availability(plan_id=plan_id, author_id=author_details.id, is_admin=author_details.is_admin)
+        previous_language = plan.language
         
         if update_plan_request.title is not None:
             plan.title = update_plan_request.title
@@ -269,6 +360,12 @@ async def update_plan_details(token: str, plan_id: UUID, update_plan_request: Up
         plan.updated_by = author_details.email
         
         plan = update_plan(db, plan)
+        if plan.featured:
+            await invalidate_featured_day_cache(language=previous_language)
+            if plan.language != previous_language:
+                await invalidate_featured_day_cache(language=plan.language)
+        if plan.status == PlanStatus.PUBLISHED:
+            await _refresh_public_plan_catalogs(previous_language, plan.language)
         
         image_url = None
         plan_image_url = plan.image_url
@@ -309,8 +406,13 @@ async def update_selected_plan_status(token:str,plan_id: UUID, plan_status_updat
         plan = _check_author_plan_availability(plan_id=plan_id, author_id=current_author.id, is_admin=current_author.is_admin)
         _check_published_plan_day_availability(plan_id=plan_id, plan_status=plan_status_update.status)
 
+        previous_status = plan.status
         plan.status = plan_status_update.status
         plan = update_plan(db=db, plan=plan)
+        if plan.featured:
+            await invalidate_featured_day_cache(language=plan.language)
+        if PlanStatus.PUBLISHED in (previous_status, plan.status):
+            await _refresh_public_plan_catalogs(plan.language)
         return PlanDTO(
             id=plan.id,
             title=plan.title,
@@ -330,6 +432,10 @@ async def delete_selected_plan(token:str,plan_id: UUID):
     with SessionLocal() as db:
         plan = _check_author_plan_availability(plan_id=plan_id, author_id=current_author.id, is_admin=current_author.is_admin)
         _soft_delete_plan_by_id(db=db, plan_id=plan.id, author=current_author)
+        if plan.featured:
+            await invalidate_featured_day_cache(language=plan.language)
+        if plan.status == PlanStatus.PUBLISHED:
+            await _refresh_public_plan_catalogs(plan.language)
         return
 
 def _get_task_subtasks_dto(subtasks: List[PlanSubTask]) -> List[SubTaskDTO]:
@@ -365,6 +471,14 @@ async def get_plan_day_details(token:str,plan_id: UUID, day_number: int) -> Plan
         )   
         return plan_day_dto
 
+async def _refresh_public_plan_catalogs(*languages):
+    # The plan change is already committed; a failed rebuild only leaves the catalog stale until its TTL
+    for language in set(languages):
+        try:
+            await refresh_plan_catalog(language=language)
+        except Exception:
+            logging.error(f"Failed to refresh the public plan catalog for {language}", exc_info=True)
+
 def _soft_delete_plan_by_id(db: Session, plan_id: UUID, author: Author):
     plan = get_plan_by_id(db=db, plan_id=plan_id)
     if not plan:
@@ -389,9 +503,10 @@ def _check_published_plan_day_availability(plan_id: UUID, plan_status: PlanStatu
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=PLAN_MUST_HAVE_AT_LEAST_ONE_DAY_WITH_CONTENT_TO_BE_PUBLISHED).model_dump())
         return
 
-def update_plan_featured_service(token:str, plan_id: UUID):
+async def update_plan_featured_service(token:str, plan_id: UUID):
     current_author = validate_and_extract_author_details(token=token)
     with SessionLocal() as db:
         plan = _check_author_plan_availability(plan_id=plan_id, author_id=current_author.id, is_admin=current_author.is_admin)
         plan.featured = not plan.featured
-        plan = update_plan(db=db, plan=plan)
\ No newline at end of file
+        plan = update_plan(db=db, plan=plan)
+        await invalidate_featured_day_cache(language=plan.language)
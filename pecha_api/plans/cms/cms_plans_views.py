@@ -6,9 +6,10 @@ from starlette import status
 from typing import Annotated
 
 from pecha_api.plans.plans_response_models import PlansResponse, PlanDTO, CreatePlanRequest, PlanWithDays, UpdatePlanRequest, \
-    PlanStatusUpdate, PlanDayDTO
+    PlanStatusUpdate, PlanDayDTO, ImportPlanRequest, PlanImportResponse
 from pecha_api.plans.cms.cms_plans_service import get_filtered_plans, create_new_plan, get_details_plan, update_plan_details, \
-    delete_selected_plan, update_plan_featured_service, update_selected_plan_status, get_plan_day_details
+    delete_selected_plan, update_plan_featured_service, update_selected_plan_status, get_plan_day_details, \
+    import_plan_service
 from pecha_api.plans.plans_enums import SortBy, SortOrder
 
 oauth2_scheme = HTTPBearer()
@@ -22,7 +23,7 @@ cms_plans_router = APIRouter(
 @cms_plans_router.get("", status_code=status.HTTP_200_OK, response_model=PlansResponse)
 async def get_plans(
         authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
-        search: Optional[str] = Query(default=None, description="Search by plan title"),
+        search: Optional[str] = Query(default=None, description="Search plan titles, descriptions and tags"),
         sort_by: str = Query(default=SortBy.TOTAL_DAYS),
         sort_order: str = Query(default=SortOrder.ASC),
         skip: int = Query(default=0),
@@ -47,6 +48,15 @@ async def create_plan(authentication_credential: Annotated[HTTPAuthorizationCred
     )
 
 
+@cms_plans_router.post("/import", status_code=status.HTTP_201_CREATED, response_model=PlanImportResponse)
+def import_plan(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
+                import_plan_request: ImportPlanRequest):
+    return import_plan_service(
+        token=authentication_credential.credentials,
+        import_plan_request=import_plan_request
+    )
+
+
 @cms_plans_router.get("/{plan_id}", status_code=status.HTTP_200_OK, response_model=PlanWithDays)
 async def get_plan_details(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
                            plan_id: UUID):
@@ -98,9 +108,9 @@ async def get_plan_day_content(authentication_credential: Annotated[HTTPAuthoriz
 
 
 @cms_plans_router.patch("/{plan_id}/featured", status_code=status.HTTP_204_NO_CONTENT)
-def update_plan_featured(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
+async def update_plan_featured(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
                               plan_id: UUID):
-    return update_plan_featured_service(
+    return await update_plan_featured_service(
         token=authentication_credential.credentials,
         plan_id=plan_id,
     )
\ No newline at end of file
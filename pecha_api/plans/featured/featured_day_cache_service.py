@@ -0,0 +1,38 @@
+from datetime import date
+from typing import Optional
+
+from pecha_api.utils import Utils
+from pecha_api.cache.cache_repository import (
+    get_cache_data,
+    set_cache,
+    clear_cache,
+)
+from pecha_api.cache.cache_enums import CacheType
+from .featured_day_response_model import PlanDayDTO
+
+
+def _featured_day_hash_key(language: str, featured_date: date) -> str:
+    payload = [language, featured_date.isoformat(), CacheType.FEATURED_DAY]
+    return Utils.generate_hash_key(payload=payload)
+
+
+async def get_featured_day_cache(language: str, featured_date: date) -> Optional[PlanDayDTO]:
+    """Get the featured day picked for a language on a given date."""
+    cache_data = await get_cache_data(hash_key=_featured_day_hash_key(language=language, featured_date=featured_date))
+    if cache_data and isinstance(cache_data, dict):
+        return PlanDayDTO(**cache_data)
+    return None
+
+
+async def set_featured_day_cache(language: str, featured_date: date, data: PlanDayDTO, cache_time_out: int):
+    """Set the featured day for a language on a given date."""
+    await set_cache(
+        hash_key=_featured_day_hash_key(language=language, featured_date=featured_date),
+        value=data,
+        cache_time_out=cache_time_out
+    )
+
+
+async def delete_featured_day_cache(language: str, featured_date: date):
+    """Delete the featured day for a language on a given date."""
+    await clear_cache(hash_key=_featured_day_hash_key(language=language, featured_date=featured_date))
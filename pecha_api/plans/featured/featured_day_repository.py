@@ -1,29 +1,54 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 from ..plans_models import Plan
 from ..items.plan_items_models import PlanItem
 from ..tasks.plan_tasks_models import PlanTask
-from ..tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
 from ..plans_enums import PlanStatus
 
-def get_all_featured_plan_days(db: Session, language: str = "EN") -> List[PlanItem]:
-   
-    query = (
+
+def _featured_plan_days_query(db: Session, language: str):
+    return (
         db.query(PlanItem)
         .join(Plan, PlanItem.plan_id == Plan.id)
-        .options(
-            joinedload(PlanItem.tasks)
-            .joinedload(PlanTask.sub_tasks)
-        )
         .filter(
             and_(
                 Plan.featured == True,
                 Plan.status == PlanStatus.PUBLISHED,
-                Plan.language == language
+                Plan.language == language,
+                Plan.deleted_at.is_(None)
             )
         )
+    )
+
+
+def count_featured_plan_days(db: Session, language: str = "EN") -> int:
+    return _featured_plan_days_query(db=db, language=language).count()
+
+
+def get_featured_plan_day_at(db: Session, position: int, language: str = "EN") -> Optional[PlanItem]:
+    # Stable ordering so that the same position always resolves to the same day
+    return (
+        _featured_plan_days_query(db=db, language=language)
+        .options(
+            selectinload(PlanItem.tasks)
+            .selectinload(PlanTask.sub_tasks)
+        )
+        .order_by(Plan.id, PlanItem.day_number, PlanItem.id)
+        .offset(position)
+        .limit(1)
+        .first()
+    )
+
+
+def get_featured_plan_languages_by_day_ids(db: Session, day_ids: List[UUID]) -> List[str]:
+    # Languages of the featured plans the given days belong to; empty when none of them is featured
+    rows = (
+        db.query(Plan.language)
+        .join(PlanItem, PlanItem.plan_id == Plan.id)
+        .filter(PlanItem.id.in_(day_ids), Plan.featured == True)
+        .distinct()
         .all()
     )
-    
-    return query
+    return [row[0] for row in rows]
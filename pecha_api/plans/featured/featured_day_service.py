@@ -1,12 +1,15 @@
 from fastapi import HTTPException, status
 from ...db.database import SessionLocal
-from .featured_day_repository import get_all_featured_plan_days
+from .featured_day_repository import count_featured_plan_days, get_featured_plan_day_at, get_featured_plan_languages_by_day_ids
+from .featured_day_cache_service import get_featured_day_cache, set_featured_day_cache, delete_featured_day_cache
 from .featured_day_response_model import PlanDayDTO, TaskDTO, SubTaskDTO
 from ...uploads.S3_utils import generate_presigned_access_url
 from ...config import get
-from ..plans_enums import ContentType
+from ..plans_enums import ContentType, LanguageCode
 import logging
-from datetime import datetime
+from datetime import datetime, date, timedelta, timezone
+from typing import List, Union
+from uuid import UUID
 
 from ..response_message import NO_FEATURED_PLANS_WITH_DAYS_FOUND
 
@@ -21,17 +24,18 @@ def generate_subtask_content_url(content_type: ContentType, content: str) -> str
 
 
 def build_task_dto(task) -> TaskDTO:
+    # Subtask content is kept as stored (S3 keys for images) so the DTO can be cached past URL expiry
     subtasks = [
         SubTaskDTO(
             id=subtask.id,
             content_type=subtask.content_type,
             duration=subtask.duration,
-            content=generate_subtask_content_url(subtask.content_type, subtask.content),
+            content=subtask.content,
             display_order=subtask.display_order
         )
         for subtask in sorted(task.sub_tasks, key=lambda st: st.display_order)
     ]
-    
+
     return TaskDTO(
         id=task.id,
         title=task.title,
@@ -41,23 +45,84 @@ def build_task_dto(task) -> TaskDTO:
     )
 
 
-def get_featured_day_service(language: str) -> PlanDayDTO:
+def _seconds_until_utc_midnight(now: datetime) -> int:
+    next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+    return max(int((next_midnight - now).total_seconds()), 1)
+
+
+def _build_featured_day(language: str, featured_date: date) -> PlanDayDTO:
     with SessionLocal() as db:
-        featured_days = get_all_featured_plan_days(db, language=language.upper())
-        
-        if not featured_days:
+        total_featured_days = count_featured_plan_days(db, language=language)
+
+        if not total_featured_days:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,detail=NO_FEATURED_PLANS_WITH_DAYS_FOUND)
+
+        position = featured_date.toordinal() % total_featured_days
+        selected_day_item = get_featured_plan_day_at(db, position=position, language=language)
+
+        if selected_day_item is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,detail=NO_FEATURED_PLANS_WITH_DAYS_FOUND)
-        
-        index = datetime.now().date().toordinal() % len(featured_days)
-        selected_day_item = featured_days[index]
-        
+
         tasks = [
-            build_task_dto(task) 
+            build_task_dto(task)
             for task in sorted(selected_day_item.tasks, key=lambda t: t.display_order)
         ]
-        
+
         return PlanDayDTO(
             id=selected_day_item.id,
             day_number=selected_day_item.day_number,
             tasks=tasks
-        )
\ No newline at end of file
+        )
+
+
+def _with_presigned_content(featured_day: PlanDayDTO) -> PlanDayDTO:
+    return featured_day.model_copy(
+        update={
+            "tasks": [
+                task.model_copy(
+                    update={
+                        "subtasks": [
+                            subtask.model_copy(update={"content": generate_subtask_content_url(subtask.content_type, subtask.content)})
+                            for subtask in task.subtasks
+                        ]
+                    }
+                )
+                for task in featured_day.tasks
+            ]
+        }
+    )
+
+
+async def get_featured_day_service(language: str) -> PlanDayDTO:
+    language = language.upper()
+    now = datetime.now(timezone.utc)
+    featured_date = now.date()
+
+    featured_day = await get_featured_day_cache(language=language, featured_date=featured_date)
+    if featured_day is None:
+        featured_day = _build_featured_day(language=language, featured_date=featured_date)
+        await set_featured_day_cache(
+            language=language,
+            featured_date=featured_date,
+            data=featured_day,
+            cache_time_out=_seconds_until_utc_midnight(now)
+        )
+
+    return _with_presigned_content(featured_day)
+
+
+async def invalidate_featured_day_cache(language: Union[LanguageCode, str]):
+    language = language.value if isinstance(language, LanguageCode) else str(language).upper()
+    await delete_featured_day_cache(language=language, featured_date=datetime.now(timezone.utc).date())
+
+
+async def invalidate_featured_day_cache_of_plan(plan) -> None:
+    """Drop today's featured day after the content of a plan changed, if the plan is featured"""
+    if plan is not None and plan.featured:
+        await invalidate_featured_day_cache(language=plan.language)
+
+
+async def invalidate_featured_day_cache_of_days(db, day_ids: List[UUID]) -> None:
+    """Drop today's featured day after tasks or sub tasks of these days changed, if their plan is featured"""
+    for language in get_featured_plan_languages_by_day_ids(db=db, day_ids=day_ids):
+        await invalidate_featured_day_cache(language=language)
@@ -1,21 +1,26 @@
 
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 from .plan_items_models import PlanItem
 from pecha_api.plans.tasks.plan_tasks_models import PlanTask
 from fastapi import HTTPException
 from starlette import status
-from sqlalchemy import func, asc, update, bindparam
+from sqlalchemy import func, asc, update, select, bindparam
 from uuid import UUID
 from typing import List, Tuple
 from pecha_api.plans.auth.plan_auth_models import ResponseError
-from pecha_api.plans.response_message import BAD_REQUEST, PLAN_DAY_NOT_FOUND
+from pecha_api.plans.response_message import BAD_REQUEST, PLAN_DAY_NOT_FOUND, DUPLICATE_DAY_NUMBERS
+from pecha_api.plans.plans_ordering import update_positions, positions_are_unique
 from uuid import UUID
 from .plan_items_response_models import ItemDayNumberDTO
+from collections import Counter
+from pecha_api.plans.cms.cms_plans_repository import increment_plan_total_days
 
 def save_plan_items(db: Session, plan_items: List[PlanItem]):
     try:
         db.add_all(plan_items)
+        for plan_id, count in Counter(item.plan_id for item in plan_items).items():
+            increment_plan_total_days(db=db, plan_id=plan_id, amount=count)
         db.commit()
         for item in plan_items:
             db.refresh(item)
@@ -50,6 +55,7 @@ def get_plan_item(db: Session, plan_id: UUID, day_id: UUID) -> PlanItem:
 def save_plan_item(db: Session, plan_item: PlanItem) -> PlanItem:
     try:
         db.add(plan_item)
+        increment_plan_total_days(db=db, plan_id=plan_item.plan_id)
         db.commit()
         db.refresh(plan_item)
         return plan_item
@@ -74,6 +80,8 @@ def delete_plan_items(db: Session, plan_items: List[PlanItem]) -> None:
     try:
         for item in plan_items:
             db.delete(item)
+        for plan_id, count in Counter(item.plan_id for item in plan_items).items():
+            increment_plan_total_days(db=db, plan_id=plan_id, amount=-count)
         db.commit()
     except Exception as e:
         db.rollback()
@@ -92,7 +100,8 @@ def get_plan_day_with_tasks_and_subtasks(db: Session, plan_id: UUID, day_number:
     plan_item = (
         db.query(PlanItem)
         .options(
-            joinedload(PlanItem.tasks).joinedload(PlanTask.sub_tasks)
+            # One query per level instead of a tasks x sub tasks joined row set
+            selectinload(PlanItem.tasks).selectinload(PlanTask.sub_tasks)
         )
         .filter(PlanItem.plan_id == plan_id, PlanItem.day_number == day_number)
         .first()
@@ -110,7 +119,9 @@ def get_day_by_plan_day_id(db: Session, plan_id: UUID, day_id: UUID) -> PlanItem
 
 def delete_day_by_id(db: Session, plan_id: UUID, day_id: UUID) -> None:
     try:
-        db.query(PlanItem).filter(PlanItem.id == day_id, PlanItem.plan_id == plan_id).delete()
+        deleted = db.query(PlanItem).filter(PlanItem.id == day_id, PlanItem.plan_id == plan_id).delete()
+        if deleted:
+            increment_plan_total_days(db=db, plan_id=plan_id, amount=-deleted)
         db.commit()
     except Exception as e:
         db.rollback()
@@ -138,12 +149,43 @@ def update_day_by_id(db: Session, plan_id: UUID, day_id: UUID, day_number: int)
 
 
 def update_days_in_bulk_by_plan_id(db: Session, plan_id: UUID, days: List[ItemDayNumberDTO]) -> None:
+    scope = PlanItem.plan_id == plan_id
     try:
-        db.execute(
-            update(PlanItem).where(PlanItem.plan_id == plan_id).execution_options(synchronize_session=False),
-            days
+        update_positions(
+            db=db,
+            model=PlanItem,
+            order_column=PlanItem.day_number,
+            scope=scope,
+            positions=[(day.id, day.day_number) for day in days]
+        )
+        unique = positions_are_unique(db=db, order_column=PlanItem.day_number, scope=scope)
+        if unique:
+            db.commit()
+        else:
+            db.rollback()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump())
+    if not unique:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=DUPLICATE_DAY_NUMBERS).model_dump())
+
+
+def renumber_days_by_plan_id(db: Session, plan_id: UUID) -> int:
+    """Close the gaps in a plan's day numbers with one UPDATE, touching only the days that move"""
+    ranked_days = (
+        select(PlanItem.id, func.row_number().over(order_by=(PlanItem.day_number, PlanItem.id)).label("day_number"))
+        .where(PlanItem.plan_id == plan_id)
+        .subquery("ranked_days")
+    )
+    try:
+        result = db.execute(
+            update(PlanItem)
+            .where(PlanItem.id == ranked_days.c.id, PlanItem.day_number != ranked_days.c.day_number)
+            .values(day_number=ranked_days.c.day_number)
+            .execution_options(synchronize_session=False)
         )
         db.commit()
+        return result.rowcount
     except Exception as e:
         db.rollback()
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump())
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump())
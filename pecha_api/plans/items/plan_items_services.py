@@ -3,7 +3,7 @@ from fastapi import HTTPException
 from starlette import status
 from pecha_api.plans.auth.plan_auth_models import ResponseError
 from pecha_api.plans.response_message import BAD_REQUEST, PLAN_NOT_FOUND, DUPLICATE_DAY_NUMBERS
-from .plan_items_repository import save_plan_item, get_last_day_number, get_day_by_plan_day_id, delete_day_by_id, get_days_by_plan_id, update_day_by_id, update_days_in_bulk_by_plan_id, get_days_by_day_ids
+from .plan_items_repository import save_plan_item, get_last_day_number, get_day_by_plan_day_id, delete_day_by_id, update_days_in_bulk_by_plan_id, get_days_by_day_ids, renumber_days_by_plan_id
 from pecha_api.plans.cms.cms_plans_repository import get_plan_by_id, get_plan_by_id_and_created_by
 from .plan_items_models import PlanItem
 from pecha_api.plans.plans_models import Plan
@@ -11,8 +11,11 @@ from pecha_api.plans.authors.plan_authors_model import Author
 from .plan_items_response_models import ItemDTO, ReorderDaysRequest
 from pecha_api.plans.authors.plan_authors_service import validate_and_extract_author_details
 from pecha_api.db.database import SessionLocal
+from pecha_api.plans.featured.featured_day_service import invalidate_featured_day_cache_of_plan
+from pecha_api.plans.cms.cms_plans_service import _refresh_public_plan_catalogs
+from pecha_api.plans.plans_enums import PlanStatus
 
-def create_plan_item(token: str, plan_id: UUID) -> ItemDTO:
+async def create_plan_item(token: str, plan_id: UUID) -> ItemDTO:
     current_author = validate_and_extract_author_details(token=token)
 
     with SessionLocal() as db_session:
@@ -25,6 +28,7 @@ def create_plan_item(token: str, plan_id: UUID) -> ItemDTO:
             created_by=current_author.email
         )
         saved_item = save_plan_item(db=db_session, plan_item=plan_item)
+    await _invalidate_plan_days_caches_(plan=plan)
 
     return ItemDTO(
         id=saved_item.id,
@@ -32,7 +36,7 @@ def create_plan_item(token: str, plan_id: UUID) -> ItemDTO:
         day_number=saved_item.day_number
     )
 
-def delete_plan_day_by_id(token: str, plan_id: UUID, day_id: UUID) -> None:
+async def delete_plan_day_by_id(token: str, plan_id: UUID, day_id: UUID) -> None:
     current_author = validate_and_extract_author_details(token=token)
 
     with SessionLocal() as db_session:
@@ -41,21 +45,24 @@ def delete_plan_day_by_id(token: str, plan_id: UUID, day_id: UUID) -> None:
         item = get_day_by_plan_day_id(db=db_session, plan_id=plan.id, day_id=day_id)
         delete_day_by_id(db=db_session, plan_id=plan.id, day_id=item.id)
         _reorder_day_display_order(db=db_session, plan_id=plan.id)
+    await _invalidate_plan_days_caches_(plan=plan)
 
-def update_plans_day_number(token: str, plan_id: UUID, reorder_days_request: ReorderDaysRequest) -> None:
+async def update_plans_day_number(token: str, plan_id: UUID, reorder_days_request: ReorderDaysRequest) -> None:
     current_author = validate_and_extract_author_details(token=token)
     with SessionLocal() as db_session:
         plan = _get_author_plan(plan_id=plan_id, current_author=current_author,is_admin=current_author.is_admin)
         _check_duplicate_day_number_payload(payload=reorder_days_request)
         update_days_in_bulk_by_plan_id(db=db_session, plan_id=plan.id, days=reorder_days_request.days)
+    await _invalidate_plan_days_caches_(plan=plan)
 
-def _reorder_day_display_order(db: SessionLocal(), plan_id: UUID) -> None:
+async def _invalidate_plan_days_caches_(plan: Plan) -> None:
+    await invalidate_featured_day_cache_of_plan(plan=plan)
+    # The public catalog lists total_days, so a published plan's catalog is rebuilt when its days change
+    if plan.status == PlanStatus.PUBLISHED:
+        await _refresh_public_plan_catalogs(plan.language)
 
-    items = get_days_by_plan_id(db=db, plan_id=plan_id)
-    sorted_items = sorted(items, key=lambda x: x.day_number)
-    
-    for index, item in enumerate(sorted_items, start=1):
-        update_day_by_id(db=db, plan_id=plan_id, day_id=item.id, day_number=index)
+def _reorder_day_display_order(db: SessionLocal(), plan_id: UUID) -> None:
+    renumber_days_by_plan_id(db=db, plan_id=plan_id)
 
 
 def _get_author_plan(plan_id: UUID, current_author: Author, is_admin: bool) -> Plan:
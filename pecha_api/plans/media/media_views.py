@@ -13,5 +13,5 @@ media_router = APIRouter(
 
 
 @media_router.post("/upload", status_code=status.HTTP_201_CREATED)
-async def upload_media_image(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)], plan_id: Optional[str] = Query(None), file: UploadFile = File(...)) -> PlanUploadResponse:
+def upload_media_image(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)], plan_id: Optional[str] = Query(None), file: UploadFile = File(...)) -> PlanUploadResponse:
     return upload_plan_image(token=authentication_credential.credentials, plan_id=plan_id, file=file)
@@ -40,6 +40,7 @@ class SortBy(enum.Enum):
     TOTAL_DAYS = "total_days"
     STATUS = "status"
     CREATED_AT = "created_at"
+    RELEVANCE = "relevance"
 
 
 # SQLAlchemy enum types
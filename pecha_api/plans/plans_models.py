@@ -1,12 +1,20 @@
-from sqlalchemy import Column, String, DateTime, Boolean, UUID, Text, Index, text, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, UUID, Text, Index, Integer, text, ForeignKey, Computed
 from ..db.database import Base
 from uuid import uuid4
 import _datetime
 from _datetime import datetime
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from .plans_enums import LanguageCodeEnum, DifficultyLevelEnum, PlanStatusEnum
 
+# English plans are stemmed; Tibetan and Chinese have no Postgres dictionary and are indexed as-is
+PLAN_SEARCH_CONFIG_SQL = "CASE WHEN language = 'EN' THEN 'english'::regconfig ELSE 'simple'::regconfig END"
+PLAN_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector({PLAN_SEARCH_CONFIG_SQL}, coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector({PLAN_SEARCH_CONFIG_SQL}, coalesce(description, '')), 'B') || "
+    f"setweight(jsonb_to_tsvector({PLAN_SEARCH_CONFIG_SQL}, tags, '[\"string\"]'), 'C')"
+)
+
 
 class Plan(Base):
     __tablename__ = "plans"
@@ -23,6 +31,13 @@ class Plan(Base):
     status = Column(PlanStatusEnum, nullable=False, default='DRAFT')
     # Content metadata
     image_url = Column(String(1000), nullable=True)
+
+    # Denormalized aggregates, kept in step with items and user_plan_progress
+    total_days = Column(Integer, server_default=text("0"), default=0, nullable=False)
+    subscription_count = Column(Integer, server_default=text("0"), default=0, nullable=False)
+
+    # Weighted full-text document over title, description and tags, maintained by Postgres
+    search_vector = Column(TSVECTOR, Computed(PLAN_SEARCH_VECTOR_SQL, persisted=True))
     
     created_at = Column(DateTime(timezone=True), default=datetime.now(_datetime.timezone.utc),nullable=False)
     created_by = Column(String(255), nullable=False)
@@ -39,7 +54,11 @@ class Plan(Base):
         # Indexes for plan discovery
         Index("idx_plans_discovery", "tags", "status"),
         Index("idx_plans_featured", "featured", postgresql_where=text("featured = TRUE")),
-        Index("idx_plans_search", text("to_tsvector('english', title || ' ' || COALESCE(description, ''))"),
-              postgresql_using="gin"),
+        Index("idx_plans_search", "search_vector", postgresql_using="gin"),
+        Index("idx_plans_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
         Index("idx_plans_tags", "tags", postgresql_using="gin"),
+        # Indexes for plan listings
+        Index("idx_plans_published_listing", "language", "status", "title",
+              postgresql_where=text("deleted_at IS NULL")),
+        Index("idx_plans_author_created", "author_id", "created_at", "id"),
     )
@@ -0,0 +1,76 @@
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Integer, UUID as SqlUUID, column, func, select, update, values
+from sqlalchemy.orm import Session
+
+# Tasks and sub tasks are ordered by spaced display_order values, so moving one item between two
+# neighbours only rewrites that item. The siblings are respaced only when two neighbours are adjacent.
+ORDER_GAP = 1024
+
+
+def update_positions(db: Session, model, order_column, scope, positions: Sequence[Tuple[UUID, int]], key_column=None) -> int:
+    """Apply (id, position) pairs to the rows of one scope in a single UPDATE ... FROM (VALUES ...)
+
+    The ids are matched against key_column, the primary key unless given, and the matched row count is returned.
+    """
+    if not positions:
+        return 0
+    key_column = model.id if key_column is None else key_column
+    new_positions = values(
+        column("id", SqlUUID(as_uuid=True)),
+        column("position", Integer),
+        name="new_positions"
+    ).data([(row_id, position) for row_id, position in positions])
+    result = db.execute(
+        update(model)
+        .where(key_column == new_positions.c.id, scope)
+        .values({order_column: new_positions.c.position})
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def positions_are_unique(db: Session, order_column, scope) -> bool:
+    duplicate = db.execute(
+        select(order_column).where(scope).group_by(order_column).having(func.count() > 1).limit(1)
+    ).first()
+    return duplicate is None
+
+
+def spaced_positions(ids: Sequence[UUID]) -> List[Tuple[UUID, int]]:
+    return [(row_id, index * ORDER_GAP) for index, row_id in enumerate(ids, start=1)]
+
+
+def move_between(db: Session, model, order_column, scope, item_id: UUID, after_id: Optional[UUID]) -> Optional[int]:
+    """Place an item right after a sibling (first when after_id is None) and return its new position.
+
+    Returns None when after_id is not a sibling of the item.
+    """
+    siblings = db.execute(
+        select(model.id, order_column).where(scope, model.id != item_id).order_by(order_column, model.id)
+    ).all()
+    if after_id is None:
+        index = 0
+    else:
+        index = next((position + 1 for position, sibling in enumerate(siblings) if sibling[0] == after_id), None)
+        if index is None:
+            return None
+
+    lower = siblings[index - 1][1] if index > 0 else 0
+    upper = siblings[index][1] if index < len(siblings) else lower + 2 * ORDER_GAP
+    if upper - lower > 1:
+        new_position = (lower + upper) // 2
+        db.execute(
+            update(model)
+            .where(model.id == item_id)
+            .values({order_column: new_position})
+            .execution_options(synchronize_session=False)
+        )
+        return new_position
+
+    ordered_ids = [sibling[0] for sibling in siblings]
+    ordered_ids.insert(index, item_id)
+    positions = spaced_positions(ordered_ids)
+    update_positions(db=db, model=model, order_column=order_column, scope=scope, positions=positions)
+    return dict(positions)[item_id]
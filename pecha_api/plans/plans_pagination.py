@@ -0,0 +1,60 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from starlette import status
+
+from .auth.plan_auth_models import ResponseError
+from .response_message import BAD_REQUEST, INVALID_CURSOR
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque keyset cursor for the (sort key, id) of the last row of a page"""
+    payload = json.dumps([_to_json_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> Tuple[Any, ...]:
+    """Decode a cursor produced by encode_cursor, parsing each value with the matching parser"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError(cursor)
+        return tuple(parser(value) for parser, value in zip(parsers, values))
+    except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ResponseError(error=BAD_REQUEST, message=INVALID_CURSOR).model_dump()
+        )
+
+
+def parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def keyset_filter(columns: Sequence, values: Sequence, descending: bool = True):
+    """Rows strictly after the cursor row in an ORDER BY over columns sharing one direction"""
+    row = tuple_(*columns)
+    return row < tuple_(*values) if descending else row > tuple_(*values)
+
+
+def keyset_page(rows: List, limit: int, cursor_values: Callable[[Any], Sequence]) -> Tuple[List, Optional[str]]:
+    """Trim a limit + 1 fetch to a page and build the cursor of the following page, if any"""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(*cursor_values(page[-1]))
@@ -23,6 +23,29 @@ class UpdatePlanRequest(BaseModel):
     image_url: Optional[str] = None
     tags: Optional[List[str]] = None
 
+class ImportSubTaskRequest(BaseModel):
+    content_type: ContentType
+    content: Optional[str] = None
+    duration: Optional[str] = None
+
+class ImportTaskRequest(BaseModel):
+    title: Optional[str] = None
+    estimated_time: Optional[int] = None
+    subtasks: List[ImportSubTaskRequest] = []
+
+class ImportPlanDayRequest(BaseModel):
+    day_number: int
+    tasks: List[ImportTaskRequest] = []
+
+class ImportPlanRequest(BaseModel):
+    title: str
+    description: str
+    difficulty_level: DifficultyLevel
+    language: str
+    image_url: Optional[str] = None
+    tags: Optional[List[str]] = []
+    days: List[ImportPlanDayRequest]
+
 class PlanStatusUpdate(BaseModel):
     status: PlanStatus
 
@@ -91,6 +114,21 @@ class PlanWithAggregates(BaseModel):
     total_days: int
     subscription_count: int
 
+class ImportedTaskDTO(BaseModel):
+    id: UUID
+    display_order: int
+    subtask_ids: List[UUID]
+
+class ImportedPlanDayDTO(BaseModel):
+    id: UUID
+    day_number: int
+    tasks: List[ImportedTaskDTO]
+
+class PlanImportResponse(BaseModel):
+    id: UUID
+    total_days: int
+    days: List[ImportedPlanDayDTO]
+
 class PlansRepositoryResponse(BaseModel):
     plan_info: List[PlanWithAggregates]
     total: int
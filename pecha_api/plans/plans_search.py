@@ -0,0 +1,45 @@
+from typing import Optional, Union
+
+from sqlalchemy import func, or_, literal_column
+
+from .plans_enums import LanguageCode
+from .plans_models import Plan
+
+SEARCH_CONFIGS = {
+    LanguageCode.EN.value: "english",
+}
+DEFAULT_SEARCH_CONFIG = "simple"
+
+
+def _search_config(language: str):
+    config = SEARCH_CONFIGS.get(language, DEFAULT_SEARCH_CONFIG)
+    return literal_column(f"'{config}'::regconfig")
+
+
+def plan_search_query(search: str, language: Optional[Union[LanguageCode, str]] = None):
+    """tsquery for a user search string, in the configuration the plans of that language are indexed with.
+
+    Without a language the query matches plans of every configuration.
+    """
+    if language is not None:
+        language = language.value if isinstance(language, LanguageCode) else language.upper()
+        return func.websearch_to_tsquery(_search_config(language), search)
+    return func.websearch_to_tsquery(_search_config(LanguageCode.EN.value), search).op("||")(
+        func.websearch_to_tsquery(_search_config(DEFAULT_SEARCH_CONFIG), search)
+    )
+
+
+def plan_search_filter(search: str, language: Optional[Union[LanguageCode, str]] = None):
+    # Full-text matches on words (idx_plans_search) or substring matches on the title (idx_plans_title_trgm),
+    # the latter keeping partial words and unsegmented scripts searchable
+    return or_(
+        Plan.search_vector.op("@@")(plan_search_query(search=search, language=language)),
+        Plan.title.ilike(f"%{search}%")
+    )
+
+
+def plan_search_rank(search: str, language: Optional[Union[LanguageCode, str]] = None):
+    return (
+        func.ts_rank_cd(Plan.search_vector, plan_search_query(search=search, language=language))
+        + func.similarity(Plan.title, search)
+    )
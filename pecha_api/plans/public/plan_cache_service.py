@@ -0,0 +1,51 @@
+import time
+from typing import Dict, Optional, Tuple
+
+from pecha_api import config
+from pecha_api.utils import Utils
+from pecha_api.cache.cache_repository import (
+    get_cache_data,
+    set_cache,
+)
+from pecha_api.cache.cache_enums import CacheType
+from .plan_response_models import PlanCatalogSnapshot
+
+# language -> (snapshot, local_until); a short-lived copy in front of Redis so that
+# browsing the catalog does not even pay for a Redis round trip and JSON decode
+_local_plan_catalogs: Dict[str, Tuple[PlanCatalogSnapshot, float]] = {}
+
+
+def _plan_catalog_hash_key(language: str) -> str:
+    payload = [language, CacheType.PLAN_CATALOG]
+    return Utils.generate_hash_key(payload=payload)
+
+
+def _remember_plan_catalog(language: str, snapshot: PlanCatalogSnapshot) -> None:
+    _local_plan_catalogs[language] = (snapshot, time.monotonic() + config.get_int("PLAN_CATALOG_LOCAL_TTL_IN_SEC"))
+
+
+async def get_plan_catalog_cache(language: str) -> Optional[PlanCatalogSnapshot]:
+    """Get the published plan catalog of a language, from this process first and Redis second."""
+    local = _local_plan_catalogs.get(language)
+    if local is not None and local[1] > time.monotonic():
+        return local[0]
+    cache_data = await get_cache_data(hash_key=_plan_catalog_hash_key(language=language))
+    if cache_data and isinstance(cache_data, dict):
+        snapshot = PlanCatalogSnapshot(**cache_data)
+        _remember_plan_catalog(language=language, snapshot=snapshot)
+        return snapshot
+    return None
+
+
+async def set_plan_catalog_cache(language: str, data: PlanCatalogSnapshot):
+    """Set the published plan catalog of a language in this process and in Redis."""
+    _remember_plan_catalog(language=language, snapshot=data)
+    await set_cache(
+        hash_key=_plan_catalog_hash_key(language=language),
+        value=data,
+        cache_time_out=config.get_int("CACHE_PLAN_CATALOG_TIMEOUT")
+    )
+
+
+def clear_local_plan_catalogs() -> None:
+    _local_plan_catalogs.clear()
@@ -4,96 +4,65 @@ from typing import Optional, Tuple, List
 from uuid import UUID
 from pecha_api.plans.plans_models import Plan
 from pecha_api.plans.items.plan_items_models import PlanItem
-from pecha_api.plans.users.plan_users_models import UserPlanProgress
-from pecha_api.plans.plans_enums import PlanStatus
+from pecha_api.plans.plans_enums import PlanStatus, SortBy
+from pecha_api.plans.plans_search import plan_search_filter, plan_search_rank
+from pecha_api.plans.plans_pagination import keyset_filter
 from pecha_api.plans.public.plan_response_models import PlanWithAggregates
 
-DEFAULT_SKIP = 0
-DEFAULT_LIMIT = 20
-DEFAULT_LANGUAGE = "EN"
-DEFAULT_SEARCH = None
-DEFAULT_SORT_BY = "title"
-DEFAULT_SORT_ORDER = "asc"
-
-def get_aggregate_counts():
-    total_days_label = func.count(func.distinct(PlanItem.id)).label("total_days")
-    subscription_count_label = func.count(func.distinct(UserPlanProgress.user_id)).label("subscription_count")
-    return total_days_label, subscription_count_label
+def _published_plan_filters(language: str) -> list:
+    return [
+        Plan.language == language,
+        Plan.deleted_at.is_(None),
+        Plan.status == PlanStatus.PUBLISHED
+    ]
 
 
-def get_published_plans_query(db: Session, total_days_label, subscription_count_label, language: str):
-    query = (
-        db.query(Plan, total_days_label, subscription_count_label)
-        .outerjoin(PlanItem, PlanItem.plan_id == Plan.id)
-        .outerjoin(UserPlanProgress, UserPlanProgress.plan_id == Plan.id)
+def get_published_plans_query(db: Session, language: str):
+    return (
+        db.query(Plan)
         .options(selectinload(Plan.author))
-        .filter(
-            Plan.language == language,
-            Plan.deleted_at.is_(None),
-            Plan.status == PlanStatus.PUBLISHED
-        )
-        .group_by(Plan.id)
+        .filter(*_published_plan_filters(language))
     )
-    
-    return query
-
-
-def apply_search_filter(query, search: Optional[str]):
-    if search:
-        query = query.filter(Plan.title.ilike(f"%{search}%"))
-    return query
-
-
-def apply_sorting(query, sort_by: str, sort_order: str, total_days_label, subscription_count_label):
-    sort_column_map = {
-        "title": Plan.title,
-        "total_days": total_days_label,
-        "subscription_count": subscription_count_label
-    }
-    
-    sort_column = sort_column_map.get(sort_by, Plan.title)
-    
-    if sort_order == "desc":
-        return query.order_by(desc(sort_column))
+
+
+def get_published_catalog_plans(db: Session, language: str) -> List[Plan]:
+    return get_published_plans_query(db, language).order_by(asc(Plan.title), asc(Plan.id)).all()
+
+
+def search_published_plans(
+    db: Session,
+    search: str,
+    language: str,
+    sort_by: str,
+    sort_order: str,
+    skip: int,
+    limit: int
+) -> Tuple[List[Plan], int]:
+    search_filter = plan_search_filter(search=search, language=language)
+    total = db.query(func.count(Plan.id)).filter(*_published_plan_filters(language), search_filter).scalar()
+
+    query = get_published_plans_query(db, language).filter(search_filter)
+    if sort_by == SortBy.RELEVANCE.value:
+        query = query.order_by(desc(plan_search_rank(search=search, language=language)), asc(Plan.id))
     else:
-        return query.order_by(asc(sort_column))
+        sort_column = {
+            "title": Plan.title,
+            "total_days": Plan.total_days,
+            "subscription_count": Plan.subscription_count
+        }.get(sort_by, Plan.title)
+        order = desc if sort_order == "desc" else asc
+        query = query.order_by(order(sort_column), order(Plan.id))
 
+    return query.offset(skip).limit(limit).all(), total
 
-def convert_to_plan_aggregates(rows):
+
+def convert_to_plan_aggregates(plans: List[Plan]) -> List[PlanWithAggregates]:
     return [
-        PlanWithAggregates(plan=plan, total_days=total_days, subscription_count=subscription_count)
-        for plan, total_days, subscription_count in rows
+        PlanWithAggregates(plan=plan, total_days=plan.total_days, subscription_count=plan.subscription_count)
+        for plan in plans
     ]
 
 
-def get_published_plans_from_db(db: Session, 
-    skip: int = DEFAULT_SKIP, 
-    limit: int = DEFAULT_LIMIT, 
-    search: Optional[str] = DEFAULT_SEARCH, 
-    language: str = DEFAULT_LANGUAGE,  
-    sort_by: str = DEFAULT_SORT_BY,
-    sort_order: str = DEFAULT_SORT_ORDER
-):
-    total_days_label, subscription_count_label = get_aggregate_counts()
-    query = get_published_plans_query(db, total_days_label, subscription_count_label, language)
-    query = apply_search_filter(query, search)
-    query = apply_sorting(query, sort_by, sort_order, total_days_label, subscription_count_label)
-    rows = query.offset(skip).limit(limit).all()
-    
-    return convert_to_plan_aggregates(rows)
-
-
-def get_published_plans_count(db: Session, search: Optional[str] = DEFAULT_SEARCH, language: str = DEFAULT_LANGUAGE) -> int:
-    query = db.query(func.count(Plan.id)).filter(
-        Plan.deleted_at.is_(None),
-        Plan.status == PlanStatus.PUBLISHED,
-        Plan.language == language
-    )
-    if search:
-        query = query.filter(Plan.title.ilike(f"%{search}%"))
-    return query.scalar()
-
-
 def get_published_plan_by_id(db: Session, plan_id: UUID) -> Optional[Plan]:
     return db.query(Plan).options(selectinload(Plan.author)).filter(
             Plan.id == plan_id,
@@ -112,20 +81,15 @@ def get_plan_item_by_day_number(db: Session, plan_id: UUID, day_number: int) ->
             PlanItem.day_number == day_number
         ).first()
 
-def get_published_plans_by_author_id(db: Session, author_id: UUID, skip: int, limit: int) -> Tuple[List[PlanWithAggregates], int]:
-    total_days_label = func.count(func.distinct(PlanItem.id)).label("total_days")
-    subscription_count_label = func.count(func.distinct(UserPlanProgress.user_id)).label("subscription_count")
+def get_published_plans_by_author_id(
+    db: Session, author_id: UUID, skip: int, limit: int, after: Optional[Tuple] = None, count_total: bool = True
+) -> Tuple[List[PlanWithAggregates], Optional[int]]:
     query = (
-        db.query(
-            Plan,
-            total_days_label,
-            subscription_count_label
-        )
-        .outerjoin(PlanItem, PlanItem.plan_id == Plan.id)
-        .outerjoin(UserPlanProgress, UserPlanProgress.plan_id == Plan.id)
+        db.query(Plan)
         .filter(Plan.author_id == author_id, Plan.status == PlanStatus.PUBLISHED, Plan.deleted_at.is_(None))
-        .group_by(Plan.id)
     )
-    total = query.count()
-    rows = query.offset(skip).limit(limit).all()
-    return convert_to_plan_aggregates(rows), total
\ No newline at end of file
+    total = query.with_entities(func.count(Plan.id)).scalar() if count_total else None
+    if after is not None:
+        query = query.filter(keyset_filter((Plan.created_at, Plan.id), after, descending=True))
+    plans = query.order_by(desc(Plan.created_at), desc(Plan.id)).offset(skip).limit(limit).all()
+    return convert_to_plan_aggregates(plans), total
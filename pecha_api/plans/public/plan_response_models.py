@@ -71,6 +71,29 @@ class PublicPlansResponse(BaseModel):
     skip: int
     limit: int
     total: int
+    next_cursor: Optional[str] = None
+
+class CatalogAuthor(BaseModel):
+    id: UUID
+    firstname: str
+    lastname: str
+    image_url: Optional[str] = None
+
+class CatalogPlan(BaseModel):
+    id: UUID
+    title: str
+    description: str
+    language: str
+    difficulty_level: Optional[DifficultyLevel] = None
+    image_url: Optional[str] = None
+    total_days: int
+    subscription_count: int
+    tags: List[str] = []
+    author: Optional[CatalogAuthor] = None
+
+class PlanCatalogSnapshot(BaseModel):
+    language: str
+    plans: List[CatalogPlan] = []
 
 class PlanWithAggregates(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -1,23 +1,38 @@
-from typing import Optional, List
+from typing import Optional, List, Union, Tuple
 import logging
 from uuid import UUID
-from typing import Optional
 from starlette import status
 from pecha_api.config import get
 from fastapi import HTTPException
 from pecha_api.db.database import SessionLocal
 from pecha_api.error_contants import ErrorConstants
 from pecha_api.plans.items.plan_items_repository import get_days_by_plan_id, get_plan_day_with_tasks_and_subtasks
-from pecha_api.plans.public.plan_response_models import PublicPlansResponse, PublicPlanDTO, PlanDayDTO, AuthorDTO,PlanDaysResponse, PlanDayBasic, SubTaskDTO, TaskDTO, ImageUrlModel
-from pecha_api.plans.items.plan_items_models import PlanItem
+from pecha_api.plans.public.plan_response_models import PublicPlansResponse, PublicPlanDTO, PlanDayDTO, AuthorDTO,PlanDaysResponse, PlanDayBasic, SubTaskDTO, TaskDTO, ImageUrlModel, \
+    CatalogPlan, CatalogAuthor, PlanCatalogSnapshot
+from pecha_api.plans.plans_models import Plan
+from pecha_api.plans.plans_enums import LanguageCode
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
 from pecha_api.users.users_service import validate_and_extract_user_details
 from pecha_api.plans.cms.cms_plans_repository import get_plan_by_id
 from pecha_api.uploads.S3_utils import generate_presigned_access_url
-from pecha_api.plans.public.plan_repository import (get_published_plans_from_db, get_published_plans_count, get_published_plan_by_id)
+from pecha_api.plans.public.plan_repository import get_published_catalog_plans, search_published_plans, get_published_plan_by_id
+from pecha_api.plans.public.plan_cache_service import get_plan_catalog_cache, set_plan_catalog_cache
+from pecha_api.plans.plans_pagination import decode_cursor, keyset_page
+from pecha_api.plans.auth.plan_auth_models import ResponseError
+from pecha_api.plans.response_message import BAD_REQUEST, CURSOR_NOT_SUPPORTED_WITH_SEARCH
 
 logger = logging.getLogger(__name__)
 
+CATALOG_SORT_KEYS = {
+    "title": lambda plan: plan.title,
+    "total_days": lambda plan: plan.total_days,
+    "subscription_count": lambda plan: plan.subscription_count
+}
+CATALOG_CURSOR_PARSERS = {
+    "total_days": int,
+    "subscription_count": int
+}
+
 async def get_image_url(image_url: Optional[str]) -> Optional[ImageUrlModel]:
     if not image_url:
         return None
@@ -31,53 +46,132 @@ async def get_image_url(image_url: Optional[str]) -> Optional[ImageUrlModel]:
         original=generate_presigned_access_url(bucket_name=get("AWS_BUCKET_NAME"), s3_key=original_url)
     )
 
+def _to_catalog_plan(plan: Plan) -> CatalogPlan:
+    author = None
+    if plan.author:
+        author = CatalogAuthor(
+            id=plan.author.id,
+            firstname=plan.author.first_name,
+            lastname=plan.author.last_name,
+            image_url=plan.author.image_url
+        )
+    return CatalogPlan(
+        id=plan.id,
+        title=plan.title,
+        description=plan.description or "",
+        language=plan.language.value if hasattr(plan.language, 'value') else plan.language,
+        difficulty_level=plan.difficulty_level,
+        image_url=plan.image_url,
+        total_days=plan.total_days or 0,
+        subscription_count=plan.subscription_count or 0,
+        tags=plan.tags if plan.tags else [],
+        author=author
+    )
+
+
+async def refresh_plan_catalog(language: Union[LanguageCode, str]) -> PlanCatalogSnapshot:
+    """Rebuild the published plan catalog of a language from the database and cache it"""
+    language = language.value if isinstance(language, LanguageCode) else language.upper()
+    with SessionLocal() as db:
+        plans = get_published_catalog_plans(db=db, language=language)
+        snapshot = PlanCatalogSnapshot(language=language, plans=[_to_catalog_plan(plan) for plan in plans])
+    await set_plan_catalog_cache(language=language, data=snapshot)
+    return snapshot
+
+
+async def get_plan_catalog(language: str) -> PlanCatalogSnapshot:
+    snapshot = await get_plan_catalog_cache(language=language)
+    if snapshot is None:
+        snapshot = await refresh_plan_catalog(language=language)
+    return snapshot
+
+
+def _catalog_sort_key(sort_by: str):
+    sort_key = CATALOG_SORT_KEYS.get(sort_by, CATALOG_SORT_KEYS["title"])
+    return lambda plan: (sort_key(plan), str(plan.id))
+
+
+def _sort_catalog(plans: List[CatalogPlan], sort_by: str, sort_order: str) -> List[CatalogPlan]:
+    return sorted(plans, key=_catalog_sort_key(sort_by), reverse=sort_order == "desc")
+
+
+def _catalog_page_after(plans: List[CatalogPlan], sort_by: str, sort_order: str, cursor: str, limit: int) -> Tuple[List[CatalogPlan], Optional[str]]:
+    """Keyset page of the sorted catalog following the (sort key, id) encoded in the cursor"""
+    sort_key = _catalog_sort_key(sort_by)
+    start = 0
+    if cursor:
+        after = decode_cursor(cursor, CATALOG_CURSOR_PARSERS.get(sort_by, str), str)
+        descending = sort_order == "desc"
+        start = next(
+            (index for index, plan in enumerate(plans) if (sort_key(plan) < after if descending else sort_key(plan) > after)),
+            len(plans)
+        )
+    return keyset_page(rows=plans[start:start + limit + 1], limit=limit, cursor_values=sort_key)
+
+
+async def _to_public_plan_dto(catalog_plan: CatalogPlan) -> PublicPlanDTO:
+    author_dto = None
+    if catalog_plan.author:
+        author_dto = AuthorDTO(
+            id=catalog_plan.author.id,
+            firstname=catalog_plan.author.firstname,
+            lastname=catalog_plan.author.lastname,
+            image=await get_image_url(image_url=catalog_plan.author.image_url)
+        )
+    return PublicPlanDTO(
+        id=catalog_plan.id,
+        title=catalog_plan.title,
+        description=catalog_plan.description,
+        language=catalog_plan.language,
+        difficulty_level=catalog_plan.difficulty_level,
+        image=await get_image_url(image_url=catalog_plan.image_url),
+        total_days=catalog_plan.total_days,
+        tags=catalog_plan.tags,
+        author=author_dto
+    )
+
+
 async def get_published_plans(
     search: Optional[str] = None, 
     language: str = "en", 
     sort_by: str = "title", 
     sort_order: str = "asc", 
     skip: int = 0, 
-    limit: int = 20
+    limit: int = 20,
+    cursor: Optional[str] = None
     ) -> PublicPlansResponse:
+
+    if search and cursor is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ResponseError(error=BAD_REQUEST, message=CURSOR_NOT_SUPPORTED_WITH_SEARCH).model_dump()
+        )
     
     try:
-        with SessionLocal() as db:
-            language_upper = language.upper()
-            plan_aggregates = get_published_plans_from_db(db=db, skip=skip, limit=limit, search=search, language=language_upper, sort_by=sort_by, sort_order=sort_order)
-            
-            plan_dtos = []
-            for plan_aggregate in plan_aggregates:
-                plan = plan_aggregate.plan
-                
-                plan_image = await get_image_url(image_url=plan.image_url)
-                
-                author_dto = None
-                if plan.author:
-                    author_image = await get_image_url(image_url=plan.author.image_url)
-                    author_dto = AuthorDTO(
-                        id=plan.author.id, 
-                        firstname=plan.author.first_name, 
-                        lastname=plan.author.last_name, 
-                        image=author_image 
-                    )
-                
-                plan_dto = PublicPlanDTO(
-                    id=plan.id,
-                    title=plan.title,
-                    description=plan.description,
-                    language=plan.language.value if hasattr(plan.language, 'value') else plan.language,
-                    difficulty_level=plan.difficulty_level,
-                    image=plan_image,
-                    total_days=plan_aggregate.total_days,
-                    tags=plan.tags if plan.tags else [],
-                    author=author_dto
+        if search:
+            # Searches are ranked by the full-text and trigram indexes rather than scanned in memory
+            with SessionLocal() as db:
+                plans, total = search_published_plans(
+                    db=db, search=search, language=language.upper(), sort_by=sort_by, sort_order=sort_order, skip=skip, limit=limit
                 )
-                plan_dtos.append(plan_dto)
-            
-            total = get_published_plans_count(db=db, search=search, language=language_upper)
-            
+                catalog_plans = [_to_catalog_plan(plan) for plan in plans]
+            plan_dtos = [await _to_public_plan_dto(catalog_plan) for catalog_plan in catalog_plans]
             return PublicPlansResponse(plans=plan_dtos, skip=skip, limit=limit, total=total)
+
+        snapshot = await get_plan_catalog(language=language.upper())
+        matching_plans = _sort_catalog(plans=snapshot.plans, sort_by=sort_by, sort_order=sort_order)
+        if cursor is not None:
+            page, next_cursor = _catalog_page_after(
+                plans=matching_plans, sort_by=sort_by, sort_order=sort_order, cursor=cursor, limit=limit
+            )
+            plan_dtos = [await _to_public_plan_dto(catalog_plan) for catalog_plan in page]
+            return PublicPlansResponse(plans=plan_dtos, skip=0, limit=limit, total=len(matching_plans), next_cursor=next_cursor)
+
+        plan_dtos = [await _to_public_plan_dto(catalog_plan) for catalog_plan in matching_plans[skip:skip + limit]]
+        return PublicPlansResponse(plans=plan_dtos, skip=skip, limit=limit, total=len(matching_plans))
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching published plans: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -89,38 +183,13 @@ async def get_published_plans(
 async def get_published_plan(plan_id: UUID) -> PublicPlanDTO:
 
     try:
+        # A primary key lookup; the language catalogs are only for listing
         with SessionLocal() as db:
             plan = get_published_plan_by_id(db=db, plan_id=plan_id)
-            
             if not plan:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.PLAN_NOT_FOUND)
-            
-            plan_image= await get_image_url(image_url=plan.image_url)
-            
-            author_dto = None
-            if plan.author:
-                author_image = await get_image_url(image_url=plan.author.image_url)
-                author_dto = AuthorDTO(
-                    id=plan.author.id, 
-                    firstname=plan.author.first_name, 
-                    lastname=plan.author.last_name, 
-                    image=author_image
-                )
-            
-            
-            total_days = db.query(PlanItem).filter(PlanItem.plan_id == plan_id).count()  
-
-            return PublicPlanDTO(
-                id=plan.id,
-                title=plan.title,
-                description=plan.description,
-                language=plan.language.value if hasattr(plan.language, 'value') else plan.language,
-                difficulty_level=plan.difficulty_level,
-                image=plan_image,  
-                total_days=total_days,
-                tags=plan.tags if plan.tags else [],
-                author=author_dto
-            )
+            catalog_plan = _to_catalog_plan(plan)
+        return await _to_public_plan_dto(catalog_plan)
     
     except Exception as e:
         logger.error(f"Error fetching published plan details: {str(e)}", exc_info=True)
@@ -23,14 +23,15 @@ public_plans_router = APIRouter(
 
 @public_plans_router.get("", status_code=status.HTTP_200_OK, response_model=PublicPlansResponse)
 async def get_plans(
-    search: Optional[str] = Query(None, description="Search by plan title"),
+    search: Optional[str] = Query(None, description="Search plan titles, descriptions and tags"),
     language: str = Query("en", description="Filter by language code (e.g., 'bo', 'en', 'zh'). Defaults to 'en'."),
-    sort_by: str = Query("title", enum=["title", "total_days", "subscription_count"]),
+    sort_by: str = Query("title", enum=["title", "total_days", "subscription_count", "relevance"]),
     sort_order: str = Query("asc", enum=["asc", "desc"]),
     skip: int = Query(0, ge=0),
-    limit: int = Query(20, ge=1, le=50)
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="Keyset pagination cursor: empty for the first page, then the previous page's next_cursor. Ignores skip; not available with search")
 ):
-    return await get_published_plans(search=search, language=language, sort_by=sort_by, sort_order=sort_order, skip=skip, limit=limit)
+    return await get_published_plans(search=search, language=language, sort_by=sort_by, sort_order=sort_order, skip=skip, limit=limit, cursor=cursor)
 
 
 @public_plans_router.get("/{plan_id}", status_code=status.HTTP_200_OK, response_model=PublicPlanDTO)
@@ -41,6 +41,8 @@ UNAUTHORIZED_TASK_ACCESS = "You are not authorized to access this task"
 DUPLICATE_DAY_NUMBERS = "Duplicate day numbers"
 SUBTASK_ORDER_FAILED = "Subtask order update failed"
 DUPLICATE_TASK_ORDER = "Duplicate task order"
+DUPLICATE_RECITATION_ORDER = "Duplicate recitation order"
+RECITATION_NOT_FOUND = "Recitation not found for this user"
 ALREADY_ENROLLED_IN_PLAN = "Already enrolled in this plan"
 ALREADY_COMPLETED_SUB_TASK = "Already completed this sub task"
 SUB_TASK_NOT_FOUND = "Sub task not found"
@@ -48,4 +50,10 @@ SUB_TASKS_NOT_COMPLETED = "Sub tasks not completed"
 NO_FEATURED_PLANS_WITH_DAYS_FOUND = "No featured plans with days found"
 NO_SEGMENTATION_IDS_RETURNED = "No segmentation IDs returned from external API"
 PECHA_SEGMENT_NOT_FOUND = "Pecha segment not found"
-ERROR_GENERATING_URL = "Error generating URL"
\ No newline at end of file
+ERROR_GENERATING_URL = "Error generating URL"
+INVALID_CURSOR = "Invalid pagination cursor"
+CURSOR_NOT_SUPPORTED_WITH_SEARCH = "Cursor pagination is not supported for searches"
+PLAN_IMPORT_WITHOUT_DAYS = "Plan import must contain at least one day"
+INVALID_DAY_NUMBER = "Day numbers must be positive"
+INVALID_PLAN_LANGUAGE = "Unsupported plan language"
+MEDIA_SUB_TASK_WITHOUT_CONTENT = "Media sub tasks must reference their content"
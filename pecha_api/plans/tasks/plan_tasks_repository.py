@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
 from fastapi import HTTPException
 from starlette import status
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy import asc
 
 
@@ -14,7 +14,8 @@ from pecha_api.plans.items.plan_items_repository import get_plan_item
 from pecha_api.plans.tasks.plan_tasks_models import PlanTask
 from pecha_api.plans.tasks.plan_tasks_response_model import CreateTaskRequest, TaskDTO, TaskOrderItem
 from pecha_api.plans.auth.plan_auth_models import ResponseError
-from pecha_api.plans.response_message import BAD_REQUEST, TASK_NOT_FOUND 
+from pecha_api.plans.response_message import BAD_REQUEST, TASK_NOT_FOUND, DUPLICATE_TASK_ORDER
+from pecha_api.plans.plans_ordering import update_positions, positions_are_unique, move_between
 
 
 def save_task(db: Session, new_task: PlanTask):
@@ -81,25 +82,64 @@ def get_tasks_by_plan_item_id(db: Session, plan_item_id: UUID) -> List[PlanTask]
     )
 
 
-def reorder_day_tasks_display_order(db: Session, tasks: List[PlanTask]):
+def reorder_day_tasks_display_order(db: Session, plan_item_id: UUID, positions: List[Tuple[UUID, int]]):
+    if not positions:
+        return
     try:
-        for task in tasks:
-            db.commit()
-            db.refresh(task)
+        update_positions(
+            db=db,
+            model=PlanTask,
+            order_column=PlanTask.display_order,
+            scope=PlanTask.plan_item_id == plan_item_id,
+            positions=positions
+        )
+        db.commit()
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump())
 
 def update_task_order(db: Session, day_id: UUID, update_task_orders: List[TaskOrderItem]) -> None:
+    scope = PlanTask.plan_item_id == day_id
     try:
-        db.execute(
-            update(PlanTask).where(PlanTask.plan_item_id == day_id).execution_options(synchronize_session=False),
-            update_task_orders
+        update_positions(
+            db=db,
+            model=PlanTask,
+            order_column=PlanTask.display_order,
+            scope=scope,
+            positions=[(task_order.id, task_order.display_order) for task_order in update_task_orders]
         )
-        db.commit()
+        # Checked after the update so positions kept by tasks outside the payload count too
+        unique = positions_are_unique(db=db, order_column=PlanTask.display_order, scope=scope)
+        if unique:
+            db.commit()
+        else:
+            db.rollback()
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump())
+    if not unique:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=DUPLICATE_TASK_ORDER).model_dump())
+
+def move_task(db: Session, task: PlanTask, after_task_id: Optional[UUID]) -> int:
+    try:
+        display_order = move_between(
+            db=db,
+            model=PlanTask,
+            order_column=PlanTask.display_order,
+            scope=PlanTask.plan_item_id == task.plan_item_id,
+            item_id=task.id,
+            after_id=after_task_id
+        )
+        if display_order is None:
+            db.rollback()
+        else:
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump())
+    if display_order is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ResponseError(error=BAD_REQUEST, message=TASK_NOT_FOUND).model_dump())
+    return display_order
 
 
 
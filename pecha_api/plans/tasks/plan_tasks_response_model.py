@@ -44,6 +44,13 @@ class UpdateTaskOrderRequest(BaseModel):
     
 class UpdatedTaskOrderResponse(BaseModel):
     updated_tasks: List[TaskOrderItem]
+
+class MoveTaskRequest(BaseModel):
+    after_task_id: Optional[UUID] = None
+
+class MovedTaskResponse(BaseModel):
+    task_id: UUID
+    display_order: int
     
 class GetTaskRequest(BaseModel):
     task_id: UUID
@@ -1,5 +1,5 @@
-from pecha_api.plans.tasks.plan_tasks_repository import save_task, get_task_by_id, delete_task, update_task_day, update_task_title, get_tasks_by_plan_item_id, reorder_day_tasks_display_order, update_task_order, get_tasks_by_plan_item_id
-from pecha_api.plans.tasks.plan_tasks_response_model import CreateTaskRequest, TaskDTO, UpdateTaskDayRequest, UpdatedTaskDayResponse, GetTaskResponse, UpdateTaskTitleRequest, UpdateTaskTitleResponse, ContentAndImageUrl, UpdateTaskOrderRequest, UpdatedTaskOrderResponse, TaskOrderItem
+from pecha_api.plans.tasks.plan_tasks_repository import save_task, get_task_by_id, delete_task, update_task_day, update_task_title, get_tasks_by_plan_item_id, reorder_day_tasks_display_order, update_task_order, get_tasks_by_plan_item_id, move_task
+from pecha_api.plans.tasks.plan_tasks_response_model import CreateTaskRequest, TaskDTO, UpdateTaskDayRequest, UpdatedTaskDayResponse, GetTaskResponse, UpdateTaskTitleRequest, UpdateTaskTitleResponse, ContentAndImageUrl, UpdateTaskOrderRequest, UpdatedTaskOrderResponse, TaskOrderItem, MoveTaskRequest, MovedTaskResponse
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import SubTaskDTO
 from pecha_api.plans.authors.plan_authors_service import validate_and_extract_author_details
 from uuid import UUID
@@ -17,6 +17,7 @@ from pecha_api.plans.auth.plan_auth_models import ResponseError
 from pecha_api.uploads.S3_utils import generate_presigned_access_url
 from pecha_api.config import get
 from pecha_api.plans.plans_enums import ContentType
+from pecha_api.plans.featured.featured_day_service import invalidate_featured_day_cache_of_days
 
 def _get_max_display_order(plan_item_id: UUID) -> int:
     with SessionLocal() as db:
@@ -41,6 +42,7 @@ async def create_new_task(token: str, create_task_request: CreateTaskRequest, pl
         )
 
     saved_task = save_task(db=db,new_task=new_task)
+    await invalidate_featured_day_cache_of_days(db=db, day_ids=[plan_item.id])
 
     return TaskDTO(
         id=saved_task.id,
@@ -59,6 +61,7 @@ async def delete_task_by_id(task_id: UUID, token: str):
         tasks = get_tasks_by_plan_item_id(db=db, plan_item_id=task.plan_item_id)
         if tasks:
             _reorder_sequentially(db=db, tasks=tasks)
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=[task.plan_item_id])
 
 async def change_task_day_service(token: str, task_id: UUID, update_task_request: UpdateTaskDayRequest) -> UpdatedTaskDayResponse:
     current_author = validate_and_extract_author_details(token=token)
@@ -72,6 +75,7 @@ async def change_task_day_service(token: str, task_id: UUID, update_task_request
             raise HTTPException(status_code=404, detail=ResponseError(error=BAD_REQUEST, message=PLAN_DAY_NOT_FOUND).model_dump())
         
         task = _get_author_task(db=db, task_id=task_id, current_author=current_author,is_admin=current_author.is_admin)
+        previous_day_id = task.plan_item_id
         task.plan_item_id = update_task_request.target_day_id
         task.display_order = display_order
 
@@ -79,6 +83,7 @@ async def change_task_day_service(token: str, task_id: UUID, update_task_request
             db=db, 
             updated_task=task
         )
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=[previous_day_id, task.plan_item_id])
 
         return UpdatedTaskDayResponse(
             task_id=task.id, 
@@ -96,6 +101,7 @@ async def update_task_title_service(token: str, task_id: UUID, update_request: U
 
         task.title = update_request.title
         updated_task = update_task_title(db=db, updated_task=task)
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=[updated_task.plan_item_id])
         
         return UpdateTaskTitleResponse(
             task_id=updated_task.id,
@@ -109,10 +115,22 @@ async def change_task_order_service(token: str, day_id: UUID, update_task_order_
     with SessionLocal() as db:
         _check_duplicate_task_order(update_task_orders=update_task_order_request.tasks)
         update_task_order(db=db, day_id=day_id, update_task_orders=update_task_order_request.tasks)
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=[day_id])
 
 
 
 
+async def move_task_service(token: str, task_id: UUID, move_task_request: MoveTaskRequest) -> MovedTaskResponse:
+    current_author = validate_and_extract_author_details(token=token)
+
+    with SessionLocal() as db:
+        task = _get_author_task(db=db, task_id=task_id, current_author=current_author,is_admin=current_author.is_admin)
+        display_order = move_task(db=db, task=task, after_task_id=move_task_request.after_task_id)
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=[task.plan_item_id])
+
+        return MovedTaskResponse(task_id=task_id, display_order=display_order)
+
+
 async def get_task_subtasks_service(task_id: UUID, token: str) -> GetTaskResponse:
     current_user = validate_and_extract_author_details(token=token)
 
@@ -154,16 +172,15 @@ def _generate_image_url_content_type(content_type: str, content: str) -> Content
 
 
 def _reorder_sequentially(db: SessionLocal(), tasks: List[PlanTask]):
-    
-    tasks_to_update: List[PlanTask] = []
-
-    for index, task in enumerate(tasks, start=1):
-        if task.display_order != index:
-            task.display_order = index
-            tasks_to_update.append(task)
-    
-    if tasks_to_update:
-        reorder_day_tasks_display_order(db=db, tasks=tasks_to_update)
+    # The loaded tasks are left untouched, so the commit does not flush them again row by row
+    positions = [
+        (task.id, index)
+        for index, task in enumerate(tasks, start=1)
+        if task.display_order != index
+    ]
+
+    if positions:
+        reorder_day_tasks_display_order(db=db, plan_item_id=tasks[0].plan_item_id, positions=positions)
 
 
 def _get_author_task(db: SessionLocal(), task_id: UUID, current_author: Author, is_admin: bool) -> PlanTask:
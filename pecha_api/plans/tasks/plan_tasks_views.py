@@ -3,8 +3,8 @@ from fastapi import APIRouter, Depends, Query
 from typing import Annotated
 from uuid import UUID
 from starlette import status
-from pecha_api.plans.tasks.plan_tasks_response_model import CreateTaskRequest, TaskDTO, UpdateTaskDayRequest, UpdatedTaskDayResponse, GetTaskResponse, UpdateTaskOrderRequest, UpdatedTaskOrderResponse, UpdateTaskTitleRequest, UpdateTaskTitleResponse
-from pecha_api.plans.tasks.plan_tasks_services import create_new_task, change_task_day_service, delete_task_by_id, get_task_subtasks_service, change_task_order_service, update_task_title_service
+from pecha_api.plans.tasks.plan_tasks_response_model import CreateTaskRequest, TaskDTO, UpdateTaskDayRequest, UpdatedTaskDayResponse, GetTaskResponse, UpdateTaskOrderRequest, UpdatedTaskOrderResponse, UpdateTaskTitleRequest, UpdateTaskTitleResponse, MoveTaskRequest, MovedTaskResponse
+from pecha_api.plans.tasks.plan_tasks_services import create_new_task, change_task_day_service, delete_task_by_id, get_task_subtasks_service, change_task_order_service, update_task_title_service, move_task_service
 
 oauth2_scheme = HTTPBearer()
 # Create router for plan endpoints
@@ -74,6 +74,18 @@ async def change_task_order(
         update_task_order_request=update_task_order_request,
     )
 
+@plans_router.patch("/{task_id}/position", response_model=MovedTaskResponse)
+async def move_task(
+    task_id: UUID,
+    authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
+    move_task_request: MoveTaskRequest,
+) -> MovedTaskResponse:
+    return await move_task_service(
+        token=authentication_credential.credentials,
+        task_id=task_id,
+        move_task_request=move_task_request,
+    )
+
 @plans_router.get("/{task_id}", response_model=GetTaskResponse)
 async def get_task(
     task_id: UUID,
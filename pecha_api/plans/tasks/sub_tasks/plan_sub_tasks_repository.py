@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -8,9 +8,10 @@ from sqlalchemy.orm import Session
 from starlette import status
 
 from pecha_api.plans.auth.plan_auth_models import ResponseError
-from pecha_api.plans.response_message import BAD_REQUEST
+from pecha_api.plans.response_message import BAD_REQUEST, SUBTASK_ORDER_FAILED, SUB_TASK_NOT_FOUND
+from pecha_api.plans.plans_ordering import update_positions, positions_are_unique, move_between
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
-from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import SubTaskDTO
+from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import SubTaskDTO, SubtaskOrderItem
 
 
 def get_max_display_order_for_sub_task(db: Session, task_id: UUID) -> int:
@@ -72,13 +73,47 @@ def update_sub_task_order(db: Session, sub_task: PlanSubTask) -> PlanSubTask:
     db.refresh(sub_task)
     return sub_task
 
-def update_sub_task_order_in_bulk_by_task_id(db: Session, sub_task_list: List[PlanSubTask], task_id: UUID) -> List[PlanSubTask]:
+def update_sub_task_order_in_bulk_by_task_id(db: Session, sub_task_list: List[SubtaskOrderItem], task_id: UUID) -> None:
+    scope = PlanSubTask.task_id == task_id
     try:
-        db.execute(update(PlanSubTask).where(PlanSubTask.task_id == task_id).execution_options(synchronize_session=False), sub_task_list)
-        db.commit()
+        update_positions(
+            db=db,
+            model=PlanSubTask,
+            order_column=PlanSubTask.display_order,
+            scope=scope,
+            positions=[(sub_task.id, sub_task.display_order) for sub_task in sub_task_list]
+        )
+        unique = positions_are_unique(db=db, order_column=PlanSubTask.display_order, scope=scope)
+        if unique:
+            db.commit()
+        else:
+            db.rollback()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump())
+    if not unique:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=SUBTASK_ORDER_FAILED).model_dump())
+
+def move_sub_task(db: Session, sub_task: PlanSubTask, after_sub_task_id: Optional[UUID]) -> int:
+    try:
+        display_order = move_between(
+            db=db,
+            model=PlanSubTask,
+            order_column=PlanSubTask.display_order,
+            scope=PlanSubTask.task_id == sub_task.task_id,
+            item_id=sub_task.id,
+            after_id=after_sub_task_id
+        )
+        if display_order is None:
+            db.rollback()
+        else:
+            db.commit()
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump())
+    if display_order is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ResponseError(error=BAD_REQUEST, message=SUB_TASK_NOT_FOUND).model_dump())
+    return display_order
 
 def update_sub_tasks(db: Session) -> None:
     db.commit()
\ No newline at end of file
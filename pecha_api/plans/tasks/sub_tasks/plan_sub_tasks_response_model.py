@@ -49,4 +49,12 @@ class UpdatedSubtaskOrderItem(BaseModel):
     display_order: int
 
 class SubTaskOrderResponse(BaseModel):
-    updated_subtasks: List[UpdatedSubtaskOrderItem]
\ No newline at end of file
+    updated_subtasks: List[UpdatedSubtaskOrderItem]
+
+class MoveSubTaskRequest(BaseModel):
+    task_id: UUID
+    after_sub_task_id: Optional[UUID] = None
+
+class MovedSubTaskResponse(BaseModel):
+    sub_task_id: UUID
+    display_order: int
\ No newline at end of file
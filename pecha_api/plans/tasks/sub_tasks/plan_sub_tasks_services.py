@@ -8,7 +8,7 @@ from pecha_api.db.database import SessionLocal
 from pecha_api.plans.tasks.plan_tasks_services import _get_author_task
 from pecha_api.plans.auth.plan_auth_models import ResponseError
 from pecha_api.plans.authors.plan_authors_service import validate_and_extract_author_details
-from pecha_api.plans.response_message import BAD_REQUEST, FORBIDDEN, UNAUTHORIZED_TASK_ACCESS, SUBTASK_ORDER_FAILED
+from pecha_api.plans.response_message import BAD_REQUEST, FORBIDDEN, UNAUTHORIZED_TASK_ACCESS, SUBTASK_ORDER_FAILED, SUB_TASK_NOT_FOUND
 from pecha_api.plans.tasks.plan_tasks_repository import get_task_by_id
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_repository import (
@@ -20,7 +20,8 @@ from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_repository import (
     update_sub_tasks_bulk,
     get_sub_task_by_id,
     update_sub_task_order,
-    update_sub_tasks
+    update_sub_tasks,
+    move_sub_task
 )
 
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import (
@@ -29,16 +30,19 @@ from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import (
     SubTaskResponse,
     UpdateSubTaskRequest,
     SubTaskOrderRequest,
-    SubTaskOrderResponse
+    SubTaskOrderResponse,
+    MoveSubTaskRequest,
+    MovedSubTaskResponse
 )
 from pecha_api.error_contants import ErrorConstants
 from pecha_api.plans.response_message import SUBTASK_ORDER_FAILED
+from pecha_api.plans.featured.featured_day_service import invalidate_featured_day_cache_of_days
 
 async def create_new_sub_tasks(token: str, create_task_request: SubTaskRequest) -> SubTaskResponse:
     current_author = validate_and_extract_author_details(token=token)
 
     with SessionLocal() as db:
-        _get_author_task(db=db, task_id=create_task_request.task_id, current_author=current_author,is_admin=current_author.is_admin)
+        task = _get_author_task(db=db, task_id=create_task_request.task_id, current_author=current_author,is_admin=current_author.is_admin)
 
         next_display_order = get_max_display_order_for_sub_task(db=db, task_id=create_task_request.task_id) + 1
 
@@ -57,6 +61,7 @@ async def create_new_sub_tasks(token: str, create_task_request: SubTaskRequest)
             )
 
         saved_sub_tasks = save_sub_tasks_bulk(db=db, sub_tasks=new_sub_tasks)
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=[task.plan_item_id])
         created_sub_tasks=[
                 SubTaskDTO(
                     id=item.id,
@@ -75,7 +80,7 @@ async def update_sub_task_by_task_id(token: str, update_sub_task_request: Update
     current_author = validate_and_extract_author_details(token=token)
 
     with SessionLocal() as db:
-        _get_author_task(db=db, task_id=update_sub_task_request.task_id, current_author=current_author,is_admin=current_author.is_admin)
+        task = _get_author_task(db=db, task_id=update_sub_task_request.task_id, current_author=current_author,is_admin=current_author.is_admin)
 
         existing_sub_tasks_to_update: List[SubTaskDTO] = [
             subtask for subtask in update_sub_task_request.sub_tasks if subtask.id is not None
@@ -105,6 +110,7 @@ async def update_sub_task_by_task_id(token: str, update_sub_task_request: Update
 
         if new_sub_tasks_to_create:
             save_sub_tasks_bulk(db=db, sub_tasks=new_sub_tasks_to_create)
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=[task.plan_item_id])
 
 
 async def change_subtask_order_service(token: str, task_id: UUID, update_subtask_order: SubTaskOrderRequest) -> None:
@@ -113,3 +119,17 @@ async def change_subtask_order_service(token: str, task_id: UUID, update_subtask
         task = _get_author_task(db=db, task_id=task_id, current_author=current_author,is_admin=current_author.is_admin)
         
         update_sub_task_order_in_bulk_by_task_id(db=db, sub_task_list=update_subtask_order.subtasks,task_id=task.id)
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=[task.plan_item_id])
+
+
+async def move_sub_task_service(token: str, sub_task_id: UUID, move_sub_task_request: MoveSubTaskRequest) -> MovedSubTaskResponse:
+    current_author = validate_and_extract_author_details(token=token)
+    with SessionLocal() as db:
+        task = _get_author_task(db=db, task_id=move_sub_task_request.task_id, current_author=current_author,is_admin=current_author.is_admin)
+        sub_task = get_sub_task_by_id(db=db, sub_task_id=sub_task_id, task_id=task.id)
+        if sub_task is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ResponseError(error=BAD_REQUEST, message=SUB_TASK_NOT_FOUND).model_dump())
+
+        display_order = move_sub_task(db=db, sub_task=sub_task, after_sub_task_id=move_sub_task_request.after_sub_task_id)
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=[task.plan_item_id])
+        return MovedSubTaskResponse(sub_task_id=sub_task_id, display_order=display_order)
@@ -4,8 +4,8 @@ from typing import Annotated
 from uuid import UUID
 from starlette import status
 
-from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import (SubTaskRequest, SubTaskResponse, UpdateSubTaskRequest, SubTaskOrderRequest, SubTaskOrderResponse)
-from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services import (create_new_sub_tasks, update_sub_task_by_task_id, change_subtask_order_service)
+from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import (SubTaskRequest, SubTaskResponse, UpdateSubTaskRequest, SubTaskOrderRequest, SubTaskOrderResponse, MoveSubTaskRequest, MovedSubTaskResponse)
+from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services import (create_new_sub_tasks, update_sub_task_by_task_id, change_subtask_order_service, move_sub_task_service)
 
 sub_tasks_router = APIRouter(
     prefix="/cms/sub-tasks",
@@ -44,4 +44,16 @@ async def change_subtask_order(
         token=authentication_credential.credentials,
         task_id=task_id,
         update_subtask_order=update_subtask_order_request,
-    )
\ No newline at end of file
+    )
+
+@sub_tasks_router.patch("/{sub_task_id}/position", response_model=MovedSubTaskResponse)
+async def move_sub_task(
+    sub_task_id: UUID,
+    authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
+    move_sub_task_request: MoveSubTaskRequest,
+):
+    return await move_sub_task_service(
+        token=authentication_credential.credentials,
+        sub_task_id=sub_task_id,
+        move_sub_task_request=move_sub_task_request,
+    )
@@ -1,12 +1,17 @@
 from typing import List, Set
 from uuid import UUID
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, exists, func
 from sqlalchemy.orm import Session
-from .plan_users_models import UserDayCompletion
+from .plan_users_models import UserDayCompletion, UserTaskCompletion, UserSubTaskCompletion
+from .plan_users_response_models import UserDayCompletionFlags
+from pecha_api.plans.tasks.plan_tasks_models import PlanTask
+from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
 from fastapi import HTTPException
 from starlette import status
 from pecha_api.plans.auth.plan_auth_models import ResponseError
 from pecha_api.plans.response_message import BAD_REQUEST
+from .plan_users_progress_repository import revert_day_completion_progress
 
 def save_user_day_completion(db: Session, user_day_completion: UserDayCompletion):
     try:
@@ -19,7 +24,9 @@ def save_user_day_completion(db: Session, user_day_completion: UserDayCompletion
 
 def delete_user_day_completion(db: Session, user_id: UUID, day_id: UUID) -> None:
     try:
-        db.query(UserDayCompletion).filter(UserDayCompletion.user_id == user_id, UserDayCompletion.day_id == day_id).delete()
+        deleted = db.query(UserDayCompletion).filter(UserDayCompletion.user_id == user_id, UserDayCompletion.day_id == day_id).delete()
+        if deleted:
+            revert_day_completion_progress(db=db, user_id=user_id, day_id=day_id)
         db.commit()
     except Exception as e:
         db.rollback()
@@ -28,6 +35,33 @@ def delete_user_day_completion(db: Session, user_id: UUID, day_id: UUID) -> None
 def get_user_day_completion_by_user_id_and_day_id(db: Session, user_id: UUID, day_id: UUID) -> UserDayCompletion:
     return db.query(UserDayCompletion).filter(UserDayCompletion.user_id == user_id, UserDayCompletion.day_id == day_id).first()
 
+def get_user_day_completion_flags(db: Session, user_id: UUID, day_id: UUID) -> UserDayCompletionFlags:
+    """The user's day, task and sub task completion state for one day in a single statement"""
+    completed_task_ids = (
+        select(func.array_agg(UserTaskCompletion.task_id))
+        .join(PlanTask, PlanTask.id == UserTaskCompletion.task_id)
+        .where(UserTaskCompletion.user_id == user_id, PlanTask.plan_item_id == day_id)
+        .scalar_subquery()
+    )
+    completed_sub_task_ids = (
+        select(func.array_agg(UserSubTaskCompletion.sub_task_id))
+        .join(PlanSubTask, PlanSubTask.id == UserSubTaskCompletion.sub_task_id)
+        .join(PlanTask, PlanTask.id == PlanSubTask.task_id)
+        .where(UserSubTaskCompletion.user_id == user_id, PlanTask.plan_item_id == day_id)
+        .scalar_subquery()
+    )
+    statement = select(
+        exists().where(UserDayCompletion.user_id == user_id, UserDayCompletion.day_id == day_id).label("day_completed"),
+        completed_task_ids.label("completed_task_ids"),
+        completed_sub_task_ids.label("completed_sub_task_ids")
+    )
+    row = db.execute(statement).one()
+    return UserDayCompletionFlags(
+        day_completed=bool(row.day_completed),
+        completed_task_ids=set(row.completed_task_ids or []),
+        completed_sub_task_ids=set(row.completed_sub_task_ids or [])
+    )
+
 def get_completed_day_ids_by_user_id_and_day_ids(db: Session, user_id: UUID, day_ids: List[UUID]) -> Set[UUID]:
     if not day_ids:
         return set()
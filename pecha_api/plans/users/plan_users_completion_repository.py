@@ -0,0 +1,182 @@
+from uuid import UUID
+from datetime import datetime, timezone, timedelta
+from sqlalchemy import select, exists, func, literal, case, and_, update, UUID as SqlUUID
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
+from fastapi import HTTPException
+from starlette import status
+from pecha_api.plans.auth.plan_auth_models import ResponseError
+from pecha_api.plans.response_message import BAD_REQUEST
+from pecha_api.plans.plans_models import Plan
+from pecha_api.plans.plans_enums import UserPlanStatus
+from pecha_api.plans.items.plan_items_models import PlanItem
+from pecha_api.plans.tasks.plan_tasks_models import PlanTask
+from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
+from .plan_users_models import UserPlanProgress, UserSubTaskCompletion, UserTaskCompletion, UserDayCompletion
+from .plan_users_response_models import CompletionCascadeResult
+
+# The whole subtask -> task -> day cascade runs as a single statement of data-modifying CTEs.
+# Every CTE reads the same snapshot, so "all children complete" checks exclude the child being
+# completed instead of relying on the row inserted a few CTEs earlier. A newly completed day also
+# advances the enrollment's counters and streak in the same statement.
+
+
+def _insert_completions(model, target_column, rows, user_id: UUID, name: str):
+    rows = rows.subquery()
+    return (
+        insert(model)
+        .from_select(
+            ["id", "user_id", target_column, "completed_at", "created_at"],
+            select(
+                func.gen_random_uuid(),
+                literal(user_id, SqlUUID(as_uuid=True)),
+                rows.c[0],
+                func.now(),
+                func.now()
+            )
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", target_column])
+        .returning(getattr(model, target_column))
+        .cte(name)
+    )
+
+
+def _pending_tasks_of_day(target, user_id: UUID):
+    other_task = aliased(PlanTask)
+    return exists().where(
+        other_task.plan_item_id == target.c.day_id,
+        other_task.id != target.c.task_id,
+        ~exists().where(
+            UserTaskCompletion.user_id == user_id,
+            UserTaskCompletion.task_id == other_task.id
+        )
+    )
+
+
+def _update_progress(day_completion, user_id: UUID):
+    # O(1) progress bookkeeping for the enrollment that owns a newly completed day
+    today = datetime.now(timezone.utc).date()
+    status_type = UserPlanProgress.status.type
+    streak_count = func.coalesce(UserPlanProgress.streak_count, 0)
+    new_streak = case(
+        (UserPlanProgress.last_completed_date == today, func.greatest(streak_count, 1)),
+        (UserPlanProgress.last_completed_date == today - timedelta(days=1), streak_count + 1),
+        else_=1
+    )
+    completed_days = UserPlanProgress.completed_days + 1
+    plan_completed = and_(Plan.total_days > 0, completed_days >= Plan.total_days)
+    return (
+        update(UserPlanProgress)
+        .where(
+            UserPlanProgress.user_id == user_id,
+            UserPlanProgress.plan_id == PlanItem.plan_id,
+            PlanItem.id == day_completion.c.day_id,
+            Plan.id == PlanItem.plan_id
+        )
+        .values(
+            completed_days=completed_days,
+            streak_count=new_streak,
+            longest_streak=func.greatest(func.coalesce(UserPlanProgress.longest_streak, 0), new_streak),
+            last_completed_date=today,
+            is_completed=plan_completed,
+            completed_at=case(
+                (plan_completed, func.coalesce(UserPlanProgress.completed_at, func.now())),
+                else_=UserPlanProgress.completed_at
+            ),
+            status=case(
+                (plan_completed, literal(UserPlanStatus.COMPLETED, status_type)),
+                (UserPlanProgress.status == UserPlanStatus.NOT_STARTED, literal(UserPlanStatus.ACTIVE, status_type)),
+                else_=UserPlanProgress.status
+            )
+        )
+        .returning(UserPlanProgress.id)
+        .cte("progress_update")
+    )
+
+
+def _execute_cascade(db: Session, user_id: UUID, target, sub_task_completion, task_completion, day_completion) -> CompletionCascadeResult:
+    progress_update = _update_progress(day_completion, user_id)
+    statement = select(
+        select(func.count()).select_from(target).scalar_subquery().label("found"),
+        select(func.count()).select_from(sub_task_completion).scalar_subquery().label("sub_tasks_completed"),
+        select(func.count()).select_from(task_completion).scalar_subquery().label("tasks_completed"),
+        select(day_completion.c.day_id).scalar_subquery().label("completed_day_id"),
+        select(func.count()).select_from(progress_update).scalar_subquery().label("progress_updated")
+    )
+    try:
+        row = db.execute(statement).one()
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump())
+    return CompletionCascadeResult(
+        found=row.found > 0,
+        sub_tasks_completed=row.sub_tasks_completed,
+        tasks_completed=row.tasks_completed,
+        completed_day_id=row.completed_day_id,
+        progress_updated=row.progress_updated > 0
+    )
+
+
+def complete_sub_task_cascade(db: Session, user_id: UUID, sub_task_id: UUID) -> CompletionCascadeResult:
+    target = (
+        select(
+            PlanSubTask.id.label("sub_task_id"),
+            PlanSubTask.task_id.label("task_id"),
+            PlanTask.plan_item_id.label("day_id")
+        )
+        .join(PlanTask, PlanTask.id == PlanSubTask.task_id)
+        .where(PlanSubTask.id == sub_task_id)
+        .cte("target")
+    )
+    other_sub_task = aliased(PlanSubTask)
+    pending_sub_tasks = exists().where(
+        other_sub_task.task_id == target.c.task_id,
+        other_sub_task.id != target.c.sub_task_id,
+        ~exists().where(
+            UserSubTaskCompletion.user_id == user_id,
+            UserSubTaskCompletion.sub_task_id == other_sub_task.id
+        )
+    )
+
+    sub_task_completion = _insert_completions(
+        UserSubTaskCompletion, "sub_task_id", select(target.c.sub_task_id), user_id, "sub_task_completion"
+    )
+    task_completion = _insert_completions(
+        UserTaskCompletion, "task_id", select(target.c.task_id).where(~pending_sub_tasks), user_id, "task_completion"
+    )
+    day_completion = _insert_completions(
+        UserDayCompletion,
+        "day_id",
+        select(target.c.day_id).where(~pending_sub_tasks, ~_pending_tasks_of_day(target, user_id)),
+        user_id,
+        "day_completion"
+    )
+    return _execute_cascade(db, user_id, target, sub_task_completion, task_completion, day_completion)
+
+
+def complete_task_cascade(db: Session, user_id: UUID, task_id: UUID) -> CompletionCascadeResult:
+    target = (
+        select(PlanTask.id.label("task_id"), PlanTask.plan_item_id.label("day_id"))
+        .where(PlanTask.id == task_id)
+        .cte("target")
+    )
+
+    sub_task_completion = _insert_completions(
+        UserSubTaskCompletion,
+        "sub_task_id",
+        select(PlanSubTask.id).join(target, PlanSubTask.task_id == target.c.task_id),
+        user_id,
+        "sub_task_completion"
+    )
+    task_completion = _insert_completions(
+        UserTaskCompletion, "task_id", select(target.c.task_id), user_id, "task_completion"
+    )
+    day_completion = _insert_completions(
+        UserDayCompletion,
+        "day_id",
+        select(target.c.day_id).where(~_pending_tasks_of_day(target, user_id)),
+        user_id,
+        "day_completion"
+    )
+    return _execute_cascade(db, user_id, target, sub_task_completion, task_completion, day_completion)
@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, DateTime, Boolean, Integer, Index, UniqueConstraint, UUID, ForeignKey
+from sqlalchemy import Column, DateTime, Date, Boolean, Integer, Index, UniqueConstraint, UUID, ForeignKey, text
 from uuid import uuid4
 from _datetime import datetime
 import _datetime
@@ -20,6 +20,8 @@ class UserPlanProgress(Base):
 
     streak_count = Column(Integer, default=0)
     longest_streak = Column(Integer, default=0)
+    completed_days = Column(Integer, server_default=text("0"), default=0, nullable=False)
+    last_completed_date = Column(Date, nullable=True)
 
     status = Column(UserPlanStatusEnum, default='ACTIVE')
     is_completed = Column(Boolean, default=False)
@@ -34,6 +36,7 @@ class UserPlanProgress(Base):
         UniqueConstraint("user_id", "plan_id", name="uq_user_plan_progress_user_plan"),
         Index("idx_user_progress_user_status", "user_id", "status"),
         Index("idx_user_progress_plan", "plan_id"),
+        Index("idx_user_progress_user_started", "user_id", "started_at", "id"),
     )
 
 
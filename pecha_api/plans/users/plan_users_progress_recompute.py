@@ -0,0 +1,21 @@
+import logging
+
+from pecha_api.db.database import SessionLocal
+from .plan_users_progress_repository import recompute_user_plan_progress
+
+
+def recompute_progress() -> int:
+    # Rebuild completed days, streaks and status of every enrollment from the completion tables
+    with SessionLocal() as db:
+        updated_progress = recompute_user_plan_progress(db=db)
+    logging.info(f"Recomputed progress of {updated_progress} enrollments")
+    return updated_progress
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    recompute_progress()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from uuid import UUID
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy import func, select, case, literal, text
 from pecha_api.plans.users.plan_users_response_models import EnrolledUserPlan
 from .plan_users_models import UserPlanProgress, UserTaskCompletion, UserDayCompletion, UserSubTaskCompletion
 from pecha_api.plans.plans_models import Plan
@@ -13,10 +13,14 @@ from pecha_api.plans.response_message import BAD_REQUEST
 from typing import List, Optional, Tuple
 from pecha_api.plans.tasks.plan_tasks_models import PlanTask
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
+from pecha_api.plans.cms.cms_plans_repository import increment_plan_subscription_count
+from pecha_api.plans.plans_enums import UserPlanStatus
+from pecha_api.plans.plans_pagination import keyset_filter
 
 def save_plan_progress(db: Session, plan_progress: EnrolledUserPlan):
     try:
         db.add(plan_progress)
+        increment_plan_subscription_count(db=db, plan_id=plan_progress.plan_id)
         db.commit()
         db.refresh(plan_progress)
     except IntegrityError as e:
@@ -31,6 +35,120 @@ def get_plan_progress_by_user_id_and_plan_id(db: Session, user_id: UUID, plan_id
     return db.query(UserPlanProgress).filter(UserPlanProgress.user_id == user_id, UserPlanProgress.plan_id == plan_id).first()
 
 
+def get_plan_progress_with_plan(db: Session, user_id: UUID, plan_id: UUID) -> Optional[Tuple[UserPlanProgress, Plan]]:
+    return (
+        db.query(UserPlanProgress, Plan)
+        .join(Plan, UserPlanProgress.plan_id == Plan.id)
+        .filter(UserPlanProgress.user_id == user_id, UserPlanProgress.plan_id == plan_id)
+        .first()
+    )
+
+
+def revert_day_completion_progress(db: Session, user_id: UUID, day_id: UUID) -> None:
+    """Step the enrollment back after one of its days lost its completion; the caller commits.
+
+    Streaks are left untouched, recompute_user_plan_progress rebuilds them exactly.
+    """
+    plan_id = select(PlanItem.plan_id).where(PlanItem.id == day_id).scalar_subquery()
+    db.query(UserPlanProgress).filter(
+        UserPlanProgress.user_id == user_id,
+        UserPlanProgress.plan_id == plan_id
+    ).update(
+        {
+            UserPlanProgress.completed_days: func.greatest(UserPlanProgress.completed_days - 1, 0),
+            UserPlanProgress.is_completed: False,
+            UserPlanProgress.completed_at: None,
+            UserPlanProgress.status: case(
+                (UserPlanProgress.status == UserPlanStatus.COMPLETED, literal(UserPlanStatus.ACTIVE, UserPlanProgress.status.type)),
+                else_=UserPlanProgress.status
+            )
+        },
+        synchronize_session=False
+    )
+
+
+# Rebuilds every enrollment's progress from user_day_completion. Streaks are runs of consecutive
+# UTC calendar days with at least one completed plan day (gaps-and-islands over distinct dates).
+RECOMPUTE_USER_PLAN_PROGRESS_SQL = text("""
+    WITH completion_dates AS (
+        SELECT DISTINCT completion.user_id, items.plan_id,
+               (completion.completed_at AT TIME ZONE 'UTC')::date AS completed_date
+        FROM user_day_completion AS completion
+        JOIN items ON items.id = completion.day_id
+    ),
+    streak_runs AS (
+        SELECT user_id, plan_id, COUNT(*) AS run_length, MAX(completed_date) AS run_end
+        FROM (
+            SELECT user_id, plan_id, completed_date,
+                   completed_date - (ROW_NUMBER() OVER (PARTITION BY user_id, plan_id ORDER BY completed_date))::int AS run_key
+            FROM completion_dates
+        ) AS keyed_dates
+        GROUP BY user_id, plan_id, run_key
+    ),
+    streaks AS (
+        SELECT DISTINCT ON (user_id, plan_id)
+               user_id, plan_id,
+               run_length AS streak_count,
+               run_end AS last_completed_date,
+               MAX(run_length) OVER (PARTITION BY user_id, plan_id) AS longest_streak
+        FROM streak_runs
+        ORDER BY user_id, plan_id, run_end DESC
+    ),
+    day_counts AS (
+        SELECT completion.user_id, items.plan_id,
+               COUNT(*) AS completed_days,
+               MAX(completion.completed_at) AS last_completed_at
+        FROM user_day_completion AS completion
+        JOIN items ON items.id = completion.day_id
+        GROUP BY completion.user_id, items.plan_id
+    ),
+    recomputed AS (
+        SELECT base.id,
+               COALESCE(day_counts.completed_days, 0) AS completed_days,
+               day_counts.last_completed_at,
+               COALESCE(streaks.streak_count, 0) AS streak_count,
+               COALESCE(streaks.longest_streak, 0) AS longest_streak,
+               streaks.last_completed_date,
+               plans.total_days > 0 AND COALESCE(day_counts.completed_days, 0) >= plans.total_days AS is_completed
+        FROM user_plan_progress AS base
+        JOIN plans ON plans.id = base.plan_id
+        LEFT JOIN day_counts ON day_counts.user_id = base.user_id AND day_counts.plan_id = base.plan_id
+        LEFT JOIN streaks ON streaks.user_id = base.user_id AND streaks.plan_id = base.plan_id
+    )
+    UPDATE user_plan_progress AS progress
+    SET completed_days = recomputed.completed_days,
+        streak_count = recomputed.streak_count,
+        longest_streak = recomputed.longest_streak,
+        last_completed_date = recomputed.last_completed_date,
+        is_completed = recomputed.is_completed,
+        completed_at = CASE
+            WHEN recomputed.is_completed THEN COALESCE(progress.completed_at, recomputed.last_completed_at)
+        END,
+        status = CASE
+            WHEN recomputed.is_completed THEN 'COMPLETED'
+            WHEN progress.status = 'COMPLETED' THEN 'ACTIVE'
+            WHEN progress.status = 'NOT_STARTED' AND recomputed.completed_days > 0 THEN 'ACTIVE'
+            ELSE progress.status
+        END
+    FROM recomputed
+    WHERE recomputed.id = progress.id
+""")
+
+
+def recompute_user_plan_progress(db: Session) -> int:
+    try:
+        result = db.execute(RECOMPUTE_USER_PLAN_PROGRESS_SQL)
+        db.commit()
+        return result.rowcount
+    except Exception as e:
+        db.rollback()
+        print(f"Error recomputing user plan progress: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ResponseError(error=BAD_REQUEST, message=str(e)).model_dump()
+        )
+
+
 def delete_user_plan_progress(db: Session, user_id: UUID, plan_id: UUID) -> None:
     
     plan_progress = db.query(UserPlanProgress).filter(
@@ -65,6 +183,7 @@ def delete_user_plan_progress(db: Session, user_id: UUID, plan_id: UUID) -> None
         ).delete(synchronize_session=False)
         
         db.delete(plan_progress)
+        increment_plan_subscription_count(db=db, plan_id=plan_id, amount=-1)
         db.commit()
     except IntegrityError as e:
         db.rollback()
@@ -73,25 +192,19 @@ def delete_user_plan_progress(db: Session, user_id: UUID, plan_id: UUID) -> None
             message=f"Database integrity error: {e.orig}").model_dump())
 
 
-def get_user_enrolled_plans_with_details(db: Session,user_id: UUID, status: Optional[str] = None,skip: int = 0, limit: int = 20,order_by_field = None,order_desc: bool = True
-) -> Tuple[List[Tuple[UserPlanProgress, Plan, int]], int]:
+def get_user_enrolled_plans_with_details(db: Session,user_id: UUID, status: Optional[str] = None,skip: int = 0, limit: int = 20,order_by_field = None,order_desc: bool = True,
+    after: Optional[Tuple] = None, count_total: bool = True
+) -> Tuple[List[Tuple[UserPlanProgress, Plan, int]], Optional[int]]:
 
     if order_by_field is None:
         order_by_field = UserPlanProgress.started_at
     
-    days_subquery = db.query(
-        PlanItem.plan_id,
-        func.count(PlanItem.id).label('total_days')
-    ).group_by(PlanItem.plan_id).subquery()
-    
     query = db.query(
         UserPlanProgress, 
         Plan, 
-        func.coalesce(days_subquery.c.total_days, 0).label('total_days')
+        Plan.total_days
     ).join(
         Plan, UserPlanProgress.plan_id == Plan.id
-    ).outerjoin(
-        days_subquery, Plan.id == days_subquery.c.plan_id
     ).filter(
         UserPlanProgress.user_id == user_id
     )
@@ -99,12 +212,16 @@ def get_user_enrolled_plans_with_details(db: Session,user_id: UUID, status: Opti
     if status:
         query = query.filter(UserPlanProgress.status == status)
     
-    total = query.count()
+    total = query.count() if count_total else None
+
+    if after is not None:
+        # Keyset mode: continue after the (order_by_field, id) of the previous page's last row
+        query = query.filter(keyset_filter((order_by_field, UserPlanProgress.id), after, descending=order_desc))
     
     if order_desc:
-        query = query.order_by(order_by_field.desc())
+        query = query.order_by(order_by_field.desc(), UserPlanProgress.id.desc())
     else:
-        query = query.order_by(order_by_field)
+        query = query.order_by(order_by_field, UserPlanProgress.id)
     
     results = query.offset(skip).limit(limit).all()
     
@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 from pydantic import BaseModel
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, date
 from pecha_api.plans.plans_enums import ContentType
 
 
@@ -29,11 +29,27 @@ class UserPlanProgressResponse(BaseModel):
     started_at: datetime
     streak_count: int
     longest_streak: int
+    completed_days: int = 0
+    total_days: int = 0
+    progress_percentage: float = 0.0
+    last_completed_date: Optional[date] = None
     status: str
     is_completed: bool
     completed_at: Optional[datetime] = None
     created_at: datetime
 
+class CompletionCascadeResult(BaseModel):
+    found: bool
+    sub_tasks_completed: int = 0
+    tasks_completed: int = 0
+    completed_day_id: Optional[UUID] = None
+    progress_updated: bool = False
+
+class UserDayCompletionFlags(BaseModel):
+    day_completed: bool = False
+    completed_task_ids: Set[UUID] = set()
+    completed_sub_task_ids: Set[UUID] = set()
+
 class EnrolledUserPlan(BaseModel):
     user_id: UUID
     plan_id: UUID
@@ -59,7 +75,8 @@ class UserPlansResponse(BaseModel):
     plans: List[UserPlanDTO]
     skip: int
     limit: int
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class UserPlanProgressUpdate(BaseModel):
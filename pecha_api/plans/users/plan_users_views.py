@@ -40,9 +40,10 @@ async def get_user_plans(
     authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
     status_filter: Optional[str] = Query(None, description="Filter by plan status"),
     skip: int = Query(0, ge=0),
-    limit: int = Query(20, ge=1, le=50)
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="Keyset pagination cursor: empty for the first page, then the previous page's next_cursor. Ignores skip and omits total")
 ):
-    return await get_user_enrolled_plans(token=authentication_credential.credentials,status_filter=status_filter,skip=skip,limit=limit)
+    return await get_user_enrolled_plans(token=authentication_credential.credentials,status_filter=status_filter,skip=skip,limit=limit,cursor=cursor)
 
 
 @user_progress_router.post("/plans", status_code=status.HTTP_204_NO_CONTENT)
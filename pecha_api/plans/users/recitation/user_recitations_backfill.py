@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from fastapi import FastAPI
+
+from pecha_api.db.database import SessionLocal
+from pecha_api.db.mongo_database import lifespan
+from pecha_api.texts.texts_repository import get_texts_by_ids
+from .user_recitations_repository import (
+    get_text_ids_without_title,
+    fill_user_recitations_text_details,
+    delete_user_recitations_by_text_ids
+)
+
+BACKFILL_BATCH_SIZE = 500
+
+
+async def backfill_user_recitation_titles(batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    # Store title and language on recitations saved before they were kept on the row.
+    # Recitations of texts that no longer exist are deleted, as deleting a text does today.
+    backfilled = 0
+    after = None
+    while True:
+        with SessionLocal() as db:
+            text_ids = get_text_ids_without_title(db=db, limit=batch_size, after=after)
+            if not text_ids:
+                return backfilled
+
+            texts = await get_texts_by_ids(text_ids=[str(text_id) for text_id in text_ids])
+            fill_user_recitations_text_details(
+                db=db,
+                text_details=[(UUID(text_id), text.title, text.language) for text_id, text in texts.items()]
+            )
+            delete_user_recitations_by_text_ids(
+                db=db,
+                text_ids=[text_id for text_id in text_ids if str(text_id) not in texts]
+            )
+
+        backfilled += len(text_ids)
+        after = text_ids[-1]
+        logging.info(f"Backfilled recitations of {backfilled} texts")
+
+
+async def _run_backfill_():
+    async with lifespan(FastAPI()):
+        await backfill_user_recitation_titles()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run_backfill_())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Index, UniqueConstraint, Integer
+from sqlalchemy import Column, Index, UniqueConstraint, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from uuid import uuid4
 from pecha_api.db.database import Base
@@ -11,9 +11,12 @@ class UserRecitations(Base):
     user_id = Column(UUID(as_uuid=True), nullable=False)
     text_id = Column(UUID(as_uuid=True), nullable=False)
     display_order = Column(Integer, nullable=False)
+    # Copied from the text so that listing a user's recitations needs no Mongo lookup
+    title = Column(String, nullable=True)
+    language = Column(String(10), nullable=True)
 
     __table_args__ = (
         UniqueConstraint("user_id", "text_id", name="uq_user_recitations_user_text"),
-        Index("idx_user_recitations_user_text_user", "user_id"),
+        Index("idx_user_recitations_user_order", "user_id", "display_order"),
         Index("idx_user_recitations_user_text_text", "text_id"),
     )
\ No newline at end of file
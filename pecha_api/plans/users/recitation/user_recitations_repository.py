@@ -1,12 +1,13 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
+from sqlalchemy import String, UUID as SqlUUID, column, delete, func, update, values
 from fastapi import HTTPException
 from starlette import status
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Sequence, Tuple
 from uuid import UUID
 from pecha_api.plans.auth.plan_auth_models import ResponseError
-from pecha_api.plans.response_message import BAD_REQUEST, NOT_FOUND
+from pecha_api.plans.plans_ordering import positions_are_unique, update_positions
+from pecha_api.plans.response_message import BAD_REQUEST, NOT_FOUND, DUPLICATE_RECITATION_ORDER, RECITATION_NOT_FOUND
 from pecha_api.plans.users.recitation.user_recitations_models import UserRecitations
 
 def save_user_recitation(db: Session, user_recitations: UserRecitations) -> None:
@@ -30,19 +31,92 @@ def get_max_display_order_for_user(db: Session, user_id: UUID) -> Optional[int]:
     return result
 
 def update_recitation_order_in_bulk(db: Session, user_id: UUID, recitation_updates: List[Dict]) -> None:
+    text_ids = [update["text_id"] for update in recitation_updates]
+    display_orders = [update["display_order"] for update in recitation_updates]
+    if len(set(text_ids)) != len(text_ids) or len(set(display_orders)) != len(display_orders):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=DUPLICATE_RECITATION_ORDER).model_dump())
+
+    scope = UserRecitations.user_id == user_id
     try:
-        for update in recitation_updates:
-            recitation = db.query(UserRecitations).filter(
-                UserRecitations.text_id == update["text_id"],
-                UserRecitations.user_id == user_id
-            ).first()           
-            if recitation:
-                recitation.display_order = update["display_order"]      
+        updated = update_positions(
+            db=db,
+            model=UserRecitations,
+            order_column=UserRecitations.display_order,
+            scope=scope,
+            positions=list(zip(text_ids, display_orders)),
+            key_column=UserRecitations.text_id
+        )
+        if updated != len(recitation_updates):
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ResponseError(error=NOT_FOUND, message=RECITATION_NOT_FOUND).model_dump())
+        # A partial reorder may collide with recitations that were left out of the request
+        if not positions_are_unique(db=db, order_column=UserRecitations.display_order, scope=scope):
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=DUPLICATE_RECITATION_ORDER).model_dump())
         db.commit()
     except IntegrityError as e:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,detail=ResponseError(error=BAD_REQUEST, message=str(e.orig)).model_dump())
-    return db.query(UserRecitations).filter(UserRecitations.user_id == user_id).all()
+
+def update_user_recitation_text_details(db: Session, text_id: UUID, title: str, language: Optional[str] = None) -> int:
+    values = {UserRecitations.title: title}
+    if language is not None:
+        values[UserRecitations.language] = language
+    result = db.execute(
+        update(UserRecitations)
+        .where(UserRecitations.text_id == text_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+def get_text_ids_without_title(db: Session, limit: int, after: Optional[UUID] = None) -> List[UUID]:
+    """Texts with recitations saved before titles were stored on the row, in text_id order after the given one"""
+    query = db.query(UserRecitations.text_id).filter(UserRecitations.title.is_(None))
+    if after is not None:
+        query = query.filter(UserRecitations.text_id > after)
+    rows = query.distinct().order_by(UserRecitations.text_id).limit(limit).all()
+    return [row[0] for row in rows]
+
+def fill_user_recitations_text_details(db: Session, text_details: Sequence[Tuple[UUID, str, Optional[str]]]) -> int:
+    """Apply (text_id, title, language) to the recitations of many texts in a single UPDATE ... FROM (VALUES ...)"""
+    if not text_details:
+        return 0
+    new_details = values(
+        column("text_id", SqlUUID(as_uuid=True)),
+        column("title", String),
+        column("language", String),
+        name="new_details"
+    ).data(list(text_details))
+    result = db.execute(
+        update(UserRecitations)
+        .where(UserRecitations.text_id == new_details.c.text_id)
+        .values({UserRecitations.title: new_details.c.title, UserRecitations.language: new_details.c.language})
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+def delete_user_recitations_by_text_ids(db: Session, text_ids: List[UUID]) -> int:
+    if not text_ids:
+        return 0
+    result = db.execute(
+        delete(UserRecitations)
+        .where(UserRecitations.text_id.in_(text_ids))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+def delete_user_recitations_by_text_id(db: Session, text_id: UUID) -> int:
+    result = db.execute(
+        delete(UserRecitations)
+        .where(UserRecitations.text_id == text_id)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
 
 def delete_user_recitation(db: Session, user_id: UUID, text_id: UUID) -> None:
     try:
@@ -1,7 +1,7 @@
 from uuid import UUID
+from typing import Optional
 from pecha_api.db.database import SessionLocal
 from pecha_api.texts.texts_utils import TextUtils
-from pecha_api.texts.texts_repository import get_texts_by_ids
 from pecha_api.users.users_service import validate_and_extract_user_details
 from pecha_api.plans.users.recitation.user_recitations_models import UserRecitations
 from pecha_api.plans.users.recitation.user_recitations_repository import (
@@ -9,6 +9,8 @@ from pecha_api.plans.users.recitation.user_recitations_repository import (
     get_user_recitations_by_user_id,
     get_max_display_order_for_user,
     update_recitation_order_in_bulk,
+    update_user_recitation_text_details,
+    delete_user_recitations_by_text_id,
     delete_user_recitation
 )
 from pecha_api.plans.users.recitation.user_recitations_response_models import (
@@ -21,15 +23,17 @@ from pecha_api.plans.users.recitation.user_recitations_response_models import (
 async def create_user_recitation_service(token: str, create_user_recitation_request: CreateUserRecitationRequest) -> None:
     current_user=validate_and_extract_user_details(token=token)
     with SessionLocal() as db:
-        await TextUtils.validate_text_exists(text_id=str(create_user_recitation_request.text_id))
-        
+        text_details = await TextUtils.get_text_details_by_id(text_id=str(create_user_recitation_request.text_id))
+
         max_order = get_max_display_order_for_user(db=db, user_id=current_user.id)
         next_order = (max_order or 0) + 1
         
         new_user_recitations = UserRecitations(
             user_id=current_user.id,
             text_id=create_user_recitation_request.text_id,
-            display_order=next_order
+            display_order=next_order,
+            title=text_details.title,
+            language=text_details.language
         )
         save_user_recitation(db=db, user_recitations=new_user_recitations)
 
@@ -43,20 +47,18 @@ async def get_user_recitations_service(token: str) -> UserRecitationsResponse:
         if not user_recitations:
             return UserRecitationsResponse(recitations=[])
         
-        text_ids = [str(recitation.text_id) for recitation in user_recitations]
-        texts_dict = await get_texts_by_ids(text_ids=text_ids)
-        
+        # Rows without a title are filled by backfill-user-recitation-titles; until then they are left out
         recitations_dto = [
             UserRecitationDTO(
-                title=texts_dict[str(recitation.text_id)].title, 
+                title=recitation.title,
                 text_id=recitation.text_id,
-                language=texts_dict[str(recitation.text_id)].language,
+                language=recitation.language,
                 display_order=recitation.display_order
             )
             for recitation in user_recitations
-            if str(recitation.text_id) in texts_dict
+            if recitation.title is not None
         ]
-        
+
         return UserRecitationsResponse(recitations=recitations_dto)
 
 async def update_recitation_order_service(token: str, update_order_request: UpdateRecitationOrderRequest) -> None:
@@ -74,3 +76,13 @@ async def delete_user_recitation_service(token: str, text_id: UUID) -> None:
 
     with SessionLocal() as db:
         delete_user_recitation(db=db, user_id=current_user.id, text_id=text_id)
+
+
+def refresh_user_recitation_text_details(text_id: str, title: str, language: Optional[str] = None) -> None:
+    with SessionLocal() as db:
+        update_user_recitation_text_details(db=db, text_id=UUID(text_id), title=title, language=language)
+
+
+def delete_user_recitations_of_text(text_id: str) -> None:
+    with SessionLocal() as db:
+        delete_user_recitations_by_text_id(db=db, text_id=UUID(text_id))
@@ -0,0 +1,66 @@
+import time
+from typing import Dict, Optional, Tuple
+
+from pecha_api import config
+from pecha_api.utils import Utils
+from pecha_api.cache.cache_repository import (
+    get_cache_data,
+    set_cache,
+    delete_cache
+)
+from pecha_api.cache.cache_enums import CacheType
+from pecha_api.texts.texts_enums import TextLanguage
+from .recitations_response_models import RecitationCatalogSnapshot
+
+# Only these catalogs are cached, so that delete_recitation_catalog_cache can reach every cached one
+_CATALOG_LANGUAGES = {language.value for language in TextLanguage}
+
+# language -> (snapshot, local_until); keeps the snapshot and its search index in this process between requests
+_local_recitation_catalogs: Dict[str, Tuple[RecitationCatalogSnapshot, float]] = {}
+
+
+def _recitation_catalog_hash_key(language: str) -> str:
+    payload = [language, CacheType.RECITATION_CATALOG]
+    return Utils.generate_hash_key(payload=payload)
+
+
+def _remember_recitation_catalog(language: str, snapshot: RecitationCatalogSnapshot) -> None:
+    _local_recitation_catalogs[language] = (snapshot, time.monotonic() + config.get_int("RECITATION_CATALOG_LOCAL_TTL_IN_SEC"))
+
+
+async def get_recitation_catalog_cache(language: str) -> Optional[RecitationCatalogSnapshot]:
+    """Get the recitation catalog of a language, from this process first and Redis second."""
+    if language not in _CATALOG_LANGUAGES:
+        return None
+    local = _local_recitation_catalogs.get(language)
+    if local is not None and local[1] > time.monotonic():
+        return local[0]
+    cache_data = await get_cache_data(hash_key=_recitation_catalog_hash_key(language=language))
+    if cache_data and isinstance(cache_data, dict):
+        snapshot = RecitationCatalogSnapshot(**cache_data)
+        _remember_recitation_catalog(language=language, snapshot=snapshot)
+        return snapshot
+    return None
+
+
+async def set_recitation_catalog_cache(language: str, data: RecitationCatalogSnapshot):
+    """Set the recitation catalog of a language in this process and in Redis."""
+    if language not in _CATALOG_LANGUAGES:
+        return
+    _remember_recitation_catalog(language=language, snapshot=data)
+    await set_cache(
+        hash_key=_recitation_catalog_hash_key(language=language),
+        value=data,
+        cache_time_out=config.get_int("CACHE_RECITATION_CATALOG_TIMEOUT")
+    )
+
+
+async def delete_recitation_catalog_cache():
+    """Drop the recitation catalogs of every language; other workers keep theirs for at most the local TTL."""
+    _local_recitation_catalogs.clear()
+    for language in _CATALOG_LANGUAGES:
+        await delete_cache(hash_key=_recitation_catalog_hash_key(language=language))
+
+
+def clear_local_recitation_catalogs() -> None:
+    _local_recitation_catalogs.clear()
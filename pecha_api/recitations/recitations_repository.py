@@ -1,12 +1,43 @@
-from typing import List, Tuple, Optional
-from pecha_api.recitations.recitations_response_models import RecitationDTO
-
-def apply_search_recitation_title_filter(texts: List[RecitationDTO], search: Optional[str]) -> List[RecitationDTO]:
-    filtered_texts = []
-    for text in texts:
-        if search:
-            if search.lower() in text.title.lower():
-                filtered_texts.append(text)
-        else:
-            filtered_texts.append(text)
-    return filtered_texts
\ No newline at end of file
+import unicodedata
+from typing import Dict, List, Optional, Set
+
+from pecha_api.recitations.recitations_response_models import RecitationCatalogEntry, RecitationCatalogSnapshot
+
+SEARCH_NGRAM_SIZE = 3
+
+
+def normalize_search_key(value: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", value).casefold().split())
+
+
+def _ngrams_(value: str) -> Set[str]:
+    return {value[index:index + SEARCH_NGRAM_SIZE] for index in range(len(value) - SEARCH_NGRAM_SIZE + 1)}
+
+
+def build_recitation_search_index(recitations: List[RecitationCatalogEntry]) -> Dict[str, Set[int]]:
+    """Trigram -> positions of the catalog entries whose search key contains it"""
+    search_index: Dict[str, Set[int]] = {}
+    for position, recitation in enumerate(recitations):
+        for ngram in _ngrams_(recitation.search_key):
+            search_index.setdefault(ngram, set()).add(position)
+    return search_index
+
+
+def search_recitation_catalog(snapshot: RecitationCatalogSnapshot, search: Optional[str]) -> List[RecitationCatalogEntry]:
+    """Catalog entries whose title contains the search, in catalog order"""
+    search_key = normalize_search_key(search) if search else ""
+    if not search_key:
+        return list(snapshot.recitations)
+    if len(search_key) < SEARCH_NGRAM_SIZE:
+        return [recitation for recitation in snapshot.recitations if search_key in recitation.search_key]
+
+    if snapshot._search_index is None:
+        snapshot._search_index = build_recitation_search_index(recitations=snapshot.recitations)
+    postings = [snapshot._search_index.get(ngram, set()) for ngram in _ngrams_(search_key)]
+    candidates = set.intersection(*sorted(postings, key=len))
+    # Every trigram matching does not make a substring match, so candidates are checked against the key
+    return [
+        snapshot.recitations[position]
+        for position in sorted(candidates)
+        if search_key in snapshot.recitations[position].search_key
+    ]
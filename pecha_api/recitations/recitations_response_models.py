@@ -1,5 +1,5 @@
-from typing import List, Dict
-from pydantic import BaseModel, Field
+from typing import List, Dict, Optional, Set
+from pydantic import BaseModel, Field, PrivateAttr
 from uuid import UUID
 
 class RecitationDTO(BaseModel):
@@ -9,6 +9,17 @@ class RecitationDTO(BaseModel):
 class RecitationsResponse(BaseModel):
     recitations: List[RecitationDTO]
 
+class RecitationCatalogEntry(BaseModel):
+    text_id: UUID
+    title: str
+    search_key: str
+
+class RecitationCatalogSnapshot(BaseModel):
+    language: str
+    recitations: List[RecitationCatalogEntry] = []
+    # Built on first search in each process; not part of the cached payload
+    _search_index: Optional[Dict[str, Set[int]]] = PrivateAttr(default=None)
+
 class RecitationDetailsRequest(BaseModel):
     language: str
     recitation: List[str]
@@ -25,6 +36,8 @@ class RecitationSegment(BaseModel):
     translations: Dict[str, Segment] = Field(default_factory=dict)
     transliterations: Dict[str, Segment] = Field(default_factory=dict)
     adaptations: Dict[str, Segment] = Field(default_factory=dict)
+    # Stored phonetics of the Tibetan root segment, if it has been converted
+    phonetics: Optional[str] = None
 
 class RecitationDetailsResponse(BaseModel):
     text_id: UUID
@@ -3,7 +3,8 @@ from pecha_api.texts.texts_enums import TextType
 from typing import List, Dict, Union,Optional
 from pecha_api.collections.collections_repository import get_all_collections_by_parent, get_collection_id_by_slug
 from pecha_api.collections.collections_service import get_collection
-from pecha_api.recitations.recitations_repository import apply_search_recitation_title_filter
+from pecha_api.recitations.recitations_repository import normalize_search_key, search_recitation_catalog
+from pecha_api.recitations.recitations_cache_service import get_recitation_catalog_cache, set_recitation_catalog_cache
 from pecha_api.recitations.recitations_response_models import RecitationDTO, RecitationsResponse
 from pecha_api.texts.texts_repository import get_all_texts_by_collection
 from pecha_api.texts.texts_service import get_root_text_by_collection_id
@@ -15,7 +16,7 @@ from pecha_api.error_contants import ErrorConstants
 from pecha_api.texts.texts_utils import TextUtils
 from pecha_api.texts.texts_response_models import TextDTO, TableOfContent
 from pecha_api.texts.texts_repository import get_contents_by_id, get_all_texts_by_group_id
-from pecha_api.texts.segments.segments_service import get_segment_by_id, get_related_mapped_segments, get_segment_details_by_id
+from pecha_api.texts.segments.segments_service import get_segments_by_ids, get_related_mapped_segments_by_parent_ids
 from pecha_api.texts.segments.segments_utils import SegmentUtils
 from pecha_api.texts.segments.segments_response_models import SegmentTranslation, SegmentTransliteration, SegmentAdaptation, SegmentRecitation
 from pecha_api.texts.segments.segments_response_models import SegmentDTO
@@ -26,18 +27,42 @@ from pecha_api.recitations.recitations_response_models import (
     RecitationDetailsResponse,
     Segment,
     RecitationSegment,  
-    RecitationsResponse
+    RecitationsResponse,
+    RecitationCatalogEntry,
+    RecitationCatalogSnapshot
 )
 
-async def get_list_of_recitations_service(search: Optional[str] = None, language: str = "en") -> RecitationsResponse:
+async def refresh_recitation_catalog(language: str) -> RecitationCatalogSnapshot:
+    """Rebuild the recitation catalog of a language from the Liturgy collection and cache it"""
     collection_id = await get_collection_id_by_slug(slug="Liturgy")
     if collection_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.COLLECTION_NOT_FOUND)
-    
+
     recitation_list_text_response: RecitationsResponse = await get_root_text_by_collection_id(collection_id=collection_id, language=language)
+    snapshot = RecitationCatalogSnapshot(
+        language=language,
+        recitations=[
+            RecitationCatalogEntry(text_id=recitation.text_id, title=recitation.title, search_key=normalize_search_key(recitation.title))
+            for recitation in recitation_list_text_response.recitations
+        ]
+    )
+    await set_recitation_catalog_cache(language=language, data=snapshot)
+    return snapshot
 
-    serched_texts=apply_search_recitation_title_filter(texts=recitation_list_text_response.recitations, search=search)
-    return RecitationsResponse(recitations=serched_texts)
+
+async def get_recitation_catalog(language: str) -> RecitationCatalogSnapshot:
+    snapshot = await get_recitation_catalog_cache(language=language)
+    if snapshot is None:
+        snapshot = await refresh_recitation_catalog(language=language)
+    return snapshot
+
+
+async def get_list_of_recitations_service(search: Optional[str] = None, language: str = "en") -> RecitationsResponse:
+    snapshot = await get_recitation_catalog(language=language)
+    recitations = search_recitation_catalog(snapshot=snapshot, search=search)
+    return RecitationsResponse(
+        recitations=[RecitationDTO(text_id=recitation.text_id, title=recitation.title) for recitation in recitations]
+    )
 
 
 async def get_recitation_details_service(text_id: str, recitation_details_request: RecitationDetailsRequest) -> RecitationDetailsResponse:
@@ -69,49 +94,41 @@ async def get_text_details_by_text_id(text_id: str) -> TextDTO:
     return await TextUtils.get_text_detail_by_id(text_id=text_id)
 
 
-async def segments_mapping_by_toc(table_of_contents: List[TableOfContent], recitation_details_request: RecitationDetailsRequest) -> List[Segment]:
-    filter_mapped_segments = []
-    for table_of_content in table_of_contents:
-        section = table_of_content.sections[0]
-
-        for segment in section.segments:
-            recitation_segment = RecitationSegment()
-            mapped_segments = []
-            segment_details = await get_segment_details_by_id(segment_id=segment.segment_id, text_details=True)
-            segment_model = SegmentDTO(
-                id=segment_details.id,
-                text_id=segment_details.text_id,
-                content=segment_details.content,
-                mapping=segment_details.mapping,
-                type=segment_details.type
+async def segments_mapping_by_toc(table_of_contents: List[TableOfContent], recitation_details_request: RecitationDetailsRequest) -> List[RecitationSegment]:
+    segment_ids = [
+        segment.segment_id
+        for table_of_content in table_of_contents
+        for segment in table_of_content.sections[0].segments
+    ]
+    if not segment_ids:
+        return []
+
+    # Root segments, their mappings and the texts of both are each loaded once for the whole TOC
+    root_segments: Dict[str, SegmentDTO] = await get_segments_by_ids(segment_ids=segment_ids)
+    if any(segment_id not in root_segments for segment_id in segment_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.SEGMENT_NOT_FOUND_MESSAGE)
+    related_segments = await get_related_mapped_segments_by_parent_ids(parent_segment_ids=segment_ids)
+
+    text_ids = list(dict.fromkeys(
+        [segment.text_id for segment in root_segments.values()]
+        + [segment.text_id for segments in related_segments.values() for segment in segments]
+    ))
+    text_details_dict: Dict[str, TextDTO] = await TextUtils.get_text_details_by_ids(text_ids=text_ids)
+
+    recitation_segments = []
+    for segment_id in segment_ids:
+        mapped_segments = [*related_segments.get(segment_id, []), root_segments[segment_id]]
+        versions = SegmentUtils.filter_version_segments(segments=mapped_segments, text_details_dict=text_details_dict)
+        recitation_segments.append(
+            RecitationSegment(
+                recitation=filter_by_type_and_language(type=RecitationListTextType.RECITATIONS.value, segments=versions, languages=recitation_details_request.recitation),
+                translations=filter_by_type_and_language(type=RecitationListTextType.TRANSLATIONS.value, segments=versions, languages=recitation_details_request.translations),
+                transliterations=filter_by_type_and_language(type=RecitationListTextType.TRANSLITERATIONS.value, segments=versions, languages=recitation_details_request.transliterations),
+                adaptations=filter_by_type_and_language(type=RecitationListTextType.ADAPTATIONS.value, segments=versions, languages=recitation_details_request.adaptations),
+                phonetics=root_segments[segment_id].phonetics
             )
-            
-            mapped_segments = await get_related_mapped_segments(parent_segment_id=segment.segment_id)
-            mapped_segments.append(segment_model)
-            
-            recitations = await SegmentUtils.filter_segment_mapping_by_type_or_text_id(segments=mapped_segments, type= TextType.VERSION.value)
-            translations = await SegmentUtils.filter_segment_mapping_by_type_or_text_id(segments=mapped_segments, type= TextType.VERSION.value)
-            transliterations = await SegmentUtils.filter_segment_mapping_by_type_or_text_id(segments=mapped_segments, type=TextType.VERSION.value)
-            adaptations = await SegmentUtils.filter_segment_mapping_by_type_or_text_id(segments=mapped_segments, type=TextType.VERSION.value)
-
-
-            for type, segments, langs in [
-                (RecitationListTextType.RECITATIONS.value, recitations, recitation_details_request.recitation),
-                (RecitationListTextType.TRANSLATIONS.value, translations, recitation_details_request.translations),
-                (RecitationListTextType.TRANSLITERATIONS.value, transliterations, recitation_details_request.transliterations),
-                (RecitationListTextType.ADAPTATIONS.value, adaptations, recitation_details_request.adaptations),
-            ]:
-                if type == RecitationListTextType.RECITATIONS.value:
-                    recitation_segment.recitation = filter_by_type_and_language(type=type, segments=segments, languages=langs)
-                elif type == RecitationListTextType.TRANSLATIONS.value:
-                    recitation_segment.translations = filter_by_type_and_language(type=type, segments=segments, languages=langs)
-                elif type == RecitationListTextType.TRANSLITERATIONS.value:
-                    recitation_segment.transliterations = filter_by_type_and_language(type=type, segments=segments, languages=langs)
-                elif type == RecitationListTextType.ADAPTATIONS.value:
-                    recitation_segment.adaptations = filter_by_type_and_language(type=type, segments=segments, languages=langs)
-           
-            filter_mapped_segments.append(recitation_segment)
-    return filter_mapped_segments
+        )
+    return recitation_segments
 
 def filter_by_type_and_language(type:str,segments: List[Union[SegmentRecitation, SegmentTranslation, SegmentTransliteration, SegmentAdaptation]],languages: List[str]) -> Dict[str, Segment]:
     filtered_segments = {
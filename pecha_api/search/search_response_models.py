@@ -23,13 +23,34 @@ class SourceResultItem(BaseModel):
 class SheetResultItem(BaseModel):
     sheet_title: str
     sheet_summary: str
-    publisher_id: int
-    sheet_id: int
+    publisher_id: Optional[str] = None
+    sheet_id: str
     publisher_name: str
-    publisher_url: str
-    publisher_image: str
-    publisher_position: str
-    publisher_organization: str
+    publisher_username: Optional[str] = None
+    publisher_url: Optional[str] = None
+    publisher_image: Optional[str] = None
+    publisher_position: Optional[str] = None
+    publisher_organization: Optional[str] = None
+    published_date: Optional[str] = None
+    language: Optional[str] = None
+    highlights: List[str] = []
+
+class SheetIndex(BaseModel):
+    """Document stored in the sheet search index"""
+    id: str
+    title: str
+    summary: str
+    content: List[str] = []
+    language: Optional[str] = None
+    is_published: bool
+    published_by: str
+    published_date: Optional[str] = None
+    publisher_id: Optional[str] = None
+    publisher_name: str
+    publisher_username: Optional[str] = None
+    publisher_position: Optional[str] = None
+    publisher_organization: Optional[str] = None
+    publisher_avatar_key: Optional[str] = None
 
 class SearchResponse(BaseModel):
     search: Search
@@ -38,6 +59,7 @@ class SearchResponse(BaseModel):
     skip: int
     limit: int
     total: int
+    next_cursor: Optional[str] = None
 
 class ExternalSegmentEntity(BaseModel):
     """Entity from external multilingual search API"""
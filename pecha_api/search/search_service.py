@@ -1,13 +1,20 @@
+import base64
+import json
 from elastic_transport import ObjectApiResponse
+from elasticsearch import NotFoundError
+from fastapi import HTTPException
+from starlette import status
+from pecha_api.error_contants import ErrorConstants
 from pecha_api.plans.response_message import NO_SEGMENTATION_IDS_RETURNED, PECHA_SEGMENT_NOT_FOUND
 from .search_enums import SearchType
 from .search_client import search_client
-from pecha_api.config import get
+from pecha_api.config import get, get_int
 from typing import List, Dict, Optional
 from pecha_api.texts.segments.segments_models import Segment
 from pecha_api.texts.texts_models import Text
 from pecha_api.config import get
 from pecha_api.http_message_utils import handle_http_status_error, handle_request_error
+from pecha_api.uploads.S3_utils import generate_presigned_access_url
 import httpx
 import logging
 from .search_response_models import (
@@ -17,6 +24,7 @@ from .search_response_models import (
     SourceResultItem,
     Search,
     SheetResultItem,
+    SheetIndex,
     ExternalSearchResponse,
     MultilingualSegmentMatch,
     MultilingualSourceResult,
@@ -25,21 +33,47 @@ from .search_response_models import (
 
 logger = logging.getLogger(__name__)
 
-MAX_SEARCH_LIMIT = 30
-
-async def get_search_results(query: str, search_type: SearchType, text_id: str = None, skip: int = 0, limit: int = 10) -> SearchResponse:
+SEARCH_PIT_KEEP_ALIVE = "1m"
+MAX_SEGMENTS_PER_TEXT = 5
+SEGMENT_SOURCE_FIELDS = ["id", "text_id", "text.title", "text.language", "text.published_date"]
+SEGMENT_HIGHLIGHT_FRAGMENT_SIZE = 150
+SEGMENT_HIGHLIGHT = {
+    "fields": {
+        "content": {
+            "fragment_size": SEGMENT_HIGHLIGHT_FRAGMENT_SIZE,
+            "number_of_fragments": 1,
+            "no_match_size": SEGMENT_HIGHLIGHT_FRAGMENT_SIZE
+        }
+    }
+}
+
+SHEET_SEARCH_FIELDS = ["title^3", "summary^2", "content"]
+SHEET_HIGHLIGHT_FRAGMENT_SIZE = 150
+SHEET_HIGHLIGHT_FRAGMENTS = 3
+
+async def get_search_results(
+        query: str,
+        search_type: SearchType,
+        text_id: str = None,
+        published_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 10
+) -> SearchResponse:
 
     if SearchType.SOURCE == search_type:
         response: SearchResponse = await _source_search(
             query=query,
             text_id=text_id,
+            cursor=cursor,
             skip=skip,
             limit=limit
         )
 
     elif SearchType.SHEET == search_type:
-        response: SearchResponse = _sheet_search(
+        response: SearchResponse = await _sheet_search(
             query=query,
+            published_by=published_by,
             skip=skip,
             limit=limit
         )
@@ -51,30 +85,95 @@ async def _source_search(
         query: str, 
         text_id: str, 
         skip: int, 
-        limit: int
+        limit: int,
+        cursor: Optional[str] = None
 ) -> SearchResponse:
     client = search_client()
+    if not text_id:
+        # Cross-text results are collapsed on text_id and paged with from/size, which has no cursor
+        # and cannot reach past the index's result window.
+        if cursor:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ErrorConstants.SEARCH_CURSOR_REQUIRES_TEXT_MESSAGE)
+        if skip + limit > get_int("ELASTICSEARCH_MAX_RESULT_WINDOW"):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ErrorConstants.SEARCH_RESULT_WINDOW_EXCEEDED_MESSAGE)
+        search_query = _generate_search_query(
+            query=query,
+            text_id=text_id,
+            skip=skip,
+            limit=limit
+        )
+        query_response: ObjectApiResponse = await client.search(
+            index=get("ELASTICSEARCH_SEGMENT_INDEX"),
+            **search_query
+        )
+        return _process_source_search_response(query, query_response, skip, limit)
+
+    # Within a single text the segments are paged with search_after over a point in time,
+    # so deep pages cost the same as the first one.
+    if cursor:
+        pit_id, search_after = _decode_search_cursor_(cursor=cursor)
+    else:
+        pit_response = await client.open_point_in_time(
+            index=get("ELASTICSEARCH_SEGMENT_INDEX"),
+            keep_alive=SEARCH_PIT_KEEP_ALIVE
+        )
+        pit_id, search_after = pit_response["id"], None
     search_query = _generate_search_query(
         query=query,
         text_id=text_id,
         skip=skip,
-        limit=limit
-    )
-    query_response: ObjectApiResponse = await client.search(
-        index=get("ELASTICSEARCH_SEGMENT_INDEX"),
-        **search_query
+        limit=limit,
+        pit_id=pit_id,
+        search_after=search_after
     )
+    try:
+        query_response: ObjectApiResponse = await client.search(**search_query)
+    except NotFoundError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ErrorConstants.INVALID_SEARCH_CURSOR_MESSAGE)
     search_response: SearchResponse = _process_source_search_response(
         query, 
         query_response, 
         skip, 
         limit)
+    hits = query_response["hits"]["hits"]
+    pit_id = query_response.get("pit_id", pit_id)
+    if len(hits) == limit:
+        search_response.next_cursor = _encode_search_cursor_(
+            pit_id=pit_id,
+            search_after=hits[-1]["sort"]
+        )
+    else:
+        # No page follows, so release the search context instead of letting it live out its keep_alive
+        await _close_point_in_time_(client=client, pit_id=pit_id)
     return search_response
 
 
+async def _close_point_in_time_(client, pit_id: str) -> None:
+    try:
+        await client.close_point_in_time(id=pit_id)
+    except Exception:
+        logger.error("Failed to close search point in time", exc_info=True)
+
+
+def _encode_search_cursor_(pit_id: str, search_after: list) -> str:
+    payload = json.dumps({"pit_id": pit_id, "search_after": search_after})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_search_cursor_(cursor: str) -> tuple[str, list]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        return payload["pit_id"], payload["search_after"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ErrorConstants.INVALID_SEARCH_CURSOR_MESSAGE)
+
+
 def _process_source_search_response(query: str, search_response: ObjectApiResponse, skip: int, limit: int) -> SearchResponse:
     hits = search_response["hits"]["hits"]
     total = search_response["hits"]["total"]["value"] if "total" in search_response["hits"] else 0
+    aggregations = search_response.get("aggregations") or {}
+    if "text_count" in aggregations:
+        total = aggregations["text_count"]["value"]
     source_dict, text_dict = _group_sources_by_text_id(hits=hits)
     sources: List[SourceResultItem] = _get_source_result_items_(text_dict=text_dict, source_dict=source_dict)
     return SearchResponse(
@@ -85,7 +184,7 @@ def _process_source_search_response(query: str, search_response: ObjectApiRespon
         sources=sources,
         skip=skip,
         limit=limit,
-        total=min(MAX_SEARCH_LIMIT, total)
+        total=total
     )
 
 def _get_source_result_items_(text_dict: dict, source_dict: dict) -> List[SourceResultItem]:
@@ -117,27 +216,41 @@ def _group_sources_by_text_id(hits: list) -> tuple[dict, dict]:
     source_dict = {}
     text_dict = {}
     for result in hits:
-        source = result["_source"]
-        text = source["text"]
-        text_id = source["text_id"]
-        text_index = TextIndex(
-            text_id=text_id,
-            language=text["language"],
-            title=text["title"],
-            published_date=text["published_date"]
-        )
-        if text_id not in source_dict:
-            source_dict[text_id] = [source]
-            text_dict[text_id] = text_index
-        else:
-            source_dict[text_id].append(source)
+        # Collapsed hits carry the matching segments of their text as inner hits
+        inner_hits = result.get("inner_hits", {}).get("segments")
+        segment_hits = inner_hits["hits"]["hits"] if inner_hits else [result]
+        for segment_hit in segment_hits:
+            source = _get_segment_source_(hit=segment_hit)
+            text = source["text"]
+            text_id = source["text_id"]
+            if text_id not in source_dict:
+                source_dict[text_id] = [source]
+                text_dict[text_id] = TextIndex(
+                    text_id=text_id,
+                    language=text["language"],
+                    title=text["title"],
+                    published_date=text["published_date"]
+                )
+            else:
+                source_dict[text_id].append(source)
     return source_dict, text_dict
 
+def _get_segment_source_(hit: dict) -> dict:
+    source = dict(hit["_source"])
+    highlighted_content = hit.get("highlight", {}).get("content")
+    if highlighted_content:
+        source["content"] = highlighted_content[0]
+    else:
+        source.setdefault("content", "")
+    return source
+
 def _generate_search_query(
         query: str, 
         text_id: str, 
         skip: int, 
-        limit: int
+        limit: int,
+        pit_id: Optional[str] = None,
+        search_after: Optional[list] = None
 ):
     search_query = {
         "query": {
@@ -153,30 +266,207 @@ def _generate_search_query(
                 ]
             }
         },
-        "from": skip,
+        "_source": SEGMENT_SOURCE_FIELDS,
+        "highlight": SEGMENT_HIGHLIGHT,
         "size": limit
     }
     if text_id:
-        search_query["query"]["bool"]["must"].append({
+        search_query["query"]["bool"]["filter"] = [
+            {
+                "term": {
+                    "text_id.keyword": text_id
+                }
+            }
+        ]
+    else:
+        # One hit per text, its best segments come back as inner hits
+        search_query["collapse"] = {
+            "field": "text_id.keyword",
+            "inner_hits": {
+                "name": "segments",
+                "size": MAX_SEGMENTS_PER_TEXT,
+                "_source": SEGMENT_SOURCE_FIELDS,
+                "highlight": SEGMENT_HIGHLIGHT
+            }
+        }
+        search_query["aggs"] = {
+            "text_count": {
+                "cardinality": {
+                    "field": "text_id.keyword"
+                }
+            }
+        }
+    if pit_id:
+        search_query["pit"] = {
+            "id": pit_id,
+            "keep_alive": SEARCH_PIT_KEEP_ALIVE
+        }
+        search_query["sort"] = [
+            {"_score": "desc"},
+            {"_shard_doc": "asc"}
+        ]
+    if search_after:
+        search_query["search_after"] = search_after
+    else:
+        search_query["from"] = skip
+    return search_query
+
+async def _sheet_search(
+        query: str,
+        published_by: Optional[str],
+        skip: int,
+        limit: int
+) -> SearchResponse:
+    client = search_client()
+    search_query = _generate_sheet_search_query(
+        query=query,
+        published_by=published_by,
+        skip=skip,
+        limit=limit
+    )
+    query_response: ObjectApiResponse = await client.search(
+        index=get("ELASTICSEARCH_SHEET_INDEX"),
+        **search_query
+    )
+    return _process_sheet_search_response(
+        query=query,
+        search_response=query_response,
+        skip=skip,
+        limit=limit
+    )
+
+
+def _generate_sheet_search_query(
+        query: str,
+        published_by: Optional[str],
+        skip: int,
+        limit: int
+) -> Dict:
+    filters = [
+        {
+            "term": {
+                "is_published": True
+            }
+        }
+    ]
+    if published_by:
+        filters.append({
             "term": {
-                "text_id.keyword": text_id
+                "published_by.keyword": published_by
             }
         })
-    return search_query
+    return {
+        "query": {
+            "bool": {
+                "must": [
+                    {
+                        "multi_match": {
+                            "query": query,
+                            "fields": SHEET_SEARCH_FIELDS
+                        }
+                    }
+                ],
+                "filter": filters
+            }
+        },
+        "_source": {
+            "excludes": ["content"]
+        },
+        "highlight": {
+            "fields": {
+                "title": {"number_of_fragments": 0},
+                "summary": {"number_of_fragments": 0},
+                "content": {
+                    "fragment_size": SHEET_HIGHLIGHT_FRAGMENT_SIZE,
+                    "number_of_fragments": SHEET_HIGHLIGHT_FRAGMENTS
+                }
+            }
+        },
+        "from": skip,
+        "size": limit
+    }
 
-def _sheet_search(query: str, skip: int, limit: int) -> SearchResponse:
+
+def _process_sheet_search_response(query: str, search_response: ObjectApiResponse, skip: int, limit: int) -> SearchResponse:
+    hits = search_response["hits"]["hits"]
+    total = search_response["hits"]["total"]["value"] if "total" in search_response["hits"] else 0
+    sheets: List[SheetResultItem] = [_get_sheet_result_item_(hit=hit) for hit in hits]
     return SearchResponse(
         search=Search(
             text=query,
             type=SearchType.SHEET
         ),
-        sheets=[],
+        sheets=sheets,
         skip=skip,
         limit=limit,
-        total=0
+        total=total
+    )
+
+
+def _get_sheet_result_item_(hit: dict) -> SheetResultItem:
+    source = hit["_source"]
+    highlight = hit.get("highlight", {})
+    publisher_image = None
+    if source.get("publisher_avatar_key"):
+        publisher_image = generate_presigned_access_url(
+            bucket_name=get("AWS_BUCKET_NAME"),
+            s3_key=source["publisher_avatar_key"]
+        )
+    return SheetResultItem(
+        sheet_id=source["id"],
+        sheet_title=source["title"],
+        sheet_summary=source.get("summary", ""),
+        publisher_id=source.get("publisher_id"),
+        publisher_name=source.get("publisher_name", ""),
+        publisher_username=source.get("publisher_username"),
+        publisher_image=publisher_image,
+        publisher_position=source.get("publisher_position"),
+        publisher_organization=source.get("publisher_organization"),
+        published_date=source.get("published_date"),
+        language=source.get("language"),
+        highlights=highlight.get("title", []) + highlight.get("summary", []) + highlight.get("content", [])
     )
 
 
+async def index_sheet(sheet_index: SheetIndex) -> None:
+    # Indexing is best effort, a search outage must not fail the sheet write.
+    try:
+        client = search_client()
+        await client.index(
+            index=get("ELASTICSEARCH_SHEET_INDEX"),
+            id=sheet_index.id,
+            document=sheet_index.model_dump()
+        )
+    except Exception as e:
+        logger.error(f"Error indexing sheet {sheet_index.id}: {str(e)}", exc_info=True)
+
+
+async def index_sheets(sheet_indexes: List[SheetIndex]) -> None:
+    # Many sheets in one bulk request, for backfills
+    if not sheet_indexes:
+        return
+    index = get("ELASTICSEARCH_SHEET_INDEX")
+    operations = []
+    for sheet_index in sheet_indexes:
+        operations.append({"index": {"_index": index, "_id": sheet_index.id}})
+        operations.append(sheet_index.model_dump())
+    response = await search_client().bulk(operations=operations)
+    if response.get("errors"):
+        failed_ids = [item["index"]["_id"] for item in response["items"] if item["index"].get("error")]
+        logger.error(f"Error indexing sheets {failed_ids}")
+
+
+async def remove_sheet_from_index(sheet_id: str) -> None:
+    try:
+        client = search_client()
+        await client.delete(
+            index=get("ELASTICSEARCH_SHEET_INDEX"),
+            id=sheet_id
+        )
+    except Exception as e:
+        logger.error(f"Error removing sheet {sheet_id} from index: {str(e)}", exc_info=True)
+
+
 
 def build_language_filter(language: str) -> List[str]:
     if language == "bo":
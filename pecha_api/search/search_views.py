@@ -25,6 +25,8 @@ async def search(
     query: str = Query(default=None, description="Search query"),
     search_type: SearchType = Query(default=None, description="Search type (SOURCE / SHEET)"),
     text_id: Optional[str] = Query(default=None, description="Text ID where the search is to be performed"),
+    published_by: Optional[str] = Query(default=None, description="Publisher email to restrict sheet search to"),
+    cursor: Optional[str] = Query(default=None, description="Cursor returned as next_cursor by the previous page"),
     skip: int = Query(default=0),
     limit: int = Query(default=10)
 ) -> SearchResponse:
@@ -32,6 +34,8 @@ async def search(
         query=query,
         search_type=search_type,
         text_id=text_id,
+        published_by=published_by,
+        cursor=cursor,
         skip=skip,
         limit=limit
     )
@@ -1,9 +1,35 @@
+import io
 import logging
 import textwrap
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from bs4 import BeautifulSoup
 from pecha_api.share.pecha_text_image_generator_config import CONFIG
 
+@lru_cache(maxsize=32)
+def _load_font(font_file_name: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per process and size."""
+    return ImageFont.truetype(font_file_name, size=size, encoding=CONFIG["ENCODING_UTF16"])
+
+@lru_cache(maxsize=4)
+def _load_logo(logo_path: str) -> Image.Image:
+    """Load and decode a logo once per process."""
+    return Image.open(logo_path).convert('RGBA')
+
+def preload_fonts() -> None:
+    """
+    Warm the font cache with every font and size the generator can ask for.
+    """
+    for lang, font_file_name in CONFIG["FONT_PATHS"].items():
+        font_size = CONFIG["FONT_SIZE"].get(lang, CONFIG["FONT_SIZE"]["FALL_BACK"])
+        for main_font_size in (font_size, int(font_size * 1.5)):
+            _load_font(font_file_name, main_font_size)
+            _load_font(font_file_name, int(main_font_size/2))
+    try:
+        _load_logo(CONFIG["IMG_LOGO_PATH"])
+    except (OSError, ValueError) as e:
+        logging.warning(f"Error preloading logo: {e}")
+
 class SyntheticImageGenerator:
     def __init__(
         self,
@@ -79,16 +105,15 @@ class SyntheticImageGenerator:
             anchor=CONFIG["ANCHOR_MIDDLE"]
         )
 
-    def save_image(
+    def render_image(
         self,
         text: str,
         ref_str: str,
-        img_file_name: str = None,
         text_color: str = None,
         logo_path: str = None
-    ) -> None:
+    ) -> Image.Image:
         """
-        Generate and save a synthetic image with the given text, reference, and options.
+        Generate a synthetic image in memory with the given text, reference, and options.
         """
         font_file_name = CONFIG["FONT_PATHS"].get(self.font_type, CONFIG["FONT_PATHS"]["FALL_BACK"])
         # Define fonts and text color
@@ -96,8 +121,8 @@ class SyntheticImageGenerator:
             main_font_size = int(self.font_size * 1.5)
         else:
             main_font_size = self.font_size
-        main_font = ImageFont.truetype(font_file_name, size=main_font_size, encoding=CONFIG["ENCODING_UTF16"])
-        ref_font = ImageFont.truetype(font_file_name, size=int(main_font_size/2), encoding=CONFIG["ENCODING_UTF16"])
+        main_font = _load_font(font_file_name, main_font_size)
+        ref_font = _load_font(font_file_name, int(main_font_size/2))
         text_color_tuple = CONFIG["TEXT_COLOR"].get(text_color, CONFIG["TEXT_COLOR"]["DEFAULT"])
         # Calculate padding and max width
         max_width = self.image_width - (CONFIG["PADDING_X"] * 2)
@@ -121,72 +146,55 @@ class SyntheticImageGenerator:
         # Add logo if provided
         if logo_path:
             img = _add_logo_to_image(img, logo_path, self.image_width, self.image_height)
-        # Save the image
-        img.save(img_file_name or CONFIG["IMG_OUTPUT_PATH"])
-
-def create_synthetic_data(
-    text: str,
-    ref_str: str,
-    lang: str,
-    bg_color: str,
-    text_color: str = None,
-    logo_path: str = None,
-    output_path: str = None
-) -> None:
-    """
-    Generate a synthetic image from text and reference string, saving to output_path.
-    """
-    cleaned_text = _clean_text(text)
-    font_type_lang = lang
-    generator = SyntheticImageGenerator(
+        return img
+
+def _create_generator(lang: str, bg_color: str) -> SyntheticImageGenerator:
+    return SyntheticImageGenerator(
         image_width=CONFIG["IMAGE_WIDTH"],
         image_height=CONFIG["IMAGE_HEIGHT"],
-        font_size=CONFIG["FONT_SIZE"].get(font_type_lang, CONFIG["FONT_SIZE"]["FALL_BACK"]),
-        font_type=font_type_lang,
+        font_size=CONFIG["FONT_SIZE"].get(lang, CONFIG["FONT_SIZE"]["FALL_BACK"]),
+        font_type=lang,
         bg_color=CONFIG["BG_COLOR"].get(bg_color, CONFIG["BG_COLOR"]["DEFAULT"])
     )
-    generator.save_image(cleaned_text, ref_str, img_file_name=output_path or CONFIG["IMG_OUTPUT_PATH"], text_color=text_color, logo_path=logo_path)
 
-def generate_segment_image(
+def render_segment_image(
     text: str = None,
     ref_str: str = None,
     lang: str = None,
     bg_color: str = None,
     text_color: str = None,
-    logo_path: str = None,
-    output_path: str = None
-) -> None:
+    logo_path: str = None
+) -> bytes:
     """
-    Main entry to generate a text image or fallback logo image.
+    Render a text image or fallback logo image in memory and return it as PNG bytes.
     """
     if text is not None and text != "":
-        create_synthetic_data(
-            text=text,
-            ref_str=ref_str,
-            lang=lang,
-            bg_color=bg_color,
-            text_color=text_color,
-            logo_path=logo_path,
-            output_path=output_path
-        )
+        generator = _create_generator(lang=lang, bg_color=bg_color)
+        img = generator.render_image(_clean_text(text), ref_str, text_color=text_color, logo_path=logo_path)
     else:
-        img = Image.new(
-            CONFIG["RGBA_MODE"], 
-            (CONFIG["FALLBACK_IMAGE_WIDTH"], CONFIG["FALLBACK_IMAGE_HEIGHT"]), 
-            color=CONFIG["BG_COLOR"].get(bg_color, CONFIG["BG_COLOR"]["DEFAULT"])
+        img = _render_fallback_image(bg_color=bg_color)
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def _render_fallback_image(bg_color: str = None) -> Image.Image:
+    img = Image.new(
+        CONFIG["RGBA_MODE"], 
+        (CONFIG["FALLBACK_IMAGE_WIDTH"], CONFIG["FALLBACK_IMAGE_HEIGHT"]), 
+        color=CONFIG["BG_COLOR"].get(bg_color, CONFIG["BG_COLOR"]["DEFAULT"])
+    )
+    try:
+        img = _add_logo_to_image(
+            img,
+            CONFIG["IMG_LOGO_PATH"],
+            CONFIG["FALLBACK_IMAGE_WIDTH"],
+            CONFIG["FALLBACK_IMAGE_HEIGHT"],
+            header_ratio=CONFIG["FALLBACK_HEADER_RATIO"],
+            logo_height_ratio=CONFIG["FALLBACK_LOGO_HEIGHT_RATIO"]
         )
-        try:
-            img = _add_logo_to_image(
-                img,
-                CONFIG["IMG_LOGO_PATH"],
-                CONFIG["FALLBACK_IMAGE_WIDTH"],
-                CONFIG["FALLBACK_IMAGE_HEIGHT"],
-                header_ratio=CONFIG["FALLBACK_HEADER_RATIO"],
-                logo_height_ratio=CONFIG["FALLBACK_LOGO_HEIGHT_RATIO"]
-            )
-        except (OSError, ValueError) as e:
-            logging.warning(f"Error adding fallback logo: {e}")
-        img.save(output_path or CONFIG["IMG_OUTPUT_PATH"])
+    except (OSError, ValueError) as e:
+        logging.warning(f"Error adding fallback logo: {e}")
+    return img
 
 def _clean_text(content: str, max_lines: int = 4) -> str:
     """
@@ -216,7 +224,7 @@ def _add_logo_to_image(
     Add a centered logo to an RGBA image, returns composited image.
     """
     try:
-        logo = Image.open(logo_path).convert('RGBA')
+        logo = _load_logo(logo_path)
         logo_height = int(image_height * (logo_height_ratio or CONFIG["LOGO_HEIGHT_RATIO"]))
         logo_ratio = logo.size[0] / logo.size[1]
         logo_width = int(logo_height * logo_ratio)
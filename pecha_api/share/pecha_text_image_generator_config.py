@@ -4,7 +4,6 @@ Configuration constants for pecha_text_image_generator.py
 
 FONTS_WUJIN_GANGBI = "pecha_api/share/static/fonts/wujin+gangbi.ttf"
 FONTS_NOTO_EN = "pecha_api/share/static/fonts/Noto-font/NotoFont-en.ttf"
-IMG_OUTPUT_PATH = "pecha_api/share/static/img/output.png"
 IMG_LOGO_PATH = "pecha_api/share/static/img/pecha-logo.png"
 
 CONFIG = {
@@ -44,7 +43,6 @@ CONFIG = {
     "ALIGN_CENTER": "center",
     "RGBA_MODE": "RGBA",
     # File Paths
-    "IMG_OUTPUT_PATH": IMG_OUTPUT_PATH,
     "IMG_LOGO_PATH": IMG_LOGO_PATH,
     # Layout
     "IMAGE_WIDTH": 700,
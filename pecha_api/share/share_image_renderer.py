@@ -0,0 +1,144 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import anyio
+
+from pecha_api.config import get, get_int
+from .pecha_text_image_generator import preload_fonts, render_segment_image
+
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """Get or create the process pool that renders share images"""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ProcessPoolExecutor(
+            max_workers=get_int("SHARE_IMAGE_RENDER_WORKERS"),
+            initializer=preload_fonts
+        )
+    return _render_pool
+
+
+def generate_share_image_key(
+    segment_id: Optional[str] = None,
+    text_id: Optional[str] = None,
+    language: Optional[str] = None,
+    text: Optional[str] = None,
+    ref_str: Optional[str] = None,
+    text_color: Optional[str] = None,
+    bg_color: Optional[str] = None
+) -> str:
+    """Deterministic cache key for a share image, built from everything that changes its pixels"""
+    # The rendered text is part of the key, so an edited segment or title is rendered again
+    # instead of serving the image of its old content.
+    content_hash = hashlib.sha256(json.dumps([text, ref_str]).encode()).hexdigest()
+    payload = json.dumps(
+        {
+            "segment_id": segment_id,
+            "text_id": text_id,
+            "language": language,
+            "content": content_hash,
+            "text_color": text_color,
+            "bg_color": bg_color
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_share_image_path(image_key: str) -> str:
+    return os.path.join(get("SHARE_IMAGE_CACHE_DIR"), f"{image_key}.png")
+
+
+async def get_share_image_stat(image_key: str) -> Optional[os.stat_result]:
+    image_path = anyio.Path(get_share_image_path(image_key=image_key))
+    try:
+        return await image_path.stat()
+    except FileNotFoundError:
+        return None
+
+
+async def get_cached_share_image(image_key: str) -> Optional[bytes]:
+    image_path = anyio.Path(get_share_image_path(image_key=image_key))
+    try:
+        return await image_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+async def store_share_image(image_key: str, image_bytes: bytes) -> None:
+    # Write to a private temp file and rename, so readers never see a partial image
+    # and concurrent renders of the same key cannot corrupt each other.
+    image_path = get_share_image_path(image_key=image_key)
+    temp_path = anyio.Path(f"{image_path}.{uuid.uuid4().hex}.tmp")
+    try:
+        await anyio.Path(os.path.dirname(image_path)).mkdir(parents=True, exist_ok=True)
+        await temp_path.write_bytes(image_bytes)
+        await anyio.to_thread.run_sync(os.replace, str(temp_path), image_path)
+    except OSError:
+        logging.error(f"Failed to cache share image {image_key}", exc_info=True)
+
+
+async def render_share_image(
+    image_key: str,
+    text: Optional[str] = None,
+    ref_str: Optional[str] = None,
+    lang: Optional[str] = None,
+    bg_color: Optional[str] = None,
+    text_color: Optional[str] = None,
+    logo_path: Optional[str] = None
+) -> bytes:
+    """Render a share image in the process pool and store it under image_key"""
+    loop = asyncio.get_running_loop()
+    image_bytes = await loop.run_in_executor(
+        get_render_pool(),
+        render_segment_image,
+        text,
+        ref_str,
+        lang,
+        bg_color,
+        text_color,
+        logo_path
+    )
+    await store_share_image(image_key=image_key, image_bytes=image_bytes)
+    return image_bytes
+
+
+def prune_share_images(max_age: int) -> int:
+    """Delete cached share images, and temp files of interrupted writes, not written for max_age seconds"""
+    cutoff = time.time() - max_age
+    pruned = 0
+    try:
+        entries = list(os.scandir(get("SHARE_IMAGE_CACHE_DIR")))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        if not entry.name.endswith((".png", ".tmp")):
+            continue
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                pruned += 1
+        except FileNotFoundError:
+            # Replaced or pruned by someone else in the meantime
+            continue
+    return pruned
+
+
+def main():
+    # A pruned image is rendered again on its next request
+    logging.basicConfig(level=logging.INFO)
+    pruned = prune_share_images(max_age=get_int("SHARE_IMAGE_CACHE_RETENTION_IN_SEC"))
+    logging.info(f"Pruned {pruned} cached share images")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,79 @@
 from fastapi import HTTPException
-import io
+import os
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional, Tuple
 from pecha_api.error_contants import ErrorConstants
 from pecha_api.texts.segments.segments_utils import SegmentUtils
-from starlette.responses import StreamingResponse
+from starlette import status
+from starlette.responses import FileResponse, Response
 from pecha_api.texts.texts_utils import TextUtils
-from .pecha_text_image_generator import generate_segment_image
+from .share_image_renderer import (
+    generate_share_image_key,
+    get_cached_share_image,
+    get_share_image_path,
+    get_share_image_stat,
+    render_share_image
+)
 from pecha_api.texts.segments.segments_service import get_segment_details_by_id
-from pecha_api.config import get
-import anyio
+from pecha_api.config import get, get_int
 
 from pecha_api.share.share_response_models import (
     ShareRequest,
     ShortUrlResponse
 )
+from pecha_api.share.share_enums import (
+    TextColor,
+    BgColor
+)
 
 from pecha_api.short_url.short_url_service import get_short_url
 
 from pecha_api.error_contants import ErrorConstants
 
 LOGO_PATH = "pecha_api/share/static/img/pecha-logo.png"
-IMAGE_PATH = "pecha_api/share/static/img/output.png"
 MEDIA_TYPE = "image/png"
 DEFAULT_OG_TITLE = get("SITE_NAME")
 DEFAULT_OG_DESCRIPTION = get("SITE_NAME")
 PECHA_FRONTEND_ENDPOINT = "https://webuddhist.com/chapter"
 
-async def get_generated_image():
+async def get_generated_image(
+    share_request: ShareRequest,
+    if_none_match: Optional[str] = None,
+    if_modified_since: Optional[str] = None
+) -> Response:
     try:
-        image_path = IMAGE_PATH
-        async with await anyio.open_file(image_path, "rb") as file:
-            image_bytes = await file.read()
-
-        return StreamingResponse(io.BytesIO(image_bytes), media_type=MEDIA_TYPE)
+        text, ref_str, language = await _get_share_image_content_(share_request=share_request)
+        image_key = _generate_share_image_key_(share_request=share_request, text=text, ref_str=ref_str, language=language)
+        image_stat = await get_share_image_stat(image_key=image_key)
+        if image_stat is None:
+            image_bytes = await _generate_segment_content_image_(
+                share_request=share_request,
+                image_key=image_key,
+                text=text,
+                ref_str=ref_str,
+                language=language
+            )
+            image_stat = await get_share_image_stat(image_key=image_key)
+            if image_stat is None:
+                # The render could not be cached on disk, serve it once without validators
+                return Response(content=image_bytes, media_type=MEDIA_TYPE, headers={"Cache-Control": "no-cache"})
+
+        headers = _generate_image_cache_headers_(image_key=image_key, image_stat=image_stat)
+        if _is_image_not_modified_(
+            image_stat=image_stat,
+            etag=headers["ETag"],
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since
+        ):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return FileResponse(
+            get_share_image_path(image_key=image_key),
+            media_type=MEDIA_TYPE,
+            headers=headers,
+            stat_result=image_stat
+        )
 
     except HTTPException as error:
         raise HTTPException(
@@ -39,13 +81,39 @@ async def get_generated_image():
             detail=ErrorConstants.IMAGE_NOT_FOUND_MESSAGE
         )
 
-async def generate_short_url(share_request: ShareRequest) -> ShortUrlResponse:
-    og_description = DEFAULT_OG_DESCRIPTION
-    if share_request.logo:
-        _generate_logo_image_(share_request=share_request)
+def _generate_image_cache_headers_(image_key: str, image_stat: os.stat_result) -> dict:
+    # The key names the request, the mtime names the render, so a re-render gets a new ETag
+    return {
+        "ETag": f'"{image_key}-{int(image_stat.st_mtime)}"',
+        "Last-Modified": formatdate(image_stat.st_mtime, usegmt=True),
+        "Cache-Control": f"public, max-age={get_int('SHARE_IMAGE_CACHE_MAX_AGE')}"
+    }
 
+def _is_image_not_modified_(
+    image_stat: os.stat_result,
+    etag: str,
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str]
+) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+    if if_none_match is not None:
+        request_etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in request_etags or etag in request_etags
+    if if_modified_since is not None:
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if modified_since.tzinfo is None:
+            modified_since = modified_since.replace(tzinfo=timezone.utc)
+        last_modified = datetime.fromtimestamp(int(image_stat.st_mtime), tz=timezone.utc)
+        return last_modified <= modified_since
+    return False
 
-    await _generate_segment_content_image_(share_request=share_request)
+async def generate_short_url(share_request: ShareRequest) -> ShortUrlResponse:
+    og_description = DEFAULT_OG_DESCRIPTION
+    # Render ahead of time so the first crawler fetch of og_image is a cache hit
+    await get_share_image(share_request=share_request)
 
     payload = _generate_short_url_payload_(share_request=share_request, og_description=og_description)
     short_url: ShortUrlResponse = await get_short_url(payload=payload)
@@ -53,15 +121,35 @@ async def generate_short_url(share_request: ShareRequest) -> ShortUrlResponse:
     return short_url
 
 
+async def get_share_image(share_request: ShareRequest) -> bytes:
+    text, ref_str, language = await _get_share_image_content_(share_request=share_request)
+    image_key = _generate_share_image_key_(share_request=share_request, text=text, ref_str=ref_str, language=language)
+    cached_image = await get_cached_share_image(image_key=image_key)
+    if cached_image is not None:
+        return cached_image
+    return await _generate_segment_content_image_(
+        share_request=share_request,
+        image_key=image_key,
+        text=text,
+        ref_str=ref_str,
+        language=language
+    )
+
 
-def _generate_logo_image_(share_request: ShareRequest):
-    generate_segment_image(
-        text_color=share_request.text_color,
-        bg_color=share_request.bg_color,
-        logo_path=LOGO_PATH
+def _generate_share_image_key_(share_request: ShareRequest, text: str, ref_str: str, language: Optional[str]) -> str:
+    return generate_share_image_key(
+        segment_id=share_request.segment_id,
+        text_id=share_request.text_id if share_request.segment_id is None else None,
+        language=language,
+        text=text,
+        ref_str=ref_str,
+        text_color=share_request.text_color.value if share_request.text_color else None,
+        bg_color=share_request.bg_color.value if share_request.bg_color else None
     )
 
-async def _generate_segment_content_image_(share_request: ShareRequest):
+
+async def _get_share_image_content_(share_request: ShareRequest) -> Tuple[str, str, Optional[str]]:
+    """The text, reference and language drawn on the share image"""
     main_content_text = get("SITE_NAME")
     reference_text = get("SITE_NAME")
     language = share_request.language
@@ -79,13 +167,23 @@ async def _generate_segment_content_image_(share_request: ShareRequest):
         text_detail = await TextUtils.get_text_detail_by_id(text_id=share_request.text_id)
         main_content_text = text_detail.title
         language = text_detail.language
-
-    generate_segment_image(
-        text=main_content_text,
-        ref_str=reference_text,
+    return main_content_text, reference_text, language
+
+
+async def _generate_segment_content_image_(
+    share_request: ShareRequest,
+    image_key: str,
+    text: str,
+    ref_str: str,
+    language: Optional[str]
+) -> bytes:
+    return await render_share_image(
+        image_key=image_key,
+        text=text,
+        ref_str=ref_str,
         lang=language,
-        text_color=share_request.text_color,
-        bg_color=share_request.bg_color,
+        text_color=share_request.text_color.value if share_request.text_color else None,
+        bg_color=share_request.bg_color.value if share_request.bg_color else None,
         logo_path=LOGO_PATH
     )
 
@@ -106,6 +204,7 @@ def _generate_short_url_payload_(share_request: ShareRequest, og_description: st
         image_url = f"{pecha_backend_endpoint}/share/image?segment_id={share_request.segment_id}&language={share_request.language}&logo={share_request.logo}"
     else:
         image_url = f"{pecha_backend_endpoint}/share/image?text_id={share_request.text_id}&language={share_request.language}&logo={share_request.logo}"
+    image_url = f"{image_url}{_generate_color_query_(share_request=share_request)}"
     payload = {
         "url": share_request.url,
         "og_title": DEFAULT_OG_DESCRIPTION,
@@ -115,6 +214,15 @@ def _generate_short_url_payload_(share_request: ShareRequest, og_description: st
     }
     return payload
 
+def _generate_color_query_(share_request: ShareRequest) -> str:
+    # Only non default colors are added, so existing share links keep their image URL
+    color_query = ""
+    if share_request.text_color and share_request.text_color != TextColor.DEFAULT:
+        color_query += f"&text_color={share_request.text_color.value}"
+    if share_request.bg_color and share_request.bg_color != BgColor.DEFAULT:
+        color_query += f"&bg_color={share_request.bg_color.value}"
+    return color_query
+
 def _generate_url_(
         content_id: str,
         content_index: int,
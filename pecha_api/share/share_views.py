@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from starlette import status
 from typing import Optional
 
@@ -6,6 +6,10 @@ from .share_response_models import (
     ShareRequest,
     ShortUrlResponse
 )
+from .share_enums import (
+    TextColor,
+    BgColor
+)
 
 from .share_service import (
     get_generated_image,
@@ -19,9 +23,28 @@ share_router = APIRouter(
 
 @share_router.get("/image", status_code=status.HTTP_200_OK)
 async def get_image(
-    segment_id: Optional[str] = Query(default=None)
+    segment_id: Optional[str] = Query(default=None),
+    text_id: Optional[str] = Query(default=None),
+    language: Optional[str] = Query(default=None),
+    logo: bool = Query(default=False),
+    text_color: TextColor = Query(default=TextColor.DEFAULT),
+    bg_color: BgColor = Query(default=BgColor.DEFAULT),
+    if_none_match: Optional[str] = Header(default=None),
+    if_modified_since: Optional[str] = Header(default=None)
 ):
-    return await get_generated_image()
+    share_request = ShareRequest(
+        segment_id=segment_id,
+        text_id=text_id,
+        language=language,
+        logo=logo,
+        text_color=text_color,
+        bg_color=bg_color
+    )
+    return await get_generated_image(
+        share_request=share_request,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since
+    )
 
 @share_router.post("", status_code=status.HTTP_201_CREATED)
 async def get_short_url(share_request: ShareRequest) -> ShortUrlResponse:
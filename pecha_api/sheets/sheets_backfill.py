@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from typing import Dict, List
+
+from fastapi import FastAPI
+
+from pecha_api.db.mongo_database import lifespan
+from pecha_api.texts.mappings.mappings_repository import get_segments_by_ids
+from pecha_api.texts.segments.segments_models import Segment
+from pecha_api.texts.texts_repository import (
+    get_contents_by_text_ids,
+    get_sheets_without_summary,
+    update_sheet_summary_by_id
+)
+from .sheets_service import build_sheet_summary, _get_all_segment_ids_in_table_of_content_
+
+BACKFILL_BATCH_SIZE = 100
+
+
+async def backfill_sheet_summaries(batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    # Store summary, word count and first image on sheets written before they were computed at write time
+    backfilled = 0
+    while True:
+        sheets = await get_sheets_without_summary(limit=batch_size)
+        if not sheets:
+            return backfilled
+
+        sheet_ids = [str(sheet.id) for sheet in sheets]
+        table_of_contents = await get_contents_by_text_ids(text_ids=sheet_ids)
+        sheet_segment_ids: Dict[str, List[str]] = {
+            sheet_id: _get_all_segment_ids_in_table_of_content_(sheet_sections=table_of_content.sections)
+            for sheet_id, table_of_content in table_of_contents.items()
+        }
+        segment_ids = [segment_id for segment_ids in sheet_segment_ids.values() for segment_id in segment_ids]
+        segments: Dict[str, Segment] = {
+            str(segment.id): segment for segment in (await get_segments_by_ids(segment_ids=segment_ids) if segment_ids else [])
+        }
+
+        for sheet_id in sheet_ids:
+            # Source segments belong to other texts; only the sheet's own blocks make up its summary
+            blocks = [
+                (segments[segment_id].type, segments[segment_id].content)
+                for segment_id in sheet_segment_ids.get(sheet_id, [])
+                if segment_id in segments and segments[segment_id].text_id == sheet_id
+            ]
+            sheet_summary = build_sheet_summary(blocks=blocks)
+            await update_sheet_summary_by_id(
+                sheet_id=sheet_id,
+                summary=sheet_summary.summary,
+                word_count=sheet_summary.word_count,
+                first_image=sheet_summary.first_image
+            )
+
+        backfilled += len(sheets)
+        logging.info(f"Backfilled summaries of {backfilled} sheets")
+
+
+async def _run_backfill_():
+    async with lifespan(FastAPI()):
+        await backfill_sheet_summaries()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run_backfill_())
+
+
+if __name__ == "__main__":
+    main()
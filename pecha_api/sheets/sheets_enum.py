@@ -7,3 +7,4 @@ class SortOrder(Enum):
 class SortBy(Enum):
     CREATED_DATE = "created_date"
     PUBLISHED_DATE = "published_date"
+    VIEWS = "views"
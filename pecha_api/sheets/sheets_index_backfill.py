@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI
+
+from pecha_api.db.database import SessionLocal
+from pecha_api.db.mongo_database import lifespan
+from pecha_api.search.search_response_models import SheetIndex
+from pecha_api.search.search_service import index_sheets
+from pecha_api.texts.mappings.mappings_repository import get_segments_by_ids
+from pecha_api.texts.segments.segments_enum import SegmentType
+from pecha_api.texts.segments.segments_models import Segment
+from pecha_api.texts.texts_repository import get_contents_by_text_ids, get_sheet_ids, get_texts_by_ids
+from pecha_api.users.users_models import Users
+from pecha_api.users.users_repository import get_users_by_emails
+from .sheets_response_models import CreateSheetRequest, Source
+from .sheets_service import _generate_sheet_index_, _get_all_segment_ids_in_table_of_content_
+
+BACKFILL_BATCH_SIZE = 100
+
+
+async def backfill_sheet_index(batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    # Index sheets written before sheets were indexed on create and update
+    indexed = 0
+    after: Optional[str] = None
+    while True:
+        sheet_ids = await get_sheet_ids(limit=batch_size, after=after)
+        if not sheet_ids:
+            return indexed
+        after = sheet_ids[-1]
+
+        sheets = await get_texts_by_ids(text_ids=sheet_ids)
+        table_of_contents = await get_contents_by_text_ids(text_ids=sheet_ids)
+        sheet_segment_ids: Dict[str, List[str]] = {
+            sheet_id: _get_all_segment_ids_in_table_of_content_(sheet_sections=table_of_content.sections)
+            for sheet_id, table_of_content in table_of_contents.items()
+        }
+        segment_ids = [segment_id for segment_ids in sheet_segment_ids.values() for segment_id in segment_ids]
+        segments: Dict[str, Segment] = {
+            str(segment.id): segment for segment in (await get_segments_by_ids(segment_ids=segment_ids) if segment_ids else [])
+        }
+        with SessionLocal() as db:
+            publishers: Dict[str, Users] = {
+                user.email: user
+                for user in get_users_by_emails(db=db, emails=list({sheet.published_by for sheet in sheets.values()}))
+            }
+
+        sheet_indexes: List[SheetIndex] = []
+        for sheet_id, sheet in sheets.items():
+            publisher = publishers.get(sheet.published_by)
+            if publisher is None:
+                logging.warning(f"Skipped sheet {sheet_id}, its publisher {sheet.published_by} no longer exists")
+                continue
+            sheet_request = CreateSheetRequest(
+                title=sheet.title,
+                source=_get_sheet_sources_(
+                    sheet_id=sheet_id,
+                    segment_ids=sheet_segment_ids.get(sheet_id, []),
+                    segments=segments
+                ),
+                is_published=sheet.is_published
+            )
+            sheet_indexes.append(_generate_sheet_index_(sheet_details=sheet, sheet_request=sheet_request, publisher=publisher))
+        await index_sheets(sheet_indexes=sheet_indexes)
+
+        indexed += len(sheet_indexes)
+        logging.info(f"Indexed {indexed} sheets")
+
+
+def _get_sheet_sources_(sheet_id: str, segment_ids: List[str], segments: Dict[str, Segment]) -> List[Source]:
+    # The sheet's blocks as they were submitted: its own segments by content, quoted segments by id
+    sources: List[Source] = []
+    for position, segment_id in enumerate(segment_ids, start=1):
+        segment = segments.get(segment_id)
+        if segment is None:
+            continue
+        if segment.text_id == sheet_id:
+            sources.append(Source(position=position, type=segment.type, content=segment.content))
+        else:
+            sources.append(Source(position=position, type=SegmentType.SOURCE, content=segment_id))
+    return sources
+
+
+async def _run_backfill_():
+    async with lifespan(FastAPI()):
+        await backfill_sheet_index()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run_backfill_())
+
+
+if __name__ == "__main__":
+    main()
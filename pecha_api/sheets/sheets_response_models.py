@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
 from pecha_api.texts.segments.segments_models import SegmentType
+from pecha_api.texts.segments.segments_response_models import SegmentDTO
+from pecha_api.texts.texts_response_models import Section
 
 class Source(BaseModel):
     position: int
@@ -45,16 +47,30 @@ class SheetDetailDTO(BaseModel):
     publisher: Publisher
     content: Optional[SheetSection] = None
     views: int = 0
+    unique_viewers: int = 0
     is_published: bool
     skip: int
     limit: int
     total: int
 
 
+class SheetSummary(BaseModel):
+    summary: str = ""
+    word_count: int = 0
+    first_image: Optional[str] = None
+
+class SheetSegmentChanges(BaseModel):
+    inserted: List[SegmentDTO] = []
+    updated: Dict[str, str] = {}
+    deleted: List[str] = []
+    section: Section
+
 class SheetDTO(BaseModel):
     id: str
     title: str
     summary: str
+    word_count: int = 0
+    first_image_url: Optional[str] = None
     published_date: str
     time_passed: str
     views: int
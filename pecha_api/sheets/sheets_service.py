@@ -1,20 +1,23 @@
 import os
 import uuid
 import re
-from typing import Optional, Dict, List
+from collections import defaultdict, deque
+from typing import Optional, Dict, List, Tuple
 import hashlib
+from bs4 import BeautifulSoup
 from fastapi import UploadFile, HTTPException, status
 
 
 from pecha_api.texts.texts_models import Text
 from pecha_api.error_contants import ErrorConstants
 from pecha_api.config import get
-from .sheets_response_models import CreateSheetRequest, SheetImageResponse, Publisher
+from .sheets_response_models import CreateSheetRequest, SheetImageResponse, Publisher, SheetSummary, SheetSegmentChanges
 from ..uploads.S3_utils import upload_bytes, generate_presigned_access_url
 from pecha_api.image_utils import ImageUtils
 from pecha_api.utils import Utils
 from pecha_api.texts.texts_utils import TextUtils
 from pecha_api.texts.texts_cache_service import update_text_details_cache
+from pecha_api.texts.texts_view_counter import record_text_view, get_pending_views, get_unique_viewers
 
 from pecha_api.users.users_models import Users
 
@@ -50,12 +53,16 @@ from pecha_api.texts.texts_service import (
     update_text_details,
     delete_text_by_text_id,
     get_sheet,
-    get_table_of_content_by_sheet_id
+    get_table_of_content_by_sheet_id,
+    get_table_of_contents_by_sheet_ids,
+    update_sheet_summary,
+    replace_table_of_content
 )
 
 from pecha_api.users.users_service import (
     validate_and_extract_user_details,
-    fetch_user_by_email
+    fetch_user_by_email,
+    fetch_users_by_emails
 )
 from pecha_api.texts.texts_enums import TextType
 from pecha_api.texts.texts_response_models import (
@@ -65,19 +72,21 @@ from pecha_api.texts.texts_response_models import (
     Section,
     TextSegment
 )
-from pecha_api.texts.mappings.mappings_repository import get_sheet_first_content_by_ids
+from pecha_api.texts.mappings.mappings_repository import get_sheet_contents_by_ids, get_segments_by_ids
 
-from pecha_api.texts.segments.segments_models import SegmentType
+from pecha_api.texts.segments.segments_models import Segment, SegmentType
 from pecha_api.texts.segments.segments_response_models import (
     CreateSegment,
     CreateSegmentRequest,
     SegmentResponse,
     SegmentDTO
 )
+from pecha_api.texts.segments.segments_utils import SegmentUtils
 from pecha_api.texts.segments.segments_service import (
     create_new_segment,
     remove_segments_by_text_id,
-    get_segments_details_by_ids
+    get_segments_details_by_ids,
+    apply_segment_changes
 )
 
 from pecha_api.sheets.sheets_response_models import (
@@ -94,52 +103,76 @@ from pecha_api.texts.texts_cache_service import (
     delete_table_of_content_by_sheet_id_cache
 )
 from pecha_api.texts.segments.segments_cache_service import (
-    delete_segments_details_by_ids_cache
+    delete_segments_details_by_ids_cache,
+    delete_segments_by_ids_cache
 )
 
 from pecha_api.cache.cache_enums import CacheType
 from pecha_api.cache.cache_repository import update_cache
+from pecha_api.search.search_response_models import SheetIndex
+from pecha_api.search.search_service import (
+    index_sheet,
+    remove_sheet_from_index
+)
 from pecha_api.utils import Utils
 import logging
 
 DEFAULT_SHEET_SECTION_NUMBER = 1
+SUMMARY_MAX_WORDS = 30
+HTML_BLOCK_TAGS = ["p", "div", "br", "li", "blockquote", "h1", "h2", "h3", "h4", "h5", "h6"]
+# Words are separated by whitespace, and in Tibetan by the tsheg and shad marks
+WORD_PATTERN = re.compile(r"[^\s\u0F0B-\u0F14]+")
 
 def _strip_html_tags_(html_content: str) -> str:
-    #Remove HTML tags from content and return clean text.
-    clean = re.compile('<.*?>')
-    return re.sub(clean, '', html_content).strip()
+    #Remove HTML tags from content and return clean text, decoding entities and keeping block boundaries as line breaks.
+    soup = BeautifulSoup(html_content, "html.parser")
+    for block in soup.find_all(HTML_BLOCK_TAGS):
+        block.insert_after("\n")
+    return soup.get_text().strip()
+
+def build_sheet_summary(blocks: List[Tuple[SegmentType, str]]) -> SheetSummary:
+    # Listing fields of a sheet from its own (type, content) blocks in display order
+    contents = [_strip_html_tags_(content) for segment_type, content in blocks if segment_type == SegmentType.CONTENT]
+    contents = [content for content in contents if content]
+    first_image = next((content for segment_type, content in blocks if segment_type == SegmentType.IMAGE), None)
+    return SheetSummary(
+        summary=clean_text(contents[0]) if contents else "",
+        word_count=sum(len(WORD_PATTERN.findall(content)) for content in contents),
+        first_image=first_image
+    )
+
+async def _save_sheet_summary_(sheet_id: str, sheet_request: CreateSheetRequest):
+    sources = sorted(sheet_request.source, key=lambda source: source.position)
+    sheet_summary = build_sheet_summary(blocks=[(source.type, source.content) for source in sources])
+    await update_sheet_summary(
+        sheet_id=sheet_id,
+        summary=sheet_summary.summary,
+        word_count=sheet_summary.word_count,
+        first_image=sheet_summary.first_image
+    )
 
-async def _generate_sheet_summary_(sheet_id: str) -> str:
-    # Generate a summary from the first content segment limited to max_words.
+async def _generate_sheet_summaries_(sheet_ids: List[str]) -> Dict[str, str]:
+    # Summaries for a page of sheets: one table of content query and one segment query for the whole page
     try:
-        # Get sheet table of content
-        sheet_table_of_content: Optional[TableOfContent] = await get_table_of_content_by_sheet_id(
-            sheet_id=sheet_id
-        )
-        
-        if not sheet_table_of_content or not sheet_table_of_content.sections:
-            return ""
-        
-        # Get all segment IDs from the table of content
-        segment_ids = _get_all_segment_ids_in_table_of_content_(sheet_sections=sheet_table_of_content.sections)
-        
-        if not segment_ids:
-            return ""
-            
-        content_segment = await _get_sheet_first_content_details_by_type_(segment_ids=segment_ids, segment_type=SegmentType.CONTENT)    
-
-        if content_segment: # not NONE
-            content = content_segment.content
-            return clean_text(content)
-        # Return empty string if no content segment found
-        return ""
-            
+        table_of_contents: Dict[str, TableOfContent] = await get_table_of_contents_by_sheet_ids(sheet_ids=sheet_ids)
+        sheet_segment_ids: Dict[str, List[str]] = {
+            sheet_id: _get_all_segment_ids_in_table_of_content_(sheet_sections=table_of_content.sections)
+            for sheet_id, table_of_content in table_of_contents.items()
+        }
+        segment_ids = [segment_id for segment_ids in sheet_segment_ids.values() for segment_id in segment_ids]
+        content_segments = await get_sheet_contents_by_ids(segment_ids=segment_ids, segment_type=SegmentType.CONTENT)
+        contents: Dict[str, str] = {str(segment.id): segment.content for segment in content_segments}
     except Exception:
-        # Return empty string if any error occurs during summary generation
-        return ""
+        return {}
+
+    summaries = {}
+    for sheet_id, segment_ids in sheet_segment_ids.items():
+        first_content = next((contents[segment_id] for segment_id in segment_ids if segment_id in contents), None)
+        summaries[sheet_id] = clean_text(first_content) if first_content else ""
+    return summaries
 
 def clean_text(content: str) -> str:
-    max_words = 30
+    max_words = SUMMARY_MAX_WORDS
     clean_text = _strip_html_tags_(content)
     if clean_text:
         # Split into words and limit to max_words
@@ -186,7 +219,7 @@ async def fetch_sheets(
     return sheets
 
 
-async def get_sheet_by_id(sheet_id: str, skip: int, limit: int) -> SheetDetailDTO:
+async def get_sheet_by_id(sheet_id: str, skip: int, limit: int, viewer: Optional[str] = None) -> SheetDetailDTO:
     sheet_details: TextDTO = await TextUtils.get_text_details_by_id(text_id=sheet_id)
     user_details: UserInfoResponse = fetch_user_by_email(email=sheet_details.published_by)
     sheet_table_of_content: Optional[TableOfContent] = await get_table_of_content_by_sheet_id(
@@ -195,52 +228,22 @@ async def get_sheet_by_id(sheet_id: str, skip: int, limit: int) -> SheetDetailDT
     if sheet_table_of_content is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.TABLE_OF_CONTENT_NOT_FOUND_MESSAGE)
 
+    # Only the first page counts as a view; later pages are the same reader scrolling
+    if skip == 0:
+        await record_text_view(text_id=sheet_id, viewer=viewer)
+    pending_views: Dict[str, int] = await get_pending_views(text_ids=[sheet_id])
+
     sections = sheet_table_of_content.sections if sheet_table_of_content else []
     sheet_dto: SheetDetailDTO = await _generate_sheet_detail_dto_(
         sheet_details=sheet_details,
         user_details=user_details,
         sheet_sections=sections,
         skip=skip,
-        limit=limit
-    )
-    return sheet_dto
-
-async def _generate_sheet_detail_dto_(
-    sheet_details: TextDTO,
-    user_details: UserInfoResponse,
-    sheet_sections: List[Section],
-    views: int,
-    skip: int,
-    limit: int
-) -> SheetDetailDTO:
-    publisher = Publisher(
-        name=f"{user_details.firstname} {user_details.lastname}",
-        username=user_details.username,
-        email=user_details.email,
-        avatar_url=user_details.avatar_url
-    )
-    segment_ids = _get_all_segment_ids_in_table_of_content_(sheet_sections=sheet_sections)
-    segments_dict: Dict[str, SegmentDTO] = await get_segments_details_by_ids(segment_ids=segment_ids)
-
-    sheet_section: Optional[SheetSection] = None
-    if sheet_sections:
-        sheet_section = await _generate_sheet_section_(
-            segments=sheet_sections[0].segments,
-            segments_dict=segments_dict
-        )
-    return SheetDetailDTO(
-        id=sheet_details.id,
-        sheet_title=sheet_details.title,
-        created_date=sheet_details.created_date,
-        publisher=publisher,
-        content=sheet_section,
-        is_published=sheet_details.is_published,
-        views=views,
-        skip=skip,
         limit=limit,
-        total=len(sheet_sections),
+        views=(sheet_details.views or 0) + pending_views.get(sheet_id, 0)
     )
-
+    sheet_dto.unique_viewers = await get_unique_viewers(text_id=sheet_id)
+    return sheet_dto
 
 async def create_new_sheet(create_sheet_request: CreateSheetRequest, token: str) -> SheetIdResponse:
     group_id =  await _create_sheet_group_(token=token)
@@ -260,6 +263,9 @@ async def create_new_sheet(create_sheet_request: CreateSheetRequest, token: str)
         segment_dict=sheet_segments,
         token=token
     )
+    await _save_sheet_summary_(sheet_id=text_id, sheet_request=create_sheet_request)
+    sheet_details: TextDTO = await TextUtils.get_text_details_by_id(text_id=text_id)
+    await _index_sheet_(sheet_details=sheet_details, sheet_request=create_sheet_request, token=token)
     return SheetIdResponse(sheet_id=text_id)
 
 async def update_sheet_by_id(
@@ -272,40 +278,127 @@ async def update_sheet_by_id(
     if not is_valid_user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=ErrorConstants.TOKEN_ERROR_MESSAGE)
 
-    await delete_text_details_by_id_cache(text_id=sheet_id, cache_type=CacheType.TEXT_DETAIL)
-    sheet_table_of_content: Optional[TableOfContent] = await _delete_sheet_table_of_content_cache_(sheet_id=sheet_id)
-    
-    await _delete_sheet_segments_cache_(sheet_table_of_content=sheet_table_of_content)
-
-    await remove_segments_by_text_id(text_id=sheet_id)
+    # Checked before anything is written, so a missing source segment leaves the sheet as it was
+    await _validate_source_segments_(sheet_request=update_sheet_request)
 
-    await remove_table_of_content_by_text_id(text_id=sheet_id)
+    await delete_text_details_by_id_cache(text_id=sheet_id, cache_type=CacheType.TEXT_DETAIL)
+    sheet_table_of_content: Optional[TableOfContent] = await get_table_of_content_by_sheet_id(sheet_id=sheet_id)
 
     await _update_text_details_(sheet_id=sheet_id, update_sheet_request=update_sheet_request)
 
-    sheet_segments: Dict[str, str] = await _process_and_upload_sheet_segments(
-        create_sheet_request=update_sheet_request,
-        text_id=sheet_id,
-        token=token
+    # Only the blocks that changed are written; unchanged blocks keep their segment ids
+    sheet_segment_changes: SheetSegmentChanges = await _diff_sheet_segments_(
+        sheet_id=sheet_id,
+        sheet_table_of_content=sheet_table_of_content,
+        update_sheet_request=update_sheet_request
     )
-    await _generate_and_upload_sheet_table_of_content(
-        create_sheet_request=update_sheet_request,
-        text_id=sheet_id,
-        segment_dict=sheet_segments,
-        token=token
+    await apply_segment_changes(
+        inserted=sheet_segment_changes.inserted,
+        updated=sheet_segment_changes.updated,
+        deleted=sheet_segment_changes.deleted
+    )
+    old_segments = sheet_table_of_content.sections[0].segments if sheet_table_of_content and sheet_table_of_content.sections else None
+    is_table_of_content_changed = old_segments != sheet_segment_changes.section.segments
+    if is_table_of_content_changed:
+        await replace_table_of_content(
+            table_of_content_request=TableOfContent(
+                text_id=sheet_id,
+                type=TableOfContentType.SHEET,
+                sections=[sheet_segment_changes.section]
+            ),
+            token=token
+        )
+        await delete_table_of_content_by_sheet_id_cache(sheet_id=sheet_id, cache_type=CacheType.SHEET_TABLE_OF_CONTENT)
+    if is_table_of_content_changed or sheet_segment_changes.updated or sheet_segment_changes.deleted:
+        await _delete_sheet_segments_cache_(sheet_table_of_content=sheet_table_of_content)
+    # Edited blocks keep their segment ids, so their own entries would otherwise serve the old content
+    await delete_segments_by_ids_cache(
+        segment_ids=list(sheet_segment_changes.updated) + list(sheet_segment_changes.deleted)
     )
+
+    await _save_sheet_summary_(sheet_id=sheet_id, sheet_request=update_sheet_request)
     sheet_details: TextDTO = await TextUtils.get_text_details_by_id(text_id=sheet_id)
     
     # Update cache with new sheet data after successful update
     await update_text_details_cache(text_id=sheet_id, updated_text_data=sheet_details, cache_type=CacheType.SHEET_DETAIL)
+    await _index_sheet_(sheet_details=sheet_details, sheet_request=update_sheet_request, token=token)
     
     return SheetIdResponse(sheet_id=sheet_id)
 
-async def _delete_sheet_table_of_content_cache_(sheet_id: str) -> Optional[TableOfContent]:
-    sheet_table_of_content: Optional[TableOfContent] = await get_table_of_content_by_sheet_id(sheet_id=sheet_id)
-    if sheet_table_of_content is not None:
-        await delete_table_of_content_by_sheet_id_cache(sheet_id=sheet_id, cache_type=CacheType.SHEET_TABLE_OF_CONTENT)
-    return sheet_table_of_content
+async def _diff_sheet_segments_(
+        sheet_id: str,
+        sheet_table_of_content: Optional[TableOfContent],
+        update_sheet_request: CreateSheetRequest
+) -> SheetSegmentChanges:
+    sections = sheet_table_of_content.sections if sheet_table_of_content else []
+    old_section: Optional[Section] = sections[0] if sections else None
+    old_positions: Dict[str, int] = {}
+    for section in sections:
+        for segment in section.segments:
+            old_positions.setdefault(segment.segment_id, segment.segment_number)
+    existing_segments = await get_segments_by_ids(segment_ids=list(old_positions)) if old_positions else []
+    # Source blocks reference segments of other texts; only the sheet's own segments can be reused
+    own_segments = sorted(
+        (segment for segment in existing_segments if segment.text_id == sheet_id and segment.type != SegmentType.SOURCE),
+        key=lambda segment: old_positions[str(segment.id)]
+    )
+
+    unmatched: Dict[str, Segment] = {str(segment.id): segment for segment in own_segments}
+    segments_by_hash: Dict[Tuple[SegmentType, str], deque] = defaultdict(deque)
+    for segment in own_segments:
+        segments_by_hash[(segment.type, _content_hash_(segment.content))].append(str(segment.id))
+
+    sources = sorted(update_sheet_request.source, key=lambda source: source.position)
+    assigned: Dict[int, str] = {}
+    # First pass: blocks whose content is unchanged keep their segment
+    for index, source in enumerate(sources):
+        if source.type == SegmentType.SOURCE:
+            continue
+        candidates = segments_by_hash[(source.type, _content_hash_(source.content))]
+        if candidates:
+            segment_id = candidates.popleft()
+            assigned[index] = segment_id
+            unmatched.pop(segment_id)
+
+    # Second pass: an edited block takes over the segment of the same type at its old position
+    unmatched_by_position = {(old_positions[segment_id], segment.type): segment_id for segment_id, segment in unmatched.items()}
+    inserted: List[SegmentDTO] = []
+    updated: Dict[str, str] = {}
+    for index, source in enumerate(sources):
+        if source.type == SegmentType.SOURCE or index in assigned:
+            continue
+        segment_id = unmatched_by_position.pop((source.position, source.type), None)
+        if segment_id is not None:
+            unmatched.pop(segment_id)
+            updated[segment_id] = source.content
+        else:
+            segment_id = str(uuid.uuid4())
+            inserted.append(SegmentDTO(id=segment_id, text_id=sheet_id, content=source.content, type=source.type))
+        assigned[index] = segment_id
+
+    now = Utils.get_utc_date_time()
+    section = Section(
+        id=old_section.id if old_section else str(uuid.uuid4()),
+        section_number=DEFAULT_SHEET_SECTION_NUMBER,
+        segments=[
+            TextSegment(
+                segment_number=source.position,
+                segment_id=source.content if source.type == SegmentType.SOURCE else assigned[index]
+            )
+            for index, source in enumerate(sources)
+        ],
+        created_date=old_section.created_date if old_section else now,
+        updated_date=now
+    )
+    return SheetSegmentChanges(inserted=inserted, updated=updated, deleted=list(unmatched), section=section)
+
+def _content_hash_(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+async def _validate_source_segments_(sheet_request: CreateSheetRequest) -> None:
+    source_segment_ids = [source.content for source in sheet_request.source if source.type == SegmentType.SOURCE]
+    if source_segment_ids:
+        await SegmentUtils.validate_segments_exists(segment_ids=list(dict.fromkeys(source_segment_ids)))
 
 async def _delete_sheet_segments_cache_(sheet_table_of_content: Optional[TableOfContent]):
     sections = sheet_table_of_content.sections if sheet_table_of_content else []
@@ -332,6 +425,7 @@ async def delete_sheet_by_id(sheet_id: str, token: str):
     await remove_segments_by_text_id(text_id=sheet_id)
     await remove_table_of_content_by_text_id(text_id=sheet_id)
     await delete_text_by_text_id(text_id=sheet_id)
+    await remove_sheet_from_index(sheet_id=sheet_id)
 
     # delete_sheet_by_id_cache(
     #     sheet_id=sheet_id
@@ -367,7 +461,8 @@ async def _generate_sheet_detail_dto_(
     user_details: UserInfoResponse,
     sheet_sections: List[Section],
     skip: int,
-    limit: int
+    limit: int,
+    views: int = 0
 ) -> SheetDetailDTO:
     publisher = Publisher(
         name=f"{user_details.firstname} {user_details.lastname}",
@@ -392,11 +487,44 @@ async def _generate_sheet_detail_dto_(
         is_published=sheet_details.is_published,
         publisher=publisher,
         content=sheet_section,
+        views=views,
         skip=skip,
         limit=limit,
         total=len(sheet_sections),
     )
 
+async def _index_sheet_(sheet_details: TextDTO, sheet_request: CreateSheetRequest, token: str):
+    publisher: Users = validate_and_extract_user_details(token=token)
+    sheet_index = _generate_sheet_index_(
+        sheet_details=sheet_details,
+        sheet_request=sheet_request,
+        publisher=publisher
+    )
+    await index_sheet(sheet_index=sheet_index)
+
+def _generate_sheet_index_(sheet_details: TextDTO, sheet_request: CreateSheetRequest, publisher: Users) -> SheetIndex:
+    sources = sorted(sheet_request.source, key=lambda source: source.position)
+    contents = [_strip_html_tags_(source.content) for source in sources if source.type == SegmentType.CONTENT]
+    contents = [content for content in contents if content]
+    # Same summary as the sheet listing shows
+    sheet_summary = build_sheet_summary(blocks=[(source.type, source.content) for source in sources])
+    return SheetIndex(
+        id=sheet_details.id,
+        title=sheet_details.title,
+        summary=sheet_summary.summary,
+        content=contents,
+        language=sheet_details.language,
+        is_published=sheet_details.is_published,
+        published_by=sheet_details.published_by,
+        published_date=sheet_details.published_date,
+        publisher_id=str(publisher.id) if publisher.id else None,
+        publisher_name=f"{publisher.firstname or ''} {publisher.lastname or ''}".strip() or (publisher.username or ""),
+        publisher_username=publisher.username,
+        publisher_position=publisher.title,
+        publisher_organization=publisher.organization,
+        publisher_avatar_key=publisher.avatar_url
+    )
+
 async def _fetch_user_sheets_(token: str, email: str, sort_by: SortBy, sort_order: SortOrder, skip: int, limit: int):
     if token == "None":
             _is_sheet_published_ = True
@@ -414,17 +542,26 @@ async def _fetch_user_sheets_(token: str, email: str, sort_by: SortBy, sort_orde
     return sheets
 
 async def _generate_sheet_dto_response_(sheets, skip: int, limit: int) -> SheetDTOResponse:
+    # Summaries are stored on the sheet at write time; only sheets written before that are summarised here
+    summaries: Dict[str, str] = {str(sheet.id): sheet.summary for sheet in sheets if getattr(sheet, "summary", None) is not None}
+    missing_summary_ids = [str(sheet.id) for sheet in sheets if str(sheet.id) not in summaries]
+    if missing_summary_ids:
+        summaries.update(await _generate_sheet_summaries_(sheet_ids=missing_summary_ids))
+    publishers: Dict[str, Publisher] = _create_publisher_objects_(published_by=[sheet.published_by for sheet in sheets])
+    pending_views: Dict[str, int] = await get_pending_views(text_ids=[str(sheet.id) for sheet in sheets])
     sheets_dto = [
         SheetDTO(
             id = str(sheet.id),
             title = sheet.title,
-            summary = await _generate_sheet_summary_(str(sheet.id)),
+            summary = summaries.get(str(sheet.id), ""),
+            word_count = getattr(sheet, "word_count", None) or 0,
+            first_image_url = _generate_first_image_url_(first_image=getattr(sheet, "first_image", None)),
             published_date = sheet.published_date,
             time_passed = Utils.time_passed(published_time=sheet.published_date, language=sheet.language),
-            views = sheet.views,
+            views = (sheet.views or 0) + pending_views.get(str(sheet.id), 0),
             is_published = sheet.is_published,
             likes = sheet.likes or [],
-            publisher = _create_publisher_object_(published_by=sheet.published_by),
+            publisher = publishers.get(sheet.published_by) or _unknown_publisher_(published_by=sheet.published_by),
             language = sheet.language
         )
         for sheet in sheets
@@ -436,23 +573,42 @@ async def _generate_sheet_dto_response_(sheets, skip: int, limit: int) -> SheetD
         total = len(sheets)
     )
 
-def _create_publisher_object_(published_by: str) -> Publisher:
+def _create_publisher_objects_(published_by: List[str]) -> Dict[str, Publisher]:
+    # One users query for every publisher on the page; avatars are presigned locally without a session
+    users: Dict[str, Users] = fetch_users_by_emails(emails=published_by)
+    return {
+        email: Publisher(
+            name=f"{user.firstname or ''} {user.lastname or ''}".strip() or user.username,
+            username=user.username,
+            email=user.email,
+            avatar_url=generate_presigned_access_url(bucket_name=get("AWS_BUCKET_NAME"), s3_key=user.avatar_url)
+        )
+        for email, user in users.items()
+    }
 
-    user_profile: UserInfoResponse = fetch_user_by_email(email=published_by)
-    
-    return Publisher(
-        name=f"{user_profile.firstname} {user_profile.lastname}".strip() or user_profile.username,
-        username=user_profile.username,
-        email=user_profile.email,
-        avatar_url=user_profile.avatar_url
-    )
+def _generate_first_image_url_(first_image: Optional[str]) -> Optional[str]:
+    if not first_image:
+        return None
+    return generate_presigned_access_url(bucket_name=get("AWS_BUCKET_NAME"), s3_key=first_image)
+
+def _unknown_publisher_(published_by: str) -> Publisher:
+    return Publisher(name=published_by, username="", email=published_by)
 
 async def _generate_sheet_section_(segments: List[TextSegment], segments_dict: Dict[str, SegmentDTO]) -> SheetSection:
+    source_text_ids = [
+        segments_dict[segment.segment_id].text_id
+        for segment in segments
+        if segments_dict[segment.segment_id].type == SegmentType.SOURCE
+    ]
+    source_texts: Dict[str, TextDTO] = await TextUtils.get_text_details_by_ids(text_ids=source_text_ids) if source_text_ids else {}
+    if any(text_id not in source_texts for text_id in source_text_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.TEXT_NOT_FOUND_MESSAGE)
+
     sheet_segments = []
     for segment in segments:
         segment_details: SegmentDTO = segments_dict[segment.segment_id]
         if segment_details.type == SegmentType.SOURCE:
-            segment_text_details: TextDTO = await TextUtils.get_text_details_by_id(text_id=segment_details.text_id)
+            segment_text_details: TextDTO = source_texts[segment_details.text_id]
             sheet_segments.append(
                 SheetSegment(
                     segment_id=segment.segment_id,
@@ -487,12 +643,6 @@ async def _generate_sheet_section_(segments: List[TextSegment], segments_dict: D
         segments=sheet_segments
     )
 
-async def _get_sheet_first_content_details_by_type_(segment_ids: List[str], segment_type: SegmentType) -> Optional[str]:
-    
-    # Get detailed firt segment information of type segment_type
-    segments_detail = await get_sheet_first_content_by_ids(segment_ids=segment_ids, segment_type=segment_type)
-    return segments_detail
-
 def _get_all_segment_ids_in_table_of_content_(sheet_sections: Section) -> List[str]:
     segment_ids = []
     for section in sheet_sections:
@@ -4,7 +4,7 @@ from fastapi.security import HTTPBearer
 from starlette import status
 
 from typing import Optional
-from fastapi import APIRouter, Depends, UploadFile, File
+from fastapi import APIRouter, Depends, UploadFile, File, Request
 from fastapi.security import HTTPAuthorizationCredentials
 from typing import Annotated
 
@@ -22,6 +22,7 @@ from .sheets_service import (
 )
 
 from pecha_api.sheets.sheets_response_models import SheetIdResponse
+from pecha_api.texts.texts_view_counter import get_viewer
 
 from .sheets_response_models import (
     CreateSheetRequest,
@@ -58,10 +59,11 @@ async def get_sheets(
 @sheets_router.get("/{sheet_id}", status_code=status.HTTP_200_OK)
 async def get_sheet(
     sheet_id: str,
+    request: Request,
     skip: int = Query(default=0),
     limit: int = Query(default=10)
 ) -> SheetDetailDTO:
-    return await get_sheet_by_id(sheet_id=sheet_id, skip=skip, limit=limit)
+    return await get_sheet_by_id(sheet_id=sheet_id, skip=skip, limit=limit, viewer=get_viewer(request=request))
 
 @sheets_router.post("", status_code=status.HTTP_201_CREATED)
 async def create_sheet(
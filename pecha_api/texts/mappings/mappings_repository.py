@@ -28,3 +28,6 @@ async def get_sheet_first_content_by_ids(segment_ids: List[str], segment_type: S
         segment_type=segment_type
     )
     return segment
+
+async def get_sheet_contents_by_ids(segment_ids: List[str], segment_type: SegmentType) -> List[Segment]:
+    return await Segment.get_segments_by_ids_and_type(segment_ids=segment_ids, segment_type=segment_type)
@@ -2,7 +2,10 @@ from pecha_api.utils import Utils
 from pecha_api.cache.cache_repository import (
     get_cache_data,
     set_cache,
-    clear_cache
+    clear_cache,
+    get_many_cache_data,
+    set_many_cache,
+    delete_many_cache
 )
 from pecha_api import config
 from .segments_response_models import (
@@ -104,4 +107,38 @@ async def set_segments_details_by_ids_cache(segment_ids: List[str] = None, cache
 async def delete_segments_details_by_ids_cache(segment_ids: List[str] = None, cache_type: CacheType = None):
     payload = list(segment_ids) + [cache_type]
     hashed_key: str = Utils.generate_hash_key(payload = payload)
-    await clear_cache(hash_key = hashed_key)
\ No newline at end of file
+    await clear_cache(hash_key = hashed_key)
+
+async def delete_segments_by_ids_cache(segment_ids: List[str] = None):
+    """Drop every per segment entry of the given segments, keyed as their setters key them"""
+    payloads = []
+    for segment_id in segment_ids or []:
+        payloads.extend([
+            [segment_id, True, CacheType.SEGMENT_DETAIL],
+            [segment_id, False, CacheType.SEGMENT_DETAIL],
+            [segment_id, CacheType.SEGMENT_INFO],
+            [segment_id, CacheType.SEGMENT_ROOT_TEXT],
+            [segment_id, CacheType.SEGMENT_TRANSLATIONS],
+            [segment_id, CacheType.SEGMENT_COMMENTARIES]
+        ])
+    await delete_many_cache(hash_keys=[Utils.generate_hash_key(payload = payload) for payload in payloads])
+
+# PHONETICS
+def _phonetics_hash_key(version: str, content: str) -> str:
+    # Keyed by content rather than segment, so identical verses share one entry and edits never serve stale phonetics
+    return Utils.generate_hash_key(payload = [version, content, CacheType.PHONETICS])
+
+async def get_phonetics_cache(version: str = None, contents: List[str] = None) -> Dict[str, str]:
+    cache_data = await get_many_cache_data(hash_keys = [_phonetics_hash_key(version = version, content = content) for content in contents])
+    return {
+        content: data["phonetics"]
+        for content, data in zip(contents, cache_data)
+        if data and isinstance(data, dict)
+    }
+
+async def set_phonetics_cache(version: str = None, data: Dict[str, str] = None):
+    cache_time_out = config.get_int("CACHE_PHONETICS_TIMEOUT")
+    await set_many_cache(
+        values = {_phonetics_hash_key(version = version, content = content): {"phonetics": phonetics} for content, phonetics in data.items()},
+        cache_time_out = cache_time_out
+    )
@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 import uuid
 from pydantic import BaseModel, Field
 from beanie import Document
+from beanie.odm.bulk import BulkWriter
 
 from .segments_enum import SegmentType
 
@@ -17,11 +18,15 @@ class Segment(Document):
     content: str
     mapping: Optional[List[Mapping]] = None
     type: SegmentType
+    # KVP phonetics of Tibetan segments, written with the converter version that produced them
+    phonetics: Optional[str] = None
+    phonetics_version: Optional[str] = None
 
     class Settings:
         collection = "segments"
         indexes = [
-            "mapping.segments"  # Index for faster lookup of segment IDs within mapping arrays
+            "mapping.segments",  # Index for faster lookup of segment IDs within mapping arrays
+            "text_id"
         ]
 
     @classmethod
@@ -82,6 +87,13 @@ class Segment(Document):
         segment_uuid_ids = [uuid.UUID(segment_id) for segment_id in segment_ids]
         return await cls.find_one({"_id": {"$in": segment_uuid_ids}, "type": segment_type})
 
+    @classmethod
+    async def get_segments_by_ids_and_type(cls, segment_ids: List[str], segment_type: SegmentType) -> List["Segment"]:
+        if not segment_ids:
+            return []
+        segment_uuid_ids = [uuid.UUID(segment_id) for segment_id in segment_ids]
+        return await cls.find({"_id": {"$in": segment_uuid_ids}, "type": segment_type}).to_list()
+
     @classmethod
     async def get_related_mapped_segments(cls, parent_segment_id: str) -> List["Segment"]:
         # Find segments where:
@@ -95,6 +107,20 @@ class Segment(Document):
             }
         }
         return await cls.find(query).to_list()
+
+    @classmethod
+    async def get_related_mapped_segments_by_parent_ids(cls, parent_segment_ids: List[str]) -> List["Segment"]:
+        # Same match as get_related_mapped_segments for many parents in one query
+        if not parent_segment_ids:
+            return []
+        query = {
+            "mapping": {
+                "$elemMatch": {
+                    "segments": {"$in": parent_segment_ids}
+                }
+            }
+        }
+        return await cls.find(query).to_list()
     
     @classmethod
     async def get_segments_by_pecha_ids(
@@ -119,6 +145,22 @@ class Segment(Document):
         
         return await cls.find(query).to_list()
 
+    @classmethod
+    async def get_segments_without_phonetics(cls, text_ids: List[str], version: str, limit: int) -> List["Segment"]:
+        return await cls.find({"text_id": {"$in": text_ids}, "phonetics_version": {"$ne": version}}).limit(limit).to_list()
+
+    @classmethod
+    async def update_phonetics(cls, phonetics: Dict[uuid.UUID, str], version: str):
+        # One $set per segment, sent to Mongo in a single bulk_write
+        if not phonetics:
+            return
+        async with BulkWriter(ordered=False, object_class=cls) as bulk_writer:
+            for segment_id, segment_phonetics in phonetics.items():
+                await cls.find_one(cls.id == segment_id).update(
+                    {"$set": {"phonetics": segment_phonetics, "phonetics_version": version}},
+                    bulk_writer=bulk_writer
+                )
+
     @classmethod
     async def delete_segment_by_text_id(cls, text_id: str):
         return await cls.find(cls.text_id == text_id).delete()
\ No newline at end of file
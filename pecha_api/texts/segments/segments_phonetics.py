@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import bophono
+from botok.tokenizers.wordtokenizer import WordTokenizer
+
+from pecha_api.config import get_int
+from pecha_api.texts.texts_enums import TextLanguage
+from .segments_cache_service import get_phonetics_cache, set_phonetics_cache
+
+# Building a WordTokenizer loads the botok dictionaries, so each process builds the tokenizer and the
+# converter once and memoizes the phonetics of every word it has seen.
+PHONETICS_SCHEMA = "KVP"
+PHONETICS_OPTIONS = {
+    'aspirateLowTones': True
+}
+# Changes whenever the schema or options change, so stored and cached phonetics of older settings are never served
+PHONETICS_VERSION = hashlib.sha256(
+    json.dumps({"schema": PHONETICS_SCHEMA, "options": PHONETICS_OPTIONS}, sort_keys=True).encode()
+).hexdigest()[:12]
+
+# Only segments of texts in this language are given phonetics
+PHONETICS_LANGUAGE = TextLanguage.Bo.value
+
+_PHONETICS_WORD_CACHE_SIZE = 100_000
+
+_tokenizer: Optional[WordTokenizer] = None
+_converter = None
+_init_lock = threading.Lock()
+_phonetics_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_tokenizer() -> WordTokenizer:
+    global _tokenizer
+    if _tokenizer is None:
+        with _init_lock:
+            if _tokenizer is None:
+                _tokenizer = WordTokenizer()
+    return _tokenizer
+
+
+def get_converter():
+    global _converter
+    if _converter is None:
+        with _init_lock:
+            if _converter is None:
+                _converter = bophono.UnicodeToApi(schema=PHONETICS_SCHEMA, options=PHONETICS_OPTIONS)
+    return _converter
+
+
+def preload_phonetics() -> None:
+    """Build the tokenizer and converter up front, so the first request does not pay for the dictionaries."""
+    get_tokenizer()
+    get_converter()
+
+
+@lru_cache(maxsize=_PHONETICS_WORD_CACHE_SIZE)
+def word_to_phonetics(word: str) -> str:
+    return get_converter().get_api(word)
+
+
+def text_to_phonetics(content: str) -> str:
+    tokens = get_tokenizer().tokenize(content)
+    return " ".join(word_to_phonetics(token.text) for token in tokens)
+
+
+def texts_to_phonetics(contents: List[str]) -> List[str]:
+    """Convert a batch of contents in one call, so a pool task carries many segments."""
+    return [text_to_phonetics(content) for content in contents]
+
+
+def get_phonetics_pool() -> ProcessPoolExecutor:
+    """Get or create the process pool that converts Tibetan to phonetics"""
+    global _phonetics_pool
+    if _phonetics_pool is None:
+        _phonetics_pool = ProcessPoolExecutor(
+            max_workers=get_int("PHONETICS_WORKERS"),
+            initializer=preload_phonetics
+        )
+    return _phonetics_pool
+
+
+async def convert_to_phonetics(contents: List[str]) -> Dict[str, str]:
+    """Phonetics of many contents, keyed by content, from the cache first and the process pool second"""
+    unique_contents = list(dict.fromkeys(contents))
+    if not unique_contents:
+        return {}
+    phonetics = await get_phonetics_cache(version=PHONETICS_VERSION, contents=unique_contents)
+    missing = [content for content in unique_contents if content not in phonetics]
+    if missing:
+        batch_size = get_int("PHONETICS_BATCH_SIZE")
+        loop = asyncio.get_running_loop()
+        batches = await asyncio.gather(*[
+            loop.run_in_executor(get_phonetics_pool(), texts_to_phonetics, missing[start:start + batch_size])
+            for start in range(0, len(missing), batch_size)
+        ])
+        converted = dict(zip(missing, [result for batch in batches for result in batch]))
+        await set_phonetics_cache(version=PHONETICS_VERSION, data=converted)
+        phonetics.update(converted)
+    return phonetics
@@ -0,0 +1,43 @@
+import asyncio
+import logging
+
+from fastapi import FastAPI
+
+from pecha_api.db.mongo_database import lifespan
+from pecha_api.texts.texts_repository import get_text_ids_by_language
+from .segments_phonetics import PHONETICS_LANGUAGE
+from .segments_repository import get_segments_without_phonetics
+from .segments_service import store_segments_phonetics
+
+BACKFILL_BATCH_SIZE = 500
+
+
+async def backfill_segment_phonetics(batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    # Store phonetics on Tibetan segments that have none, or whose phonetics came from other converter options
+    text_ids = await get_text_ids_by_language(language=PHONETICS_LANGUAGE)
+    if not text_ids:
+        return 0
+    backfilled = 0
+    while True:
+        segments = await get_segments_without_phonetics(text_ids=text_ids, limit=batch_size)
+        if not segments:
+            return backfilled
+
+        await store_segments_phonetics(segments=segments)
+
+        backfilled += len(segments)
+        logging.info(f"Backfilled phonetics of {backfilled} segments")
+
+
+async def _run_backfill_():
+    async with lifespan(FastAPI()):
+        await backfill_segment_phonetics()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run_backfill_())
+
+
+if __name__ == "__main__":
+    main()
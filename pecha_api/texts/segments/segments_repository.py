@@ -7,10 +7,12 @@ from .segments_models import Segment
 from .segments_response_models import CreateSegmentRequest, SegmentDTO, MappingResponse, SegmentUpdateRequest
 import logging
 from beanie.exceptions import CollectionWasNotInitialized
-from typing import List, Dict
+from typing import List, Dict, Optional
+from beanie.odm.bulk import BulkWriter
 from fastapi import HTTPException
 from starlette import status
 from pecha_api.error_contants import ErrorConstants
+from .segments_phonetics import PHONETICS_VERSION
 
 async def get_segments_by_pecha_segment_ids(pecha_segment_ids: List[str]) -> List[SegmentDTO]:
     try:
@@ -19,6 +21,13 @@ async def get_segments_by_pecha_segment_ids(pecha_segment_ids: List[str]) -> Lis
         logging.debug(e)
         return []
 
+async def get_segments_by_pecha_ids(pecha_segment_ids: List[str], text_id: str) -> List[Segment]:
+    try:
+        return await Segment.get_segments_by_pecha_ids(pecha_segment_ids=pecha_segment_ids, text_id=text_id)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return []
+
 async def get_segment_by_id(segment_id: str) -> SegmentDTO | None:
     try:
         segment = await Segment.get_segment_by_id(segment_id=segment_id)
@@ -57,6 +66,13 @@ async def check_all_segment_exists(segment_ids: List[UUID]) -> bool:
         return False
 
 
+def get_stored_phonetics(segment: Segment) -> Optional[str]:
+    # Phonetics written by other converter options are stale until the backfill rewrites them
+    if getattr(segment, "phonetics_version", None) != PHONETICS_VERSION:
+        return None
+    return segment.phonetics
+
+
 async def get_segments_by_ids(segment_ids: List[str]) -> Dict[str, SegmentDTO]:
     try:
         if not segment_ids:
@@ -67,7 +83,8 @@ async def get_segments_by_ids(segment_ids: List[str]) -> Dict[str, SegmentDTO]:
             text_id=segment.text_id,
             content=segment.content,
             mapping=[MappingResponse(**mapping.model_dump()) for mapping in segment.mapping],
-            type=segment.type
+            type=segment.type,
+            phonetics=get_stored_phonetics(segment=segment)
         ) for segment in list_of_segments_detail}
     except CollectionWasNotInitialized as e:
         logging.debug(e)
@@ -98,6 +115,22 @@ async def get_related_mapped_segments(parent_segment_id: str) -> List[SegmentDTO
         logging.debug(e)
         return []
 
+async def get_related_mapped_segments_by_parent_ids(parent_segment_ids: List[str]) -> Dict[str, List[SegmentDTO]]:
+    try:
+        segments = await Segment.get_related_mapped_segments_by_parent_ids(parent_segment_ids=parent_segment_ids)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return {}
+    parent_ids = set(parent_segment_ids)
+    related_segments: Dict[str, List[SegmentDTO]] = {}
+    for segment in segments:
+        mapped_parent_ids = dict.fromkeys(
+            parent_id for mapping in segment.mapping for parent_id in mapping.segments if parent_id in parent_ids
+        )
+        for parent_id in mapped_parent_ids:
+            related_segments.setdefault(parent_id, []).append(segment)
+    return related_segments
+
 async def delete_segments_by_text_id(text_id: str):
     try:
         await Segment.delete_segment_by_text_id(text_id=text_id)
@@ -106,6 +139,25 @@ async def delete_segments_by_text_id(text_id: str):
         return False
 
 
+async def bulk_write_segments(inserted: List[SegmentDTO], updated: Dict[str, str], deleted: List[str]):
+    # Inserts, content updates and deletes of one text go to Mongo in a single bulk_write
+    if not (inserted or updated or deleted):
+        return
+    async with BulkWriter(ordered=False, object_class=Segment) as bulk_writer:
+        for segment in inserted:
+            await Segment.insert_one(
+                Segment(id=UUID(segment.id), text_id=segment.text_id, content=segment.content, type=segment.type),
+                bulk_writer=bulk_writer
+            )
+        for segment_id, content in updated.items():
+            await Segment.find_one(Segment.id == UUID(segment_id)).update(
+                {"$set": {"content": content, "phonetics": None, "phonetics_version": None}},
+                bulk_writer=bulk_writer
+            )
+        if deleted:
+            await Segment.find({"_id": {"$in": [UUID(segment_id) for segment_id in deleted]}}).delete(bulk_writer=bulk_writer)
+
+
 async def update_segment_by_id(segment_update_request: SegmentUpdateRequest) -> SegmentDTO | None:
     try:
         for segment_update in segment_update_request.segments:
@@ -113,9 +165,26 @@ async def update_segment_by_id(segment_update_request: SegmentUpdateRequest) ->
             if not segment:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.SEGMENT_NOT_FOUND_MESSAGE)
             segment.content = segment_update.content
+            segment.phonetics = None
+            segment.phonetics_version = None
             await segment.save()
         
         return segment
     except CollectionWasNotInitialized as e:
         logging.debug(e)
-        return None
\ No newline at end of file
+        return None
+
+
+async def get_segments_without_phonetics(text_ids: List[str], limit: int) -> List[Segment]:
+    try:
+        return await Segment.get_segments_without_phonetics(text_ids=text_ids, version=PHONETICS_VERSION, limit=limit)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return []
+
+
+async def update_segments_phonetics(phonetics: Dict[str, str]):
+    return await Segment.update_phonetics(
+        phonetics={UUID(segment_id): segment_phonetics for segment_id, segment_phonetics in phonetics.items()},
+        version=PHONETICS_VERSION
+    )
@@ -33,6 +33,7 @@ class SegmentDTO(BaseModel):
     type: SegmentType
     mapping: Optional[List[MappingResponse]] = None
     text: Optional[TextDTO] = None
+    phonetics: Optional[str] = None
 
 class SegmentUpdate(BaseModel):
     pecha_segment_id: str
@@ -4,10 +4,15 @@ from .segments_repository import (
     get_segment_by_id, 
     get_segments_by_ids,
     get_related_mapped_segments,
+    get_related_mapped_segments_by_parent_ids,
     get_segments_by_text_id,
     delete_segments_by_text_id,
-    update_segment_by_id
+    update_segment_by_id,
+    bulk_write_segments,
+    get_segments_by_pecha_ids,
+    update_segments_phonetics
 )
+from .segments_phonetics import PHONETICS_LANGUAGE, convert_to_phonetics
 from ...users.users_service import verify_admin_access
 from .segments_response_models import (
     CreateSegmentRequest, 
@@ -26,8 +31,10 @@ from starlette import status
 
 from .segments_utils import SegmentUtils
 from ..texts_utils import TextUtils
+from ..texts_enums import TextType
 
-from typing import List, Dict
+import logging
+from typing import List, Dict, Optional
 
 from .segments_response_models import (
     SegmentTranslationsResponse, 
@@ -52,6 +59,7 @@ from .segments_cache_service import (
 from pecha_api.uploads.S3_utils import generate_presigned_access_url
 
 from .segments_enum import SegmentType
+from .segments_models import Segment
 from ..texts_service import TextUtils
 from ..texts_repository import get_text_by_pecha_text_id
 from ...users.users_service import validate_user_exists
@@ -95,6 +103,7 @@ async def create_new_segment(create_segment_request: CreateSegmentRequest, token
     if is_valid_user:
         await TextUtils.validate_text_exists(text_id=create_segment_request.text_id)
         new_segment = await create_segment(create_segment_request=create_segment_request)
+        await _store_phonetics_on_write_(text_id=create_segment_request.text_id, segments=new_segment)
         segments =  [
             SegmentDTO(
                 id=str(segment.id),
@@ -207,6 +216,9 @@ async def fetch_segments_by_text_id(text_id: str) -> List[SegmentDTO]:
     segments = await get_segments_by_text_id(text_id=text_id)
     return segments
 
+async def apply_segment_changes(inserted: List[SegmentDTO], updated: Dict[str, str], deleted: List[str]):
+    await bulk_write_segments(inserted=inserted, updated=updated, deleted=deleted)
+
 async def remove_segments_by_text_id(text_id: str):
     is_valid_text = await TextUtils.validate_text_exists(text_id=text_id)
     if not is_valid_text:
@@ -221,7 +233,38 @@ async def update_segments_service(token: str, segment_update_request: SegmentUpd
         if not text:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.TEXT_NOT_FOUND_MESSAGE)
         
-        return await update_segment_by_id(segment_update_request=segment_update_request) 
+        updated_segment = await update_segment_by_id(segment_update_request=segment_update_request)
+        if _needs_phonetics_(text=text):
+            segments = await get_segments_by_pecha_ids(
+                pecha_segment_ids=[segment.pecha_segment_id for segment in segment_update_request.segments],
+                text_id=str(text.id)
+            )
+            await _store_phonetics_on_write_(text_id=str(text.id), segments=segments, text=text)
+        return updated_segment
+
+
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=ErrorConstants.ADMIN_ERROR_MESSAGE)
+
+
+async def store_segments_phonetics(segments: List[Segment]) -> None:
+    """Convert segments to phonetics and store them on the segments, so readers never convert per request"""
+    if not segments:
+        return
+    phonetics = await convert_to_phonetics(contents=[segment.content for segment in segments])
+    await update_segments_phonetics(phonetics={str(segment.id): phonetics[segment.content] for segment in segments})
+
+
+def _needs_phonetics_(text) -> bool:
+    # Sheets are skipped like in backfill-segment-phonetics, as their segments are also written by apply_segment_changes
+    return text.language == PHONETICS_LANGUAGE and TextType(text.type) != TextType.SHEET
 
 
-    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=ErrorConstants.ADMIN_ERROR_MESSAGE)
\ No newline at end of file
+async def _store_phonetics_on_write_(text_id: str, segments: List[Segment], text=None) -> None:
+    # A failed conversion must not fail the write; backfill-segment-phonetics picks up what is left
+    try:
+        if text is None:
+            text = await TextUtils.get_text_details_by_id(text_id=text_id)
+        if _needs_phonetics_(text=text):
+            await store_segments_phonetics(segments=segments)
+    except Exception:
+        logging.error(f"Failed to store phonetics of text {text_id}", exc_info=True)
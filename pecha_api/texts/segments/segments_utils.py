@@ -2,8 +2,6 @@ from typing import Dict, List, Optional, Union
 from uuid import UUID
 from fastapi import HTTPException
 from starlette import status
-import bophono
-from botok.tokenizers.wordtokenizer import WordTokenizer
 
 
 from pecha_api.error_contants import ErrorConstants
@@ -14,7 +12,9 @@ from .segments_repository import (
     check_all_segment_exists,
     get_segment_by_id,
     get_related_mapped_segments,
+    get_stored_phonetics,
 )
+from .segments_phonetics import text_to_phonetics
 from ..texts_response_models import TextDTO
 from ..texts_repository import get_contents_by_id
 from pecha_api.constants import Constants
@@ -186,6 +186,31 @@ class SegmentUtils:
                 appended_commentary_text_ids.append(segment.text_id)
                 
         return filtered_segments
+
+    @staticmethod
+    def filter_version_segments(
+        segments: List[SegmentDTO], text_details_dict: Dict[str, TextDTO]
+    ) -> List[SegmentTranslation]:
+        """
+        Version segments among mappings whose texts are already resolved, as filter_segment_mapping_by_type_or_text_id returns them.
+        """
+        filtered_segments = []
+        for segment in segments:
+            text_detail = text_details_dict.get(segment.text_id)
+            if not text_detail or str(text_detail.id) in Constants.excluded_text_ids:
+                continue
+            if text_detail.type == TextType.VERSION.value:
+                filtered_segments.append(
+                    SegmentTranslation(
+                        segment_id=str(segment.id),
+                        text_id=segment.text_id,
+                        title=text_detail.title,
+                        source=text_detail.published_by,
+                        language=text_detail.language,
+                        content=segment.content
+                    )
+                )
+        return filtered_segments
     
     @staticmethod
     async def get_root_mapping_count(segment_id: str) -> int:
@@ -261,7 +286,8 @@ class SegmentUtils:
                     segment_id=segment.segment_id,
                     segment_number=segment.segment_number,
                     content=segment_details.content,
-                    translation=translation
+                    translation=translation,
+                    phonetics=get_stored_phonetics(segment=segment_details)
                 )
                 
                 detail_section.segments.append(detail_segment)
@@ -343,17 +369,5 @@ class SegmentUtils:
     
     @staticmethod
     def apply_bophono(segmentContent:str)->str:
-        options = {
-            'aspirateLowTones': True
-        }
-        tokenizer = WordTokenizer()
-        tokens = tokenizer.tokenize(segmentContent)
-        token_text =  []
-        for token in tokens:
-            token_text.append(token.text)
-        kvpconverter = bophono.UnicodeToApi(schema="KVP", options = options)
-        kvp_ipa_list = []
-        for segment in token_text:
-            kvp_ipa = kvpconverter.get_api(segment)
-            kvp_ipa_list.append(kvp_ipa)
-        return " ".join(kvp_ipa_list)
+        # Runs inline; request paths should use convert_to_phonetics, which batches and runs in the process pool
+        return text_to_phonetics(content=segmentContent)
@@ -8,6 +8,9 @@ from pecha_api.cache.cache_repository import (
     update_cache,
     invalidate_text_related_cache,
     invalidate_multiple_cache_keys,
+    get_many_cache_data,
+    set_many_cache,
+    delete_many_cache,
 )
 from .texts_response_models import (
     DetailTableOfContentResponse,
@@ -19,7 +22,7 @@ from .texts_response_models import (
 )
 from pecha_api.cache.cache_enums import CacheType
 
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
 from pecha_api import config
 
@@ -124,6 +127,26 @@ async def get_text_details_by_id_cache(text_id: str = None, cache_type: CacheTyp
         cache_data = TextDTO(**cache_data)
     return cache_data
 
+async def get_text_details_by_ids_cache(text_ids: List[str] = None, cache_type: CacheType = None) -> Dict[str, TextDTO]:
+    """Cached text details of many texts in one round trip, sharing the keys of get_text_details_by_id_cache."""
+    hashed_keys = [Utils.generate_hash_key(payload = [text_id, cache_type]) for text_id in text_ids]
+    cache_data = await get_many_cache_data(hash_keys = hashed_keys)
+    return {
+        text_id: TextDTO(**data)
+        for text_id, data in zip(text_ids, cache_data)
+        if data and isinstance(data, dict)
+    }
+
+async def set_text_details_by_ids_cache(cache_type: CacheType = None, data: Dict[str, TextDTO] = None):
+    cache_time_out = config.get_int("CACHE_TEXT_TIMEOUT")
+    await set_many_cache(
+        values = {Utils.generate_hash_key(payload = [text_id, cache_type]): text_detail for text_id, text_detail in data.items()},
+        cache_time_out = cache_time_out
+    )
+
+async def delete_text_details_by_ids_cache(text_ids: List[str] = None, cache_type: CacheType = None):
+    await delete_many_cache(hash_keys = [Utils.generate_hash_key(payload = [text_id, cache_type]) for text_id in text_ids])
+
 async def delete_text_details_by_id_cache(text_id: str = None, cache_type: CacheType = None):
     payload = [text_id, cache_type]
     hashed_key: str = Utils.generate_hash_key(payload = payload)
@@ -1,11 +1,12 @@
 import uuid
 from uuid import UUID
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from .texts_response_models import Section
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 from beanie import Document
+from beanie.odm.bulk import BulkWriter
 
 from pecha_api.sheets.sheets_enum import (
     SortBy, 
@@ -29,6 +30,17 @@ class TableOfContent(Document):
         query = cls.find(cls.text_id == text_id)
         return await query.to_list()
 
+    @classmethod
+    async def get_table_of_contents_by_text_ids(cls, text_ids: List[str]) -> List["TableOfContent"]:
+        return await cls.find({"text_id": {"$in": text_ids}}).to_list()
+
+    @classmethod
+    async def update_sections_by_text_id(cls, text_id: str, sections: List[Section]) -> bool:
+        result = await cls.find_one(cls.text_id == text_id).update(
+            {"$set": {"sections": [section.model_dump() for section in sections]}}
+        )
+        return result is not None and result.matched_count > 0
+
     @classmethod
     async def delete_table_of_content_by_text_id(cls, text_id: str):
         return await cls.find(cls.text_id == text_id).delete()
@@ -51,6 +63,11 @@ class TableOfContent(Document):
         return contents
 
 
+class TextIdProjection(BaseModel):
+    # Reads only _id, for queries that need nothing else of a text
+    id: UUID = Field(alias="_id")
+
+
 class Text(Document):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     pecha_text_id: Optional[str] = None
@@ -68,7 +85,13 @@ class Text(Document):
     type: TextType
     categories: Optional[List[str]] = None
     views: Optional[int] = 0
+    # Id of the last view flush applied to views, so a retried flush is not counted twice
+    views_flush_id: Optional[str] = None
     likes: Optional[List[str]] = []
+    # Sheet listing fields, computed when a sheet is written
+    summary: Optional[str] = None
+    word_count: Optional[int] = None
+    first_image: Optional[str] = None
 
     class Settings:
         collection = "texts"
@@ -211,6 +234,42 @@ class Text(Document):
         return await cls.find_one(cls.id == text_id).delete()
 
 
+    @classmethod
+    async def get_text_ids_by_language(cls, language: str) -> List[str]:
+        texts = await cls.find({"language": language, "type": {"$ne": TextType.SHEET}}).project(TextIdProjection).to_list()
+        return [str(text.id) for text in texts]
+
+    @classmethod
+    async def get_sheet_ids(cls, limit: int, after: Optional[UUID] = None) -> List[str]:
+        # Keyset pages of sheet ids in _id order
+        query = {"type": TextType.SHEET}
+        if after is not None:
+            query["_id"] = {"$gt": after}
+        sheets = await cls.find(query).sort("_id").limit(limit).project(TextIdProjection).to_list()
+        return [str(sheet.id) for sheet in sheets]
+
+    @classmethod
+    async def get_sheets_without_summary(cls, limit: int) -> List["Text"]:
+        return await cls.find({"type": TextType.SHEET, "summary": None}).limit(limit).to_list()
+
+    @classmethod
+    async def update_sheet_summary(cls, text_id: UUID, summary: str, word_count: int, first_image: Optional[str]):
+        return await cls.find_one(cls.id == text_id).update(
+            {"$set": {"summary": summary, "word_count": word_count, "first_image": first_image}}
+        )
+
+    @classmethod
+    async def increment_views(cls, views: Dict[UUID, int], flush_id: str):
+        # One $inc per text, sent to Mongo in a single bulk_write; a text that already took this flush is skipped
+        if not views:
+            return
+        async with BulkWriter(ordered=False, object_class=cls) as bulk_writer:
+            for text_id, count in views.items():
+                await cls.find_one(cls.id == text_id, cls.views_flush_id != flush_id).update(
+                    {"$inc": {"views": count}, "$set": {"views_flush_id": flush_id}},
+                    bulk_writer=bulk_writer
+                )
+
     @classmethod
     async def get_sheets(
         cls, 
@@ -234,6 +293,7 @@ class Text(Document):
             field = {
                 SortBy.CREATED_DATE: "created_date",
                 SortBy.PUBLISHED_DATE: "published_date",
+                SortBy.VIEWS: "views",
             }
             sort_field = field.get(sort_by)
             if sort_field:
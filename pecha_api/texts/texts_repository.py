@@ -189,6 +189,16 @@ async def create_table_of_content_detail(table_of_content_request: TableOfConten
 async def get_contents_by_id(text_id: str) -> List[TableOfContent]:
     return await TableOfContent.get_table_of_contents_by_text_id(text_id=text_id)
     
+async def get_contents_by_text_ids(text_ids: List[str]) -> Dict[str, TableOfContent]:
+    # One query for many texts, keeping the first table of content of each text like get_contents_by_id callers do
+    table_of_contents: Dict[str, TableOfContent] = {}
+    for table_of_content in await TableOfContent.get_table_of_contents_by_text_ids(text_ids=text_ids):
+        table_of_contents.setdefault(table_of_content.text_id, table_of_content)
+    return table_of_contents
+
+async def update_table_of_content_sections(text_id: str, sections: List) -> bool:
+    return await TableOfContent.update_sections_by_text_id(text_id=text_id, sections=sections)
+
 async def get_table_of_content_by_content_id(content_id: str, skip: int = None, limit: int = None) -> Optional[TableOfContent]:
     return await TableOfContent.get_table_of_content_by_content_id(content_id=content_id, skip=skip, limit=limit)
 
@@ -196,6 +206,21 @@ async def get_table_of_content_by_content_id(content_id: str, skip: int = None,
 async def delete_table_of_content_by_text_id(text_id: str):
     return await TableOfContent.delete_table_of_content_by_text_id(text_id=text_id)
 
+async def get_text_ids_by_language(language: str) -> List[str]:
+    return await Text.get_text_ids_by_language(language=language)
+
+async def get_sheet_ids(limit: int, after: Optional[str] = None) -> List[str]:
+    return await Text.get_sheet_ids(limit=limit, after=UUID(after) if after else None)
+
+async def get_sheets_without_summary(limit: int) -> List[Text]:
+    return await Text.get_sheets_without_summary(limit=limit)
+
+async def update_sheet_summary_by_id(sheet_id: str, summary: str, word_count: int, first_image: Optional[str]):
+    return await Text.update_sheet_summary(text_id=UUID(sheet_id), summary=summary, word_count=word_count, first_image=first_image)
+
+async def increment_text_views(views: Dict[str, int], flush_id: str):
+    return await Text.increment_views(views={UUID(text_id): count for text_id, count in views.items()}, flush_id=flush_id)
+
 async def update_text_details_by_id(text_id: str, update_text_request: UpdateTextRequest) -> TextDTO:
     text_details = await Text.get_text(text_id=text_id)
     text_details.title = update_text_request.title
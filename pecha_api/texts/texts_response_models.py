@@ -63,6 +63,7 @@ class DetailTextSegment(BaseModel):
     segment_number: Optional[int] = None
     content: Optional[str] = None
     translation: Optional[Translation] = None
+    phonetics: Optional[str] = None
 
 class DetailSection(BaseModel):
     id: str
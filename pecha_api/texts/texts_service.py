@@ -9,6 +9,9 @@ from .texts_repository import (
     create_text,
     create_table_of_content_detail,
     get_contents_by_id,
+    get_contents_by_text_ids,
+    update_sheet_summary_by_id,
+    update_table_of_content_sections,
     get_table_of_content_by_content_id,
     get_sections_count_of_table_of_content,
     delete_table_of_content_by_text_id,
@@ -70,6 +73,12 @@ from pecha_api.sheets.sheets_enum import (
 from pecha_api.cache.cache_enums import CacheType
 
 from .texts_utils import TextUtils
+from .texts_view_counter import record_text_view, get_pending_views
+from pecha_api.recitations.recitations_cache_service import delete_recitation_catalog_cache
+from pecha_api.plans.users.recitation.user_recitations_services import (
+    refresh_user_recitation_text_details,
+    delete_user_recitations_of_text
+)
 from pecha_api.users.users_service import validate_user_exists
 from pecha_api.collections.collections_service import get_collection
 from pecha_api.users.users_service import (
@@ -90,7 +99,8 @@ async def get_text_by_text_id_or_collection(
         collection_id: Optional[str] = None,
         language: Optional[str] = None,
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        viewer: Optional[str] = None
 ) -> TextsCategoryResponse | TextDTO:
     # if language is None:
     #     language = get("DEFAULT_LANGUAGE")
@@ -131,6 +141,12 @@ async def get_text_by_text_id_or_collection(
         data = response
     )
 
+    if isinstance(response, TextDTO):
+        # Buffered views are added after caching so the cached text keeps the flushed count
+        await record_text_view(text_id=text_id, viewer=viewer)
+        pending_views = await get_pending_views(text_ids=[text_id])
+        response = response.model_copy(update={"views": (response.views or 0) + pending_views.get(text_id, 0)})
+
     return response
 
 
@@ -165,6 +181,14 @@ async def get_table_of_content_by_sheet_id(sheet_id: str) -> Optional[TableOfCon
     
     return table_of_content
 
+async def get_table_of_contents_by_sheet_ids(sheet_ids: List[str]) -> Dict[str, TableOfContent]:
+    if not sheet_ids:
+        return {}
+    return await get_contents_by_text_ids(text_ids=sheet_ids)
+
+async def update_sheet_summary(sheet_id: str, summary: str, word_count: int, first_image: Optional[str]):
+    await update_sheet_summary_by_id(sheet_id=sheet_id, summary=summary, word_count=word_count, first_image=first_image)
+
 async def get_table_of_contents_by_text_id(text_id: str, language: str = None, skip: int = 0, limit: int = 10) -> TableOfContentResponse:
     
     if language is None:
@@ -327,6 +351,8 @@ async def create_new_text(
         if not valid_group:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.GROUP_NOT_FOUND_MESSAGE)
         new_text = await create_text(create_text_request=create_text_request)
+        if new_text.type != TextType.SHEET:
+            await delete_recitation_catalog_cache()
         return TextDTO(
             id=str(new_text.id),
             pecha_text_id=str(new_text.pecha_text_id),
@@ -365,6 +391,19 @@ async def create_table_of_content(table_of_content_request: TableOfContent, toke
 
 
 
+async def replace_table_of_content(table_of_content_request: TableOfContent, token: str):
+    # Patch the sections of the existing table of content in place, keeping its id
+    is_valid_user = validate_user_exists(token=token)
+    if not is_valid_user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=ErrorConstants.TOKEN_ERROR_MESSAGE)
+    segment_ids = TextUtils.get_all_segment_ids(table_of_content=table_of_content_request)
+    if segment_ids:
+        await SegmentUtils.validate_segments_exists(segment_ids=list(dict.fromkeys(segment_ids)))
+    is_updated = await update_table_of_content_sections(text_id=table_of_content_request.text_id, sections=table_of_content_request.sections)
+    if not is_updated:
+        await create_table_of_content_detail(table_of_content_request=table_of_content_request)
+
+
 # PRIVATE FUNCTIONS
 
 async def get_table_of_content_by_type(table_of_content: TableOfContent):
@@ -584,6 +623,9 @@ async def update_text_details(text_id: str, update_text_request: UpdateTextReque
     
     # Update the text details in the database
     updated_text = await update_text_details_by_id(text_id=text_id, update_text_request=update_text_request)
+    if text_details.type != TextType.SHEET.value:
+        await delete_recitation_catalog_cache()
+        refresh_user_recitation_text_details(text_id=text_id, title=update_text_request.title)
     
     # Update the cache with the new text details
     try:
@@ -601,6 +643,8 @@ async def delete_text_by_text_id(text_id: str):
     if not is_valid_text:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.TEXT_NOT_FOUND_MESSAGE)
     await delete_text_by_id(text_id=text_id)
+    await delete_recitation_catalog_cache()
+    delete_user_recitations_of_text(text_id=text_id)
 
 
 def _filter_single_section_(section: Section, wanted_segment_ids: Set[str]) -> Section | None:
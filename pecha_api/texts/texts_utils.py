@@ -28,7 +28,9 @@ from .texts_models import Text
 from .texts_cache_service import (
     get_text_details_by_id_cache,
     set_text_details_by_id_cache,
-    delete_text_details_by_id_cache
+    delete_text_details_by_id_cache,
+    get_text_details_by_ids_cache,
+    set_text_details_by_ids_cache
 )
 
 from pecha_api.constants import Constants
@@ -44,7 +46,16 @@ class TextUtils:
 
     @staticmethod
     async def get_text_details_by_ids(text_ids: List[str]) -> Dict[str, TextDTO]:
-        texts_detail = await get_texts_by_ids(text_ids=text_ids)
+        # One cache round trip for all ids, then one query for the misses; unknown ids are left out
+        text_ids = list(dict.fromkeys(text_ids))
+        if not text_ids:
+            return {}
+        texts_detail: Dict[str, TextDTO] = await get_text_details_by_ids_cache(text_ids=text_ids, cache_type=CacheType.TEXT_DETAIL)
+        missing_text_ids = [text_id for text_id in text_ids if text_id not in texts_detail]
+        if missing_text_ids:
+            fetched_texts_detail = await get_texts_by_ids(text_ids=missing_text_ids)
+            await set_text_details_by_ids_cache(cache_type=CacheType.TEXT_DETAIL, data=fetched_texts_detail)
+            texts_detail.update(fetched_texts_detail)
         return texts_detail
     
     @staticmethod
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import uuid
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from redis.exceptions import ResponseError
+
+from pecha_api import config
+from pecha_api.cache.cache_repository import get_client
+from pecha_api.cache.cache_enums import CacheType
+from pecha_api.db.mongo_database import lifespan
+from .texts_repository import increment_text_views
+from .texts_cache_service import delete_text_details_by_ids_cache
+
+# Views are counted in Redis on the read path and written to Mongo by flush_text_views with one $inc per text,
+# so a hot text costs one HINCRBY per read instead of one Mongo write.
+
+# Field of the flushing hash naming the flush; text ids are UUIDs, so it never collides with a text
+_FLUSH_ID_FIELD = "_flush_id"
+
+
+def _pending_views_key() -> str:
+    return f"{config.get('CACHE_PREFIX')}text_views:pending"
+
+
+def _flushing_views_key() -> str:
+    return f"{config.get('CACHE_PREFIX')}text_views:flushing"
+
+
+def _unique_viewers_key(text_id: str) -> str:
+    return f"{config.get('CACHE_PREFIX')}text_views:unique:{text_id}"
+
+
+def get_viewer(request: Request) -> Optional[str]:
+    # Unique viewers are estimated per client address. Behind a proxy, uvicorn resolves X-Forwarded-For into
+    # request.client only for the proxies trusted by --forwarded-allow-ips (FORWARDED_ALLOW_IPS), so a client
+    # cannot pose as many viewers by sending the header itself.
+    return request.client.host if request.client else None
+
+
+async def record_text_view(text_id: str, viewer: Optional[str] = None) -> None:
+    try:
+        client = get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hincrby(_pending_views_key(), text_id, 1)
+            if viewer:
+                pipe.pfadd(_unique_viewers_key(text_id), viewer)
+            await pipe.execute()
+    except Exception:
+        logging.error("An error occurred in record_text_view", exc_info=True)
+
+
+async def get_pending_views(text_ids: List[str]) -> Dict[str, int]:
+    """Views recorded in Redis that are not yet flushed to Mongo, including a flush in progress"""
+    if not text_ids:
+        return {}
+    try:
+        client = get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hmget(_pending_views_key(), text_ids)
+            pipe.hmget(_flushing_views_key(), text_ids)
+            pending, flushing = await pipe.execute()
+    except Exception:
+        logging.error("An error occurred in get_pending_views", exc_info=True)
+        return {}
+    return {
+        text_id: int(pending_count or 0) + int(flushing_count or 0)
+        for text_id, pending_count, flushing_count in zip(text_ids, pending, flushing)
+    }
+
+
+async def get_unique_viewers(text_id: str) -> int:
+    try:
+        return await get_client().pfcount(_unique_viewers_key(text_id))
+    except Exception:
+        logging.error("An error occurred in get_unique_viewers", exc_info=True)
+        return 0
+
+
+async def flush_text_views() -> int:
+    """Move the buffered view counts into Text.views and return how many texts were updated.
+
+    The pending hash is renamed before it is read, so views recorded during a flush land in a fresh hash.
+    A flush that fails keeps the renamed hash and is retried by the next call. The hash carries a flush id
+    that each text records with its $inc, so a retry skips the texts the failed attempt already counted.
+    Cached text details are dropped before the flushing hash, so readers never add the pending count
+    to a base that predates the flush.
+    """
+    client = get_client()
+    pending_key, flushing_key = _pending_views_key(), _flushing_views_key()
+    if not await client.exists(flushing_key):
+        try:
+            await client.rename(pending_key, flushing_key)
+        except ResponseError:
+            # Nothing was viewed since the last flush
+            return 0
+    # Kept by a retry, so the retry writes under the id of the attempt it repeats
+    await client.hsetnx(flushing_key, _FLUSH_ID_FIELD, uuid.uuid4().hex)
+
+    buffered = {
+        (field.decode() if isinstance(field, bytes) else field): (value.decode() if isinstance(value, bytes) else value)
+        for field, value in (await client.hgetall(flushing_key)).items()
+    }
+    flush_id = buffered.pop(_FLUSH_ID_FIELD)
+    views = {text_id: int(count) for text_id, count in buffered.items() if int(count) > 0}
+    await increment_text_views(views=views, flush_id=flush_id)
+    await delete_text_details_by_ids_cache(text_ids=list(views), cache_type=CacheType.TEXT_DETAIL)
+    await client.delete(flushing_key)
+    return len(views)
+
+
+async def _run_flush_loop_(interval: int):
+    async with lifespan(FastAPI()):
+        while True:
+            try:
+                flushed = await flush_text_views()
+                if flushed:
+                    logging.info(f"Flushed views of {flushed} texts")
+            except Exception:
+                logging.error("An error occurred while flushing text views", exc_info=True)
+            await asyncio.sleep(interval)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run_flush_loop_(interval=config.get_int("TEXT_VIEWS_FLUSH_INTERVAL_IN_SEC")))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from starlette import status
 
@@ -24,6 +24,7 @@ from .texts_response_models import (
     DetailTableOfContentResponse,
     TextDetailsRequest
 )
+from .texts_view_counter import get_viewer
 
 oauth2_scheme = HTTPBearer()
 text_router = APIRouter(
@@ -34,6 +35,7 @@ text_router = APIRouter(
 
 @text_router.get("", status_code=status.HTTP_200_OK)
 async def get_text(
+    request: Request,
     text_id: Optional[str] = Query(default=None),
     collection_id: Optional[str] = Query(default=None),
     language: str = Query(default=None),
@@ -45,7 +47,8 @@ async def get_text(
         collection_id=collection_id,
         language=language,
         skip=skip,
-        limit=limit
+        limit=limit,
+        viewer=get_viewer(request=request)
     )
 
 
@@ -1,23 +1,33 @@
+import threading
+import time
+from collections import OrderedDict
 from http import HTTPMethod
 from io import BytesIO
+from typing import Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from fastapi import UploadFile, HTTPException
 import logging
 
 from starlette import status
 
-from ..config import get
+from ..config import get, get_int
 
 s3_client = boto3.client(
     "s3",
     aws_access_key_id=get("AWS_ACCESS_KEY"),
     aws_secret_access_key=get("AWS_SECRET_KEY"),
-    region_name=get("AWS_REGION")
-
+    region_name=get("AWS_REGION"),
+    # Sync upload views run in FastAPI's thread pool and share this client
+    config=Config(max_pool_connections=get_int("AWS_MAX_POOL_CONNECTIONS"))
 )
 
+# (bucket_name, s3_key) -> (presigned_url, cached_until)
+_presigned_url_cache: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+_presigned_url_cache_lock = threading.Lock()
+
 
 def upload_file(bucket_name: str, s3_key: str, file: UploadFile) -> str:
     try:
@@ -64,19 +74,40 @@ def upload_bytes(bucket_name: str, s3_key: str, file: BytesIO, content_type: str
 
 def generate_presigned_access_url(bucket_name: str, s3_key: str):
     if isinstance(s3_key, str) and s3_key.strip():
+        cache_key = (bucket_name, s3_key)
+        now = time.monotonic()
+        with _presigned_url_cache_lock:
+            cached = _presigned_url_cache.get(cache_key)
+            if cached is not None and cached[1] > now:
+                _presigned_url_cache.move_to_end(cache_key)
+                return cached[0]
         # Generate a presigned URL for uploading an object
+        expires_in = get_int("IMAGE_EXPIRATION_IN_SEC")
         presigned_url = s3_client.generate_presigned_url(
             ClientMethod="get_object",
             Params={
                 "Bucket": bucket_name,
                 "Key": s3_key
             },
-            ExpiresIn=3600
+            ExpiresIn=expires_in
         )
+        # Hand out a cached URL only while it still has a safety margin of validity left
+        cache_ttl = expires_in - get_int("PRESIGNED_URL_CACHE_MARGIN_IN_SEC")
+        if cache_ttl > 0:
+            with _presigned_url_cache_lock:
+                _presigned_url_cache[cache_key] = (presigned_url, now + cache_ttl)
+                _presigned_url_cache.move_to_end(cache_key)
+                while len(_presigned_url_cache) > get_int("PRESIGNED_URL_CACHE_SIZE"):
+                    _presigned_url_cache.popitem(last=False)
         return presigned_url
     return ""
 
 
+def clear_presigned_url_cache() -> None:
+    with _presigned_url_cache_lock:
+        _presigned_url_cache.clear()
+
+
 def delete_file(file_path: str):
     try:
         s3_client.delete_object(
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import jose
 from fastapi import HTTPException, status, UploadFile
@@ -12,7 +12,7 @@ from .user_response_models import UserInfoRequest, UserInfoResponse, SocialMedia
 from .users_enums import SocialProfile
 from .users_models import Users, SocialMediaAccount
 from ..auth.auth_repository import validate_token
-from .users_repository import get_user_by_email, update_user, get_user_by_username
+from .users_repository import get_user_by_email, update_user, get_user_by_username, get_users_by_emails
 from ..uploads.S3_utils import delete_file, upload_bytes, generate_presigned_access_url
 from ..db.database import SessionLocal
 from ..config import get
@@ -38,6 +38,12 @@ def fetch_user_by_email(email: str) -> Optional[UserInfoResponse]:
     return generate_user_info_response(user=user)
 
 
+def fetch_users_by_emails(emails: List[str]) -> Dict[str, Users]:
+    with SessionLocal() as db_session:
+        users = get_users_by_emails(db=db_session, emails=list(set(emails)))
+    return {user.email: user for user in users}
+
+
 def generate_user_info_response(user: Users) -> Optional[UserInfoResponse]:
     if user:
         social_media_profiles = []
@@ -7,16 +7,15 @@ from jose import JWTError
 from jose.exceptions import JWTClaimsError
 from jwt import ExpiredSignatureError
 from starlette import status
-from uuid import uuid4
+from uuid import uuid4, UUID
 from typing import List
 
 # Stub heavy repository module before importing the service to avoid ORM initialization during import
 _stub_repo_module = types.ModuleType("pecha_api.plans.public.plan_repository")
 setattr(_stub_repo_module, "get_published_plans_by_author_id", MagicMock())
 # Ensure other imports from this module in unrelated tests still work
-setattr(_stub_repo_module, "get_published_plans_from_db", MagicMock())
-setattr(_stub_repo_module, "get_published_plans_count", MagicMock())
-setattr(_stub_repo_module, "get_published_plan_by_id", MagicMock())
+setattr(_stub_repo_module, "get_published_catalog_plans", MagicMock())
+setattr(_stub_repo_module, "search_published_plans", MagicMock())
 setattr(_stub_repo_module, "get_plan_items_by_plan_id", MagicMock())
 setattr(_stub_repo_module, "get_plan_item_by_day_number", MagicMock())
 sys.modules["pecha_api.plans.public.plan_repository"] = _stub_repo_module
@@ -933,6 +932,55 @@ class TestGetPlansByAuthor:
         assert result.plans[1].image.medium == "url-b-med"
         assert result.plans[1].image.original == "url-b-orig"
 
+    @patch('pecha_api.plans.authors.plan_authors_service._get_author_details_by_id')
+    @patch('pecha_api.plans.authors.plan_authors_service.get_published_plans_by_author_id')
+    @patch('pecha_api.plans.authors.plan_authors_service.generate_presigned_access_url')
+    @patch('pecha_api.plans.authors.plan_authors_service.get')
+    @pytest.mark.asyncio
+    async def test_get_plans_by_author_with_cursor(
+        self,
+        mock_get_config,
+        mock_generate_presigned_url,
+        mock_get_published_plans,
+        mock_get_author_by_id,
+    ):
+        """Test keyset pagination in get_plans_by_author."""
+        from datetime import datetime, timezone
+        from pecha_api.plans.plans_pagination import encode_cursor, decode_cursor, parse_datetime
+
+        author_id = uuid4()
+        mock_get_author_by_id.return_value = TestDataFactory.create_mock_author(author_id=author_id)
+        aggregates = []
+        for day in (7, 6):
+            plan_obj = MagicMock()
+            plan_obj.id = uuid4()
+            plan_obj.title = f"Plan {day}"
+            plan_obj.description = "Desc"
+            plan_obj.language = "en"
+            plan_obj.image_url = None
+            plan_obj.created_at = datetime(2025, 12, day, tzinfo=timezone.utc)
+            aggregate = MagicMock()
+            aggregate.plan = plan_obj
+            aggregate.total_days = 3
+            aggregate.subscription_count = 1
+            aggregates.append(aggregate)
+        mock_get_published_plans.return_value = (aggregates, None)
+        cursor_created_at = datetime(2025, 12, 8, tzinfo=timezone.utc)
+        cursor_id = uuid4()
+
+        result = await get_plans_by_author(author_id, skip=5, limit=1, cursor=encode_cursor(cursor_created_at, cursor_id))
+
+        kwargs = mock_get_published_plans.call_args.kwargs
+        assert kwargs["after"] == (cursor_created_at, cursor_id)
+        assert kwargs["skip"] == 0
+        assert kwargs["limit"] == 2
+        assert kwargs["count_total"] is False
+        assert result.skip == 0
+        assert result.total is None
+        assert [plan.title for plan in result.plans] == ["Plan 7"]
+        first_plan = aggregates[0].plan
+        assert decode_cursor(result.next_cursor, parse_datetime, UUID) == (first_plan.created_at, first_plan.id)
+
 
 class TestGetAuthorDetailsById:
     """Test cases for _get_author_details_by_id function."""
@@ -158,7 +158,7 @@ async def test_get_plans_for_selected_author_success():
         resp = await get_plans_endpoint(author_id=author_id)
 
         # View forwards author_id with pagination defaults skip=0, limit=10
-        mock_service.assert_awaited_once_with(author_id=author_id, skip=0, limit=10)
+        mock_service.assert_awaited_once_with(author_id=author_id, skip=0, limit=10, cursor=None)
         assert resp == expected
 
 
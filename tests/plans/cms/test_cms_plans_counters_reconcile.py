@@ -0,0 +1,15 @@
+from unittest.mock import patch, MagicMock
+
+from pecha_api.plans.cms.cms_plans_counters_reconcile import reconcile_counters
+
+
+def test_reconcile_counters_runs_the_reconcile_in_one_session():
+    db_session = MagicMock()
+
+    with patch("pecha_api.plans.cms.cms_plans_counters_reconcile.SessionLocal") as mock_session_local, \
+        patch("pecha_api.plans.cms.cms_plans_counters_reconcile.reconcile_plan_counters", return_value=3) as mock_reconcile:
+        mock_session_local.return_value.__enter__.return_value = db_session
+
+        assert reconcile_counters() == 3
+
+    mock_reconcile.assert_called_once_with(db=db_session)
@@ -1,7 +1,7 @@
 import os
 import uuid
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from pecha_api.db.database import Base
@@ -9,7 +9,10 @@ from pecha_api.plans.plans_models import Plan
 from pecha_api.plans.items.plan_items_models import PlanItem
 from pecha_api.plans.users.plan_users_models import UserPlanProgress
 from pecha_api.plans.authors.plan_authors_model import Author
-from pecha_api.plans.cms.cms_plans_repository import save_plan, get_plans_by_author_id
+from pecha_api.plans.cms.cms_plans_repository import save_plan, get_plans_by_author_id, reconcile_plan_counters
+from pecha_api.plans.items.plan_items_repository import save_plan_items
+from pecha_api.plans.public.plan_repository import search_published_plans
+from pecha_api.plans.plans_enums import PlanStatus, LanguageCode
 from pecha_api.plans.plans_response_models import PlansRepositoryResponse
 from pecha_api.users.users_models import Users
 
@@ -26,6 +29,8 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 
 @pytest.fixture(scope="module")
 def db():
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     # Create only the plans-related tables needed for these tests
     Base.metadata.create_all(
         bind=engine,
@@ -142,14 +147,11 @@ def test_get_plans_sort_by_total_days_desc(db):
         )
         p = save_plan(db, p)
         created[title] = p
-        for day in range(count):
-            item = PlanItem(
-                plan_id=p.id,
-                day_number=day + 1,
-                created_by="tester",
-            )
-            db.add(item)
-        db.commit()
+        if count:
+            save_plan_items(db, [
+                PlanItem(plan_id=p.id, day_number=day + 1, created_by="tester")
+                for day in range(count)
+            ])
 
     repo_resp = get_plans_by_author_id(
         db=db,
@@ -171,3 +173,68 @@ def test_get_plans_sort_by_total_days_desc(db):
     ]
 
 
+def test_reconcile_plan_counters_fixes_drifted_totals(db):
+    author = _create_author(db)
+    plan = save_plan(db, Plan(
+        title="Drifted Plan",
+        description="desc",
+        author_id=author.id,
+        created_by="tester",
+    ))
+    db.add_all([
+        PlanItem(plan_id=plan.id, day_number=day, created_by="tester")
+        for day in range(1, 4)
+    ])
+    db.commit()
+
+    updated = reconcile_plan_counters(db)
+    db.refresh(plan)
+
+    assert updated >= 1
+    assert plan.total_days == 3
+    assert plan.subscription_count == 0
+    assert reconcile_plan_counters(db) == 0
+
+
+def test_get_plans_search_ranks_title_matches_over_tag_and_description_matches(db):
+    author = _create_author(db)
+    for title, description, tags in [
+        ("Evening Reflection", "Cultivating compassion before sleep", []),
+        ("Compassion Basics", "First steps", []),
+        ("Loving Kindness", "Wishing others well", ["compassion"]),
+        ("Unrelated Plan", "Nothing to see", []),
+    ]:
+        save_plan(db, Plan(title=title, description=description, tags=tags, author_id=author.id, created_by="tester"))
+
+    repo_resp = get_plans_by_author_id(
+        db=db,
+        search="compassionate",
+        author_id=author.id,
+        is_admin=False,
+        sort_by="relevance",
+        sort_order="asc",
+        skip=0,
+        limit=10,
+    )
+
+    titles = [r.plan.title for r in repo_resp.plan_info]
+    assert repo_resp.total == 3
+    assert titles[0] == "Compassion Basics"
+    assert set(titles) == {"Compassion Basics", "Evening Reflection", "Loving Kindness"}
+
+
+def test_search_published_plans_matches_partial_titles_of_the_language_only(db):
+    author = _create_author(db)
+    for title, language, plan_status in [
+        ("Meditation Retreat", LanguageCode.EN, PlanStatus.PUBLISHED),
+        ("Meditation Draft", LanguageCode.EN, PlanStatus.DRAFT),
+        ("Meditation in Tibetan", LanguageCode.BO, PlanStatus.PUBLISHED),
+    ]:
+        save_plan(db, Plan(title=title, language=language, status=plan_status, author_id=author.id, created_by="tester"))
+
+    plans, total = search_published_plans(
+        db=db, search="medit", language="EN", sort_by="relevance", sort_order="asc", skip=0, limit=10
+    )
+
+    assert total == 1
+    assert [plan.title for plan in plans] == ["Meditation Retreat"]
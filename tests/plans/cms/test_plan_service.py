@@ -1,6 +1,6 @@
 import uuid
 import pytest
-from unittest.mock import patch, MagicMock, ANY
+from unittest.mock import patch, MagicMock, AsyncMock, ANY
 from fastapi import HTTPException
 
 import pecha_api.plans.cms.cms_plans_service as plans_service
@@ -10,13 +10,16 @@ from pecha_api.plans.items.plan_items_models import PlanItem
 from pecha_api.plans.tasks.plan_tasks_models import PlanTask
 from pecha_api.plans.plans_response_models import (
     CreatePlanRequest, UpdatePlanRequest, PlanStatusUpdate,
-    PlanDTO,PlanWithAggregates, PlansRepositoryResponse, AuthorDTO
+    PlanDTO,PlanWithAggregates, PlansRepositoryResponse, AuthorDTO,
+    ImportPlanRequest, ImportPlanDayRequest, ImportTaskRequest, ImportSubTaskRequest
 )
 from pecha_api.plans.cms.cms_plans_service import (
     create_new_plan, get_filtered_plans, get_details_plan,
     update_plan_details, update_selected_plan_status, delete_selected_plan, get_plan_day_details,
+    update_plan_featured_service, import_plan_service,
     DUMMY_PLANS, DUMMY_DAYS
 )
+from pecha_api.plans.response_message import DUPLICATE_DAY_NUMBERS, MEDIA_SUB_TASK_WITHOUT_CONTENT, INVALID_PLAN_LANGUAGE, PLAN_IMPORT_WITHOUT_DAYS
 
 
 def _mock_session_local(mock_session_local):
@@ -438,6 +441,7 @@ async def test_update_plan_details_success():
     author_id = uuid.uuid4()
     
     mock_plan = MagicMock(spec=Plan)
+    mock_plan.featured = False
     mock_plan.id = plan_id
     mock_plan.author_id = author_id
     mock_plan.title = "Original Title"
@@ -515,6 +519,7 @@ async def test_update_plan_details_partial_update():
     author_id = uuid.uuid4()
     
     mock_plan = MagicMock(spec=Plan)
+    mock_plan.featured = False
     mock_plan.id = plan_id
     mock_plan.author_id = author_id
     mock_plan.title = "Original Title"
@@ -601,6 +606,7 @@ async def test_update_plan_details_with_image_url_generation():
     author_id = uuid.uuid4()
     
     mock_plan = MagicMock(spec=Plan)
+    mock_plan.featured = False
     mock_plan.id = plan_id
     mock_plan.author_id = author_id
     mock_plan.title = "Test Plan"
@@ -657,6 +663,7 @@ async def test_update_plan_details_image_url_generation_failure():
     author_id = uuid.uuid4()
     
     mock_plan = MagicMock(spec=Plan)
+    mock_plan.featured = False
     mock_plan.id = plan_id
     mock_plan.author_id = author_id
     mock_plan.title = "Test Plan"
@@ -710,6 +717,7 @@ async def test_update_plan_details_no_image_url():
     author_id = uuid.uuid4()
     
     mock_plan = MagicMock(spec=Plan)
+    mock_plan.featured = False
     mock_plan.id = plan_id
     mock_plan.author_id = author_id
     mock_plan.title = "Test Plan"
@@ -766,6 +774,7 @@ async def test_update_selected_plan_status_success_db_backed():
     mock_plan.image_url = "images/plan.jpg"
     mock_plan.tags = ["t"]
     mock_plan.status = PlanStatus.DRAFT
+    mock_plan.featured = True
 
     items = [MagicMock(spec=PlanItem), MagicMock(spec=PlanItem)]
     user_progress = [MagicMock(), MagicMock(), MagicMock()]
@@ -777,6 +786,8 @@ async def test_update_selected_plan_status_success_db_backed():
          patch("pecha_api.plans.cms.cms_plans_service.get_plan_items_by_plan_id") as mock_get_items, \
          patch("pecha_api.plans.cms.cms_plans_service.get_plan_progress") as mock_get_progress, \
          patch("pecha_api.plans.cms.cms_plans_service.update_plan") as mock_update_plan, \
+         patch("pecha_api.plans.cms.cms_plans_service.invalidate_featured_day_cache", new_callable=AsyncMock) as mock_invalidate, \
+         patch("pecha_api.plans.cms.cms_plans_service.refresh_plan_catalog", new_callable=AsyncMock) as mock_refresh_catalog, \
          patch("pecha_api.plans.cms.cms_plans_service.validate_and_extract_author_details") as mock_validate_author:
         db_session = _mock_session_local(mock_session_local)
 
@@ -795,6 +806,8 @@ async def test_update_selected_plan_status_success_db_backed():
         mock_get_plan_by_id.assert_called_once_with(db=db_session, plan_id=plan_id)
         mock_get_items.assert_called_with(db=db_session, plan_id=plan_id)
         mock_update_plan.assert_called_once_with(db=db_session, plan=mock_plan)
+        mock_invalidate.assert_awaited_once_with(language="EN")
+        mock_refresh_catalog.assert_awaited_once_with(language="EN")
 
         assert resp.id == plan_id
         assert resp.status == PlanStatus.PUBLISHED
@@ -891,10 +904,12 @@ async def test_delete_selected_plan_success():
     plan = MagicMock(spec=Plan)
     plan.id = plan_id
     plan.author_id = author.id
+    plan.featured = False
 
     with patch("pecha_api.plans.cms.cms_plans_service.SessionLocal") as mock_session_local, \
         patch("pecha_api.plans.cms.cms_plans_service.get_plan_by_id") as mock_get_plan_by_id, \
         patch("pecha_api.plans.cms.cms_plans_service._soft_delete_plan_by_id") as mock_soft_delete, \
+        patch("pecha_api.plans.cms.cms_plans_service.invalidate_featured_day_cache", new_callable=AsyncMock) as mock_invalidate, \
         patch("pecha_api.plans.cms.cms_plans_service.validate_and_extract_author_details") as mock_validate_author:
         db_session = _mock_session_local(mock_session_local)
         mock_validate_author.return_value = author
@@ -905,4 +920,151 @@ async def test_delete_selected_plan_success():
         mock_validate_author.assert_called_once_with(token="dummy-token")
         mock_get_plan_by_id.assert_called_once_with(db=db_session, plan_id=plan_id)
         mock_soft_delete.assert_called_once_with(db=db_session, plan_id=plan_id, author=author)
+        mock_invalidate.assert_not_awaited()
 
+
+@pytest.mark.asyncio
+async def test_update_plan_featured_service_toggles_and_invalidates_featured_day():
+    plan_id = uuid.uuid4()
+    author = MagicMock(id=uuid.uuid4(), is_admin=False)
+
+    plan = MagicMock(spec=Plan)
+    plan.id = plan_id
+    plan.author_id = author.id
+    plan.featured = False
+    plan.language = "BO"
+
+    with patch("pecha_api.plans.cms.cms_plans_service.SessionLocal") as mock_session_local, \
+        patch("pecha_api.plans.cms.cms_plans_service.get_plan_by_id", return_value=plan), \
+        patch("pecha_api.plans.cms.cms_plans_service.update_plan", return_value=plan) as mock_update_plan, \
+        patch("pecha_api.plans.cms.cms_plans_service.invalidate_featured_day_cache", new_callable=AsyncMock) as mock_invalidate, \
+        patch("pecha_api.plans.cms.cms_plans_service.validate_and_extract_author_details", return_value=author):
+        db_session = _mock_session_local(mock_session_local)
+
+        await update_plan_featured_service(token="dummy-token", plan_id=plan_id)
+
+        assert plan.featured is True
+        mock_update_plan.assert_called_once_with(db=db_session, plan=plan)
+        mock_invalidate.assert_awaited_once_with(language="BO")
+
+
+@pytest.mark.asyncio
+async def test_delete_selected_published_plan_refreshes_public_catalog():
+    plan_id = uuid.uuid4()
+    author = MagicMock(id=uuid.uuid4(), is_admin=False)
+
+    plan = MagicMock(spec=Plan)
+    plan.id = plan_id
+    plan.author_id = author.id
+    plan.featured = False
+    plan.status = PlanStatus.PUBLISHED
+    plan.language = "ZH"
+
+    with patch("pecha_api.plans.cms.cms_plans_service.SessionLocal") as mock_session_local, \
+        patch("pecha_api.plans.cms.cms_plans_service.get_plan_by_id", return_value=plan), \
+        patch("pecha_api.plans.cms.cms_plans_service._soft_delete_plan_by_id"), \
+        patch("pecha_api.plans.cms.cms_plans_service.refresh_plan_catalog", new_callable=AsyncMock) as mock_refresh_catalog, \
+        patch("pecha_api.plans.cms.cms_plans_service.validate_and_extract_author_details", return_value=author):
+        _mock_session_local(mock_session_local)
+
+        await delete_selected_plan(token="dummy-token", plan_id=plan_id)
+
+        mock_refresh_catalog.assert_awaited_once_with(language="ZH")
+
+
+@pytest.mark.asyncio
+async def test_refresh_public_plan_catalogs_swallows_rebuild_errors():
+    with patch("pecha_api.plans.cms.cms_plans_service.refresh_plan_catalog", new_callable=AsyncMock,
+               side_effect=Exception("cache down")) as mock_refresh_catalog:
+        await plans_service._refresh_public_plan_catalogs("EN", "EN")
+
+    mock_refresh_catalog.assert_awaited_once_with(language="EN")
+
+
+def _import_request(days=None, language="en") -> ImportPlanRequest:
+    if days is None:
+        days = [
+            ImportPlanDayRequest(day_number=2, tasks=[
+                ImportTaskRequest(title="Evening reading", subtasks=[ImportSubTaskRequest(content_type=ContentType.TEXT, content="Read")])
+            ]),
+            ImportPlanDayRequest(day_number=1, tasks=[
+                ImportTaskRequest(title="Breathing", estimated_time=10, subtasks=[
+                    ImportSubTaskRequest(content_type=ContentType.TEXT, content="Sit comfortably"),
+                    ImportSubTaskRequest(content_type=ContentType.IMAGE, content="images/plan/breathing.jpg"),
+                ]),
+                ImportTaskRequest(title="Listening", subtasks=[
+                    ImportSubTaskRequest(content_type=ContentType.AUDIO, content="https://example.com/talk.mp3", duration="10:00")
+                ]),
+            ]),
+        ]
+    return ImportPlanRequest(
+        title="Imported Plan",
+        description="A plan imported in one request",
+        difficulty_level=DifficultyLevel.BEGINNER,
+        language=language,
+        tags=["imported"],
+        days=days,
+    )
+
+
+def test_import_plan_service_saves_tree_in_one_call_and_returns_id_mapping():
+    author = MagicMock()
+    author.id = uuid.uuid4()
+    author.email = "author@example.com"
+
+    with patch("pecha_api.plans.cms.cms_plans_service.SessionLocal") as mock_session_local, \
+        patch("pecha_api.plans.cms.cms_plans_service.save_plan_tree") as mock_save_tree, \
+        patch("pecha_api.plans.cms.cms_plans_service.validate_and_extract_author_details", return_value=author):
+        db_session = _mock_session_local(mock_session_local)
+
+        result = import_plan_service(token="dummy-token", import_plan_request=_import_request())
+
+    mock_save_tree.assert_called_once()
+    kwargs = mock_save_tree.call_args.kwargs
+    assert kwargs["db"] is db_session
+
+    plan_row = kwargs["plan_row"]
+    assert plan_row["id"] == result.id
+    assert plan_row["author_id"] == author.id
+    assert plan_row["status"] == PlanStatus.DRAFT
+    assert plan_row["language"].value == "EN"
+    assert plan_row["total_days"] == 2
+
+    assert [row["day_number"] for row in kwargs["item_rows"]] == [1, 2]
+    assert [(row["title"], row["display_order"]) for row in kwargs["task_rows"]] == [
+        ("Breathing", 1), ("Listening", 2), ("Evening reading", 1)
+    ]
+    assert [row["display_order"] for row in kwargs["sub_task_rows"]] == [1, 2, 1, 1]
+
+    assert result.total_days == 2
+    assert [day.day_number for day in result.days] == [1, 2]
+    first_day = result.days[0]
+    assert first_day.id == kwargs["item_rows"][0]["id"]
+    assert [task.id for task in first_day.tasks] == [row["id"] for row in kwargs["task_rows"][:2]]
+    assert first_day.tasks[0].subtask_ids == [row["id"] for row in kwargs["sub_task_rows"][:2]]
+    assert all(row["task_id"] == first_day.tasks[0].id for row in kwargs["sub_task_rows"][:2])
+
+
+@pytest.mark.parametrize(
+    "import_request, message",
+    [
+        (_import_request(days=[]), PLAN_IMPORT_WITHOUT_DAYS),
+        (_import_request(days=[ImportPlanDayRequest(day_number=1), ImportPlanDayRequest(day_number=1)]), DUPLICATE_DAY_NUMBERS),
+        (_import_request(days=[ImportPlanDayRequest(day_number=1, tasks=[
+            ImportTaskRequest(title="Video", subtasks=[ImportSubTaskRequest(content_type=ContentType.VIDEO)])
+        ])]), MEDIA_SUB_TASK_WITHOUT_CONTENT),
+        (_import_request(language="fr"), INVALID_PLAN_LANGUAGE),
+    ],
+)
+def test_import_plan_service_rejects_invalid_trees_before_touching_the_database(import_request, message):
+    with patch("pecha_api.plans.cms.cms_plans_service.SessionLocal") as mock_session_local, \
+        patch("pecha_api.plans.cms.cms_plans_service.save_plan_tree") as mock_save_tree, \
+        patch("pecha_api.plans.cms.cms_plans_service.validate_and_extract_author_details", return_value=MagicMock()):
+
+        with pytest.raises(HTTPException) as exc_info:
+            import_plan_service(token="dummy-token", import_plan_request=import_request)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["message"] == message
+    mock_session_local.assert_not_called()
+    mock_save_tree.assert_not_called()
@@ -0,0 +1,51 @@
+import uuid
+import pytest
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+
+from pecha_api.plans.cms.cms_plans_repository import save_plan_tree
+from pecha_api.plans.response_message import BAD_REQUEST
+
+
+def _rows(count: int):
+    return [{"id": uuid.uuid4()} for _ in range(count)]
+
+
+def test_save_plan_tree_runs_one_executemany_per_table_and_commits_once():
+    db = MagicMock()
+    plan_row = {"id": uuid.uuid4()}
+    item_rows, task_rows, sub_task_rows = _rows(365), _rows(730), _rows(1460)
+
+    save_plan_tree(db=db, plan_row=plan_row, item_rows=item_rows, task_rows=task_rows, sub_task_rows=sub_task_rows)
+
+    inserted = [(call.args[0].table.name, call.args[1]) for call in db.execute.call_args_list]
+    assert inserted == [
+        ("plans", [plan_row]),
+        ("items", item_rows),
+        ("tasks", task_rows),
+        ("sub_tasks", sub_task_rows),
+    ]
+    db.commit.assert_called_once()
+
+
+def test_save_plan_tree_skips_empty_levels():
+    db = MagicMock()
+
+    save_plan_tree(db=db, plan_row={"id": uuid.uuid4()}, item_rows=_rows(1), task_rows=[], sub_task_rows=[])
+
+    assert db.execute.call_count == 2
+
+
+def test_save_plan_tree_rolls_back_everything_on_error():
+    db = MagicMock()
+    db.execute.side_effect = [None, IntegrityError("INSERT", {}, Exception("duplicate key"))]
+
+    with pytest.raises(HTTPException) as exc_info:
+        save_plan_tree(db=db, plan_row={"id": uuid.uuid4()}, item_rows=_rows(2), task_rows=[], sub_task_rows=[])
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["error"] == BAD_REQUEST
+    assert exc_info.value.detail["message"] == "duplicate key"
+    db.rollback.assert_called_once()
+    db.commit.assert_not_called()
@@ -1,13 +1,26 @@
 import pytest
 from uuid import uuid4
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import patch, MagicMock, Mock, AsyncMock
 from fastapi import HTTPException
 from starlette import status
-from datetime import date
-
-from pecha_api.plans.featured.featured_day_service import get_featured_day_service
+from datetime import date, datetime, timezone
+
+from pecha_api.plans.featured.featured_day_service import (
+    get_featured_day_service,
+    invalidate_featured_day_cache,
+    invalidate_featured_day_cache_of_plan,
+    invalidate_featured_day_cache_of_days,
+    _seconds_until_utc_midnight,
+)
 from pecha_api.plans.featured.featured_day_response_model import PlanDayDTO, TaskDTO, SubTaskDTO
-from pecha_api.plans.plans_enums import ContentType
+from pecha_api.plans.plans_enums import ContentType, LanguageCode
+
+
+@pytest.fixture(autouse=True)
+def featured_day_cache():
+    with patch("pecha_api.plans.featured.featured_day_service.get_featured_day_cache", new_callable=AsyncMock, return_value=None) as mock_get, \
+         patch("pecha_api.plans.featured.featured_day_service.set_featured_day_cache", new_callable=AsyncMock) as mock_set:
+        yield mock_get, mock_set
 
 
 @pytest.fixture
@@ -51,16 +64,11 @@ def sample_plan_item(sample_task):
 
 @pytest.mark.asyncio
 async def test_get_featured_day_service_success(sample_plan_item, mock_db_session):
-    mock_date = MagicMock()
-    mock_date.toordinal.return_value = 738892 
-    
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[sample_plan_item]) as mock_repo, \
-         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1) as mock_repo, \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=sample_plan_item):
         
-        mock_datetime.now.return_value.date.return_value = mock_date
-        
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert isinstance(result, PlanDayDTO)
         assert result.id == sample_plan_item.id
@@ -84,7 +92,6 @@ async def test_get_featured_day_service_success(sample_plan_item, mock_db_sessio
         assert subtask.display_order == 1
         
         mock_repo.assert_called_once_with(mock_db_session.__enter__.return_value, language="EN")
-        mock_datetime.now.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -126,16 +133,12 @@ async def test_get_featured_day_service_multiple_tasks():
     mock_db_session.__enter__ = Mock(return_value=mock_db_session)
     mock_db_session.__exit__ = Mock(return_value=None)
     
-    mock_date = MagicMock()
-    mock_date.toordinal.return_value = 738892
     
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]) as mock_repo, \
-         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
-        
-        mock_datetime.now.return_value.date.return_value = mock_date
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1) as mock_repo, \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=plan_item):
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert result.day_number == 7
         assert len(result.tasks) == 2
@@ -154,10 +157,10 @@ async def test_get_featured_day_service_multiple_tasks():
 @pytest.mark.asyncio
 async def test_get_featured_day_service_no_featured_plans(mock_db_session):
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[]) as mock_repo:
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=0) as mock_repo:
         
         with pytest.raises(HTTPException) as exc_info:
-            get_featured_day_service(language="EN")
+            await get_featured_day_service(language="EN")
         
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
         assert exc_info.value.detail == "No featured plans with days found"
@@ -172,16 +175,12 @@ async def test_get_featured_day_service_empty_tasks(mock_db_session):
     plan_item.day_number = 1
     plan_item.tasks = []
     
-    mock_date = MagicMock()
-    mock_date.toordinal.return_value = 738892
     
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
-         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
-        
-        mock_datetime.now.return_value.date.return_value = mock_date
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=plan_item):
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert result.day_number == 1
         assert result.tasks == []
@@ -219,16 +218,12 @@ async def test_get_featured_day_service_task_sorting():
     mock_db_session.__enter__ = Mock(return_value=mock_db_session)
     mock_db_session.__exit__ = Mock(return_value=None)
     
-    mock_date = MagicMock()
-    mock_date.toordinal.return_value = 738892
     
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
-         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=plan_item):
         
-        mock_datetime.now.return_value.date.return_value = mock_date
-        
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert len(result.tasks) == 3
         assert result.tasks[0].title == "Task 1"
@@ -278,16 +273,12 @@ async def test_get_featured_day_service_subtask_sorting():
     mock_db_session.__enter__ = Mock(return_value=mock_db_session)
     mock_db_session.__exit__ = Mock(return_value=None)
     
-    mock_date = MagicMock()
-    mock_date.toordinal.return_value = 738892
     
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
-         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
-        
-        mock_datetime.now.return_value.date.return_value = mock_date
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=plan_item):
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert len(result.tasks[0].subtasks) == 3
         assert result.tasks[0].subtasks[0].content == "Subtask 1"
@@ -322,17 +313,25 @@ async def test_get_featured_day_service_date_based_selection_from_multiple():
     mock_db_session.__enter__ = Mock(return_value=mock_db_session)
     mock_db_session.__exit__ = Mock(return_value=None)
     
+    featured_date = date(2024, 1, 2)
+    mock_datetime = MagicMock()
+    mock_datetime.now.return_value.date.return_value = featured_date
+
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=featured_days):
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=len(featured_days)), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at",
+               side_effect=lambda db, position, language: featured_days[position]) as mock_day_at, \
+         patch("pecha_api.plans.featured.featured_day_service.datetime", mock_datetime), \
+         patch("pecha_api.plans.featured.featured_day_service._seconds_until_utc_midnight", return_value=60):
         
-        result1 = get_featured_day_service(language="EN")
-        result2 = get_featured_day_service(language="EN")
+        result1 = await get_featured_day_service(language="EN")
+        result2 = await get_featured_day_service(language="EN")
         
         assert result1.id == result2.id
         assert result1.day_number == result2.day_number
+        assert result1.id == featured_days[featured_date.toordinal() % 3].id
         
-        assert result1.day_number in [1, 2, 3]
-        
+        mock_day_at.assert_called_with(mock_db_session, position=featured_date.toordinal() % 3, language="EN")
         assert isinstance(result1, PlanDayDTO)
 
 
@@ -382,16 +381,12 @@ async def test_get_featured_day_service_with_all_content_types():
     mock_db_session.__enter__ = Mock(return_value=mock_db_session)
     mock_db_session.__exit__ = Mock(return_value=None)
     
-    mock_date = MagicMock()
-    mock_date.toordinal.return_value = 738892
     
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
-         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
-        
-        mock_datetime.now.return_value.date.return_value = mock_date
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=plan_item):
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         subtasks = result.tasks[0].subtasks
         assert len(subtasks) == 4
@@ -426,16 +421,12 @@ async def test_get_featured_day_service_with_optional_fields_none():
     mock_db_session.__enter__ = Mock(return_value=mock_db_session)
     mock_db_session.__exit__ = Mock(return_value=None)
     
-    mock_date = MagicMock()
-    mock_date.toordinal.return_value = 738892
     
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
-         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
-        
-        mock_datetime.now.return_value.date.return_value = mock_date
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=plan_item):
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert result.tasks[0].title is None
         assert result.tasks[0].estimated_time is None
@@ -448,10 +439,10 @@ async def test_get_featured_day_service_with_optional_fields_none():
 @pytest.mark.asyncio
 async def test_get_featured_day_service_database_error(mock_db_session):
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", side_effect=Exception("Database connection error")):
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", side_effect=Exception("Database connection error")):
         
         with pytest.raises(Exception) as exc_info:
-            get_featured_day_service(language="EN")
+            await get_featured_day_service(language="EN")
         
         assert str(exc_info.value) == "Database connection error"
 
@@ -463,16 +454,12 @@ async def test_get_featured_day_service_large_day_number(mock_db_session):
     plan_item.day_number = 365
     plan_item.tasks = []
     
-    mock_date = MagicMock()
-    mock_date.toordinal.return_value = 738892
     
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
-         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=plan_item):
         
-        mock_datetime.now.return_value.date.return_value = mock_date
-        
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert result.day_number == 365
 
@@ -505,18 +492,137 @@ async def test_get_featured_day_service_many_subtasks():
     mock_db_session.__enter__ = Mock(return_value=mock_db_session)
     mock_db_session.__exit__ = Mock(return_value=None)
     
-    mock_date = MagicMock()
-    mock_date.toordinal.return_value = 738892
     
     with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
-         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
-        
-        mock_datetime.now.return_value.date.return_value = mock_date
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=plan_item):
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert len(result.tasks[0].subtasks) == 20
         for i, subtask in enumerate(result.tasks[0].subtasks, 1):
             assert subtask.content == f"Subtask {i}"
             assert subtask.display_order == i
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_service_cache_hit_skips_database(featured_day_cache):
+    mock_get, mock_set = featured_day_cache
+    cached_day = PlanDayDTO(id=uuid4(), day_number=3, tasks=[])
+    mock_get.return_value = cached_day
+
+    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal") as mock_session_local:
+        result = await get_featured_day_service(language="en")
+
+    assert result == cached_day
+    mock_get.assert_awaited_once_with(language="EN", featured_date=datetime.now(timezone.utc).date())
+    mock_session_local.assert_not_called()
+    mock_set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_service_cache_miss_stores_day_until_midnight(featured_day_cache, sample_plan_item, mock_db_session):
+    _, mock_set = featured_day_cache
+
+    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=1), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_at", return_value=sample_plan_item), \
+         patch("pecha_api.plans.featured.featured_day_service._seconds_until_utc_midnight", return_value=1234):
+        result = await get_featured_day_service(language="en")
+
+    mock_set.assert_awaited_once()
+    kwargs = mock_set.await_args.kwargs
+    assert kwargs["language"] == "EN"
+    assert kwargs["cache_time_out"] == 1234
+    assert kwargs["data"].id == result.id
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_service_presigns_images_on_read_only(featured_day_cache):
+    mock_get, _ = featured_day_cache
+    mock_get.return_value = PlanDayDTO(
+        id=uuid4(),
+        day_number=1,
+        tasks=[
+            TaskDTO(
+                id=uuid4(),
+                subtasks=[
+                    SubTaskDTO(id=uuid4(), content_type=ContentType.IMAGE, content="images/day1.png", display_order=1),
+                    SubTaskDTO(id=uuid4(), content_type=ContentType.TEXT, content="Breathe", display_order=2)
+                ]
+            )
+        ]
+    )
+
+    with patch("pecha_api.plans.featured.featured_day_service.generate_presigned_access_url", return_value="https://signed/day1.png") as mock_presign:
+        result = await get_featured_day_service(language="EN")
+
+    assert result.tasks[0].subtasks[0].content == "https://signed/day1.png"
+    assert result.tasks[0].subtasks[1].content == "Breathe"
+    mock_presign.assert_called_once()
+    assert mock_get.return_value.tasks[0].subtasks[0].content == "images/day1.png"
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_service_does_not_cache_missing_day(featured_day_cache, mock_db_session):
+    _, mock_set = featured_day_cache
+
+    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=0):
+        with pytest.raises(HTTPException):
+            await get_featured_day_service(language="EN")
+
+    mock_set.assert_not_awaited()
+
+
+def test_seconds_until_utc_midnight():
+    assert _seconds_until_utc_midnight(datetime(2024, 5, 1, 23, 59, 0, tzinfo=timezone.utc)) == 60
+    assert _seconds_until_utc_midnight(datetime(2024, 5, 1, 0, 0, 0, tzinfo=timezone.utc)) == 86400
+
+
+@pytest.mark.asyncio
+async def test_invalidate_featured_day_cache_uses_plan_language():
+    with patch("pecha_api.plans.featured.featured_day_service.delete_featured_day_cache", new_callable=AsyncMock) as mock_delete:
+        await invalidate_featured_day_cache(language=LanguageCode.BO)
+
+    mock_delete.assert_awaited_once_with(language="BO", featured_date=datetime.now(timezone.utc).date())
+
+
+@pytest.mark.asyncio
+async def test_invalidate_featured_day_cache_of_plan_only_for_featured_plans():
+    featured_plan = Mock(featured=True, language="EN")
+    plan = Mock(featured=False, language="BO")
+    with patch("pecha_api.plans.featured.featured_day_service.delete_featured_day_cache", new_callable=AsyncMock) as mock_delete:
+        await invalidate_featured_day_cache_of_plan(plan=plan)
+        await invalidate_featured_day_cache_of_plan(plan=featured_plan)
+
+    mock_delete.assert_awaited_once_with(language="EN", featured_date=datetime.now(timezone.utc).date())
+
+
+@pytest.mark.asyncio
+async def test_invalidate_featured_day_cache_of_days_uses_languages_of_featured_plans():
+    db = MagicMock()
+    day_ids = [uuid4(), uuid4()]
+    with patch(
+        "pecha_api.plans.featured.featured_day_service.get_featured_plan_languages_by_day_ids",
+        return_value=["EN", "BO"],
+    ) as mock_languages, patch(
+        "pecha_api.plans.featured.featured_day_service.delete_featured_day_cache", new_callable=AsyncMock
+    ) as mock_delete:
+        await invalidate_featured_day_cache_of_days(db=db, day_ids=day_ids)
+
+    mock_languages.assert_called_once_with(db=db, day_ids=day_ids)
+    assert [call.kwargs["language"] for call in mock_delete.await_args_list] == ["EN", "BO"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_featured_day_cache_of_days_skips_days_of_unfeatured_plans():
+    with patch(
+        "pecha_api.plans.featured.featured_day_service.get_featured_plan_languages_by_day_ids",
+        return_value=[],
+    ), patch(
+        "pecha_api.plans.featured.featured_day_service.delete_featured_day_cache", new_callable=AsyncMock
+    ) as mock_delete:
+        await invalidate_featured_day_cache_of_days(db=MagicMock(), day_ids=[uuid4()])
+
+    mock_delete.assert_not_awaited()
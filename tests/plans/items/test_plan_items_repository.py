@@ -0,0 +1,79 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch, call
+
+from pecha_api.plans.items.plan_items_repository import (
+    save_plan_item,
+    save_plan_items,
+    delete_plan_items,
+    delete_day_by_id,
+)
+
+
+def test_save_plan_item_increments_plan_total_days_before_commit():
+    db = MagicMock()
+    plan_id = uuid.uuid4()
+    plan_item = SimpleNamespace(plan_id=plan_id)
+
+    with patch("pecha_api.plans.items.plan_items_repository.increment_plan_total_days") as mock_increment:
+        mock_increment.side_effect = lambda **kwargs: db.commit.assert_not_called()
+        result = save_plan_item(db=db, plan_item=plan_item)
+
+    assert result is plan_item
+    mock_increment.assert_called_once_with(db=db, plan_id=plan_id)
+    db.commit.assert_called_once()
+
+
+def test_save_plan_items_increments_each_plan_by_its_item_count():
+    db = MagicMock()
+    plan_a = uuid.uuid4()
+    plan_b = uuid.uuid4()
+    plan_items = [
+        SimpleNamespace(plan_id=plan_a),
+        SimpleNamespace(plan_id=plan_a),
+        SimpleNamespace(plan_id=plan_b),
+    ]
+
+    with patch("pecha_api.plans.items.plan_items_repository.increment_plan_total_days") as mock_increment:
+        save_plan_items(db=db, plan_items=plan_items)
+
+    mock_increment.assert_has_calls(
+        [call(db=db, plan_id=plan_a, amount=2), call(db=db, plan_id=plan_b, amount=1)],
+        any_order=True
+    )
+    db.commit.assert_called_once()
+
+
+def test_delete_plan_items_decrements_plan_total_days():
+    db = MagicMock()
+    plan_id = uuid.uuid4()
+    plan_items = [SimpleNamespace(plan_id=plan_id), SimpleNamespace(plan_id=plan_id)]
+
+    with patch("pecha_api.plans.items.plan_items_repository.increment_plan_total_days") as mock_increment:
+        delete_plan_items(db=db, plan_items=plan_items)
+
+    mock_increment.assert_called_once_with(db=db, plan_id=plan_id, amount=-2)
+    db.commit.assert_called_once()
+
+
+def test_delete_day_by_id_decrements_plan_total_days_when_day_deleted():
+    db = MagicMock()
+    plan_id = uuid.uuid4()
+    db.query.return_value.filter.return_value.delete.return_value = 1
+
+    with patch("pecha_api.plans.items.plan_items_repository.increment_plan_total_days") as mock_increment:
+        delete_day_by_id(db=db, plan_id=plan_id, day_id=uuid.uuid4())
+
+    mock_increment.assert_called_once_with(db=db, plan_id=plan_id, amount=-1)
+    db.commit.assert_called_once()
+
+
+def test_delete_day_by_id_leaves_counter_when_nothing_deleted():
+    db = MagicMock()
+    db.query.return_value.filter.return_value.delete.return_value = 0
+
+    with patch("pecha_api.plans.items.plan_items_repository.increment_plan_total_days") as mock_increment:
+        delete_day_by_id(db=db, plan_id=uuid.uuid4(), day_id=uuid.uuid4())
+
+    mock_increment.assert_not_called()
+    db.commit.assert_called_once()
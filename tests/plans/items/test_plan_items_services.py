@@ -1,11 +1,24 @@
 import uuid
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import HTTPException
 
 from pecha_api.plans.items.plan_items_services import create_plan_item, delete_plan_day_by_id, update_plans_day_number
 from pecha_api.plans.items.plan_items_models import PlanItem
 from pecha_api.plans.items.plan_items_response_models import ItemDTO, ReorderDaysRequest, ItemDayNumberDTO
+from pecha_api.plans.plans_enums import PlanStatus
+
+
+@pytest.fixture(autouse=True)
+def _mock_featured_day_invalidation_():
+    with patch("pecha_api.plans.items.plan_items_services.invalidate_featured_day_cache_of_plan", new_callable=AsyncMock) as mock_invalidate:
+        yield mock_invalidate
+
+
+@pytest.fixture(autouse=True)
+def _mock_catalog_refresh_():
+    with patch("pecha_api.plans.items.plan_items_services._refresh_public_plan_catalogs", new_callable=AsyncMock) as mock_refresh:
+        yield mock_refresh
 
 
 def _mock_session_local(mock_session_local):
@@ -15,7 +28,8 @@ def _mock_session_local(mock_session_local):
     return mock_db_session
 
 
-def test_create_plan_item_success():
+@pytest.mark.asyncio
+async def test_create_plan_item_success(_mock_featured_day_invalidation_):
     plan_id = uuid.uuid4()
     saved_item_id = uuid.uuid4()
 
@@ -43,7 +57,7 @@ def test_create_plan_item_success():
         saved_item.day_number = 4
         mock_save_plan_item.return_value = saved_item
 
-        resp = create_plan_item(token="dummy-token", plan_id=plan_id)
+        resp = await create_plan_item(token="dummy-token", plan_id=plan_id)
 
         assert mock_validate_author.call_count == 1
         mock_get_plan_by_id.assert_called_once_with(db=db_session, plan_id=plan_id, created_by=author.email, is_admin=author.is_admin)
@@ -64,9 +78,11 @@ def test_create_plan_item_success():
         assert resp.id == saved_item_id
         assert resp.plan_id == plan_id
         assert resp.day_number == 4
+        _mock_featured_day_invalidation_.assert_awaited_once_with(plan=plan)
 
 
-def test_create_plan_item_propagates_repository_error():
+@pytest.mark.asyncio
+async def test_create_plan_item_propagates_repository_error(_mock_featured_day_invalidation_):
     plan_id = uuid.uuid4()
 
     plan = MagicMock()
@@ -92,13 +108,15 @@ def test_create_plan_item_propagates_repository_error():
         mock_save_plan_item.side_effect = error
 
         with pytest.raises(HTTPException) as exc_info:
-            create_plan_item(token="dummy-token", plan_id=plan_id)
+            await create_plan_item(token="dummy-token", plan_id=plan_id)
 
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == {"error": "Bad request", "message": "duplicate"}
+        _mock_featured_day_invalidation_.assert_not_awaited()
 
 
-def test_delete_plan_day_success_reorders():
+@pytest.mark.asyncio
+async def test_delete_plan_day_success_reorders(_mock_featured_day_invalidation_):
     plan_id = uuid.uuid4()
     day_id = uuid.uuid4()
 
@@ -108,13 +126,6 @@ def test_delete_plan_day_success_reorders():
     item_to_delete = MagicMock()
     item_to_delete.id = day_id
 
-    # Create three items with day numbers 1, 3, 5 which should be reordered to 1,2,3 after delete
-    remaining_items = [
-        MagicMock(id=uuid.uuid4(), day_number=1),
-        MagicMock(id=uuid.uuid4(), day_number=3),
-        MagicMock(id=uuid.uuid4(), day_number=5),
-    ]
-
     author = MagicMock()
     author.email = "author@example.com"
     author.is_admin = False
@@ -124,35 +135,26 @@ def test_delete_plan_day_success_reorders():
          patch("pecha_api.plans.items.plan_items_services.get_plan_by_id_and_created_by") as mock_get_plan_by_id, \
          patch("pecha_api.plans.items.plan_items_services.get_day_by_plan_day_id") as mock_get_day, \
          patch("pecha_api.plans.items.plan_items_services.delete_day_by_id") as mock_delete, \
-         patch("pecha_api.plans.items.plan_items_services.get_days_by_plan_id") as mock_get_days, \
-         patch("pecha_api.plans.items.plan_items_services.update_day_by_id") as mock_update_day:
+         patch("pecha_api.plans.items.plan_items_services.renumber_days_by_plan_id") as mock_renumber:
         db_session = _mock_session_local(mock_session_local)
 
         mock_validate_author.return_value = author
         mock_get_plan_by_id.return_value = plan
         mock_get_day.return_value = item_to_delete
-        mock_get_days.return_value = remaining_items
 
-        delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
+        await delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
 
         assert mock_validate_author.call_count == 1
         mock_get_plan_by_id.assert_called_once_with(db=db_session, plan_id=plan_id, created_by=author.email, is_admin=author.is_admin)
         mock_get_day.assert_called_once_with(db=db_session, plan_id=plan_id, day_id=day_id)
         mock_delete.assert_called_once_with(db=db_session, plan_id=plan_id, day_id=item_to_delete.id)
-
-        # Verify reordering calls: items sorted by original day_number -> indices 1..n
-        assert mock_update_day.call_count == 3
-        # First call should set first item's day_number to 1, etc.
-        expected_new_numbers = [1, 2, 3]
-        for call, new_num in zip(mock_update_day.call_args_list, expected_new_numbers):
-            kwargs = call.kwargs
-            assert kwargs["db"] is db_session
-            assert kwargs["plan_id"] == plan_id
-            assert "day_id" in kwargs and kwargs["day_id"] is not None
-            assert kwargs["day_number"] == new_num
+        # The remaining days are renumbered 1..n by a single statement
+        mock_renumber.assert_called_once_with(db=db_session, plan_id=plan_id)
+        _mock_featured_day_invalidation_.assert_awaited_once_with(plan=plan)
 
 
-def test_delete_plan_day_not_found():
+@pytest.mark.asyncio
+async def test_delete_plan_day_not_found():
     plan_id = uuid.uuid4()
     day_id = uuid.uuid4()
 
@@ -173,13 +175,14 @@ def test_delete_plan_day_not_found():
         mock_get_day.side_effect = HTTPException(status_code=404, detail={"error": "Not Found", "message": "day not found"})
 
         with pytest.raises(HTTPException) as exc_info:
-            delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
+            await delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
 
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == {"error": "Not Found", "message": "day not found"}
 
 
-def test_delete_plan_day_auth_error():
+@pytest.mark.asyncio
+async def test_delete_plan_day_auth_error():
     plan_id = uuid.uuid4()
     day_id = uuid.uuid4()
 
@@ -187,13 +190,14 @@ def test_delete_plan_day_auth_error():
         mock_validate_author.side_effect = HTTPException(status_code=401, detail="Unauthorized")
 
         with pytest.raises(HTTPException) as exc_info:
-            delete_plan_day_by_id(token="bad-token", plan_id=plan_id, day_id=day_id)
+            await delete_plan_day_by_id(token="bad-token", plan_id=plan_id, day_id=day_id)
 
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "Unauthorized"
 
 
-def test_delete_plan_day_repository_error():
+@pytest.mark.asyncio
+async def test_delete_plan_day_repository_error():
     plan_id = uuid.uuid4()
     day_id = uuid.uuid4()
 
@@ -219,13 +223,14 @@ def test_delete_plan_day_repository_error():
         mock_delete.side_effect = HTTPException(status_code=400, detail={"error": "Bad request", "message": "cannot delete"})
 
         with pytest.raises(HTTPException) as exc_info:
-            delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
+            await delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
 
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == {"error": "Bad request", "message": "cannot delete"}
 
 
-def test_update_plans_day_number_success_calls_bulk_update():
+@pytest.mark.asyncio
+async def test_update_plans_day_number_success_calls_bulk_update(_mock_featured_day_invalidation_):
     plan_id = uuid.uuid4()
 
     plan = MagicMock()
@@ -252,7 +257,7 @@ def test_update_plans_day_number_success_calls_bulk_update():
         mock_validate_author.return_value = author
         mock_get_plan_by_id.return_value = plan
 
-        update_plans_day_number(token="dummy-token", plan_id=plan_id, reorder_days_request=payload)
+        await update_plans_day_number(token="dummy-token", plan_id=plan_id, reorder_days_request=payload)
 
         # validate called once in the service
         assert mock_validate_author.call_count == 1
@@ -261,9 +266,11 @@ def test_update_plans_day_number_success_calls_bulk_update():
         called_kwargs = mock_bulk_update.call_args.kwargs
         assert called_kwargs["db"] is db_session
         assert called_kwargs["days"] == payload.days
+        _mock_featured_day_invalidation_.assert_awaited_once_with(plan=plan)
 
 
-def test_update_plans_day_number_duplicate_payload_raises_400():
+@pytest.mark.asyncio
+async def test_update_plans_day_number_duplicate_payload_raises_400():
     plan_id = uuid.uuid4()
 
     payload = ReorderDaysRequest(
@@ -285,7 +292,34 @@ def test_update_plans_day_number_duplicate_payload_raises_400():
         mock_get_plan_by_id.return_value = plan
 
         with pytest.raises(HTTPException) as exc_info:
-            update_plans_day_number(token="dummy-token", plan_id=plan_id, reorder_days_request=payload)
+            await update_plans_day_number(token="dummy-token", plan_id=plan_id, reorder_days_request=payload)
 
         assert exc_info.value.status_code == 400
-        assert exc_info.value.detail == {"error": "Bad request", "message": "Duplicate day numbers"}
\ No newline at end of file
+        assert exc_info.value.detail == {"error": "Bad request", "message": "Duplicate day numbers"}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("plan_status, refreshed", [(PlanStatus.PUBLISHED, True), (PlanStatus.DRAFT, False)])
+async def test_delete_plan_day_refreshes_catalog_of_published_plan(_mock_catalog_refresh_, plan_status, refreshed):
+    plan = MagicMock()
+    plan.id = uuid.uuid4()
+    plan.status = plan_status
+    plan.language = "en"
+
+    author = MagicMock()
+    author.email = "author@example.com"
+    author.is_admin = False
+
+    with patch("pecha_api.plans.items.plan_items_services.SessionLocal") as mock_session_local, \
+         patch("pecha_api.plans.items.plan_items_services.validate_and_extract_author_details", return_value=author), \
+         patch("pecha_api.plans.items.plan_items_services.get_plan_by_id_and_created_by", return_value=plan), \
+         patch("pecha_api.plans.items.plan_items_services.get_day_by_plan_day_id"), \
+         patch("pecha_api.plans.items.plan_items_services.delete_day_by_id"), \
+         patch("pecha_api.plans.items.plan_items_services.renumber_days_by_plan_id"):
+        _mock_session_local(mock_session_local)
+
+        await delete_plan_day_by_id(token="dummy-token", plan_id=plan.id, day_id=uuid.uuid4())
+
+    if refreshed:
+        _mock_catalog_refresh_.assert_awaited_once_with("en")
+    else:
+        _mock_catalog_refresh_.assert_not_awaited()
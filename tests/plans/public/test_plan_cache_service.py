@@ -0,0 +1,69 @@
+import pytest
+from uuid import uuid4
+from unittest.mock import patch, AsyncMock
+
+from pecha_api.plans.public.plan_cache_service import (
+    get_plan_catalog_cache,
+    set_plan_catalog_cache,
+    clear_local_plan_catalogs
+)
+from pecha_api.plans.public.plan_response_models import PlanCatalogSnapshot, CatalogPlan
+
+
+@pytest.fixture(autouse=True)
+def empty_local_catalogs():
+    clear_local_plan_catalogs()
+    yield
+    clear_local_plan_catalogs()
+
+
+def _snapshot() -> PlanCatalogSnapshot:
+    return PlanCatalogSnapshot(
+        language="EN",
+        plans=[CatalogPlan(id=uuid4(), title="Plan", description="", language="EN", total_days=3, subscription_count=1)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_plan_catalog_cache_empty_cache():
+    with patch("pecha_api.plans.public.plan_cache_service.get_cache_data", new_callable=AsyncMock, return_value=None):
+        assert await get_plan_catalog_cache(language="EN") is None
+
+
+@pytest.mark.asyncio
+async def test_get_plan_catalog_cache_reads_redis_once_then_local_copy():
+    snapshot = _snapshot()
+    with patch("pecha_api.plans.public.plan_cache_service.get_cache_data", new_callable=AsyncMock,
+               return_value=snapshot.model_dump(mode="json")) as mock_get_cache_data:
+        first = await get_plan_catalog_cache(language="EN")
+        second = await get_plan_catalog_cache(language="EN")
+
+    assert first == snapshot
+    assert second is first
+    mock_get_cache_data.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_plan_catalog_cache_local_copy_expires():
+    snapshot = _snapshot()
+    with patch("pecha_api.plans.public.plan_cache_service.config.get_int", return_value=0), \
+         patch("pecha_api.plans.public.plan_cache_service.get_cache_data", new_callable=AsyncMock,
+               return_value=snapshot.model_dump(mode="json")) as mock_get_cache_data:
+        await get_plan_catalog_cache(language="EN")
+        await get_plan_catalog_cache(language="EN")
+
+    assert mock_get_cache_data.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_set_plan_catalog_cache_writes_redis_and_local_copy():
+    snapshot = _snapshot()
+    with patch("pecha_api.plans.public.plan_cache_service.set_cache", new_callable=AsyncMock) as mock_set_cache, \
+         patch("pecha_api.plans.public.plan_cache_service.get_cache_data", new_callable=AsyncMock) as mock_get_cache_data:
+        await set_plan_catalog_cache(language="EN", data=snapshot)
+        cached = await get_plan_catalog_cache(language="EN")
+
+    assert cached is snapshot
+    mock_set_cache.assert_awaited_once()
+    assert mock_set_cache.await_args.kwargs["value"] is snapshot
+    mock_get_cache_data.assert_not_awaited()
@@ -1,15 +1,19 @@
 import pytest
-from uuid import uuid4
-from unittest.mock import patch, MagicMock, Mock
+from uuid import uuid4, UUID
+from unittest.mock import patch, MagicMock, Mock, AsyncMock
 from fastapi import HTTPException
 from starlette import status
 
-from pecha_api.plans.public.plan_service import get_published_plans, get_published_plan,get_plan_days, get_plan_day_details
-from pecha_api.plans.public.plan_response_models import PublicPlansResponse, PublicPlanDTO, PlanDaysResponse, PlanDayDTO
+from pecha_api.plans.public.plan_service import get_published_plans, get_published_plan,get_plan_days, get_plan_day_details, refresh_plan_catalog
+from pecha_api.plans.public.plan_response_models import PublicPlansResponse, PublicPlanDTO, PlanDaysResponse, PlanDayDTO, \
+    CatalogPlan, CatalogAuthor, PlanCatalogSnapshot
 from pecha_api.plans.plans_enums import PlanStatus, DifficultyLevel, LanguageCode
 from pecha_api.error_contants import ErrorConstants
 from pecha_api.plans.plans_enums import ContentType
 
+PRESIGNED_URL = "https://bucket.s3.amazonaws.com/presigned-url"
+
+
 @pytest.fixture
 def sample_author():
     author = MagicMock()
@@ -41,550 +45,327 @@ def sample_plan(sample_author):
     plan.tags = ["meditation", "mindfulness", "beginner"]
     plan.author = sample_author
     plan.deleted_at = None
+    plan.total_days = 30
+    plan.subscription_count = 150
     return plan
 
 
+def _catalog_plan(title: str, total_days: int = 10, subscription_count: int = 0, with_author: bool = True, plan_id: UUID = None) -> CatalogPlan:
+    author = None
+    if with_author:
+        author = CatalogAuthor(id=uuid4(), firstname="John", lastname="Doe", image_url="images/author_avatars/author-id/avatar.jpg")
+    return CatalogPlan(
+        id=plan_id or uuid4(),
+        title=title,
+        description=f"{title} description",
+        language="EN",
+        difficulty_level=DifficultyLevel.BEGINNER,
+        image_url="images/plan_images/plan-id/uuid/image.jpg",
+        total_days=total_days,
+        subscription_count=subscription_count,
+        tags=["meditation"],
+        author=author
+    )
+
+
 @pytest.fixture
-def sample_plan_aggregate(sample_plan):
-    aggregate = MagicMock()
-    aggregate.plan = sample_plan
-    aggregate.total_days = 30
-    aggregate.subscription_count = 150
-    return aggregate
+def catalog():
+    return PlanCatalogSnapshot(
+        language="EN",
+        plans=[
+            _catalog_plan("Introduction to Meditation", total_days=30, subscription_count=150),
+            _catalog_plan("Compassion Practice", total_days=7, subscription_count=500),
+            _catalog_plan("Advanced Meditation Retreat", total_days=90, subscription_count=20),
+        ]
+    )
 
 
 @pytest.fixture
-def mock_db_session():
-    session = MagicMock()
-    session.__enter__ = Mock(return_value=session)
-    session.__exit__ = Mock(return_value=None)
-    return session
+def cached_catalog(catalog):
+    with patch("pecha_api.plans.public.plan_service.get_plan_catalog_cache", new_callable=AsyncMock, return_value=catalog) as mock_get_cache, \
+         patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=PRESIGNED_URL):
+        yield mock_get_cache, mock_session_local
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_success(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]) as mock_repo, \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url") as mock_presigned_url:
-        
-        result = await get_published_plans(
-            search=None,
-            language="en",  # Use default language
-            sort_by="title",
-            sort_order="asc",
-            skip=0,
-            limit=20
-        )
-        
-        assert isinstance(result, PublicPlansResponse)
-        assert len(result.plans) == 1
-        assert result.skip == 0
-        assert result.limit == 20
-        assert result.total == 1
-        
-        plan_dto = result.plans[0]
-        assert plan_dto.title == "Introduction to Meditation"
-        assert plan_dto.language == "EN"
-        assert plan_dto.total_days == 30
-        assert plan_dto.image is not None
-        assert plan_dto.image.thumbnail == "https://bucket.s3.amazonaws.com/presigned-url"
-        assert plan_dto.image.medium == "https://bucket.s3.amazonaws.com/presigned-url"
-        assert plan_dto.image.original == "https://bucket.s3.amazonaws.com/presigned-url"
-        
-        assert plan_dto.author is not None
-        assert plan_dto.author.id == sample_plan_aggregate.plan.author.id
-        assert plan_dto.author.firstname == "John"
-        assert plan_dto.author.lastname == "Doe"
-        assert plan_dto.author.image is not None
-        assert plan_dto.author.image.thumbnail == "https://bucket.s3.amazonaws.com/presigned-url"
-        
-        mock_repo.assert_called_once_with(
-            db=mock_db_session.__enter__.return_value,
-            skip=0,
-            limit=20,
-            search=None,
-            language="EN",  
-            sort_by="title",
-            sort_order="asc"
-        )
+async def test_get_published_plans_success(cached_catalog):
+    mock_get_cache, mock_session_local = cached_catalog
+
+    result = await get_published_plans(search=None, language="en", sort_by="title", sort_order="asc", skip=0, limit=20)
+
+    assert isinstance(result, PublicPlansResponse)
+    assert result.total == 3
+    assert result.skip == 0
+    assert result.limit == 20
+    assert [plan.title for plan in result.plans] == ["Advanced Meditation Retreat", "Compassion Practice", "Introduction to Meditation"]
+
+    plan_dto = result.plans[2]
+    assert plan_dto.language == "EN"
+    assert plan_dto.total_days == 30
+    assert plan_dto.image.thumbnail == PRESIGNED_URL
+    assert plan_dto.image.medium == PRESIGNED_URL
+    assert plan_dto.image.original == PRESIGNED_URL
+    assert plan_dto.author.firstname == "John"
+    assert plan_dto.author.lastname == "Doe"
+    assert plan_dto.author.image.thumbnail == PRESIGNED_URL
+
+    mock_get_cache.assert_awaited_once_with(language="EN")
+    mock_session_local.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_with_search(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]) as mock_repo, \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
-        
-        result = await get_published_plans(
-            search="meditation",
-            language="en",
-            sort_by="title",
-            sort_order="asc",
-            skip=0,
-            limit=20
-        )
-        
-        assert len(result.plans) == 1
-        mock_repo.assert_called_once_with(
-            db=mock_db_session.__enter__.return_value,
-            skip=0,
-            limit=20,
-            search="meditation",
-            language="EN", 
-            sort_by="title",
-            sort_order="asc"
+async def test_get_published_plans_with_search_uses_ranked_database_search(sample_plan):
+    with patch("pecha_api.plans.public.plan_service.get_plan_catalog_cache", new_callable=AsyncMock) as mock_get_cache, \
+         patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+         patch("pecha_api.plans.public.plan_service.search_published_plans", return_value=([sample_plan], 4)) as mock_search, \
+         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=PRESIGNED_URL):
+        mock_db_session = _mock_session_local(mock_session_local)
+
+        result = await get_published_plans(search="meditation", language="en", sort_by="relevance", skip=2, limit=1)
+
+        mock_search.assert_called_once_with(
+            db=mock_db_session, search="meditation", language="EN", sort_by="relevance", sort_order="asc", skip=2, limit=1
         )
+        mock_get_cache.assert_not_awaited()
+        assert result.total == 4
+        assert [plan.title for plan in result.plans] == ["Introduction to Meditation"]
+        assert result.plans[0].author.firstname == "John"
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_with_language_filter(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]) as mock_repo, \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
-        
-        result = await get_published_plans(
-            search=None,
-            language="en",
-            sort_by="title",
-            sort_order="asc",
-            skip=0,
-            limit=20
-        )
-        
-        assert len(result.plans) == 1
-        mock_repo.assert_called_once_with(
-            db=mock_db_session.__enter__.return_value,
-            skip=0,
-            limit=20,
-            search=None,
-            language="EN", 
-            sort_by="title",
-            sort_order="asc"
-        )
+async def test_get_published_plans_sort_by_title_desc(cached_catalog):
+    result = await get_published_plans(sort_by="title", sort_order="desc")
+
+    assert [plan.title for plan in result.plans] == ["Introduction to Meditation", "Compassion Practice", "Advanced Meditation Retreat"]
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_sort_by_title_asc(sample_plan_aggregate, mock_db_session):
-    plan1 = MagicMock()
-    plan1.id = uuid4()
-    plan1.title = "Advanced Meditation"
-    plan1.description = "Advanced techniques"
-    plan1.language = LanguageCode.EN
-    plan1.difficulty_level = DifficultyLevel.BEGINNER
-    plan1.image_url = None
-    plan1.status = PlanStatus.PUBLISHED
-    plan1.tags = []
-    plan1.author = None
-    
-    plan2 = MagicMock()
-    plan2.id = uuid4()
-    plan2.title = "Beginner Meditation"
-    plan2.description = "Basic techniques"
-    plan2.language = LanguageCode.EN
-    plan2.difficulty_level = DifficultyLevel.BEGINNER
-    plan2.image_url = None
-    plan2.status = PlanStatus.PUBLISHED
-    plan2.tags = []
-    plan2.author = None
-    
-    agg1 = MagicMock()
-    agg1.plan = plan1
-    agg1.total_days = 20
-    agg1.subscription_count = 100
-    
-    agg2 = MagicMock()
-    agg2.plan = plan2
-    agg2.total_days = 10
-    agg2.subscription_count = 50
-    
-    aggregates = [agg1, agg2]
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=aggregates), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=2), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=None):
-        
-        result = await get_published_plans(sort_by="title", sort_order="asc")
-        
-        assert result.plans[0].title == "Advanced Meditation"
-        assert result.plans[1].title == "Beginner Meditation"
+async def test_get_published_plans_sort_by_total_days(cached_catalog):
+    result = await get_published_plans(sort_by="total_days", sort_order="asc")
+
+    assert [plan.total_days for plan in result.plans] == [7, 30, 90]
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_sort_by_title_desc(sample_plan_aggregate, mock_db_session):
-    plan1 = MagicMock()
-    plan1.id = uuid4()
-    plan1.title = "Advanced Meditation"
-    plan1.description = "Advanced techniques"
-    plan1.language = LanguageCode.EN
-    plan1.difficulty_level = DifficultyLevel.BEGINNER
-    plan1.image_url = None
-    plan1.status = PlanStatus.PUBLISHED
-    plan1.tags = []
-    plan1.author = None
-    
-    plan2 = MagicMock()
-    plan2.id = uuid4()
-    plan2.title = "Beginner Meditation"
-    plan2.description = "Basic techniques"
-    plan2.language = LanguageCode.EN
-    plan2.difficulty_level = DifficultyLevel.BEGINNER
-    plan2.image_url = None
-    plan2.status = PlanStatus.PUBLISHED
-    plan2.tags = []
-    plan2.author = None
-    
-    agg1 = MagicMock()
-    agg1.plan = plan1
-    agg1.total_days = 20
-    agg1.subscription_count = 100
-    
-    agg2 = MagicMock()
-    agg2.plan = plan2
-    agg2.total_days = 10
-    agg2.subscription_count = 50
-    
-    aggregates = [agg1, agg2]
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=aggregates), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=2), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=None):
-        
-        result = await get_published_plans(sort_by="title", sort_order="desc")
-        
-        assert len(result.plans) == 2
-        assert result.plans[0].title == "Advanced Meditation"
-        assert result.plans[1].title == "Beginner Meditation"
+async def test_get_published_plans_sort_by_subscription_count(cached_catalog):
+    result = await get_published_plans(sort_by="subscription_count", sort_order="desc")
+
+    assert [plan.title for plan in result.plans] == ["Compassion Practice", "Introduction to Meditation", "Advanced Meditation Retreat"]
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_sort_by_total_days(sample_plan_aggregate, mock_db_session):
-    plan1 = MagicMock()
-    plan1.id = uuid4()
-    plan1.title = "Short Plan"
-    plan1.description = "Short plan"
-    plan1.language = LanguageCode.EN
-    plan1.difficulty_level = DifficultyLevel.BEGINNER
-    plan1.image_url = None
-    plan1.status = PlanStatus.PUBLISHED
-    plan1.tags = []
-    plan1.author = None
-    
-    plan2 = MagicMock()
-    plan2.id = uuid4()
-    plan2.title = "Long Plan"
-    plan2.description = "Long plan"
-    plan2.language = LanguageCode.EN
-    plan2.difficulty_level = DifficultyLevel.BEGINNER
-    plan2.image_url = None
-    plan2.status = PlanStatus.PUBLISHED
-    plan2.tags = []
-    plan2.author = None
-    
-    agg1 = MagicMock()
-    agg1.plan = plan1
-    agg1.total_days = 10
-    agg1.subscription_count = 100
-    
-    agg2 = MagicMock()
-    agg2.plan = plan2
-    agg2.total_days = 30
-    agg2.subscription_count = 50
-    
-    aggregates = [agg1, agg2]
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=aggregates), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=2), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=None):
-        
-        result = await get_published_plans(sort_by="total_days", sort_order="asc")
-        
-        assert result.plans[0].total_days == 10
-        assert result.plans[1].total_days == 30
+async def test_get_published_plans_ties_are_broken_by_id(cached_catalog, catalog):
+    first_id = UUID("00000000-0000-0000-0000-000000000001")
+    second_id = UUID("00000000-0000-0000-0000-000000000002")
+    catalog.plans = [_catalog_plan("Same", plan_id=second_id), _catalog_plan("Same", plan_id=first_id)]
+
+    ascending = await get_published_plans(sort_order="asc")
+    descending = await get_published_plans(sort_order="desc")
+
+    assert [plan.id for plan in ascending.plans] == [first_id, second_id]
+    assert [plan.id for plan in descending.plans] == [second_id, first_id]
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_sort_by_subscription_count(sample_plan_aggregate, mock_db_session):
-    plan1 = MagicMock()
-    plan1.id = uuid4()
-    plan1.title = "Popular Plan"
-    plan1.description = "Popular plan"
-    plan1.language = LanguageCode.EN
-    plan1.difficulty_level = DifficultyLevel.BEGINNER
-    plan1.image_url = None
-    plan1.status = PlanStatus.PUBLISHED
-    plan1.tags = []
-    plan1.author = None
-    
-    plan2 = MagicMock()
-    plan2.id = uuid4()
-    plan2.title = "Less Popular Plan"
-    plan2.description = "Less popular plan"
-    plan2.language = LanguageCode.EN
-    plan2.difficulty_level = DifficultyLevel.BEGINNER
-    plan2.image_url = None
-    plan2.status = PlanStatus.PUBLISHED
-    plan2.tags = []
-    plan2.author = None
-    
-    agg1 = MagicMock()
-    agg1.plan = plan1
-    agg1.total_days = 10
-    agg1.subscription_count = 200
-    
-    agg2 = MagicMock()
-    agg2.plan = plan2
-    agg2.total_days = 10
-    agg2.subscription_count = 50
-    
-    aggregates = [agg1, agg2]
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=aggregates), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=2), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=None):
-        
-        result = await get_published_plans(sort_by="subscription_count", sort_order="desc")
-        
-        assert len(result.plans) == 2
-        assert result.plans[0].title == "Popular Plan"
-        assert result.plans[1].title == "Less Popular Plan"
+async def test_get_published_plans_with_pagination(cached_catalog):
+    result = await get_published_plans(skip=1, limit=1)
+
+    assert result.skip == 1
+    assert result.limit == 1
+    assert result.total == 3
+    assert [plan.title for plan in result.plans] == ["Compassion Practice"]
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_empty_result(mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[]), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=0):
-        
-        result = await get_published_plans()
-        
-        assert isinstance(result, PublicPlansResponse)
-        assert len(result.plans) == 0
-        assert result.total == 0
+async def test_get_published_plans_with_cursor_walks_catalog_by_keyset(cached_catalog):
+    first_page = await get_published_plans(sort_by="total_days", sort_order="desc", limit=2, cursor="")
+
+    assert [plan.total_days for plan in first_page.plans] == [90, 30]
+    assert first_page.total == 3
+    assert first_page.next_cursor is not None
+
+    second_page = await get_published_plans(sort_by="total_days", sort_order="desc", limit=2, cursor=first_page.next_cursor)
+
+    assert [plan.total_days for plan in second_page.plans] == [7]
+    assert second_page.next_cursor is None
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_without_author(mock_db_session):
-    plan_no_author = MagicMock()
-    plan_no_author.id = uuid4()
-    plan_no_author.title = "Orphan Plan"
-    plan_no_author.description = "Plan without author"
-    plan_no_author.language = LanguageCode.EN
-    plan_no_author.difficulty_level = DifficultyLevel.BEGINNER
-    plan_no_author.image_url = None
-    plan_no_author.status = PlanStatus.PUBLISHED
-    plan_no_author.tags = []
-    plan_no_author.author = None
-    
-    aggregate = MagicMock()
-    aggregate.plan = plan_no_author
-    aggregate.total_days = 10
-    aggregate.subscription_count = 0
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[aggregate]), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
-        
-        result = await get_published_plans()
-        
-        assert len(result.plans) == 1
-        assert result.plans[0].author is None
+async def test_get_published_plans_cursor_survives_catalog_insertions(cached_catalog, catalog):
+    first_page = await get_published_plans(limit=1, cursor="")
+    catalog.plans.append(_catalog_plan("A New Beginning"))
+
+    second_page = await get_published_plans(limit=1, cursor=first_page.next_cursor)
+
+    assert [plan.title for plan in first_page.plans] == ["Advanced Meditation Retreat"]
+    assert [plan.title for plan in second_page.plans] == ["Compassion Practice"]
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_with_pagination(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]) as mock_repo, \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
-        
-        result = await get_published_plans(skip=10, limit=5)
-        
-        assert result.skip == 10
-        assert result.limit == 5
-        mock_repo.assert_called_once_with(
-            db=mock_db_session.__enter__.return_value,
-            skip=10,
-            limit=5,
-            search=None,
-            language="EN",  # Service converts to uppercase before calling repository
-            sort_by="title",
-            sort_order="asc"
-        )
+async def test_get_published_plans_invalid_cursor(cached_catalog):
+    with pytest.raises(HTTPException) as exc_info:
+        await get_published_plans(sort_by="total_days", cursor="not-a-cursor")
+
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_image_url_generation_failure(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
-        
-        result = await get_published_plans()
-        
-        assert len(result.plans) == 1
-        assert result.plans[0].image is not None
+async def test_get_published_plans_cursor_with_search_is_rejected():
+    with patch("pecha_api.plans.public.plan_service.search_published_plans") as mock_search:
+        with pytest.raises(HTTPException) as exc_info:
+            await get_published_plans(search="meditation", cursor="")
+
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    mock_search.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_get_published_plans_database_error(mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", side_effect=Exception("Database connection error")):
-        
+async def test_get_published_plans_empty_result(cached_catalog, catalog):
+    catalog.plans = []
+
+    result = await get_published_plans()
+
+    assert isinstance(result, PublicPlansResponse)
+    assert len(result.plans) == 0
+    assert result.total == 0
+
+
+@pytest.mark.asyncio
+async def test_get_published_plans_without_author(cached_catalog, catalog):
+    catalog.plans = [_catalog_plan("Orphan Plan", with_author=False)]
+
+    result = await get_published_plans()
+
+    assert len(result.plans) == 1
+    assert result.plans[0].author is None
+
+
+@pytest.mark.asyncio
+async def test_get_published_plans_cache_miss_builds_catalog_once(sample_plan):
+    mock_db_session = MagicMock()
+    with patch("pecha_api.plans.public.plan_service.get_plan_catalog_cache", new_callable=AsyncMock, return_value=None), \
+         patch("pecha_api.plans.public.plan_service.set_plan_catalog_cache", new_callable=AsyncMock) as mock_set_cache, \
+         patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+         patch("pecha_api.plans.public.plan_service.get_published_catalog_plans", return_value=[sample_plan]) as mock_repo, \
+         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=PRESIGNED_URL):
+        mock_db_session = _mock_session_local(mock_session_local)
+
+        result = await get_published_plans(language="en")
+
+        mock_repo.assert_called_once_with(db=mock_db_session, language="EN")
+        mock_set_cache.assert_awaited_once()
+        snapshot = mock_set_cache.await_args.kwargs["data"]
+        assert snapshot.language == "EN"
+        assert snapshot.plans[0].image_url == sample_plan.image_url
+        assert snapshot.plans[0].subscription_count == 150
+        assert result.total == 1
+        assert result.plans[0].total_days == 30
+
+
+@pytest.mark.asyncio
+async def test_get_published_plans_database_error():
+    with patch("pecha_api.plans.public.plan_service.get_plan_catalog_cache", new_callable=AsyncMock, return_value=None), \
+         patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+         patch("pecha_api.plans.public.plan_service.get_published_catalog_plans", side_effect=Exception("Database connection error")):
+        _mock_session_local(mock_session_local)
+
         with pytest.raises(HTTPException) as exc_info:
             await get_published_plans()
-        
+
         assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert "Failed to fetch published plans" in str(exc_info.value.detail)
 
+
 @pytest.mark.asyncio
-async def test_get_published_plan_success(sample_plan, sample_author, mock_db_session):
-    plan_id = sample_plan.id
-    
-    mock_query = MagicMock()
-    mock_db_session.__enter__.return_value.query.return_value = mock_query
-    mock_query.filter.return_value.count.return_value = 30 
-    mock_query.filter.return_value.distinct.return_value.count.return_value = 150 
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=sample_plan) as mock_repo, \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url") as mock_presigned_url:
-        
-        result = await get_published_plan(plan_id=plan_id)
-        
-        assert isinstance(result, PublicPlanDTO)
-        assert result.id == plan_id
-        assert result.title == "Introduction to Meditation"
-        assert result.language == "EN" 
-        assert result.total_days == 30
-        assert result.image is not None
-        assert result.image.thumbnail == "https://bucket.s3.amazonaws.com/presigned-url"
-        assert result.image.medium == "https://bucket.s3.amazonaws.com/presigned-url"
-        assert result.image.original == "https://bucket.s3.amazonaws.com/presigned-url"
-        
-        assert result.author is not None
-        assert result.author.firstname == "John"
-        assert result.author.lastname == "Doe"
-        assert result.author.image is not None
-        assert result.author.image.thumbnail == "https://bucket.s3.amazonaws.com/presigned-url"
-        
-        mock_repo.assert_called_once_with(db=mock_db_session.__enter__.return_value, plan_id=plan_id)
+async def test_refresh_plan_catalog_accepts_language_code_and_defaults_missing_fields(sample_plan):
+    sample_plan.description = None
+    sample_plan.tags = None
+    sample_plan.author = None
+    with patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+         patch("pecha_api.plans.public.plan_service.set_plan_catalog_cache", new_callable=AsyncMock) as mock_set_cache, \
+         patch("pecha_api.plans.public.plan_service.get_published_catalog_plans", return_value=[sample_plan]) as mock_repo:
+        mock_db_session = _mock_session_local(mock_session_local)
 
+        snapshot = await refresh_plan_catalog(language=LanguageCode.BO)
 
-@pytest.mark.asyncio
-async def test_get_published_plan_not_found(mock_db_session):
-    plan_id = uuid4()
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=None):
-        
-        with pytest.raises(HTTPException) as exc_info:
-            await get_published_plan(plan_id=plan_id)
-        
-        assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        assert "Failed to fetch published plan details" in str(exc_info.value.detail)
+        mock_repo.assert_called_once_with(db=mock_db_session, language="BO")
+        mock_set_cache.assert_awaited_once_with(language="BO", data=snapshot)
+        assert snapshot.plans[0].description == ""
+        assert snapshot.plans[0].tags == []
+        assert snapshot.plans[0].author is None
+
+
+@pytest.fixture
+def published_plan_lookup(sample_plan):
+    with patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+         patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=sample_plan) as mock_get_plan, \
+         patch("pecha_api.plans.public.plan_service.get_plan_catalog_cache", new_callable=AsyncMock) as mock_get_cache, \
+         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=PRESIGNED_URL):
+        db_session = _mock_session_local(mock_session_local)
+        yield mock_get_plan, mock_get_cache, db_session
 
 
 @pytest.mark.asyncio
-async def test_get_published_plan_without_author(mock_db_session):
-    plan_no_author = MagicMock()
-    plan_no_author.id = uuid4()
-    plan_no_author.title = "Orphan Plan"
-    plan_no_author.description = "Plan without author"
-    plan_no_author.language = LanguageCode.EN
-    plan_no_author.difficulty_level = DifficultyLevel.BEGINNER
-    plan_no_author.image_url = None
-    plan_no_author.status = PlanStatus.PUBLISHED
-    plan_no_author.tags = []
-    plan_no_author.author = None
-    
-    mock_query = MagicMock()
-    mock_db_session.__enter__.return_value.query.return_value = mock_query
-    mock_query.filter.return_value.count.return_value = 10
-    mock_query.filter.return_value.distinct.return_value.count.return_value = 5
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=plan_no_author), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
-        
-        result = await get_published_plan(plan_id=plan_no_author.id)
-        
-        assert result.author is None
-        assert result.title == "Orphan Plan"
+async def test_get_published_plan_success(published_plan_lookup, sample_plan):
+    mock_get_plan, _, db_session = published_plan_lookup
+
+    result = await get_published_plan(plan_id=sample_plan.id)
+
+    assert isinstance(result, PublicPlanDTO)
+    assert result.id == sample_plan.id
+    assert result.title == "Introduction to Meditation"
+    assert result.language == "EN"
+    assert result.total_days == 30
+    assert result.image.thumbnail == PRESIGNED_URL
+    assert result.author.firstname == "John"
+    assert result.author.image.thumbnail == PRESIGNED_URL
+    mock_get_plan.assert_called_once_with(db=db_session, plan_id=sample_plan.id)
 
 
 @pytest.mark.asyncio
-async def test_get_published_plan_image_url_generation_failure(sample_plan, mock_db_session):
-    plan_id = sample_plan.id
-    
-    mock_query = MagicMock()
-    mock_db_session.__enter__.return_value.query.return_value = mock_query
-    mock_query.filter.return_value.count.return_value = 30
-    mock_query.filter.return_value.distinct.return_value.count.return_value = 150
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=sample_plan), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
-        
-        result = await get_published_plan(plan_id=plan_id)
-        
-        assert result.image is not None
+async def test_get_published_plan_is_a_primary_key_lookup(published_plan_lookup, sample_plan):
+    mock_get_plan, mock_get_cache, _ = published_plan_lookup
+
+    await get_published_plan(plan_id=sample_plan.id)
+
+    assert mock_get_plan.call_count == 1
+    mock_get_cache.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_get_published_plan_database_error(mock_db_session):
-    plan_id = uuid4()
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", side_effect=Exception("Database connection error")):
-        
-        with pytest.raises(HTTPException) as exc_info:
-            await get_published_plan(plan_id=plan_id)
-        
-        assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        assert "Failed to fetch published plan details" in str(exc_info.value.detail)
+async def test_get_published_plan_not_found(published_plan_lookup):
+    mock_get_plan, _, _ = published_plan_lookup
+    mock_get_plan.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_published_plan(plan_id=uuid4())
+
+    assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert "Failed to fetch published plan details" in str(exc_info.value.detail)
 
 
 @pytest.mark.asyncio
-async def test_get_published_plan_with_empty_tags(sample_plan, mock_db_session):
-    sample_plan.tags = None
-    
-    mock_query = MagicMock()
-    mock_db_session.__enter__.return_value.query.return_value = mock_query
-    mock_query.filter.return_value.count.return_value = 10
-    mock_query.filter.return_value.distinct.return_value.count.return_value = 5
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=sample_plan), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
-        
-        result = await get_published_plan(plan_id=sample_plan.id)
-        
-        assert result.tags == []
+async def test_get_published_plan_without_author(published_plan_lookup, sample_plan):
+    sample_plan.author = None
+
+    result = await get_published_plan(plan_id=sample_plan.id)
+
+    assert result.author is None
+    assert result.title == "Introduction to Meditation"
 
 
 @pytest.mark.asyncio
-async def test_get_published_plan_zero_subscriptions(sample_plan, mock_db_session):
-    mock_query = MagicMock()
-    mock_db_session.__enter__.return_value.query.return_value = mock_db_session
-    mock_query.filter.return_value.count.return_value = 15
-    mock_query.filter.return_value.distinct.return_value.count.return_value = 0
-    
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=sample_plan), \
-         patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
-        
-        result = await get_published_plan(plan_id=sample_plan.id)
-        
-        assert result.title == sample_plan.title
-        assert result.id == sample_plan.id
+async def test_get_published_plan_database_error():
+    with patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+         patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", side_effect=Exception("Database connection error")):
+        _mock_session_local(mock_session_local)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_published_plan(plan_id=uuid4())
+
+        assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert "Failed to fetch published plan details" in str(exc_info.value.detail)
 
 @pytest.mark.asyncio
 async def test_get_plan_days_success():
@@ -92,7 +92,8 @@ async def test_get_plans_success(sample_plans_response):
             sort_by="title",
             sort_order="asc",
             skip=0,
-            limit=20
+            limit=20,
+            cursor=None
         )
 
 
@@ -112,7 +113,8 @@ async def test_get_plans_with_search_filter(sample_plans_response):
             sort_by="title",
             sort_order="asc",
             skip=0,
-            limit=20
+            limit=20,
+            cursor=None
         )
 
 
@@ -132,7 +134,8 @@ async def test_get_plans_with_language_filter(sample_plans_response):
             sort_by="title",
             sort_order="asc",
             skip=0,
-            limit=20
+            limit=20,
+            cursor=None
         )
 
 
@@ -152,7 +155,8 @@ async def test_get_plans_with_sorting(sample_plans_response):
             sort_by="subscription_count",
             sort_order="desc",
             skip=0,
-            limit=20
+            limit=20,
+            cursor=None
         )
 
 
@@ -171,7 +175,8 @@ async def test_get_plans_with_pagination(sample_plans_response):
             sort_by="title",
             sort_order="asc",
             skip=10,
-            limit=5
+            limit=5,
+            cursor=None
         )
 
 
@@ -192,7 +197,8 @@ async def test_get_plans_with_all_filters(sample_plans_response):
             sort_by="total_days",
             sort_order="desc",
             skip=5,
-            limit=10
+            limit=10,
+            cursor=None
         )
 
 
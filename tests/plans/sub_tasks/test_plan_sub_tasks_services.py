@@ -1,7 +1,8 @@
 import uuid
 import pytest
 from types import SimpleNamespace
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
+from fastapi import HTTPException
 
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import (
     SubTaskDTO,
@@ -11,16 +12,24 @@ from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import (
     UpdateSubTaskRequest,
     SubTaskOrderRequest,
     SubtaskOrderItem,
+    MoveSubTaskRequest,
 )
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services import (
     create_new_sub_tasks,
     update_sub_task_by_task_id,
     change_subtask_order_service,
+    move_sub_task_service,
 )
-from pecha_api.plans.response_message import BAD_REQUEST, FORBIDDEN, UNAUTHORIZED_TASK_ACCESS
+from pecha_api.plans.response_message import BAD_REQUEST, FORBIDDEN, UNAUTHORIZED_TASK_ACCESS, SUB_TASK_NOT_FOUND
 from pecha_api.plans.plans_enums import ContentType
 
 
+@pytest.fixture(autouse=True)
+def _mock_featured_day_invalidation_():
+    with patch("pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services.invalidate_featured_day_cache_of_days", new_callable=AsyncMock) as mock_invalidate:
+        yield mock_invalidate
+
+
 @pytest.mark.asyncio
 async def test_create_new_sub_tasks_builds_and_saves_with_incremented_display_order():
     task_id = uuid.uuid4()
@@ -53,7 +62,7 @@ async def test_create_new_sub_tasks_builds_and_saves_with_incremented_display_or
         return_value=session_cm,
     ) as mock_session, patch(
         "pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services._get_author_task",
-        return_value=SimpleNamespace(id=task_id, created_by="author@example.com"),
+        return_value=SimpleNamespace(id=task_id, plan_item_id=uuid.uuid4(), created_by="author@example.com"),
     ) as mock_get_task, patch(
         "pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services.get_max_display_order_for_sub_task",
         return_value=5,
@@ -204,7 +213,7 @@ async def test_update_sub_task_by_task_id_deletes_missing_and_updates_existing_a
         return_value=session_cm,
     ) as mock_session, patch(
         "pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services._get_author_task",
-        return_value=SimpleNamespace(id=task_id, created_by="author@example.com"),
+        return_value=SimpleNamespace(id=task_id, plan_item_id=uuid.uuid4(), created_by="author@example.com"),
     ) as mock_get_task, patch(
         "pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services.get_sub_tasks_by_task_id",
         return_value=[
@@ -326,7 +335,7 @@ async def test_update_sub_task_by_task_id_creates_new_sub_tasks_for_none_ids():
         return_value=session_cm,
     ), patch(
         "pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services._get_author_task",
-        return_value=SimpleNamespace(id=task_id, created_by="author@example.com"),
+        return_value=SimpleNamespace(id=task_id, plan_item_id=uuid.uuid4(), created_by="author@example.com"),
     ), patch(
         "pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services.get_sub_tasks_by_task_id",
         return_value=[SimpleNamespace(id=existing_id)],
@@ -424,7 +433,7 @@ async def test_change_subtask_order_service_success():
     sub_task_id_2 = uuid.uuid4()
     sub_task_id_3 = uuid.uuid4()
     
-    task = SimpleNamespace(id=task_id, created_by="author@example.com")
+    task = SimpleNamespace(id=task_id, plan_item_id=uuid.uuid4(), created_by="author@example.com")
     
     request = SubTaskOrderRequest(
         subtasks=[
@@ -482,7 +491,7 @@ async def test_change_subtask_order_service_move_up():
     task_id = uuid.uuid4()
     sub_task_ids = [uuid.uuid4() for _ in range(5)]
     
-    task = SimpleNamespace(id=task_id, created_by="author@example.com")
+    task = SimpleNamespace(id=task_id, plan_item_id=uuid.uuid4(), created_by="author@example.com")
     
     request = SubTaskOrderRequest(
         subtasks=[
@@ -529,7 +538,7 @@ async def test_change_subtask_order_service_move_down():
     task_id = uuid.uuid4()
     sub_task_ids = [uuid.uuid4() for _ in range(5)]
     
-    task = SimpleNamespace(id=task_id, created_by="author@example.com")
+    task = SimpleNamespace(id=task_id, plan_item_id=uuid.uuid4(), created_by="author@example.com")
     
     request = SubTaskOrderRequest(
         subtasks=[
@@ -576,7 +585,7 @@ async def test_change_subtask_order_service_to_first_position():
     task_id = uuid.uuid4()
     sub_task_ids = [uuid.uuid4() for _ in range(3)]
     
-    task = SimpleNamespace(id=task_id, created_by="author@example.com")
+    task = SimpleNamespace(id=task_id, plan_item_id=uuid.uuid4(), created_by="author@example.com")
     
     request = SubTaskOrderRequest(
         subtasks=[
@@ -722,7 +731,7 @@ async def test_change_subtask_order_service_database_error():
     task_id = uuid.uuid4()
     sub_task_ids = [uuid.uuid4() for _ in range(3)]
     
-    task = SimpleNamespace(id=task_id, created_by="author@example.com")
+    task = SimpleNamespace(id=task_id, plan_item_id=uuid.uuid4(), created_by="author@example.com")
     
     request = SubTaskOrderRequest(
         subtasks=[
@@ -762,7 +771,7 @@ async def test_change_subtask_order_service_update_failed():
     task_id = uuid.uuid4()
     sub_task_ids = [uuid.uuid4() for _ in range(2)]
     
-    task = SimpleNamespace(id=task_id, created_by="author@example.com")
+    task = SimpleNamespace(id=task_id, plan_item_id=uuid.uuid4(), created_by="author@example.com")
     
     request = SubTaskOrderRequest(
         subtasks=[
@@ -796,4 +805,52 @@ async def test_change_subtask_order_service_update_failed():
                 update_subtask_order=request,
             )
         
-        assert exc.value.status_code == 400
\ No newline at end of file
+        assert exc.value.status_code == 400
+
+
+def _move_sub_task_patches(sub_task):
+    session_cm = MagicMock()
+    db_mock = MagicMock()
+    session_cm.__enter__.return_value = db_mock
+    task = SimpleNamespace(id=uuid.uuid4(), plan_item_id=uuid.uuid4(), created_by="author@example.com")
+    return db_mock, task, [
+        patch("pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services.validate_and_extract_author_details", return_value=SimpleNamespace(email="author@example.com", is_admin=False)),
+        patch("pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services.SessionLocal", return_value=session_cm),
+        patch("pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services._get_author_task", return_value=task),
+        patch("pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services.get_sub_task_by_id", return_value=sub_task),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_move_sub_task_service_returns_new_display_order():
+    sub_task = SimpleNamespace(id=uuid.uuid4())
+    after_sub_task_id = uuid.uuid4()
+    db_mock, task, patches = _move_sub_task_patches(sub_task)
+
+    with patches[0], patches[1], patches[2], patches[3], patch(
+        "pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services.move_sub_task", return_value=3072
+    ) as mock_move:
+        response = await move_sub_task_service(
+            token="token",
+            sub_task_id=sub_task.id,
+            move_sub_task_request=MoveSubTaskRequest(task_id=task.id, after_sub_task_id=after_sub_task_id),
+        )
+
+    assert response.sub_task_id == sub_task.id
+    assert response.display_order == 3072
+    mock_move.assert_called_once_with(db=db_mock, sub_task=sub_task, after_sub_task_id=after_sub_task_id)
+
+
+@pytest.mark.asyncio
+async def test_move_sub_task_service_sub_task_not_found():
+    _, task, patches = _move_sub_task_patches(None)
+
+    with patches[0], patches[1], patches[2], patches[3], patch(
+        "pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_services.move_sub_task"
+    ) as mock_move:
+        with pytest.raises(HTTPException) as exc_info:
+            await move_sub_task_service(token="token", sub_task_id=uuid.uuid4(), move_sub_task_request=MoveSubTaskRequest(task_id=task.id))
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == {"error": BAD_REQUEST, "message": SUB_TASK_NOT_FOUND}
+    mock_move.assert_not_called()
@@ -2,6 +2,7 @@ import uuid
 import pytest
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 
 from pecha_api.plans.response_message import BAD_REQUEST, TASK_NOT_FOUND
@@ -209,28 +210,28 @@ def test_get_tasks_by_plan_item_id_filters_and_orders():
 # Removed: update_task_order_by_id no longer exists in repository
 
 
-def test_reorder_day_tasks_display_order_commits_and_refreshes_each_task():
+def test_reorder_day_tasks_display_order_updates_all_tasks_in_one_statement():
     db = MagicMock()
-    tasks = [SimpleNamespace(id=1), SimpleNamespace(id=2), SimpleNamespace(id=3)]
+    positions = [(uuid.uuid4(), order) for order in (1, 2, 3)]
 
-    reorder_day_tasks_display_order(db=db, tasks=tasks)
+    reorder_day_tasks_display_order(db=db, plan_item_id=uuid.uuid4(), positions=positions)
 
-    # commit once per task
-    assert db.commit.call_count == len(tasks)
-    # refresh called for each specific task
-    refreshed = [call_args[0][0] for call_args in db.refresh.call_args_list]
-    assert refreshed == tasks
+    db.execute.assert_called_once()
+    db.commit.assert_called_once()
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "UPDATE tasks SET display_order=new_positions.position" in sql
+    assert "FROM (VALUES" in sql
 
 
 def test_reorder_day_tasks_display_order_rolls_back_and_raises_on_error():
     db = MagicMock()
-    tasks = [SimpleNamespace(id=1)]
+    positions = [(uuid.uuid4(), 1)]
     db.commit.side_effect = Exception("boom")
 
     from fastapi import HTTPException
 
     with pytest.raises(HTTPException) as exc:
-        reorder_day_tasks_display_order(db=db, tasks=tasks)
+        reorder_day_tasks_display_order(db=db, plan_item_id=uuid.uuid4(), positions=positions)
 
     assert exc.value.status_code == 400
     assert exc.value.detail["error"] == BAD_REQUEST
@@ -1,7 +1,7 @@
 import uuid
 import pytest
 from types import SimpleNamespace
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import HTTPException
 from pecha_api.plans.response_message import BAD_REQUEST, PLAN_DAY_NOT_FOUND, FORBIDDEN, UNAUTHORIZED_TASK_ACCESS, TASK_NOT_FOUND, DUPLICATE_TASK_ORDER
 from pecha_api.plans.tasks.plan_tasks_response_model import (
@@ -13,6 +13,7 @@ from pecha_api.plans.tasks.plan_tasks_response_model import (
     UpdateTaskTitleRequest,
     UpdateTaskTitleResponse,
     UpdateTaskOrderRequest,
+    MoveTaskRequest,
 )
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import SubTaskDTO
 from pecha_api.plans.plans_enums import ContentType
@@ -27,9 +28,16 @@ from pecha_api.plans.tasks.plan_tasks_services import (
     _get_author_task,
     change_task_order_service,
     _check_duplicate_task_order,
+    move_task_service,
 )
 
 
+@pytest.fixture(autouse=True)
+def _mock_featured_day_invalidation_():
+    with patch("pecha_api.plans.tasks.plan_tasks_services.invalidate_featured_day_cache_of_days", new_callable=AsyncMock) as mock_invalidate:
+        yield mock_invalidate
+
+
 @pytest.mark.asyncio
 async def test_create_new_task_builds_and_saves_with_incremented_display_order():
     plan_id = uuid.uuid4()
@@ -440,9 +448,10 @@ async def test_delete_task_by_id_database_error():
 
 
 @pytest.mark.asyncio
-async def test_change_task_day_service_success():
+async def test_change_task_day_service_success(_mock_featured_day_invalidation_):
     task_id = uuid.uuid4()
     target_day_id = uuid.uuid4()
+    previous_day_id = uuid.uuid4()
 
     request = UpdateTaskDayRequest(target_day_id=target_day_id)
 
@@ -473,7 +482,7 @@ async def test_change_task_day_service_success():
         "pecha_api.plans.tasks.plan_tasks_services._get_author_task",
         return_value=SimpleNamespace(
             id=task_id,
-            plan_item_id=uuid.uuid4(),
+            plan_item_id=previous_day_id,
             display_order=None,
             estimated_time=None,
             title="Moved Task",
@@ -499,6 +508,9 @@ async def test_change_task_day_service_success():
         assert mock_update.call_count == 1
         assert set(mock_update.call_args.kwargs.keys()) == {"db", "updated_task"}
         assert mock_update.call_args.kwargs["db"] is db_mock
+        _mock_featured_day_invalidation_.assert_awaited_once_with(
+            db=db_mock, day_ids=[previous_day_id, target_day_id]
+        )
 
         expected = UpdatedTaskDayResponse(
             task_id=updated_task.id,
@@ -784,6 +796,7 @@ async def test_update_task_title_service_success():
     
     mock_updated_task = SimpleNamespace(
         id=task_id,
+        plan_item_id=uuid.uuid4(),
         title=new_title,
         created_by=author_email,
     )
@@ -1008,33 +1021,55 @@ async def test_update_task_title_service_database_error():
 
 def test__reorder_sequentially_updates_only_when_needed_and_calls_repository():
     db = MagicMock()
+    day_id = uuid.uuid4()
     # Current orders: 1, 3, 3 -> should become 1, 2, 3; only second task changes
-    t1 = SimpleNamespace(id=1, display_order=1)
-    t2 = SimpleNamespace(id=2, display_order=3)
-    t3 = SimpleNamespace(id=3, display_order=3)
+    t1 = SimpleNamespace(id=1, plan_item_id=day_id, display_order=1)
+    t2 = SimpleNamespace(id=2, plan_item_id=day_id, display_order=3)
+    t3 = SimpleNamespace(id=3, plan_item_id=day_id, display_order=3)
 
     with patch(
         "pecha_api.plans.tasks.plan_tasks_services.reorder_day_tasks_display_order",
     ) as mock_repo_reorder:
         _reorder_sequentially(db=db, tasks=[t1, t2, t3])
 
-    # Only tasks with mismatched order should be updated before calling repo
-    assert t1.display_order == 1
-    assert t2.display_order == 2
-    assert t3.display_order == 3
+    # The loaded tasks are not modified
+    assert [t.display_order for t in (t1, t2, t3)] == [1, 3, 3]
+
+    # Repository called with the positions of the tasks that move (t2 only)
+    mock_repo_reorder.assert_called_once_with(db=db, plan_item_id=day_id, positions=[(2, 2)])
+
 
-    # Repository called with tasks that needed updating (t2 only)
-    assert mock_repo_reorder.call_count == 1
-    called_tasks = mock_repo_reorder.call_args.kwargs["tasks"]
-    assert [t.id for t in called_tasks] == [2]
+def test__reorder_sequentially_leaves_no_dirty_tasks_at_commit():
+    # Map every model PlanTask relates to, so it can be built as a real ORM object
+    import pecha_api.app  # noqa: F401
+    from sqlalchemy.orm import Session, make_transient_to_detached
+    from pecha_api.plans.tasks.plan_tasks_models import PlanTask
+
+    day_id = uuid.uuid4()
+    session = Session()
+    tasks = []
+    for order in (1, 3, 4):
+        task = PlanTask(id=uuid.uuid4(), plan_item_id=day_id, title=f"task {order}", display_order=order)
+        make_transient_to_detached(task)
+        session.add(task)
+        tasks.append(task)
+
+    dirty_at_commit = []
+    session.execute = MagicMock()
+    session.commit = MagicMock(side_effect=lambda: dirty_at_commit.append(list(session.dirty)))
+
+    _reorder_sequentially(db=session, tasks=tasks)
+
+    session.execute.assert_called_once()
+    assert dirty_at_commit == [[]]
 
 
 def test__reorder_sequentially_no_changes_does_not_call_repository():
     db = MagicMock()
     tasks = [
-        SimpleNamespace(id=1, display_order=1),
-        SimpleNamespace(id=2, display_order=2),
-        SimpleNamespace(id=3, display_order=3),
+        SimpleNamespace(id=1, plan_item_id=uuid.uuid4(), display_order=1),
+        SimpleNamespace(id=2, plan_item_id=uuid.uuid4(), display_order=2),
+        SimpleNamespace(id=3, plan_item_id=uuid.uuid4(), display_order=3),
     ]
 
     with patch(
@@ -1148,6 +1183,7 @@ async def test_update_task_title_service_empty_title():
     
     mock_updated_task = SimpleNamespace(
         id=task_id,
+        plan_item_id=uuid.uuid4(),
         title="",
         created_by=author_email,
     )
@@ -1339,3 +1375,66 @@ async def test_change_task_order_service_database_error():
 @pytest.mark.asyncio
 async def test_change_task_order_service_task_not_in_day():
     pytest.skip("change_task_order_service no longer validates day membership; condition not applicable")
+
+
+@pytest.mark.asyncio
+async def test_move_task_service_returns_new_display_order():
+    task_id = uuid.uuid4()
+    after_task_id = uuid.uuid4()
+    mock_author = SimpleNamespace(email="author@example.com", is_admin=False)
+    mock_task = SimpleNamespace(id=task_id, created_by="author@example.com", plan_item_id=uuid.uuid4())
+
+    db_mock = MagicMock()
+    session_cm = MagicMock()
+    session_cm.__enter__.return_value = db_mock
+
+    with patch(
+        "pecha_api.plans.tasks.plan_tasks_services.validate_and_extract_author_details",
+        return_value=mock_author,
+    ), patch(
+        "pecha_api.plans.tasks.plan_tasks_services.SessionLocal",
+        return_value=session_cm,
+    ), patch(
+        "pecha_api.plans.tasks.plan_tasks_services.get_task_by_id",
+        return_value=mock_task,
+    ), patch(
+        "pecha_api.plans.tasks.plan_tasks_services.move_task",
+        return_value=1536,
+    ) as mock_move:
+        response = await move_task_service(
+            token="token",
+            task_id=task_id,
+            move_task_request=MoveTaskRequest(after_task_id=after_task_id),
+        )
+
+    assert response.task_id == task_id
+    assert response.display_order == 1536
+    mock_move.assert_called_once_with(db=db_mock, task=mock_task, after_task_id=after_task_id)
+
+
+@pytest.mark.asyncio
+async def test_move_task_service_forbidden_for_other_author():
+    mock_author = SimpleNamespace(email="other@example.com", is_admin=False)
+    mock_task = SimpleNamespace(id=uuid.uuid4(), created_by="author@example.com", plan_item_id=uuid.uuid4())
+
+    session_cm = MagicMock()
+    session_cm.__enter__.return_value = MagicMock()
+
+    with patch(
+        "pecha_api.plans.tasks.plan_tasks_services.validate_and_extract_author_details",
+        return_value=mock_author,
+    ), patch(
+        "pecha_api.plans.tasks.plan_tasks_services.SessionLocal",
+        return_value=session_cm,
+    ), patch(
+        "pecha_api.plans.tasks.plan_tasks_services.get_task_by_id",
+        return_value=mock_task,
+    ), patch(
+        "pecha_api.plans.tasks.plan_tasks_services.move_task",
+    ) as mock_move:
+        with pytest.raises(HTTPException) as exc_info:
+            await move_task_service(token="token", task_id=mock_task.id, move_task_request=MoveTaskRequest())
+
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail == {"error": FORBIDDEN, "message": UNAUTHORIZED_TASK_ACCESS}
+    mock_move.assert_not_called()
@@ -0,0 +1,119 @@
+import uuid
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+import pecha_api.app  # noqa: F401  (registers every mapper)
+from pecha_api.plans.plans_ordering import ORDER_GAP, move_between, positions_are_unique, spaced_positions, update_positions
+from pecha_api.plans.tasks.plan_tasks_models import PlanTask
+from pecha_api.plans.users.recitation.user_recitations_models import UserRecitations
+
+
+def _compiled(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _db_with_siblings(siblings):
+    db = MagicMock()
+    db.execute.return_value.all.return_value = siblings
+    return db
+
+
+def test_update_positions_joins_a_values_list_in_one_statement():
+    db = MagicMock()
+    day_id = uuid.uuid4()
+
+    update_positions(
+        db=db,
+        model=PlanTask,
+        order_column=PlanTask.display_order,
+        scope=PlanTask.plan_item_id == day_id,
+        positions=[(uuid.uuid4(), 1), (uuid.uuid4(), 2)]
+    )
+
+    db.execute.assert_called_once()
+    sql = _compiled(db.execute.call_args.args[0])
+    assert "SET display_order=new_positions.position FROM (VALUES" in sql
+    assert "tasks.id = new_positions.id AND tasks.plan_item_id =" in sql
+
+
+def test_update_positions_matches_on_key_column():
+    db = MagicMock()
+    user_id = uuid.uuid4()
+
+    update_positions(
+        db=db,
+        model=UserRecitations,
+        order_column=UserRecitations.display_order,
+        scope=UserRecitations.user_id == user_id,
+        positions=[(uuid.uuid4(), 1)],
+        key_column=UserRecitations.text_id
+    )
+
+    sql = _compiled(db.execute.call_args.args[0])
+    assert "user_recitations.text_id = new_positions.id AND user_recitations.user_id =" in sql
+
+
+def test_update_positions_without_positions_skips_the_database():
+    db = MagicMock()
+
+    assert update_positions(db=db, model=PlanTask, order_column=PlanTask.display_order, scope=True, positions=[]) == 0
+    db.execute.assert_not_called()
+
+
+def test_positions_are_unique_groups_by_order_column():
+    db = MagicMock()
+    db.execute.return_value.first.return_value = (3,)
+
+    assert positions_are_unique(db=db, order_column=PlanTask.display_order, scope=PlanTask.plan_item_id == uuid.uuid4()) is False
+    sql = _compiled(db.execute.call_args.args[0])
+    assert "GROUP BY tasks.display_order \nHAVING count(*) >" in sql
+
+
+def test_spaced_positions_leave_gaps():
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    assert spaced_positions([first, second]) == [(first, ORDER_GAP), (second, 2 * ORDER_GAP)]
+
+
+def test_move_between_writes_midpoint_of_neighbours():
+    task_id = uuid.uuid4()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    db = _db_with_siblings([(first, 1024), (second, 2048)])
+
+    position = move_between(db=db, model=PlanTask, order_column=PlanTask.display_order, scope=PlanTask.plan_item_id == uuid.uuid4(), item_id=task_id, after_id=first)
+
+    assert position == 1536
+    assert db.execute.call_count == 2
+    assert "VALUES" not in _compiled(db.execute.call_args.args[0])
+
+
+def test_move_between_first_and_last_positions():
+    task_id = uuid.uuid4()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    siblings = [(first, 1024), (second, 2048)]
+    scope = PlanTask.plan_item_id == uuid.uuid4()
+
+    assert move_between(db=_db_with_siblings(siblings), model=PlanTask, order_column=PlanTask.display_order, scope=scope, item_id=task_id, after_id=None) == 512
+    assert move_between(db=_db_with_siblings(siblings), model=PlanTask, order_column=PlanTask.display_order, scope=scope, item_id=task_id, after_id=second) == 2048 + ORDER_GAP
+
+
+def test_move_between_adjacent_neighbours_respaces_siblings():
+    task_id = uuid.uuid4()
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db = _db_with_siblings([(first, 1), (second, 2), (third, 3)])
+
+    position = move_between(db=db, model=PlanTask, order_column=PlanTask.display_order, scope=PlanTask.plan_item_id == uuid.uuid4(), item_id=task_id, after_id=first)
+
+    assert position == 2 * ORDER_GAP
+    assert db.execute.call_count == 2
+    assert "FROM (VALUES" in _compiled(db.execute.call_args.args[0])
+
+
+def test_move_between_unknown_sibling_returns_none():
+    db = _db_with_siblings([(uuid.uuid4(), 1024)])
+
+    position = move_between(db=db, model=PlanTask, order_column=PlanTask.display_order, scope=PlanTask.plan_item_id == uuid.uuid4(), item_id=uuid.uuid4(), after_id=uuid.uuid4())
+
+    assert position is None
+    db.execute.assert_called_once()
@@ -0,0 +1,55 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+import pecha_api.app  # noqa: F401  (registers every mapper)
+from pecha_api.plans.plans_models import Plan
+from pecha_api.plans.plans_pagination import encode_cursor, decode_cursor, keyset_filter, keyset_page, parse_datetime
+from pecha_api.plans.response_message import BAD_REQUEST, INVALID_CURSOR
+
+
+def test_cursor_round_trips_sort_key_and_id():
+    started_at = datetime(2025, 12, 8, 9, 30, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(started_at, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, parse_datetime, uuid.UUID) == (started_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("only-one-value"), encode_cursor("not-a-date", str(uuid.uuid4()))])
+def test_decode_cursor_rejects_malformed_cursors(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, parse_datetime, uuid.UUID)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == {"error": BAD_REQUEST, "message": INVALID_CURSOR}
+
+
+def test_keyset_filter_compares_row_values():
+    descending = select(Plan.id).where(keyset_filter((Plan.created_at, Plan.id), ("2025-12-08", "id"), descending=True))
+    ascending = select(Plan.id).where(keyset_filter((Plan.created_at, Plan.id), ("2025-12-08", "id"), descending=False))
+
+    assert "(plans.created_at, plans.id) < (" in str(descending.compile(dialect=postgresql.dialect()))
+    assert "(plans.created_at, plans.id) > (" in str(ascending.compile(dialect=postgresql.dialect()))
+
+
+def test_keyset_page_trims_extra_row_into_next_cursor():
+    rows = [(1, "a"), (2, "b"), (3, "c")]
+
+    page, next_cursor = keyset_page(rows=rows, limit=2, cursor_values=lambda row: row)
+
+    assert page == [(1, "a"), (2, "b")]
+    assert decode_cursor(next_cursor, int, str) == (2, "b")
+
+
+def test_keyset_page_last_page_has_no_cursor():
+    page, next_cursor = keyset_page(rows=[(1, "a")], limit=2, cursor_values=lambda row: row)
+
+    assert page == [(1, "a")]
+    assert next_cursor is None
@@ -0,0 +1,40 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+import pecha_api.app  # noqa: F401  (registers every mapper)
+from pecha_api.plans.plans_enums import LanguageCode
+from pecha_api.plans.plans_models import Plan
+from pecha_api.plans.plans_search import plan_search_filter, plan_search_rank
+
+
+def _sql(expression) -> str:
+    statement = select(Plan.id).where(expression)
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_plan_search_filter_uses_language_config():
+    sql = _sql(plan_search_filter(search="compassion", language=LanguageCode.EN))
+
+    assert "plans.search_vector @@ websearch_to_tsquery('english'::regconfig, 'compassion')" in sql
+    assert "plans.title ILIKE '%%compassion%%'" in sql
+
+
+def test_plan_search_filter_uses_simple_config_for_unstemmed_languages():
+    sql = _sql(plan_search_filter(search="བྱང་ཆུབ", language="bo"))
+
+    assert "websearch_to_tsquery('simple'::regconfig" in sql
+    assert "'english'::regconfig" not in sql
+
+
+def test_plan_search_filter_without_language_matches_every_config():
+    sql = _sql(plan_search_filter(search="compassion"))
+
+    assert "websearch_to_tsquery('english'::regconfig, 'compassion') || websearch_to_tsquery('simple'::regconfig, 'compassion')" in sql
+
+
+def test_plan_search_rank_combines_text_rank_and_title_similarity():
+    statement = select(plan_search_rank(search="compassion", language="EN"))
+    sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert "ts_rank_cd(plans.search_vector, websearch_to_tsquery('english'::regconfig, 'compassion'))" in sql
+    assert "similarity(plans.title, 'compassion')" in sql
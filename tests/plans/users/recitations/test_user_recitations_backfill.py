@@ -0,0 +1,34 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock, MagicMock
+from uuid import uuid4
+
+from pecha_api.plans.users.recitation.user_recitations_backfill import backfill_user_recitation_titles
+
+
+@pytest.mark.asyncio
+async def test_backfill_user_recitation_titles_fills_known_texts_and_deletes_orphans():
+    known_id, orphan_id, next_id = sorted([uuid4(), uuid4(), uuid4()])
+    db_session = MagicMock()
+    texts = [
+        {str(known_id): SimpleNamespace(title="Known Title", language="bo")},
+        {str(next_id): SimpleNamespace(title="Next Title", language=None)}
+    ]
+
+    with patch("pecha_api.plans.users.recitation.user_recitations_backfill.SessionLocal") as mock_session_local, \
+        patch("pecha_api.plans.users.recitation.user_recitations_backfill.get_text_ids_without_title",
+              side_effect=[[known_id, orphan_id], [next_id], []]) as mock_get_text_ids, \
+        patch("pecha_api.plans.users.recitation.user_recitations_backfill.get_texts_by_ids", new_callable=AsyncMock, side_effect=texts), \
+        patch("pecha_api.plans.users.recitation.user_recitations_backfill.fill_user_recitations_text_details") as mock_fill, \
+        patch("pecha_api.plans.users.recitation.user_recitations_backfill.delete_user_recitations_by_text_ids") as mock_delete:
+        mock_session_local.return_value.__enter__.return_value = db_session
+
+        backfilled = await backfill_user_recitation_titles(batch_size=2)
+
+    assert backfilled == 3
+    assert [call.kwargs["after"] for call in mock_get_text_ids.call_args_list] == [None, orphan_id, next_id]
+    assert [call.kwargs["text_details"] for call in mock_fill.call_args_list] == [
+        [(known_id, "Known Title", "bo")],
+        [(next_id, "Next Title", None)]
+    ]
+    assert [call.kwargs["text_ids"] for call in mock_delete.call_args_list] == [[orphan_id], []]
@@ -0,0 +1,126 @@
+import uuid
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from fastapi import HTTPException
+
+from pecha_api.plans.response_message import BAD_REQUEST, NOT_FOUND, DUPLICATE_RECITATION_ORDER, RECITATION_NOT_FOUND
+from pecha_api.plans.users.recitation.user_recitations_models import UserRecitations
+from pecha_api.plans.users.recitation.user_recitations_repository import (
+    update_recitation_order_in_bulk,
+    update_user_recitation_text_details,
+    delete_user_recitations_by_text_id,
+    fill_user_recitations_text_details,
+    delete_user_recitations_by_text_ids
+)
+
+
+def _updates(*pairs):
+    return [{"text_id": text_id, "display_order": display_order} for text_id, display_order in pairs]
+
+
+def test_update_recitation_order_in_bulk_uses_one_update_keyed_by_text_id():
+    db = MagicMock()
+    user_id, first, second = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    with patch("pecha_api.plans.users.recitation.user_recitations_repository.update_positions", return_value=2) as mock_update, \
+        patch("pecha_api.plans.users.recitation.user_recitations_repository.positions_are_unique", return_value=True):
+        update_recitation_order_in_bulk(db=db, user_id=user_id, recitation_updates=_updates((first, 2), (second, 1)))
+
+    kwargs = mock_update.call_args.kwargs
+    assert kwargs["positions"] == [(first, 2), (second, 1)]
+    assert kwargs["key_column"] is UserRecitations.text_id
+    db.commit.assert_called_once()
+    db.rollback.assert_not_called()
+
+
+def test_update_recitation_order_in_bulk_rejects_duplicates_in_request():
+    db = MagicMock()
+    text_id = uuid.uuid4()
+
+    with pytest.raises(HTTPException) as exc_info:
+        update_recitation_order_in_bulk(db=db, user_id=uuid.uuid4(), recitation_updates=_updates((text_id, 1), (uuid.uuid4(), 1)))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["message"] == DUPLICATE_RECITATION_ORDER
+    db.execute.assert_not_called()
+
+
+def test_update_recitation_order_in_bulk_unknown_recitation_rolls_back():
+    db = MagicMock()
+
+    with patch("pecha_api.plans.users.recitation.user_recitations_repository.update_positions", return_value=1):
+        with pytest.raises(HTTPException) as exc_info:
+            update_recitation_order_in_bulk(db=db, user_id=uuid.uuid4(), recitation_updates=_updates((uuid.uuid4(), 1), (uuid.uuid4(), 2)))
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == {"error": NOT_FOUND, "message": RECITATION_NOT_FOUND}
+    db.rollback.assert_called_once()
+    db.commit.assert_not_called()
+
+
+def test_update_recitation_order_in_bulk_collision_with_untouched_recitation_rolls_back():
+    db = MagicMock()
+
+    with patch("pecha_api.plans.users.recitation.user_recitations_repository.update_positions", return_value=1), \
+        patch("pecha_api.plans.users.recitation.user_recitations_repository.positions_are_unique", return_value=False):
+        with pytest.raises(HTTPException) as exc_info:
+            update_recitation_order_in_bulk(db=db, user_id=uuid.uuid4(), recitation_updates=_updates((uuid.uuid4(), 1)))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == {"error": BAD_REQUEST, "message": DUPLICATE_RECITATION_ORDER}
+    db.rollback.assert_called_once()
+    db.commit.assert_not_called()
+
+
+def test_update_user_recitation_text_details_keeps_language_when_not_given():
+    db = MagicMock()
+    db.execute.return_value = SimpleNamespace(rowcount=3)
+
+    updated = update_user_recitation_text_details(db=db, text_id=uuid.uuid4(), title="new title")
+
+    assert updated == 3
+    statement = db.execute.call_args.args[0]
+    assert "title" in str(statement)
+    assert "language" not in str(statement)
+    db.commit.assert_called_once()
+
+
+def test_delete_user_recitations_by_text_id():
+    db = MagicMock()
+    db.execute.return_value = SimpleNamespace(rowcount=2)
+
+    assert delete_user_recitations_by_text_id(db=db, text_id=uuid.uuid4()) == 2
+    db.commit.assert_called_once()
+
+
+def test_fill_user_recitations_text_details_runs_one_statement():
+    db = MagicMock()
+    db.execute.return_value = SimpleNamespace(rowcount=4)
+
+    updated = fill_user_recitations_text_details(
+        db=db,
+        text_details=[(uuid.uuid4(), "first", "bo"), (uuid.uuid4(), "second", None)]
+    )
+
+    assert updated == 4
+    db.execute.assert_called_once()
+    assert "VALUES" in str(db.execute.call_args.args[0])
+    db.commit.assert_called_once()
+
+
+def test_fill_user_recitations_text_details_without_texts():
+    db = MagicMock()
+
+    assert fill_user_recitations_text_details(db=db, text_details=[]) == 0
+    db.execute.assert_not_called()
+
+
+def test_delete_user_recitations_by_text_ids():
+    db = MagicMock()
+    db.execute.return_value = SimpleNamespace(rowcount=3)
+
+    assert delete_user_recitations_by_text_ids(db=db, text_ids=[uuid.uuid4(), uuid.uuid4()]) == 3
+    db.execute.assert_called_once()
+    db.commit.assert_called_once()
+    assert delete_user_recitations_by_text_ids(db=MagicMock(), text_ids=[]) == 0
@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
 from uuid import uuid4
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
@@ -10,6 +11,10 @@ from pecha_api.plans.users.recitation.user_recitations_views import (
     update_recitation_order
 )
 from pecha_api.plans.users.recitation.user_recitations_views import create_user_recitation, get_user_recitations, delete_user_recitation
+from pecha_api.plans.users.recitation.user_recitations_services import (
+    create_user_recitation_service,
+    get_user_recitations_service
+)
 from pecha_api.plans.users.recitation.user_recitations_response_models import (
     CreateUserRecitationRequest,
     UserRecitationsResponse,
@@ -545,4 +550,41 @@ class TestUpdateRecitationOrderView:
         mock_service.assert_awaited_once_with(
             token=token,
             text_id=text_id
-        )
\ No newline at end of file
+        )
+
+class TestGetUserRecitationsService:
+
+    @pytest.mark.asyncio
+    async def test_get_user_recitations_reads_stored_titles_only(self):
+        text_id, untitled_id = uuid4(), uuid4()
+        recitations = [
+            SimpleNamespace(text_id=text_id, title="Stored Title", language="bo", display_order=1),
+            SimpleNamespace(text_id=untitled_id, title=None, language=None, display_order=2)
+        ]
+
+        with patch("pecha_api.plans.users.recitation.user_recitations_services.validate_and_extract_user_details", return_value=SimpleNamespace(id=uuid4())), \
+            patch("pecha_api.plans.users.recitation.user_recitations_services.SessionLocal"), \
+            patch("pecha_api.plans.users.recitation.user_recitations_services.get_user_recitations_by_user_id", return_value=recitations), \
+            patch("pecha_api.plans.users.recitation.user_recitations_services.update_user_recitation_text_details") as mock_update:
+            response = await get_user_recitations_service(token="valid_token")
+
+        mock_update.assert_not_called()
+        assert response.recitations == [UserRecitationDTO(title="Stored Title", text_id=text_id, language="bo", display_order=1)]
+
+
+class TestCreateUserRecitationService:
+
+    @pytest.mark.asyncio
+    async def test_create_user_recitation_stores_text_title(self):
+        text_id = uuid4()
+        text_details = SimpleNamespace(title="Text Title", language="bo")
+
+        with patch("pecha_api.plans.users.recitation.user_recitations_services.validate_and_extract_user_details", return_value=SimpleNamespace(id=uuid4())), \
+            patch("pecha_api.plans.users.recitation.user_recitations_services.SessionLocal"), \
+            patch("pecha_api.plans.users.recitation.user_recitations_services.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=text_details), \
+            patch("pecha_api.plans.users.recitation.user_recitations_services.get_max_display_order_for_user", return_value=4), \
+            patch("pecha_api.plans.users.recitation.user_recitations_services.save_user_recitation") as mock_save:
+            await create_user_recitation_service(token="valid_token", create_user_recitation_request=CreateUserRecitationRequest(text_id=text_id))
+
+        saved = mock_save.call_args.kwargs["user_recitations"]
+        assert (saved.text_id, saved.title, saved.language, saved.display_order) == (text_id, "Text Title", "bo", 5)
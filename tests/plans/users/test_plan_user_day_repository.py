@@ -0,0 +1,41 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from sqlalchemy.dialects import postgresql
+
+from pecha_api.plans.users.plan_user_day_repository import get_user_day_completion_flags
+
+
+def _db_returning(row):
+    db = MagicMock()
+    db.execute.return_value.one.return_value = row
+    return db
+
+
+def test_get_user_day_completion_flags_reads_all_flags_in_one_statement():
+    task_id = uuid.uuid4()
+    sub_task_ids = [uuid.uuid4(), uuid.uuid4()]
+    db = _db_returning(SimpleNamespace(day_completed=True, completed_task_ids=[task_id], completed_sub_task_ids=sub_task_ids))
+
+    flags = get_user_day_completion_flags(db=db, user_id=uuid.uuid4(), day_id=uuid.uuid4())
+
+    assert flags.day_completed is True
+    assert flags.completed_task_ids == {task_id}
+    assert flags.completed_sub_task_ids == set(sub_task_ids)
+    db.execute.assert_called_once()
+
+    statement = db.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "EXISTS (SELECT" in sql
+    assert "FROM user_day_completion" in sql
+    assert sql.count("array_agg(") == 2
+
+
+def test_get_user_day_completion_flags_without_completions():
+    db = _db_returning(SimpleNamespace(day_completed=False, completed_task_ids=None, completed_sub_task_ids=None))
+
+    flags = get_user_day_completion_flags(db=db, user_id=uuid.uuid4(), day_id=uuid.uuid4())
+
+    assert flags.day_completed is False
+    assert flags.completed_task_ids == set()
+    assert flags.completed_sub_task_ids == set()
@@ -0,0 +1,79 @@
+import uuid
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from pecha_api.plans.response_message import BAD_REQUEST
+from pecha_api.plans.users.plan_users_completion_repository import (
+    complete_sub_task_cascade,
+    complete_task_cascade,
+)
+
+
+def _db_returning(row):
+    db = MagicMock()
+    db.execute.return_value.one.return_value = row
+    return db
+
+
+def _compiled_sql(db) -> str:
+    statement = db.execute.call_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_complete_sub_task_cascade_runs_single_statement_and_commits_once():
+    day_id = uuid.uuid4()
+    db = _db_returning(SimpleNamespace(found=1, sub_tasks_completed=1, tasks_completed=1, completed_day_id=day_id, progress_updated=1))
+
+    result = complete_sub_task_cascade(db=db, user_id=uuid.uuid4(), sub_task_id=uuid.uuid4())
+
+    assert result.found is True
+    assert result.sub_tasks_completed == 1
+    assert result.tasks_completed == 1
+    assert result.completed_day_id == day_id
+    assert result.progress_updated is True
+    db.execute.assert_called_once()
+    db.commit.assert_called_once()
+
+    sql = _compiled_sql(db)
+    assert "INSERT INTO user_sub_task_completion" in sql
+    assert "INSERT INTO user_task_completion" in sql
+    assert "INSERT INTO user_day_completion" in sql
+    assert sql.count("ON CONFLICT") == 3
+    assert "UPDATE user_plan_progress" in sql
+
+
+def test_complete_sub_task_cascade_not_found():
+    db = _db_returning(SimpleNamespace(found=0, sub_tasks_completed=0, tasks_completed=0, completed_day_id=None, progress_updated=0))
+
+    result = complete_sub_task_cascade(db=db, user_id=uuid.uuid4(), sub_task_id=uuid.uuid4())
+
+    assert result.found is False
+    assert result.completed_day_id is None
+
+
+def test_complete_task_cascade_completes_all_sub_tasks_of_task():
+    db = _db_returning(SimpleNamespace(found=1, sub_tasks_completed=3, tasks_completed=1, completed_day_id=None, progress_updated=0))
+
+    result = complete_task_cascade(db=db, user_id=uuid.uuid4(), task_id=uuid.uuid4())
+
+    assert result.found is True
+    assert result.sub_tasks_completed == 3
+    db.execute.assert_called_once()
+    db.commit.assert_called_once()
+    assert _compiled_sql(db).count("ON CONFLICT") == 3
+
+
+def test_complete_task_cascade_error_rolls_back_and_raises_400():
+    db = MagicMock()
+    db.execute.side_effect = Exception("boom")
+
+    with pytest.raises(HTTPException) as exc_info:
+        complete_task_cascade(db=db, user_id=uuid.uuid4(), task_id=uuid.uuid4())
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["error"] == BAD_REQUEST
+    db.rollback.assert_called_once()
+    db.commit.assert_not_called()
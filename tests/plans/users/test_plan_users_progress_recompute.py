@@ -0,0 +1,15 @@
+from unittest.mock import patch, MagicMock
+
+from pecha_api.plans.users.plan_users_progress_recompute import recompute_progress
+
+
+def test_recompute_progress_runs_the_recompute_in_one_session():
+    db_session = MagicMock()
+
+    with patch("pecha_api.plans.users.plan_users_progress_recompute.SessionLocal") as mock_session_local, \
+        patch("pecha_api.plans.users.plan_users_progress_recompute.recompute_user_plan_progress", return_value=5) as mock_recompute:
+        mock_session_local.return_value.__enter__.return_value = db_session
+
+        assert recompute_progress() == 5
+
+    mock_recompute.assert_called_once_with(db=db_session)
@@ -6,7 +6,7 @@ from sqlalchemy.exc import IntegrityError
 
 from fastapi import HTTPException
 
-from pecha_api.plans.users.plan_users_response_models import UserPlanEnrollRequest
+from pecha_api.plans.users.plan_users_response_models import UserPlanEnrollRequest, CompletionCascadeResult, UserDayCompletionFlags
 from pecha_api.plans.users.plan_users_service import (
     enroll_user_in_plan,
     complete_sub_task_service,
@@ -144,8 +144,6 @@ def test_enroll_user_in_plan_already_enrolled_raises_409():
 def test_complete_sub_task_service_success():
     user_id = uuid.uuid4()
     sub_task_id = uuid.uuid4()
-    task_id = uuid.uuid4()
-    day_id = uuid.uuid4()
 
     db_mock, session_cm = _mock_session_with_db()
 
@@ -156,50 +154,14 @@ def test_complete_sub_task_service_success():
         "pecha_api.plans.users.plan_users_service.SessionLocal",
         return_value=session_cm,
     ), patch(
-        "pecha_api.plans.users.plan_users_service.get_sub_task_by_subtask_id",
-        return_value=SimpleNamespace(id=sub_task_id, task_id=task_id),
-    ) as mock_get_sub_task, patch(
-        "pecha_api.plans.users.plan_users_service.get_task_by_id",
-        return_value=SimpleNamespace(id=task_id, plan_item_id=day_id),
-    ) as mock_get_task, patch(
-        "pecha_api.plans.users.plan_users_service.UserSubTaskCompletion",
-    ) as MockUserSubTaskCompletion, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_sub_task_completions",
-    ) as mock_save, patch(
-        "pecha_api.plans.users.plan_users_service._check_all_subtasks_completed",
-        return_value=False,
-    ) as mock_check_all, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_task_completion",
-    ) as mock_save_task_completion, patch(
-        "pecha_api.plans.users.plan_users_service.check_day_completion",
-        return_value=None,
-    ) as mock_check_day, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_day_completion",
-    ) as mock_save_day:
-        constructed = SimpleNamespace(user_id=user_id, sub_task_id=sub_task_id)
-        MockUserSubTaskCompletion.return_value = constructed
-
+        "pecha_api.plans.users.plan_users_service.complete_sub_task_cascade",
+        return_value=CompletionCascadeResult(found=True, sub_tasks_completed=1),
+    ) as mock_cascade:
         result = complete_sub_task_service(token="token123", id=sub_task_id)
 
         assert result is None
-
         mock_validate.assert_called_once_with(token="token123")
-        mock_get_sub_task.assert_called_once_with(db=db_mock, id=sub_task_id)
-        mock_get_task.assert_called_once_with(db=db_mock, task_id=task_id)
-
-        ctor_kwargs = MockUserSubTaskCompletion.call_args.kwargs
-        assert ctor_kwargs["user_id"] == user_id
-        assert ctor_kwargs["sub_task_id"] == sub_task_id
-
-        mock_save.assert_called_once()
-        assert mock_save.call_args.kwargs["db"] is db_mock
-        assert mock_save.call_args.kwargs["user_sub_task_completions"] is constructed
-        mock_check_all.assert_called_once()
-        assert mock_check_all.call_args.kwargs["user_id"] == user_id
-        assert mock_check_all.call_args.kwargs["task_id"] == task_id
-        mock_save_task_completion.assert_not_called()
-        mock_check_day.assert_called_once_with(db=db_mock, user_id=user_id, day_id=day_id)
-        mock_save_day.assert_not_called()
+        mock_cascade.assert_called_once_with(db=db_mock, user_id=user_id, sub_task_id=sub_task_id)
 
 
 def test_complete_sub_task_service_sub_task_not_found_raises_404():
@@ -215,86 +177,19 @@ def test_complete_sub_task_service_sub_task_not_found_raises_404():
         "pecha_api.plans.users.plan_users_service.SessionLocal",
         return_value=session_cm,
     ), patch(
-        "pecha_api.plans.users.plan_users_service.get_sub_task_by_subtask_id",
-        return_value=None,
+        "pecha_api.plans.users.plan_users_service.complete_sub_task_cascade",
+        return_value=CompletionCascadeResult(found=False),
     ):
-        with pytest.raises(AttributeError) as exc_info:
+        with pytest.raises(HTTPException) as exc_info:
             complete_sub_task_service(token="token123", id=sub_task_id)
-        
-        assert "'NoneType' object has no attribute 'task_id'" in str(exc_info.value)
-
-
-def test_complete_sub_task_service_marks_task_completion_when_all_subtasks_done():
-    user_id = uuid.uuid4()
-    sub_task_id = uuid.uuid4()
-    task_id = uuid.uuid4()
-    day_id = uuid.uuid4()
 
-    db_mock, session_cm = _mock_session_with_db()
-
-    with patch(
-        "pecha_api.plans.users.plan_users_service.validate_and_extract_user_details",
-        return_value=SimpleNamespace(id=user_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.SessionLocal",
-        return_value=session_cm,
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_sub_task_by_subtask_id",
-        return_value=SimpleNamespace(id=sub_task_id, task_id=task_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_task_by_id",
-        return_value=SimpleNamespace(id=task_id, plan_item_id=day_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.UserSubTaskCompletion",
-    ) as MockUserSubTaskCompletion, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_sub_task_completions",
-    ) as mock_save_subtask, patch(
-        "pecha_api.plans.users.plan_users_service._check_all_subtasks_completed",
-        return_value=True,
-    ) as mock_check_all, patch(
-        "pecha_api.plans.users.plan_users_service.UserTaskCompletion",
-    ) as MockUserTaskCompletion, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_task_completion",
-    ) as mock_save_task, patch(
-        "pecha_api.plans.users.plan_users_service.check_day_completion",
-        return_value=None,
-    ) as mock_check_day, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_day_completion",
-    ) as mock_save_day:
-        constructed_sub = SimpleNamespace(user_id=user_id, sub_task_id=sub_task_id)
-        MockUserSubTaskCompletion.return_value = constructed_sub
-
-        constructed_task = SimpleNamespace(user_id=user_id, task_id=task_id)
-        MockUserTaskCompletion.return_value = constructed_task
-
-        result = complete_sub_task_service(token="token123", id=sub_task_id)
-
-        assert result is None
-        mock_save_subtask.assert_called_once()
-        assert mock_save_subtask.call_args.kwargs["db"] is db_mock
-        assert mock_save_subtask.call_args.kwargs["user_sub_task_completions"] is constructed_sub
-
-        mock_check_all.assert_called_once()
-        assert mock_check_all.call_args.kwargs["user_id"] == user_id
-        assert mock_check_all.call_args.kwargs["task_id"] == task_id
-
-        # When all subtasks are completed, task completion should be saved
-        mock_save_task.assert_called_once()
-        assert mock_save_task.call_args.kwargs["db"] is db_mock
-        assert mock_save_task.call_args.kwargs["user_task_completion"] is constructed_task
-        
-        # check_day_completion should be called
-        mock_check_day.assert_called_once_with(db=db_mock, user_id=user_id, day_id=day_id)
-        # Day completion should NOT be saved since check_day_completion returned None (not completed)
-        mock_save_day.assert_not_called()
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail["message"] == SUB_TASK_NOT_FOUND
 
 
-def test_complete_sub_task_service_saves_day_completion_when_day_completed():
-    """Test that day completion is saved when check_day_completion indicates day is complete"""
+def test_complete_sub_task_service_is_idempotent_on_repeat_taps():
     user_id = uuid.uuid4()
     sub_task_id = uuid.uuid4()
-    task_id = uuid.uuid4()
-    day_id = uuid.uuid4()
 
     db_mock, session_cm = _mock_session_with_db()
 
@@ -305,52 +200,14 @@ def test_complete_sub_task_service_saves_day_completion_when_day_completed():
         "pecha_api.plans.users.plan_users_service.SessionLocal",
         return_value=session_cm,
     ), patch(
-        "pecha_api.plans.users.plan_users_service.get_sub_task_by_subtask_id",
-        return_value=SimpleNamespace(id=sub_task_id, task_id=task_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_task_by_id",
-        return_value=SimpleNamespace(id=task_id, plan_item_id=day_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.UserSubTaskCompletion",
-    ) as MockUserSubTaskCompletion, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_sub_task_completions",
-    ), patch(
-        "pecha_api.plans.users.plan_users_service._check_all_subtasks_completed",
-        return_value=True,
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.UserTaskCompletion",
-    ) as MockUserTaskCompletion, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_task_completion",
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.check_day_completion",
-        return_value=True,
-    ) as mock_check_day, patch(
-        "pecha_api.plans.users.plan_users_service.UserDayCompletion",
-    ) as MockUserDayCompletion, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_day_completion",
-    ) as mock_save_day:
-        constructed_sub = SimpleNamespace(user_id=user_id, sub_task_id=sub_task_id)
-        MockUserSubTaskCompletion.return_value = constructed_sub
+        "pecha_api.plans.users.plan_users_service.complete_sub_task_cascade",
+        return_value=CompletionCascadeResult(found=True),
+    ) as mock_cascade:
+        complete_sub_task_service(token="token123", id=sub_task_id)
+        complete_sub_task_service(token="token123", id=sub_task_id)
 
-        constructed_task = SimpleNamespace(user_id=user_id, task_id=task_id)
-        MockUserTaskCompletion.return_value = constructed_task
-
-        constructed_day = SimpleNamespace(user_id=user_id, day_id=day_id)
-        MockUserDayCompletion.return_value = constructed_day
-
-        result = complete_sub_task_service(token="token123", id=sub_task_id)
-
-        assert result is None
-        
-        # check_day_completion should be called
-        mock_check_day.assert_called_once_with(db=db_mock, user_id=user_id, day_id=day_id)
-        
-        # Day completion SHOULD be saved since check_day_completion returned True
-        mock_save_day.assert_called_once()
-        assert mock_save_day.call_args.kwargs["db"] is db_mock
-        saved_day = mock_save_day.call_args.kwargs["user_day_completion"]
-        assert saved_day.user_id == user_id
-        assert saved_day.day_id == day_id
+        assert mock_cascade.call_count == 2
+        db_mock.commit.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -504,6 +361,58 @@ async def test_get_user_enrolled_plans_with_pagination():
         assert len(result.plans) == 10
 
 
+@pytest.mark.asyncio
+async def test_get_user_enrolled_plans_with_cursor_uses_keyset_without_count():
+    from pecha_api.plans.users.plan_users_service import get_user_enrolled_plans
+    from pecha_api.plans.plans_pagination import encode_cursor, decode_cursor, parse_datetime
+    from datetime import datetime, timezone, timedelta
+
+    user_id = uuid.uuid4()
+    cursor_started_at = datetime(2025, 12, 8, tzinfo=timezone.utc)
+    cursor_id = uuid.uuid4()
+    results = []
+    for index in range(3):
+        progress = SimpleNamespace(id=uuid.uuid4(), started_at=cursor_started_at - timedelta(days=index + 1))
+        plan = SimpleNamespace(
+            id=uuid.uuid4(),
+            title=f"Plan {index}",
+            description="Desc",
+            language=SimpleNamespace(value="EN"),
+            difficulty_level=SimpleNamespace(value="BEGINNER"),
+            image_url=None,
+            tags=[],
+        )
+        results.append((progress, plan, 10))
+
+    _, session_cm = _mock_session_with_db()
+
+    with patch(
+        "pecha_api.plans.users.plan_users_service.validate_and_extract_user_details",
+        return_value=SimpleNamespace(id=user_id),
+    ), patch(
+        "pecha_api.plans.users.plan_users_service.SessionLocal",
+        return_value=session_cm,
+    ), patch(
+        "pecha_api.plans.users.plan_users_service.get_user_enrolled_plans_with_details",
+        return_value=(results, None),
+    ) as mock_details:
+        result = await get_user_enrolled_plans(
+            token="tok", skip=40, limit=2, cursor=encode_cursor(cursor_started_at, cursor_id)
+        )
+
+        kwargs = mock_details.call_args.kwargs
+        assert kwargs["after"] == (cursor_started_at, cursor_id)
+        assert kwargs["skip"] == 0
+        assert kwargs["limit"] == 3
+        assert kwargs["count_total"] is False
+
+        assert result.skip == 0
+        assert result.total is None
+        assert [plan.title for plan in result.plans] == ["Plan 0", "Plan 1"]
+        last_progress = results[1][0]
+        assert decode_cursor(result.next_cursor, parse_datetime, uuid.UUID) == (last_progress.started_at, last_progress.id)
+
+
 @pytest.mark.asyncio
 async def test_get_user_enrolled_plans_empty_result():
     from pecha_api.plans.users.plan_users_service import get_user_enrolled_plans
@@ -585,84 +494,84 @@ async def test_get_user_enrolled_plans_success_with_filter_and_pagination():
         assert result.plans[0].id == plan_id_1
 
 
-@pytest.mark.asyncio
-async def test_get_user_plan_progress_success():
-    user_id = uuid.uuid4()
-    plan_id = uuid.uuid4()
+def _progress_with_plan(user_id, plan_id, **progress_fields):
+    from datetime import datetime, timezone
 
-    dto = PlanDTO(
+    progress = SimpleNamespace(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        plan_id=plan_id,
+        started_at=datetime(2024, 1, 15, 10, tzinfo=timezone.utc),
+        streak_count=2,
+        longest_streak=3,
+        completed_days=3,
+        last_completed_date=datetime.now(timezone.utc).date(),
+        status=SimpleNamespace(value="ACTIVE"),
+        is_completed=False,
+        completed_at=None,
+        created_at=datetime(2024, 1, 15, 10, tzinfo=timezone.utc),
+    )
+    for key, value in progress_fields.items():
+        setattr(progress, key, value)
+    plan = SimpleNamespace(
         id=plan_id,
         title="Plan X",
         description="desc",
-        language="en",
-        total_days=30,
-        status=PlanStatus.PUBLISHED,
-        subscription_count=0,
-        difficulty_level=DifficultyLevel.BEGINNER,
-        tags=[],
+        language=SimpleNamespace(value="EN"),
+        difficulty_level=SimpleNamespace(value="BEGINNER"),
+        image_url=None,
+        total_days=12,
+        tags=["tag"],
     )
+    return progress, plan
 
-    mock_progress = [
-        {
-            "id": str(uuid.uuid4()),
-            "user_id": str(user_id),
-            "plan_id": str(plan_id),
-            "started_at": "2024-01-15T10:00:00Z",
-            "streak_count": 2,
-            "longest_streak": 3,
-            "status": "active",
-            "is_completed": False,
-            "completed_at": None,
-            "created_at": "2024-01-15T10:00:00Z",
-        }
-    ]
+
+@pytest.mark.asyncio
+async def test_get_user_plan_progress_success():
+    user_id = uuid.uuid4()
+    plan_id = uuid.uuid4()
+    db_mock, session_cm = _mock_session_with_db()
 
     with patch(
         "pecha_api.plans.users.plan_users_service.validate_and_extract_user_details",
         return_value=SimpleNamespace(id=user_id),
     ), patch(
-        "pecha_api.plans.users.plan_users_service.MOCK_USER_PROGRESS",
-        new=mock_progress, create=True,
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.load_plans_from_json",
-        return_value=SimpleNamespace(plans=[SimpleNamespace(id=str(plan_id))]),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.convert_plan_model_to_dto",
-        return_value=dto,
+        "pecha_api.plans.users.plan_users_service.SessionLocal",
+        return_value=session_cm,
     ), patch(
-        "pecha_api.plans.users.plan_users_service.UserPlanProgress",
-    ) as MockUserPlanProgress:
-        constructed = SimpleNamespace(
-            id=uuid.uuid4(),
-            user_id=user_id,
-            plan_id=plan_id,
-            plan=dto.model_dump(),
-            status="active",
-        )
-        MockUserPlanProgress.return_value = constructed
-
+        "pecha_api.plans.users.plan_users_service.get_plan_progress_with_plan",
+        return_value=_progress_with_plan(user_id, plan_id),
+    ) as mock_get_progress:
         result = await get_user_plan_progress(token="tok", plan_id=plan_id)
 
-        ctor_kwargs = MockUserPlanProgress.call_args.kwargs
-        assert ctor_kwargs["user_id"] == user_id
-        assert ctor_kwargs["plan_id"] == plan_id
-        assert ctor_kwargs["plan"]["id"] == plan_id
-        assert ctor_kwargs["status"] == "active"
-
-        assert result is constructed
+        mock_get_progress.assert_called_once_with(db=db_mock, user_id=user_id, plan_id=plan_id)
+        assert result.user_id == user_id
+        assert result.plan_id == plan_id
+        assert result.plan["id"] == str(plan_id)
+        assert result.plan["total_days"] == 12
+        assert result.status == "ACTIVE"
+        assert result.streak_count == 2
+        assert result.longest_streak == 3
+        assert result.completed_days == 3
+        assert result.total_days == 12
+        assert result.progress_percentage == 25.0
 
 
 @pytest.mark.asyncio
 async def test_get_user_plan_progress_not_enrolled_raises_404():
     user_id = uuid.uuid4()
     plan_id = uuid.uuid4()
+    _, session_cm = _mock_session_with_db()
 
     with patch(
         "pecha_api.plans.users.plan_users_service.validate_and_extract_user_details",
         return_value=SimpleNamespace(id=user_id),
     ), patch(
-        "pecha_api.plans.users.plan_users_service.MOCK_USER_PROGRESS",
-        new=[], create=True,
+        "pecha_api.plans.users.plan_users_service.SessionLocal",
+        return_value=session_cm,
+    ), patch(
+        "pecha_api.plans.users.plan_users_service.get_plan_progress_with_plan",
+        return_value=None,
     ):
         with pytest.raises(HTTPException) as exc_info:
             await get_user_plan_progress(token="tok", plan_id=plan_id)
@@ -690,36 +599,36 @@ def test_complete_task_service_success():
         "pecha_api.plans.users.plan_users_service.SessionLocal",
         return_value=session_cm,
     ), patch(
-        "pecha_api.plans.users.plan_users_service.get_task_by_id",
-        return_value=SimpleNamespace(id=task_id, plan_item_id=day_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.complete_all_subtasks_completions",
-    ) as mock_complete_all_subtasks, patch(
-        "pecha_api.plans.users.plan_users_service.UserTaskCompletion",
-    ) as MockUserTaskCompletion, patch(
-        "pecha_api.plans.users.plan_users_service.save_user_task_completion",
-    ) as mock_save, patch(
-        "pecha_api.plans.users.plan_users_service.check_day_completion",
-    ) as mock_check_day_completion:
-        constructed = SimpleNamespace(user_id=user_id, task_id=task_id)
-        MockUserTaskCompletion.return_value = constructed
-
+        "pecha_api.plans.users.plan_users_service.complete_task_cascade",
+        return_value=CompletionCascadeResult(found=True, sub_tasks_completed=2, tasks_completed=1, completed_day_id=day_id),
+    ) as mock_cascade:
         result = complete_task_service(token="tok", task_id=task_id)
 
         assert result is None
-        mock_save.assert_called_once()
-        assert mock_save.call_args.kwargs["db"] is db_mock
-        assert mock_save.call_args.kwargs["user_task_completion"] is constructed
+        mock_cascade.assert_called_once_with(db=db_mock, user_id=user_id, task_id=task_id)
 
-        mock_complete_all_subtasks.assert_called_once()
-        assert mock_complete_all_subtasks.call_args.kwargs["db"] is db_mock
-        assert mock_complete_all_subtasks.call_args.kwargs["user_id"] == user_id
-        assert mock_complete_all_subtasks.call_args.kwargs["task_id"] == task_id
 
-        mock_check_day_completion.assert_called_once()
-        assert mock_check_day_completion.call_args.kwargs["db"] is db_mock
-        assert mock_check_day_completion.call_args.kwargs["user_id"] == user_id
-        assert mock_check_day_completion.call_args.kwargs["day_id"] == day_id
+def test_complete_task_service_task_not_found_raises_404():
+    user_id = uuid.uuid4()
+    task_id = uuid.uuid4()
+
+    _, session_cm = _mock_session_with_db_and_task_flow()
+
+    with patch(
+        "pecha_api.plans.users.plan_users_service.validate_and_extract_user_details",
+        return_value=SimpleNamespace(id=user_id),
+    ), patch(
+        "pecha_api.plans.users.plan_users_service.SessionLocal",
+        return_value=session_cm,
+    ), patch(
+        "pecha_api.plans.users.plan_users_service.complete_task_cascade",
+        return_value=CompletionCascadeResult(found=False),
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            complete_task_service(token="tok", task_id=task_id)
+        
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail["message"] == TASK_NOT_FOUND
 
 
 @pytest.mark.asyncio
@@ -767,28 +676,6 @@ async def test_get_user_enrolled_plans_without_image():
         assert result.total == 1
 
 
-def test_complete_task_service_task_not_found_raises_404():
-    user_id = uuid.uuid4()
-    task_id = uuid.uuid4()
-
-    _, session_cm = _mock_session_with_db_and_task_flow()
-
-    with patch(
-        "pecha_api.plans.users.plan_users_service.validate_and_extract_user_details",
-        return_value=SimpleNamespace(id=user_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.SessionLocal",
-        return_value=session_cm,
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_task_by_id",
-        return_value=None,
-    ):
-        with pytest.raises(HTTPException) as exc_info:
-            complete_task_service(token="tok", task_id=task_id)
-        
-        assert exc_info.value.status_code == 404
-
-
 @pytest.mark.asyncio
 async def test_get_user_enrolled_plans_presigned_url_error():
     from pecha_api.plans.users.plan_users_service import get_user_enrolled_plans
@@ -928,119 +815,6 @@ async def test_get_user_enrolled_plans_multiple_plans():
         assert result.plans[2].total_days == 7
 
 
-def test_complete_all_subtasks_completions_creates_missing_only():
-    from pecha_api.plans.users.plan_users_service import complete_all_subtasks_completions
-
-    user_id = uuid.uuid4()
-    task_id = uuid.uuid4()
-
-    sub_a, sub_b, sub_c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
-
-    db_mock = MagicMock()
-
-    with patch(
-        "pecha_api.plans.users.plan_users_service.get_sub_tasks_by_task_id",
-        return_value=[SimpleNamespace(id=sub_a), SimpleNamespace(id=sub_b), SimpleNamespace(id=sub_c)],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_uncompleted_user_sub_task_ids",
-        return_value=[sub_b],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.UserSubTaskCompletion",
-        side_effect=lambda user_id, sub_task_id: SimpleNamespace(user_id=user_id, sub_task_id=sub_task_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.save_user_sub_task_completions_bulk",
-    ) as mock_bulk:
-        complete_all_subtasks_completions(db=db_mock, user_id=user_id, task_id=task_id)
-
-        assert mock_bulk.call_count == 1
-        created_list = mock_bulk.call_args.kwargs["user_sub_task_completions"]
-        assert len(created_list) == 1
-        assert created_list[0].user_id == user_id
-        assert created_list[0].sub_task_id == sub_b
-
-
-def test_complete_all_subtasks_completions_no_new_items_calls_bulk_with_empty():
-    from pecha_api.plans.users.plan_users_service import complete_all_subtasks_completions
-
-    user_id = uuid.uuid4()
-    task_id = uuid.uuid4()
-
-    sub_a, sub_b = uuid.uuid4(), uuid.uuid4()
-
-    db_mock = MagicMock()
-
-    with patch(
-        "pecha_api.plans.users.plan_users_service.get_sub_tasks_by_task_id",
-        return_value=[SimpleNamespace(id=sub_a), SimpleNamespace(id=sub_b)],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_uncompleted_user_sub_task_ids",
-        return_value=[],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.UserSubTaskCompletion",
-        side_effect=lambda user_id, sub_task_id: SimpleNamespace(user_id=user_id, sub_task_id=sub_task_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.save_user_sub_task_completions_bulk",
-    ) as mock_bulk:
-        complete_all_subtasks_completions(db=db_mock, user_id=user_id, task_id=task_id)
-
-        created_list = mock_bulk.call_args.kwargs["user_sub_task_completions"]
-        assert created_list == []
-
-
-def test_check_day_completion_marks_day_complete_when_all_done():
-    from pecha_api.plans.users.plan_users_service import check_day_completion
-
-    user_id = uuid.uuid4()
-    day_id = uuid.uuid4()
-
-    t1, t2 = uuid.uuid4(), uuid.uuid4()
-
-    db_mock = MagicMock()
-
-    with patch(
-        "pecha_api.plans.users.plan_users_service.get_tasks_by_plan_item_id",
-        return_value=[SimpleNamespace(id=t1), SimpleNamespace(id=t2)],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_uncompleted_user_task_ids",
-        return_value=[],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.UserDayCompletion",
-        side_effect=lambda user_id, day_id: SimpleNamespace(user_id=user_id, day_id=day_id),
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.save_user_day_completion",
-    ) as mock_save:
-        check_day_completion(db=db_mock, user_id=user_id, day_id=day_id)
-
-        assert mock_save.call_count == 1
-        udc = mock_save.call_args.kwargs["user_day_completion"]
-        assert udc.user_id == user_id
-        assert udc.day_id == day_id
-
-
-def test_check_day_completion_does_nothing_when_remaining_tasks():
-    from pecha_api.plans.users.plan_users_service import check_day_completion
-
-    user_id = uuid.uuid4()
-    day_id = uuid.uuid4()
-
-    t1, t2 = uuid.uuid4(), uuid.uuid4()
-
-    db_mock = MagicMock()
-
-    with patch(
-        "pecha_api.plans.users.plan_users_service.get_tasks_by_plan_item_id",
-        return_value=[SimpleNamespace(id=t1), SimpleNamespace(id=t2)],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_uncompleted_user_task_ids",
-        return_value=[t2],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.save_user_day_completion",
-    ) as mock_save:
-        check_day_completion(db=db_mock, user_id=user_id, day_id=day_id)
-
-        mock_save.assert_not_called()
-
-
 def test_delete_task_service_success():
     user_id = uuid.uuid4()
     task_id = uuid.uuid4()
@@ -1155,42 +929,27 @@ def test_delete_task_service_task_not_found_raises_404():
 
 
 @pytest.mark.asyncio
-async def test_get_user_plan_progress_plan_not_found():
+async def test_get_user_plan_progress_lapsed_streak_reports_zero():
+    from datetime import date
+
     user_id = uuid.uuid4()
     plan_id = uuid.uuid4()
-
-    mock_progress = [
-        {
-            "id": str(uuid.uuid4()),
-            "user_id": str(user_id),
-            "plan_id": str(plan_id),
-            "started_at": "2024-01-15T10:00:00Z",
-            "streak_count": 1,
-            "longest_streak": 1,
-            "status": "active",
-            "is_completed": False,
-            "completed_at": None,
-            "created_at": "2024-01-15T10:00:00Z",
-        }
-    ]
+    _, session_cm = _mock_session_with_db()
 
     with patch(
         "pecha_api.plans.users.plan_users_service.validate_and_extract_user_details",
         return_value=SimpleNamespace(id=user_id),
     ), patch(
-        "pecha_api.plans.users.plan_users_service.MOCK_USER_PROGRESS",
-        new=mock_progress, create=True,
+        "pecha_api.plans.users.plan_users_service.SessionLocal",
+        return_value=session_cm,
     ), patch(
-        "pecha_api.plans.users.plan_users_service.load_plans_from_json",
-        return_value=SimpleNamespace(plans=[]),  # plan missing
+        "pecha_api.plans.users.plan_users_service.get_plan_progress_with_plan",
+        return_value=_progress_with_plan(user_id, plan_id, last_completed_date=date(2024, 1, 1), streak_count=4),
     ):
-        from pecha_api.plans.users.plan_users_service import get_user_plan_progress
-
-        with pytest.raises(HTTPException) as exc_info:
-            await get_user_plan_progress(token="tok", plan_id=plan_id)
+        result = await get_user_plan_progress(token="tok", plan_id=plan_id)
 
-        assert exc_info.value.status_code == 404
-        assert exc_info.value.detail == ErrorConstants.PLAN_NOT_FOUND
+        assert result.streak_count == 0
+        assert result.longest_streak == 3
 
 
 def test_get_user_plan_day_details_service_success():
@@ -1240,15 +999,9 @@ def test_get_user_plan_day_details_service_success():
         "pecha_api.plans.users.plan_users_service.get_plan_day_with_tasks_and_subtasks",
         return_value=plan_item,
     ), patch(
-        "pecha_api.plans.users.plan_users_service.is_day_completed",
-        return_value=True,
-    ) as mock_day_completed, patch(
-        "pecha_api.plans.users.plan_users_service.get_user_task_completions_by_user_id_and_task_ids",
-        return_value=[SimpleNamespace(task_id=task1_id)],
-    ) as mock_task_completions, patch(
-        "pecha_api.plans.users.plan_users_service.get_user_subtask_completions_by_user_id_and_sub_task_ids",
-        return_value=[SimpleNamespace(sub_task_id=sub1_id)],
-    ) as mock_subtask_completions:
+        "pecha_api.plans.users.plan_users_service.get_user_day_completion_flags",
+        return_value=UserDayCompletionFlags(day_completed=True, completed_task_ids={task1_id}, completed_sub_task_ids={sub1_id}),
+    ) as mock_completion_flags:
         result = get_user_plan_day_details_service(token="tok", plan_id=plan_id, day_number=3)
 
         # Top-level day details
@@ -1273,16 +1026,8 @@ def test_get_user_plan_day_details_service_success():
         assert result.tasks[1].sub_tasks[0].id == sub2_id
         assert result.tasks[1].sub_tasks[0].is_completed is False
 
-        # Verify helper invocations
-        mock_day_completed.assert_called_once_with(db=db_mock, user_id=user_id, day_id=day_id)
-        mock_task_completions.assert_called_once()
-        assert mock_task_completions.call_args.kwargs["db"] is db_mock
-        assert mock_task_completions.call_args.kwargs["user_id"] == user_id
-        assert set(mock_task_completions.call_args.kwargs["task_ids"]) == {task1_id, task2_id}
-        mock_subtask_completions.assert_called_once()
-        assert mock_subtask_completions.call_args.kwargs["db"] is db_mock
-        assert mock_subtask_completions.call_args.kwargs["user_id"] == user_id
-        assert set(mock_subtask_completions.call_args.kwargs["sub_task_ids"]) == {sub1_id, sub2_id}
+        # All completion flags of the day come from one lookup
+        mock_completion_flags.assert_called_once_with(db=db_mock, user_id=user_id, day_id=day_id)
 
 
 def test_is_completion_helpers_boolean_gateways():
@@ -1308,50 +1053,6 @@ def test_is_completion_helpers_boolean_gateways():
         assert is_day_completed(db=db_mock, user_id=user_id, day_id=day_id) is False
 
 
-def test_check_all_subtasks_completed_true():
-    from pecha_api.plans.users.plan_users_service import _check_all_subtasks_completed
-
-    user_id = uuid.uuid4()
-    task_id = uuid.uuid4()
-    sub_a, sub_b = uuid.uuid4(), uuid.uuid4()
-
-    db_mock, session_cm = _mock_session_with_db()
-
-    with patch(
-        "pecha_api.plans.users.plan_users_service.SessionLocal",
-        return_value=session_cm,
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_sub_tasks_by_task_id",
-        return_value=[SimpleNamespace(id=sub_a), SimpleNamespace(id=sub_b)],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_uncompleted_user_sub_task_ids",
-        return_value=[],
-    ):
-        assert _check_all_subtasks_completed(user_id=user_id, task_id=task_id) is True
-
-
-def test_check_all_subtasks_completed_false():
-    from pecha_api.plans.users.plan_users_service import _check_all_subtasks_completed
-
-    user_id = uuid.uuid4()
-    task_id = uuid.uuid4()
-    sub_a, sub_b = uuid.uuid4(), uuid.uuid4()
-
-    db_mock, session_cm = _mock_session_with_db()
-
-    with patch(
-        "pecha_api.plans.users.plan_users_service.SessionLocal",
-        return_value=session_cm,
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_sub_tasks_by_task_id",
-        return_value=[SimpleNamespace(id=sub_a), SimpleNamespace(id=sub_b)],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_uncompleted_user_sub_task_ids",
-        return_value=[sub_b],
-    ):
-        assert _check_all_subtasks_completed(user_id=user_id, task_id=task_id) is False
-
-
 def test_get_user_plan_day_details_service_image_subtask_presigned():
     from pecha_api.plans.users.plan_users_service import get_user_plan_day_details_service
     user_id = uuid.uuid4()
@@ -1394,14 +1095,8 @@ def test_get_user_plan_day_details_service_image_subtask_presigned():
         "pecha_api.plans.users.plan_users_service.get_plan_day_with_tasks_and_subtasks",
         return_value=plan_item,
     ), patch(
-        "pecha_api.plans.users.plan_users_service.is_day_completed",
-        return_value=False,
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_user_task_completions_by_user_id_and_task_ids",
-        return_value=[],
-    ), patch(
-        "pecha_api.plans.users.plan_users_service.get_user_subtask_completions_by_user_id_and_sub_task_ids",
-        return_value=[],
+        "pecha_api.plans.users.plan_users_service.get_user_day_completion_flags",
+        return_value=UserDayCompletionFlags(),
     ), patch(
         "pecha_api.plans.users.plan_users_service.get",
         return_value="bucket",
@@ -1720,6 +1415,93 @@ def test_delete_user_plan_progress_repository_with_no_completion_records():
     db_mock.commit.assert_called_once()
 
 
+def test_delete_user_plan_progress_repository_decrements_subscription_count():
+    user_id = uuid.uuid4()
+    plan_id = uuid.uuid4()
+
+    db_mock = MagicMock()
+    db_mock.query.return_value.filter.return_value.first.return_value = MagicMock()
+
+    with patch(
+        "pecha_api.plans.users.plan_users_progress_repository.increment_plan_subscription_count"
+    ) as mock_increment:
+        delete_user_plan_progress(db=db_mock, user_id=user_id, plan_id=plan_id)
+
+    mock_increment.assert_called_once_with(db=db_mock, plan_id=plan_id, amount=-1)
+    db_mock.commit.assert_called_once()
+
+
+def test_save_plan_progress_repository_increments_subscription_count():
+    from pecha_api.plans.users.plan_users_progress_repository import save_plan_progress
+
+    plan_id = uuid.uuid4()
+    db_mock = MagicMock()
+    plan_progress = SimpleNamespace(plan_id=plan_id)
+
+    with patch(
+        "pecha_api.plans.users.plan_users_progress_repository.increment_plan_subscription_count"
+    ) as mock_increment:
+        save_plan_progress(db=db_mock, plan_progress=plan_progress)
+
+    mock_increment.assert_called_once_with(db=db_mock, plan_id=plan_id)
+    db_mock.add.assert_called_once_with(plan_progress)
+    db_mock.commit.assert_called_once()
+
+
+def test_recompute_user_plan_progress_repository_commits_and_returns_rowcount():
+    from pecha_api.plans.users.plan_users_progress_repository import recompute_user_plan_progress
+
+    db_mock = MagicMock()
+    db_mock.execute.return_value.rowcount = 4
+
+    assert recompute_user_plan_progress(db=db_mock) == 4
+    db_mock.execute.assert_called_once()
+    db_mock.commit.assert_called_once()
+
+
+def test_recompute_user_plan_progress_repository_error_rolls_back():
+    from pecha_api.plans.users.plan_users_progress_repository import recompute_user_plan_progress
+
+    db_mock = MagicMock()
+    db_mock.execute.side_effect = Exception("boom")
+
+    with pytest.raises(HTTPException) as exc_info:
+        recompute_user_plan_progress(db=db_mock)
+
+    assert exc_info.value.status_code == 500
+    db_mock.rollback.assert_called_once()
+    db_mock.commit.assert_not_called()
+
+
+def test_delete_user_day_completion_reverts_progress_before_commit():
+    from pecha_api.plans.users.plan_user_day_repository import delete_user_day_completion
+
+    user_id = uuid.uuid4()
+    day_id = uuid.uuid4()
+    db_mock = MagicMock()
+    db_mock.query.return_value.filter.return_value.delete.return_value = 1
+
+    with patch("pecha_api.plans.users.plan_user_day_repository.revert_day_completion_progress") as mock_revert:
+        mock_revert.side_effect = lambda **kwargs: db_mock.commit.assert_not_called()
+        delete_user_day_completion(db=db_mock, user_id=user_id, day_id=day_id)
+
+    mock_revert.assert_called_once_with(db=db_mock, user_id=user_id, day_id=day_id)
+    db_mock.commit.assert_called_once()
+
+
+def test_delete_user_day_completion_leaves_progress_when_nothing_deleted():
+    from pecha_api.plans.users.plan_user_day_repository import delete_user_day_completion
+
+    db_mock = MagicMock()
+    db_mock.query.return_value.filter.return_value.delete.return_value = 0
+
+    with patch("pecha_api.plans.users.plan_user_day_repository.revert_day_completion_progress") as mock_revert:
+        delete_user_day_completion(db=db_mock, user_id=uuid.uuid4(), day_id=uuid.uuid4())
+
+    mock_revert.assert_not_called()
+    db_mock.commit.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_get_user_plan_days_completion_status_service_success():
     """Test successful retrieval of plan days completion status"""
@@ -434,7 +434,7 @@ def test_get_user_plans_multiple_plans(authenticated_client):
         assert data["plans"][1]["language"] == "BO"
         assert data["plans"][2]["image_url"] == ""
 def test_get_user_plans_success_default_pagination(authenticated_client):
-    response_payload = {"plans": [], "skip": 0, "limit": 20, "total": 0}
+    response_payload = {"plans": [], "skip": 0, "limit": 20, "total": 0, "next_cursor": None}
 
     with patch("pecha_api.plans.users.plan_users_views.get_user_enrolled_plans", new_callable=AsyncMock, return_value=response_payload) as mock_get:
         response = authenticated_client.get(
@@ -451,7 +451,7 @@ def test_get_user_plans_success_default_pagination(authenticated_client):
 
 
 def test_get_user_plans_with_filters_and_pagination(authenticated_client):
-    response_payload = {"plans": [], "skip": 10, "limit": 5, "total": 0}
+    response_payload = {"plans": [], "skip": 10, "limit": 5, "total": 0, "next_cursor": None}
 
     with patch("pecha_api.plans.users.plan_users_views.get_user_enrolled_plans", new_callable=AsyncMock, return_value=response_payload) as mock_get:
         response = authenticated_client.get(
@@ -0,0 +1,63 @@
+import pytest
+from uuid import uuid4
+from unittest.mock import patch, AsyncMock
+
+from pecha_api.recitations.recitations_cache_service import (
+    get_recitation_catalog_cache,
+    set_recitation_catalog_cache,
+    delete_recitation_catalog_cache,
+    clear_local_recitation_catalogs
+)
+from pecha_api.recitations.recitations_response_models import RecitationCatalogSnapshot, RecitationCatalogEntry
+
+
+@pytest.fixture(autouse=True)
+def empty_local_catalogs():
+    clear_local_recitation_catalogs()
+    yield
+    clear_local_recitation_catalogs()
+
+
+def _snapshot(language: str = "en") -> RecitationCatalogSnapshot:
+    return RecitationCatalogSnapshot(
+        language=language,
+        recitations=[RecitationCatalogEntry(text_id=uuid4(), title="Recitation", search_key="recitation")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_recitation_catalog_cache_reads_redis_once_then_local_copy():
+    snapshot = _snapshot()
+    with patch("pecha_api.recitations.recitations_cache_service.get_cache_data", new_callable=AsyncMock,
+               return_value=snapshot.model_dump(mode="json")) as mock_get_cache_data:
+        first = await get_recitation_catalog_cache(language="en")
+        second = await get_recitation_catalog_cache(language="en")
+
+    assert first == snapshot
+    assert second is first
+    mock_get_cache_data.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_recitation_catalog_cache_skips_unlisted_languages():
+    with patch("pecha_api.recitations.recitations_cache_service.get_cache_data", new_callable=AsyncMock) as mock_get_cache_data, \
+         patch("pecha_api.recitations.recitations_cache_service.set_cache", new_callable=AsyncMock) as mock_set_cache:
+        await set_recitation_catalog_cache(language="fr", data=_snapshot(language="fr"))
+        cached = await get_recitation_catalog_cache(language="fr")
+
+    assert cached is None
+    mock_set_cache.assert_not_awaited()
+    mock_get_cache_data.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_recitation_catalog_cache_drops_every_language():
+    with patch("pecha_api.recitations.recitations_cache_service.set_cache", new_callable=AsyncMock), \
+         patch("pecha_api.recitations.recitations_cache_service.delete_cache", new_callable=AsyncMock) as mock_delete_cache, \
+         patch("pecha_api.recitations.recitations_cache_service.get_cache_data", new_callable=AsyncMock, return_value=None):
+        await set_recitation_catalog_cache(language="en", data=_snapshot())
+        await delete_recitation_catalog_cache()
+        cached = await get_recitation_catalog_cache(language="en")
+
+    assert cached is None
+    assert mock_delete_cache.await_count == 3
@@ -0,0 +1,45 @@
+from uuid import uuid4
+
+from pecha_api.recitations.recitations_repository import normalize_search_key, search_recitation_catalog
+from pecha_api.recitations.recitations_response_models import RecitationCatalogSnapshot, RecitationCatalogEntry
+
+
+def _catalog(titles: list) -> RecitationCatalogSnapshot:
+    return RecitationCatalogSnapshot(
+        language="en",
+        recitations=[
+            RecitationCatalogEntry(text_id=uuid4(), title=title, search_key=normalize_search_key(title))
+            for title in titles
+        ]
+    )
+
+
+def test_normalize_search_key_folds_case_and_spacing():
+    assert normalize_search_key("  Heart   SUTRA ") == "heart sutra"
+
+
+def test_search_recitation_catalog_matches_substrings_in_catalog_order():
+    catalog = _catalog(["Praise to Tara", "Heart Sutra", "Sutra of Golden Light", "Tara Sadhana"])
+
+    assert [entry.title for entry in search_recitation_catalog(snapshot=catalog, search="SUTRA")] == ["Heart Sutra", "Sutra of Golden Light"]
+    assert [entry.title for entry in search_recitation_catalog(snapshot=catalog, search="tara")] == ["Praise to Tara", "Tara Sadhana"]
+
+
+def test_search_recitation_catalog_checks_trigram_candidates():
+    catalog = _catalog(["abc bcb cbc", "abcbcd"])
+
+    assert [entry.title for entry in search_recitation_catalog(snapshot=catalog, search="abcbc")] == ["abcbcd"]
+
+
+def test_search_recitation_catalog_short_and_empty_searches():
+    catalog = _catalog(["Heart Sutra", "Tara Sadhana"])
+
+    assert [entry.title for entry in search_recitation_catalog(snapshot=catalog, search="ha")] == ["Tara Sadhana"]
+    assert len(search_recitation_catalog(snapshot=catalog, search=None)) == 2
+    assert len(search_recitation_catalog(snapshot=catalog, search="   ")) == 2
+
+
+def test_search_recitation_catalog_tibetan_titles():
+    catalog = _catalog(["ཤེས་རབ་སྙིང་པོ།", "སྒྲོལ་མ་ལ་བསྟོད་པ།"])
+
+    assert [entry.title for entry in search_recitation_catalog(snapshot=catalog, search="སྙིང་པོ")] == ["ཤེས་རབ་སྙིང་པོ།"]
@@ -16,6 +16,8 @@ from pecha_api.recitations.recitations_response_models import (
     RecitationDetailsRequest,
     RecitationSegment,
     Segment,
+    RecitationCatalogEntry,
+    RecitationCatalogSnapshot,
 )
 from pecha_api.texts.texts_response_models import TableOfContent, TableOfContentType, Section, TextSegment, TextDTO
 from pecha_api.texts.segments.segments_response_models import (
@@ -34,52 +36,53 @@ from pecha_api.error_contants import ErrorConstants
 class TestGetListOfRecitationsService:
     """Test cases for get_list_of_recitations_service function."""
 
+    @staticmethod
+    def create_catalog(language: str, titles: list) -> RecitationCatalogSnapshot:
+        return RecitationCatalogSnapshot(
+            language=language,
+            recitations=[
+                RecitationCatalogEntry(text_id=uuid4(), title=title, search_key=title.lower())
+                for title in titles
+            ]
+        )
+
+    @patch('pecha_api.recitations.recitations_services.set_recitation_catalog_cache')
+    @patch('pecha_api.recitations.recitations_services.get_recitation_catalog_cache')
     @patch('pecha_api.recitations.recitations_services.get_collection_id_by_slug')
     @patch('pecha_api.recitations.recitations_services.get_root_text_by_collection_id')
-    @patch('pecha_api.recitations.recitations_services.apply_search_recitation_title_filter')
     @pytest.mark.asyncio
-    async def test_get_list_of_recitations_service_success(
+    async def test_get_list_of_recitations_service_builds_and_caches_catalog(
         self,
-        mock_apply_search_filter,
         mock_get_root_text,
-        mock_get_collection_id
+        mock_get_collection_id,
+        mock_get_catalog_cache,
+        mock_set_catalog_cache
     ):
-        """Test successful retrieval of recitations list."""
-        # Setup mocks
         liturgy_collection_id = str(uuid4())
         mock_get_collection_id.return_value = liturgy_collection_id
-        
-        text_id = str(uuid4())
-        text_title = "Test Recitation"
-        recitation_dto = RecitationDTO(text_id=UUID(text_id), title=text_title)
-        mock_recitations_response = RecitationsResponse(recitations=[recitation_dto])
-        mock_get_root_text.return_value = mock_recitations_response
-        mock_apply_search_filter.return_value = [recitation_dto]
-        
-        # Execute
+        mock_get_catalog_cache.return_value = None
+        recitation_dto = RecitationDTO(text_id=uuid4(), title="Test  Recitation")
+        mock_get_root_text.return_value = RecitationsResponse(recitations=[recitation_dto])
+
         result = await get_list_of_recitations_service(language="en")
-        
-        # Verify
-        assert isinstance(result, RecitationsResponse)
-        assert len(result.recitations) == 1
-        
-        recitation = result.recitations[0]
-        assert isinstance(recitation, RecitationDTO)
-        assert recitation.title == text_title
-        assert str(recitation.text_id) == text_id
-        
-        # Verify mock calls
+
+        assert result == RecitationsResponse(recitations=[recitation_dto])
         mock_get_collection_id.assert_called_once_with(slug="Liturgy")
         mock_get_root_text.assert_called_once_with(collection_id=liturgy_collection_id, language="en")
-        mock_apply_search_filter.assert_called_once_with(texts=[recitation_dto], search=None)
+        cached_catalog = mock_set_catalog_cache.call_args.kwargs["data"]
+        assert mock_set_catalog_cache.call_args.kwargs["language"] == "en"
+        assert cached_catalog.recitations[0].search_key == "test recitation"
 
+    @patch('pecha_api.recitations.recitations_services.get_recitation_catalog_cache')
     @patch('pecha_api.recitations.recitations_services.get_collection_id_by_slug')
     @pytest.mark.asyncio
     async def test_get_list_of_recitations_service_collection_not_found(
         self,
-        mock_get_collection_id
+        mock_get_collection_id,
+        mock_get_catalog_cache
     ):
         """Test get_list_of_recitations_service when Liturgy collection is not found."""
+        mock_get_catalog_cache.return_value = None
         mock_get_collection_id.return_value = None
         
         with pytest.raises(HTTPException) as exc_info:
@@ -89,97 +92,58 @@ class TestGetListOfRecitationsService:
         assert exc_info.value.detail == ErrorConstants.COLLECTION_NOT_FOUND
         mock_get_collection_id.assert_called_once_with(slug="Liturgy")
 
+    @patch('pecha_api.recitations.recitations_services.get_recitation_catalog_cache')
     @patch('pecha_api.recitations.recitations_services.get_collection_id_by_slug')
-    @patch('pecha_api.recitations.recitations_services.get_root_text_by_collection_id')
-    @patch('pecha_api.recitations.recitations_services.apply_search_recitation_title_filter')
     @pytest.mark.asyncio
-    async def test_get_list_of_recitations_service_search_filter_no_match(
+    async def test_get_list_of_recitations_service_with_search_match(
         self,
-        mock_apply_search_filter,
-        mock_get_root_text,
-        mock_get_collection_id
+        mock_get_collection_id,
+        mock_get_catalog_cache
     ):
-        """Test get_list_of_recitations_service when search filter returns no match."""
-        liturgy_collection_id = str(uuid4())
-        mock_get_collection_id.return_value = liturgy_collection_id
-        
-        text_id = str(uuid4())
-        text_title = "Test Recitation"
-        recitation_dto = RecitationDTO(text_id=UUID(text_id), title=text_title)
-        mock_recitations_response = RecitationsResponse(recitations=[recitation_dto])
-        mock_get_root_text.return_value = mock_recitations_response
-        mock_apply_search_filter.return_value = []
-        
-        result = await get_list_of_recitations_service(search="nonexistent", language="en")
-        
-        assert isinstance(result, RecitationsResponse)
-        assert len(result.recitations) == 0
-        assert result.recitations == []
-        
-        mock_get_collection_id.assert_called_once_with(slug="Liturgy")
-        mock_get_root_text.assert_called_once_with(collection_id=liturgy_collection_id, language="en")
-        mock_apply_search_filter.assert_called_once_with(texts=[recitation_dto], search="nonexistent")
+        """Cached catalogs answer searches without touching the collection."""
+        catalog = self.create_catalog("en", ["Morning Prayer Recitation", "Evening Prayer", "Praise to Tara"])
+        mock_get_catalog_cache.return_value = catalog
 
-    @patch('pecha_api.recitations.recitations_services.get_collection_id_by_slug')
-    @patch('pecha_api.recitations.recitations_services.get_root_text_by_collection_id')
-    @patch('pecha_api.recitations.recitations_services.apply_search_recitation_title_filter')
+        result = await get_list_of_recitations_service(search="PRAYER", language="en")
+
+        assert [recitation.title for recitation in result.recitations] == ["Morning Prayer Recitation", "Evening Prayer"]
+        assert result.recitations[0].text_id == catalog.recitations[0].text_id
+        mock_get_collection_id.assert_not_called()
+
+    @patch('pecha_api.recitations.recitations_services.get_recitation_catalog_cache')
     @pytest.mark.asyncio
-    async def test_get_list_of_recitations_service_with_search_match(
+    async def test_get_list_of_recitations_service_search_filter_no_match(
         self,
-        mock_apply_search_filter,
-        mock_get_root_text,
-        mock_get_collection_id
+        mock_get_catalog_cache
     ):
-        """Test get_list_of_recitations_service when search filter matches."""
-        liturgy_collection_id = str(uuid4())
-        mock_get_collection_id.return_value = liturgy_collection_id
-        
-        text_id = str(uuid4())
-        text_title = "Morning Prayer Recitation"
-        recitation_dto = RecitationDTO(text_id=UUID(text_id), title=text_title)
-        mock_recitations_response = RecitationsResponse(recitations=[recitation_dto])
-        mock_get_root_text.return_value = mock_recitations_response
-        mock_apply_search_filter.return_value = [recitation_dto]
-        
-        result = await get_list_of_recitations_service(search="morning", language="en")
-        
-        assert isinstance(result, RecitationsResponse)
-        assert len(result.recitations) == 1
-        assert result.recitations[0].title == text_title
-        assert str(result.recitations[0].text_id) == text_id
-        
-        mock_get_collection_id.assert_called_once_with(slug="Liturgy")
-        mock_get_root_text.assert_called_once_with(collection_id=liturgy_collection_id, language="en")
-        mock_apply_search_filter.assert_called_once_with(texts=[recitation_dto], search="morning")
+        mock_get_catalog_cache.return_value = self.create_catalog("en", ["Test Recitation"])
+
+        result = await get_list_of_recitations_service(search="nonexistent", language="en")
 
+        assert result.recitations == []
+
+    @patch('pecha_api.recitations.recitations_services.set_recitation_catalog_cache')
+    @patch('pecha_api.recitations.recitations_services.get_recitation_catalog_cache')
     @patch('pecha_api.recitations.recitations_services.get_collection_id_by_slug')
     @patch('pecha_api.recitations.recitations_services.get_root_text_by_collection_id')
-    @patch('pecha_api.recitations.recitations_services.apply_search_recitation_title_filter')
     @pytest.mark.asyncio
     async def test_get_list_of_recitations_service_different_languages(
         self,
-        mock_apply_search_filter,
         mock_get_root_text,
-        mock_get_collection_id
+        mock_get_collection_id,
+        mock_get_catalog_cache,
+        mock_set_catalog_cache
     ):
         """Test get_list_of_recitations_service with different language parameters."""
         liturgy_collection_id = str(uuid4())
         mock_get_collection_id.return_value = liturgy_collection_id
-        
-        text_id = str(uuid4())
-        text_title = "Tibetan Recitation"
-        recitation_dto = RecitationDTO(text_id=UUID(text_id), title=text_title)
-        mock_recitations_response = RecitationsResponse(recitations=[recitation_dto])
-        mock_get_root_text.return_value = mock_recitations_response
-        mock_apply_search_filter.return_value = [recitation_dto]
-        
+        mock_get_catalog_cache.return_value = None
+        mock_get_root_text.return_value = RecitationsResponse(recitations=[RecitationDTO(text_id=uuid4(), title="Tibetan Recitation")])
+
         result = await get_list_of_recitations_service(language="bo")
-        
-        assert isinstance(result, RecitationsResponse)
-        assert len(result.recitations) == 1
-        assert result.recitations[0].title == text_title
-        
-        # Verify language is passed correctly
+
+        assert result.recitations[0].title == "Tibetan Recitation"
+        mock_get_catalog_cache.assert_called_once_with(language="bo")
         mock_get_root_text.assert_called_once_with(collection_id=liturgy_collection_id, language="bo")
 
 
@@ -325,15 +289,15 @@ class TestSegmentsMappingByToc:
             content=content
         )
 
-    @patch('pecha_api.recitations.recitations_services.get_segment_details_by_id')
-    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
+    @patch('pecha_api.recitations.recitations_services.get_segments_by_ids')
+    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_by_parent_ids')
+    @patch('pecha_api.recitations.recitations_services.TextUtils.get_text_details_by_ids')
     @pytest.mark.asyncio
     async def test_segments_mapping_by_toc_empty_table_of_contents(
         self,
-        mock_filter_segments,
+        mock_get_text_details,
         mock_get_related_segments,
-        mock_get_segment_details
+        mock_get_segments
     ):
         """Test mapping with empty table of contents."""
         request = RecitationDetailsRequest(
@@ -352,9 +316,9 @@ class TestSegmentsMappingByToc:
         assert result == []
         
         # Verify no mock calls were made
-        mock_get_segment_details.assert_not_called()
+        mock_get_segments.assert_not_called()
         mock_get_related_segments.assert_not_called()
-        mock_filter_segments.assert_not_called()
+        mock_get_text_details.assert_not_called()
 
 class TestFilterByTypeAndLanguage:
     """Test cases for filter_by_type_and_language function."""
@@ -658,22 +622,9 @@ class TestGetRecitationDetailsServiceSuccess:
 class TestSegmentsMappingByTocWithData:
     """Test cases for segments_mapping_by_toc with actual data."""
 
-    @patch('pecha_api.recitations.recitations_services.get_segment_details_by_id')
-    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
-    @pytest.mark.asyncio
-    async def test_segments_mapping_by_toc_with_single_segment(
-        self,
-        mock_filter_segments,
-        mock_get_related_segments,
-        mock_get_segment_details
-    ):
-        """Test segments_mapping_by_toc with a single segment."""
-        segment_id = str(uuid4())
-        text_id = str(uuid4())
-        
-        # Create table of content with one segment
-        toc = [
+    @staticmethod
+    def create_table_of_contents(text_id: str, segment_ids: list) -> list:
+        return [
             TableOfContent(
                 id=str(uuid4()),
                 type=TableOfContentType.TEXT,
@@ -684,266 +635,159 @@ class TestSegmentsMappingByTocWithData:
                         title="Section 1",
                         section_number=1,
                         segments=[
-                            TextSegment(segment_id=segment_id, segment_number=1)
+                            TextSegment(segment_id=segment_id, segment_number=index)
+                            for index, segment_id in enumerate(segment_ids, start=1)
                         ]
                     )
                 ]
             )
         ]
-        
-        # Mock segment details
-        segment_dto = SegmentDTO(
-            id=segment_id,
-            text_id=text_id,
-            content="Test segment content",
-            type=SegmentType.SOURCE
+
+    @staticmethod
+    def create_text(text_id: str, type: str, language: str) -> TextDTO:
+        return TextDTO(
+            id=text_id,
+            title=f"{language} {type}",
+            language=language,
+            group_id="group_id",
+            type=type,
+            is_published=True,
+            created_date="2023-01-01",
+            updated_date="2023-01-01",
+            published_date="2023-01-01",
+            published_by="pecha"
         )
-        mock_get_segment_details.return_value = segment_dto
-        mock_get_related_segments.return_value = []
-        
-        # Mock filter responses for each type
-        mock_filter_segments.return_value = []
-        
+
+    @patch('pecha_api.recitations.recitations_services.get_segments_by_ids')
+    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_by_parent_ids')
+    @patch('pecha_api.recitations.recitations_services.TextUtils.get_text_details_by_ids')
+    @pytest.mark.asyncio
+    async def test_segments_mapping_by_toc_loads_everything_once(
+        self,
+        mock_get_text_details,
+        mock_get_related_segments,
+        mock_get_segments
+    ):
+        root_text_id, english_text_id, tibetan_text_id = str(uuid4()), str(uuid4()), str(uuid4())
+        segment_ids = [str(uuid4()) for _ in range(3)]
+        mock_get_segments.return_value = {
+            segment_id: SegmentDTO(id=segment_id, text_id=root_text_id, content=f"root {index}", type=SegmentType.SOURCE)
+            for index, segment_id in enumerate(segment_ids)
+        }
+        english_segment = SegmentDTO(id=str(uuid4()), text_id=english_text_id, content="english", type=SegmentType.SOURCE)
+        tibetan_segment = SegmentDTO(id=str(uuid4()), text_id=tibetan_text_id, content="tibetan", type=SegmentType.SOURCE)
+        mock_get_related_segments.return_value = {
+            segment_ids[0]: [english_segment, tibetan_segment],
+            segment_ids[2]: [english_segment]
+        }
+        mock_get_text_details.return_value = {
+            root_text_id: self.create_text(root_text_id, TextType.ROOT_TEXT.value, "bo"),
+            english_text_id: self.create_text(english_text_id, TextType.VERSION.value, "en"),
+            tibetan_text_id: self.create_text(tibetan_text_id, TextType.VERSION.value, "bo")
+        }
         request = RecitationDetailsRequest(
             language="en",
-            recitation=["en"],
+            recitation=["bo"],
             translations=["en"],
-            transliterations=["bo"],
-            adaptations=["en"]
+            transliterations=[],
+            adaptations=["en", "bo"]
         )
-        
-        # Execute
-        result = await segments_mapping_by_toc(table_of_contents=toc, recitation_details_request=request)
-        
-        # Verify
-        assert len(result) == 1
-        assert isinstance(result[0], RecitationSegment)
-        
-        # Verify segment details were fetched
-        mock_get_segment_details.assert_called_once_with(segment_id=segment_id, text_details=True)
-        mock_get_related_segments.assert_called_once_with(parent_segment_id=segment_id)
-        
-        # Verify filter was called 4 times (recitations, translations, transliterations, adaptations)
-        assert mock_filter_segments.call_count == 4
 
-    @patch('pecha_api.recitations.recitations_services.get_segment_details_by_id')
-    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
+        result = await segments_mapping_by_toc(
+            table_of_contents=self.create_table_of_contents(root_text_id, segment_ids),
+            recitation_details_request=request
+        )
+
+        assert len(result) == 3
+        assert result[0].recitation == {"bo": Segment(id=tibetan_segment.id, content="tibetan")}
+        assert result[0].translations == {"en": Segment(id=english_segment.id, content="english")}
+        assert result[0].transliterations == {}
+        assert set(result[0].adaptations) == {"en", "bo"}
+        assert result[1] == RecitationSegment()
+        assert result[2].translations == {"en": Segment(id=english_segment.id, content="english")}
+        assert result[2].recitation == {}
+
+        mock_get_segments.assert_called_once_with(segment_ids=segment_ids)
+        mock_get_related_segments.assert_called_once_with(parent_segment_ids=segment_ids)
+        mock_get_text_details.assert_called_once()
+        assert mock_get_text_details.call_args.kwargs["text_ids"] == [root_text_id, english_text_id, tibetan_text_id]
+
+    @patch('pecha_api.recitations.recitations_services.get_segments_by_ids')
+    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_by_parent_ids')
+    @patch('pecha_api.recitations.recitations_services.TextUtils.get_text_details_by_ids')
     @pytest.mark.asyncio
-    async def test_segments_mapping_by_toc_with_multiple_segments(
+    async def test_segments_mapping_by_toc_serves_stored_phonetics(
         self,
-        mock_filter_segments,
+        mock_get_text_details,
         mock_get_related_segments,
-        mock_get_segment_details
+        mock_get_segments
     ):
-        """Test segments_mapping_by_toc with multiple segments."""
-        segment_id_1 = str(uuid4())
-        segment_id_2 = str(uuid4())
-        text_id = str(uuid4())
-        
-        # Create table of content with two segments
-        toc = [
-            TableOfContent(
-                id=str(uuid4()),
-                type=TableOfContentType.TEXT,
-                text_id=text_id,
-                sections=[
-                    Section(
-                        id=str(uuid4()),
-                        title="Section 1",
-                        section_number=1,
-                        segments=[
-                            TextSegment(segment_id=segment_id_1, segment_number=1),
-                            TextSegment(segment_id=segment_id_2, segment_number=2)
-                        ]
-                    )
-                ]
-            )
-        ]
-        
-        # Mock segment details
-        def get_segment_side_effect(segment_id, text_details):
-            return SegmentDTO(
-                id=segment_id,
-                text_id=text_id,
-                content=f"Content for {segment_id}",
-                type=SegmentType.SOURCE
-            )
-        
-        mock_get_segment_details.side_effect = get_segment_side_effect
-        mock_get_related_segments.return_value = []
-        mock_filter_segments.return_value = []
-        
-        request = RecitationDetailsRequest(
-            language="en",
-            recitation=["en"],
-            translations=[],
-            transliterations=[],
-            adaptations=[]
+        root_text_id = str(uuid4())
+        segment_ids = [str(uuid4()), str(uuid4())]
+        mock_get_segments.return_value = {
+            segment_ids[0]: SegmentDTO(id=segment_ids[0], text_id=root_text_id, content="ཨོཾ", type=SegmentType.SOURCE, phonetics="om"),
+            segment_ids[1]: SegmentDTO(id=segment_ids[1], text_id=root_text_id, content="ཧཱུྃ", type=SegmentType.SOURCE)
+        }
+        mock_get_related_segments.return_value = {}
+        mock_get_text_details.return_value = {root_text_id: self.create_text(root_text_id, TextType.ROOT_TEXT.value, "bo")}
+        request = RecitationDetailsRequest(language="bo", recitation=["bo"])
+
+        result = await segments_mapping_by_toc(
+            table_of_contents=self.create_table_of_contents(root_text_id, segment_ids),
+            recitation_details_request=request
         )
-        
-        # Execute
-        result = await segments_mapping_by_toc(table_of_contents=toc, recitation_details_request=request)
-        
-        # Verify
-        assert len(result) == 2
-        assert all(isinstance(seg, RecitationSegment) for seg in result)
-        
-        # Verify segment details were fetched for both segments
-        assert mock_get_segment_details.call_count == 2
-        assert mock_get_related_segments.call_count == 2
 
-    @patch('pecha_api.recitations.recitations_services.get_segment_details_by_id')
-    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
+        assert [segment.phonetics for segment in result] == ["om", None]
+
+    @patch('pecha_api.recitations.recitations_services.get_segments_by_ids')
+    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_by_parent_ids')
+    @patch('pecha_api.recitations.recitations_services.TextUtils.get_text_details_by_ids')
     @pytest.mark.asyncio
-    async def test_segments_mapping_by_toc_with_filtered_data(
+    async def test_segments_mapping_by_toc_missing_segment(
         self,
-        mock_filter_segments,
+        mock_get_text_details,
         mock_get_related_segments,
-        mock_get_segment_details
+        mock_get_segments
     ):
-        """Test segments_mapping_by_toc with filtered segment data."""
-        segment_id = str(uuid4())
-        text_id = str(uuid4())
-        
-        toc = [
-            TableOfContent(
-                id=str(uuid4()),
-                type=TableOfContentType.TEXT,
-                text_id=text_id,
-                sections=[
-                    Section(
-                        id=str(uuid4()),
-                        title="Section 1",
-                        section_number=1,
-                        segments=[
-                            TextSegment(segment_id=segment_id, segment_number=1)
-                        ]
-                    )
-                ]
+        segment_ids = [str(uuid4()), str(uuid4())]
+        mock_get_segments.return_value = {
+            segment_ids[0]: SegmentDTO(id=segment_ids[0], text_id=str(uuid4()), content="root", type=SegmentType.SOURCE)
+        }
+        request = RecitationDetailsRequest(language="en", recitation=["en"])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await segments_mapping_by_toc(
+                table_of_contents=self.create_table_of_contents(str(uuid4()), segment_ids),
+                recitation_details_request=request
             )
-        ]
-        
-        segment_dto = SegmentDTO(
-            id=segment_id,
-            text_id=text_id,
-            content="Test content",
-            type=SegmentType.SOURCE
-        )
-        mock_get_segment_details.return_value = segment_dto
-        
-        # Mock some related segments
-        related_segment = SegmentDTO(
-            id=str(uuid4()),
-            text_id=str(uuid4()),
-            content="Related content",
-            type=SegmentType.SOURCE
-        )
-        mock_get_related_segments.return_value = [related_segment]
-        
-        # Mock filter to return actual segments
-        mock_translation = SegmentTranslation(
-            segment_id=str(uuid4()),
-            text_id=str(uuid4()),
-            title="Translation",
-            source="test",
-            language="en",
-            content="Translated content"
-        )
-        
-        def filter_side_effect(segments, type):
-            if type == TextType.VERSION.value:
-                return [mock_translation]
-            return []
-        
-        mock_filter_segments.side_effect = filter_side_effect
-        
-        request = RecitationDetailsRequest(
-            language="en",
-            recitation=["en"],
-            translations=["en"],
-            transliterations=[],
-            adaptations=[]
-        )
-        
-        # Execute
-        result = await segments_mapping_by_toc(table_of_contents=toc, recitation_details_request=request)
-        
-        # Verify
-        assert len(result) == 1
-        recitation_segment = result[0]
-        assert isinstance(recitation_segment, RecitationSegment)
-        
-        # Verify that related segments were retrieved
-        mock_get_related_segments.assert_called_once_with(parent_segment_id=segment_id)
 
-    @patch('pecha_api.recitations.recitations_services.get_segment_details_by_id')
-    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+        assert exc_info.value.detail == ErrorConstants.SEGMENT_NOT_FOUND_MESSAGE
+        mock_get_related_segments.assert_not_called()
+        mock_get_text_details.assert_not_called()
+
+    @patch('pecha_api.recitations.recitations_services.get_segments_by_ids')
+    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_by_parent_ids')
+    @patch('pecha_api.recitations.recitations_services.TextUtils.get_text_details_by_ids')
     @patch('pecha_api.recitations.recitations_services.filter_by_type_and_language')
     @pytest.mark.asyncio
     async def test_segments_mapping_by_toc_calls_filter_by_type_and_language(
         self,
         mock_filter_by_type_lang,
-        mock_filter_segments,
+        mock_get_text_details,
         mock_get_related_segments,
-        mock_get_segment_details
+        mock_get_segments
     ):
         """Test that segments_mapping_by_toc properly calls filter_by_type_and_language for all segment types."""
         segment_id = str(uuid4())
         text_id = str(uuid4())
-        
-        toc = [
-            TableOfContent(
-                id=str(uuid4()),
-                type=TableOfContentType.TEXT,
-                text_id=text_id,
-                sections=[
-                    Section(
-                        id=str(uuid4()),
-                        title="Section 1",
-                        section_number=1,
-                        segments=[
-                            TextSegment(segment_id=segment_id, segment_number=1)
-                        ]
-                    )
-                ]
-            )
-        ]
-        
-        segment_dto = SegmentDTO(
-            id=segment_id,
-            text_id=text_id,
-            content="Test content",
-            type=SegmentType.SOURCE
-        )
-        mock_get_segment_details.return_value = segment_dto
-        mock_get_related_segments.return_value = []
-        
-        # Mock filter to return mock segments
-        mock_recitation = SegmentTranslation(
-            segment_id=str(uuid4()),
-            text_id=str(uuid4()),
-            title="Recitation",
-            source="test",
-            language="en",
-            content="Recitation content"
-        )
-        mock_translation = SegmentTranslation(
-            segment_id=str(uuid4()),
-            text_id=str(uuid4()),
-            title="Translation",
-            source="test",
-            language="bo",
-            content="Translation content"
-        )
-        
-        mock_filter_segments.return_value = [mock_recitation, mock_translation]
-        
-        # Mock filter_by_type_and_language to return empty dicts
+        mock_get_segments.return_value = {
+            segment_id: SegmentDTO(id=segment_id, text_id=text_id, content="Test content", type=SegmentType.SOURCE)
+        }
+        mock_get_related_segments.return_value = {}
+        mock_get_text_details.return_value = {}
         mock_filter_by_type_lang.return_value = {}
-        
+
         request = RecitationDetailsRequest(
             language="en",
             recitation=["en"],
@@ -951,19 +795,16 @@ class TestSegmentsMappingByTocWithData:
             transliterations=["bo"],
             adaptations=["en"]
         )
-        
-        # Execute
-        result = await segments_mapping_by_toc(table_of_contents=toc, recitation_details_request=request)
-        
-        # Verify
+
+        result = await segments_mapping_by_toc(
+            table_of_contents=self.create_table_of_contents(text_id, [segment_id]),
+            recitation_details_request=request
+        )
+
         assert len(result) == 1
-        
-        # Verify filter_by_type_and_language was called 4 times (once for each type)
         assert mock_filter_by_type_lang.call_count == 4
-        
-        # Verify the calls were made with correct types
         call_types = [call.kwargs['type'] for call in mock_filter_by_type_lang.call_args_list]
         assert RecitationListTextType.RECITATIONS.value in call_types
         assert RecitationListTextType.TRANSLATIONS.value in call_types
         assert RecitationListTextType.TRANSLITERATIONS.value in call_types
-        assert RecitationListTextType.ADAPTATIONS.value in call_types
\ No newline at end of file
+        assert RecitationListTextType.ADAPTATIONS.value in call_types
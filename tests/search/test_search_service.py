@@ -6,6 +6,7 @@ import httpx
 
 from pecha_api.search.search_response_models import (
     SearchResponse,
+    SheetIndex,
     SourceResultItem,
     SheetResultItem,
     TextIndex,
@@ -22,7 +23,10 @@ from pecha_api.search.search_service import (
     get_search_results,
     get_multilingual_search_results,
     call_external_search_api,
-    build_multilingual_sources
+    build_multilingual_sources,
+    index_sheet,
+    index_sheets,
+    remove_sheet_from_index
 )
 
 @pytest.mark.asyncio
@@ -59,6 +63,7 @@ async def test_get_search_results_for_source_within_text_success():
     text_id = "e6370d09-aa0c-4a41-96ef-deffb89c7810"
     mock_elastic_response = _get_mock_elastic_source_within_text_response_()
     mock_client = Mock()
+    mock_client.open_point_in_time = AsyncMock(return_value={"id": "pit_id"})
     mock_client.search = AsyncMock(return_value=mock_elastic_response)
 
     with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=mock_client):
@@ -73,8 +78,273 @@ async def test_get_search_results_for_source_within_text_success():
         assert isinstance(response.sources[0], SourceResultItem)
         assert response.sources[0].text is not None
         assert response.sources[0].text.text_id == text_id
+        search_kwargs = mock_client.search.call_args.kwargs
+        assert "index" not in search_kwargs
+        assert search_kwargs["pit"]["id"] == "pit_id"
+        assert search_kwargs["query"]["bool"]["filter"] == [{"term": {"text_id.keyword": text_id}}]
 
 
+@pytest.mark.asyncio
+async def test_get_search_results_for_source_within_text_last_page_closes_point_in_time():
+    text_id = "e6370d09-aa0c-4a41-96ef-deffb89c7810"
+    mock_elastic_response = _get_mock_elastic_source_within_text_response_()
+    mock_client = Mock()
+    mock_client.open_point_in_time = AsyncMock(return_value={"id": "pit_id"})
+    mock_client.close_point_in_time = AsyncMock()
+    mock_client.search = AsyncMock(return_value=mock_elastic_response)
+    limit = len(mock_elastic_response["hits"]["hits"]) + 1
+
+    with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=mock_client):
+        response = await get_search_results(query="query", search_type=SearchType.SOURCE, text_id=text_id, limit=limit)
+
+    assert response.next_cursor is None
+    mock_client.close_point_in_time.assert_awaited_once_with(id="pit_id")
+
+
+@pytest.mark.asyncio
+async def test_get_search_results_for_source_collapsed_by_text():
+    mock_elastic_response = {
+        "hits": {
+            "total": {"value": 42, "relation": "eq"},
+            "hits": [
+                {
+                    "_id": "hit_1",
+                    "_source": {
+                        "id": "segment_1",
+                        "text_id": "text_1",
+                        "text": {"title": "Text 1", "language": "en", "published_date": "2025-01-01"}
+                    },
+                    "inner_hits": {
+                        "segments": {
+                            "hits": {
+                                "hits": [
+                                    {
+                                        "_source": {
+                                            "id": "segment_1",
+                                            "text_id": "text_1",
+                                            "text": {"title": "Text 1", "language": "en", "published_date": "2025-01-01"}
+                                        },
+                                        "highlight": {"content": ["the <em>query</em> fragment"]}
+                                    },
+                                    {
+                                        "_source": {
+                                            "id": "segment_2",
+                                            "text_id": "text_1",
+                                            "text": {"title": "Text 1", "language": "en", "published_date": "2025-01-01"}
+                                        },
+                                        "highlight": {"content": ["another <em>query</em>"]}
+                                    }
+                                ]
+                            }
+                        }
+                    }
+                }
+            ]
+        },
+        "aggregations": {"text_count": {"value": 7}}
+    }
+    mock_client = Mock()
+    mock_client.search = AsyncMock(return_value=mock_elastic_response)
+
+    with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=mock_client):
+        response = await get_search_results(query="query", search_type=SearchType.SOURCE, skip=0, limit=10)
+
+        assert response.total == 7
+        assert response.next_cursor is None
+        assert len(response.sources) == 1
+        assert [match.segment_id for match in response.sources[0].segment_match] == ["segment_1", "segment_2"]
+        assert response.sources[0].segment_match[0].content == "the <em>query</em> fragment"
+        search_kwargs = mock_client.search.call_args.kwargs
+        assert search_kwargs["collapse"]["field"] == "text_id.keyword"
+        assert "content" not in search_kwargs["_source"]
+        assert search_kwargs["from"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_search_results_for_source_within_text_cursor_pagination():
+    text_id = "e6370d09-aa0c-4a41-96ef-deffb89c7810"
+    first_page = _get_mock_elastic_source_within_text_response_()
+    for index, hit in enumerate(first_page["hits"]["hits"]):
+        hit["sort"] = [hit.get("_score", 1.0), index]
+    first_page["pit_id"] = "refreshed_pit_id"
+    mock_client = Mock()
+    mock_client.open_point_in_time = AsyncMock(return_value={"id": "pit_id"})
+    mock_client.close_point_in_time = AsyncMock()
+    mock_client.search = AsyncMock(return_value=first_page)
+    limit = len(first_page["hits"]["hits"])
+
+    with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=mock_client):
+        response = await get_search_results(query="query", search_type=SearchType.SOURCE, text_id=text_id, limit=limit)
+
+        assert response.next_cursor is not None
+
+        await get_search_results(
+            query="query",
+            search_type=SearchType.SOURCE,
+            text_id=text_id,
+            cursor=response.next_cursor,
+            limit=limit
+        )
+
+        mock_client.open_point_in_time.assert_awaited_once()
+        second_search_kwargs = mock_client.search.call_args.kwargs
+        assert second_search_kwargs["pit"]["id"] == "refreshed_pit_id"
+        assert second_search_kwargs["search_after"] == first_page["hits"]["hits"][-1]["sort"]
+        assert "from" not in second_search_kwargs
+        mock_client.close_point_in_time.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_search_results_for_source_invalid_cursor():
+    with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=Mock()):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_search_results(
+                query="query",
+                search_type=SearchType.SOURCE,
+                text_id="text_id",
+                cursor="not-a-cursor"
+            )
+
+        assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_search_results_for_source_cursor_without_text_id():
+    mock_client = AsyncMock()
+    with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=mock_client):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_search_results(
+                query="query",
+                search_type=SearchType.SOURCE,
+                cursor="some-cursor"
+            )
+
+    assert exc_info.value.status_code == 400
+    mock_client.search.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_search_results_for_source_beyond_result_window():
+    mock_client = AsyncMock()
+    with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=mock_client):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_search_results(
+                query="query",
+                search_type=SearchType.SOURCE,
+                skip=9995,
+                limit=10
+            )
+
+    assert exc_info.value.status_code == 400
+    mock_client.search.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_search_results_for_sheet_success():
+    mock_elastic_response = {
+        "hits": {
+            "total": {"value": 1, "relation": "eq"},
+            "hits": [
+                {
+                    "_index": "pecha-sheets",
+                    "_id": "sheet_id",
+                    "_score": 2.5,
+                    "_source": {
+                        "id": "sheet_id",
+                        "title": "Sheet on compassion",
+                        "summary": "A short summary",
+                        "is_published": True,
+                        "published_by": "test_user@gmail.com",
+                        "published_date": "2025-01-01",
+                        "language": "en",
+                        "publisher_id": "publisher_id",
+                        "publisher_name": "firstname lastname",
+                        "publisher_username": "username",
+                        "publisher_avatar_key": None
+                    },
+                    "highlight": {
+                        "title": ["Sheet on <em>compassion</em>"],
+                        "content": ["practice <em>compassion</em> daily"]
+                    }
+                }
+            ]
+        }
+    }
+    mock_client = Mock()
+    mock_client.search = AsyncMock(return_value=mock_elastic_response)
+
+    with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=mock_client):
+        response = await get_search_results(
+            query="compassion",
+            search_type=SearchType.SHEET,
+            published_by="test_user@gmail.com",
+            skip=0,
+            limit=10
+        )
+
+        assert isinstance(response, SearchResponse)
+        assert response.sources == []
+        assert response.total == 1
+        assert len(response.sheets) == 1
+        assert response.sheets[0].sheet_id == "sheet_id"
+        assert response.sheets[0].publisher_username == "username"
+        assert response.sheets[0].highlights == [
+            "Sheet on <em>compassion</em>",
+            "practice <em>compassion</em> daily"
+        ]
+        search_kwargs = mock_client.search.call_args.kwargs
+        assert search_kwargs["index"] == "pecha-sheets"
+        assert {"term": {"is_published": True}} in search_kwargs["query"]["bool"]["filter"]
+        assert {"term": {"published_by.keyword": "test_user@gmail.com"}} in search_kwargs["query"]["bool"]["filter"]
+
+
+@pytest.mark.asyncio
+async def test_index_sheets_sends_one_bulk_request():
+    sheet_indexes = [
+        SheetIndex(id=sheet_id, title="title", summary="", is_published=True, published_by="test_user@gmail.com", publisher_name="name")
+        for sheet_id in ("sheet_1", "sheet_2")
+    ]
+    mock_client = Mock()
+    mock_client.bulk = AsyncMock(return_value={"errors": False, "items": []})
+
+    with patch("pecha_api.search.search_service.search_client", return_value=mock_client):
+        await index_sheets(sheet_indexes=sheet_indexes)
+
+    operations = mock_client.bulk.call_args.kwargs["operations"]
+    assert [operation["index"]["_id"] for operation in operations[::2]] == ["sheet_1", "sheet_2"]
+    assert [document["id"] for document in operations[1::2]] == ["sheet_1", "sheet_2"]
+
+
+@pytest.mark.asyncio
+async def test_index_sheet_swallows_search_errors():
+    sheet_index = SheetIndex(
+        id="sheet_id",
+        title="title",
+        summary="summary",
+        is_published=True,
+        published_by="test_user@gmail.com",
+        publisher_name="name"
+    )
+    mock_client = Mock()
+    mock_client.index = AsyncMock(side_effect=Exception("connection refused"))
+
+    with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=mock_client):
+        await index_sheet(sheet_index=sheet_index)
+
+        mock_client.index.assert_awaited_once()
+        assert mock_client.index.call_args.kwargs["id"] == "sheet_id"
+
+
+@pytest.mark.asyncio
+async def test_remove_sheet_from_index_success():
+    mock_client = Mock()
+    mock_client.delete = AsyncMock()
+
+    with patch("pecha_api.search.search_service.search_client", new_callable=Mock, return_value=mock_client):
+        await remove_sheet_from_index(sheet_id="sheet_id")
+
+        mock_client.delete.assert_awaited_once_with(index="pecha-sheets", id="sheet_id")
+
 
 def _get_mock_elastic_source_response_():
     return {
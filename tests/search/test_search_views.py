@@ -78,10 +78,10 @@ def test_search_type_sheet_success():
     )
     mock_sheet_result_item = [
         SheetResultItem(
-            sheet_id=i,
+            sheet_id=str(i),
             sheet_title=f"Sheet Title {i}",
             sheet_summary=f"Sheet summary {i}",
-            publisher_id=100 + i,
+            publisher_id=str(100 + i),
             publisher_name=f"Publisher {i}",
             publisher_url=f"https://publisher{i}.com",
             publisher_image=f"https://publisher{i}.com/image.jpg",
@@ -109,7 +109,7 @@ def test_search_type_sheet_success():
         assert data["search"]["type"] == "SHEET"
         assert data["sheets"] is not None
         assert len(data["sheets"]) == 3
-        assert data["sheets"][0]["sheet_id"] == 1
+        assert data["sheets"][0]["sheet_id"] == "1"
         assert data["sheets"][0]["sheet_title"] == "Sheet Title 1"
         assert data["sheets"][0]["publisher_name"] == "Publisher 1"
         assert data["total"] == 3
@@ -138,6 +138,8 @@ def test_search_with_text_id():
             query="query in text",
             search_type=SearchType.SOURCE,
             text_id="specific_text_123",
+            published_by=None,
+            cursor=None,
             skip=0,
             limit=10
         )
@@ -196,6 +198,8 @@ def test_search_with_all_parameters():
             query="full query",
             search_type=SearchType.SOURCE,
             text_id="text_456",
+            published_by=None,
+            cursor=None,
             skip=10,
             limit=25
         )
@@ -248,6 +252,8 @@ def test_search_with_default_parameters():
             query=None,
             search_type=None,
             text_id=None,
+            published_by=None,
+            cursor=None,
             skip=0,
             limit=10
         )
@@ -9,7 +9,11 @@ from pecha_api.texts.segments.segments_cache_service import (
     get_segment_commentaries_by_id_cache,
     set_segment_commentaries_by_id_cache,
     get_segment_translations_by_id_cache,
-    set_segment_translations_by_id_cache
+    set_segment_translations_by_id_cache,
+    get_phonetics_cache,
+    set_phonetics_cache,
+    set_segment_info_by_id_cache,
+    delete_segments_by_ids_cache
 )
 
 from pecha_api.texts.segments.segments_response_models import (
@@ -22,6 +26,7 @@ from pecha_api.texts.segments.segments_response_models import (
     SegmentTranslationsResponse
 )
 from pecha_api.texts.segments.segments_enum import SegmentType
+from pecha_api.cache.cache_enums import CacheType
 
 @pytest.mark.asyncio
 async def test_get_segment_details_by_id_cache_success():
@@ -181,3 +186,37 @@ async def test_set_segment_translations_by_id_cache_success():
     with patch("pecha_api.texts.segments.segments_cache_service.set_cache", new_callable=AsyncMock, return_value=None):
 
         await set_segment_translations_by_id_cache(segment_id="segment_id", data=mock_data)
+
+
+@pytest.mark.asyncio
+async def test_get_phonetics_cache_returns_hits_by_content():
+    with patch("pecha_api.texts.segments.segments_cache_service.get_many_cache_data", new_callable=AsyncMock, return_value=[{"phonetics": "om"}, None]) as mock_get:
+        response = await get_phonetics_cache(version="v1", contents=["ཨོཾ", "ཧཱུྃ"])
+
+    assert response == {"ཨོཾ": "om"}
+    assert len(mock_get.call_args.kwargs["hash_keys"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_set_phonetics_cache_keys_depend_on_version():
+    with patch("pecha_api.texts.segments.segments_cache_service.set_many_cache", new_callable=AsyncMock) as mock_set:
+        await set_phonetics_cache(version="v1", data={"ཨོཾ": "om"})
+        await set_phonetics_cache(version="v2", data={"ཨོཾ": "om"})
+
+    first, second = [call.kwargs["values"] for call in mock_set.call_args_list]
+    assert list(first.values()) == [{"phonetics": "om"}]
+    assert first.keys() != second.keys()
+
+
+@pytest.mark.asyncio
+async def test_delete_segments_by_ids_cache_deletes_the_keys_the_setters_write():
+    with patch("pecha_api.texts.segments.segments_cache_service.set_cache", new_callable=AsyncMock) as mock_set:
+        await set_segment_info_by_id_cache(segment_id="segment_id", cache_type=CacheType.SEGMENT_INFO, data=None)
+    info_key = mock_set.call_args.kwargs["hash_key"]
+
+    with patch("pecha_api.texts.segments.segments_cache_service.delete_many_cache", new_callable=AsyncMock) as mock_delete:
+        await delete_segments_by_ids_cache(segment_ids=["segment_id", "other_id"])
+
+    deleted_keys = mock_delete.call_args.kwargs["hash_keys"]
+    assert info_key in deleted_keys
+    assert len(deleted_keys) == 12
@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from pecha_api.texts.segments.segments_phonetics import (
+    PHONETICS_VERSION,
+    convert_to_phonetics
+)
+
+
+class _InlineExecutor:
+    """Runs pool work in the test process so the pool boundary can be asserted without spawning workers"""
+
+    def __init__(self):
+        self.batches = []
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        self.batches.append(args[0])
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def _fake_phonetics_(contents):
+    return [f"phonetics of {content}" for content in contents]
+
+
+@pytest.mark.asyncio
+async def test_convert_to_phonetics_serves_cached_contents_and_batches_the_rest():
+    pool = _InlineExecutor()
+    with patch("pecha_api.texts.segments.segments_phonetics.get_phonetics_cache", new_callable=AsyncMock, return_value={"cached": "from cache"}) as mock_get_cache, \
+        patch("pecha_api.texts.segments.segments_phonetics.set_phonetics_cache", new_callable=AsyncMock) as mock_set_cache, \
+        patch("pecha_api.texts.segments.segments_phonetics.get_phonetics_pool", return_value=pool), \
+        patch("pecha_api.texts.segments.segments_phonetics.texts_to_phonetics", side_effect=_fake_phonetics_), \
+        patch("pecha_api.texts.segments.segments_phonetics.get_int", return_value=2):
+        response = await convert_to_phonetics(contents=["cached", "a", "b", "a", "c"])
+
+    mock_get_cache.assert_awaited_once_with(version=PHONETICS_VERSION, contents=["cached", "a", "b", "c"])
+    assert pool.batches == [["a", "b"], ["c"]]
+    mock_set_cache.assert_awaited_once_with(
+        version=PHONETICS_VERSION,
+        data={"a": "phonetics of a", "b": "phonetics of b", "c": "phonetics of c"}
+    )
+    assert response == {
+        "cached": "from cache",
+        "a": "phonetics of a",
+        "b": "phonetics of b",
+        "c": "phonetics of c"
+    }
+
+
+@pytest.mark.asyncio
+async def test_convert_to_phonetics_fully_cached_skips_the_pool():
+    with patch("pecha_api.texts.segments.segments_phonetics.get_phonetics_cache", new_callable=AsyncMock, return_value={"a": "from cache"}), \
+        patch("pecha_api.texts.segments.segments_phonetics.set_phonetics_cache", new_callable=AsyncMock) as mock_set_cache, \
+        patch("pecha_api.texts.segments.segments_phonetics.get_phonetics_pool") as mock_pool:
+        response = await convert_to_phonetics(contents=["a"])
+
+    assert response == {"a": "from cache"}
+    mock_pool.assert_not_called()
+    mock_set_cache.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_convert_to_phonetics_without_contents():
+    with patch("pecha_api.texts.segments.segments_phonetics.get_phonetics_cache", new_callable=AsyncMock) as mock_get_cache:
+        assert await convert_to_phonetics(contents=[]) == {}
+
+    mock_get_cache.assert_not_awaited()
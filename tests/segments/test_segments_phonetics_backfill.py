@@ -0,0 +1,34 @@
+import uuid
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
+
+from pecha_api.texts.segments.segments_phonetics_backfill import backfill_segment_phonetics
+
+
+@pytest.mark.asyncio
+async def test_backfill_segment_phonetics_stores_each_batch():
+    first_batch = [SimpleNamespace(id=uuid.uuid4(), content="ཨོཾ"), SimpleNamespace(id=uuid.uuid4(), content="ཧཱུྃ")]
+    second_batch = [SimpleNamespace(id=uuid.uuid4(), content="མཆོད་")]
+
+    with patch("pecha_api.texts.segments.segments_phonetics_backfill.get_text_ids_by_language", new_callable=AsyncMock, return_value=["text_id"]) as mock_get_texts, \
+         patch("pecha_api.texts.segments.segments_phonetics_backfill.get_segments_without_phonetics", new_callable=AsyncMock,
+               side_effect=[first_batch, second_batch, []]) as mock_get_segments, \
+         patch("pecha_api.texts.segments.segments_phonetics_backfill.store_segments_phonetics", new_callable=AsyncMock) as mock_store:
+
+        backfilled = await backfill_segment_phonetics(batch_size=2)
+
+    assert backfilled == 3
+    mock_get_texts.assert_awaited_once_with(language="bo")
+    mock_get_segments.assert_awaited_with(text_ids=["text_id"], limit=2)
+    assert [call.kwargs["segments"] for call in mock_store.await_args_list] == [first_batch, second_batch]
+
+
+@pytest.mark.asyncio
+async def test_backfill_segment_phonetics_without_tibetan_texts():
+    with patch("pecha_api.texts.segments.segments_phonetics_backfill.get_text_ids_by_language", new_callable=AsyncMock, return_value=[]), \
+         patch("pecha_api.texts.segments.segments_phonetics_backfill.get_segments_without_phonetics", new_callable=AsyncMock) as mock_get_segments:
+
+        assert await backfill_segment_phonetics() == 0
+
+    mock_get_segments.assert_not_awaited()
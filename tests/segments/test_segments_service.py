@@ -13,7 +13,9 @@ from pecha_api.texts.segments.segments_service import (
     remove_segments_by_text_id,
     fetch_segments_by_text_id,
     get_segments_details_by_ids,
-    update_segments_service
+    update_segments_service,
+    store_segments_phonetics,
+    _store_phonetics_on_write_
 )
 from pecha_api.texts.segments.segments_utils import SegmentUtils
 from pecha_api.texts.segments.segments_response_models import (
@@ -39,6 +41,7 @@ from pecha_api.texts.segments.segments_response_models import (
 )
 
 from pecha_api.texts.segments.segments_enum import SegmentType
+from pecha_api.texts.texts_enums import TextType
 
 
 from pecha_api.texts.texts_response_models import TextDTO
@@ -709,7 +712,8 @@ async def test_update_segments_service_success():
     mock_text = type('Text', (), {
         'id': "text_123",
         'pecha_text_id': "pecha_text_123",
-        'title': "Test Text"
+        'title': "Test Text",
+        'language': "en"
     })()
     
     mock_updated_segment = type('Segment', (), {
@@ -784,3 +788,67 @@ async def test_update_segments_service_text_not_found():
             )
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == ErrorConstants.TEXT_NOT_FOUND_MESSAGE
+
+
+@pytest.mark.asyncio
+async def test_store_segments_phonetics_writes_one_value_per_segment():
+    segments = [
+        type('Segment', (), {'id': "segment_1", 'content': "ཨོཾ"})(),
+        type('Segment', (), {'id': "segment_2", 'content': "ཨོཾ"})()
+    ]
+
+    with patch('pecha_api.texts.segments.segments_service.convert_to_phonetics', new_callable=AsyncMock, return_value={"ཨོཾ": "om"}) as mock_convert, \
+        patch('pecha_api.texts.segments.segments_service.update_segments_phonetics', new_callable=AsyncMock) as mock_update:
+        await store_segments_phonetics(segments=segments)
+
+    mock_convert.assert_awaited_once_with(contents=["ཨོཾ", "ཨོཾ"])
+    mock_update.assert_awaited_once_with(phonetics={"segment_1": "om", "segment_2": "om"})
+
+
+@pytest.mark.asyncio
+async def test_store_phonetics_on_write_skips_other_languages():
+    with patch('pecha_api.texts.segments.segments_service.TextUtils.get_text_details_by_id', new_callable=AsyncMock,
+               return_value=type('Text', (), {'language': "en"})()), \
+        patch('pecha_api.texts.segments.segments_service.store_segments_phonetics', new_callable=AsyncMock) as mock_store:
+        await _store_phonetics_on_write_(text_id="text_id", segments=[])
+
+    mock_store.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_store_phonetics_on_write_skips_sheets():
+    with patch('pecha_api.texts.segments.segments_service.TextUtils.get_text_details_by_id', new_callable=AsyncMock,
+               return_value=type('Text', (), {'language': "bo", 'type': "sheet"})()), \
+        patch('pecha_api.texts.segments.segments_service.store_segments_phonetics', new_callable=AsyncMock) as mock_store:
+        await _store_phonetics_on_write_(text_id="text_id", segments=[])
+
+    mock_store.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_store_phonetics_on_write_does_not_fail_the_write():
+    text = type('Text', (), {'language': "bo", 'type': TextType.VERSION})()
+    with patch('pecha_api.texts.segments.segments_service.store_segments_phonetics', new_callable=AsyncMock, side_effect=Exception("pool down")) as mock_store:
+        await _store_phonetics_on_write_(text_id="text_id", segments=[], text=text)
+
+    mock_store.assert_awaited_once_with(segments=[])
+
+
+@pytest.mark.asyncio
+async def test_update_segments_service_stores_phonetics_of_the_text_segments_only():
+    segment_update_request = SegmentUpdateRequest(
+        pecha_text_id="pecha_text_123",
+        segments=[SegmentUpdate(pecha_segment_id="pecha_segment_123", content="ཨོཾ")]
+    )
+    mock_text = type('Text', (), {'id': "text_123", 'language': "bo", 'type': TextType.VERSION})()
+    segments = [type('Segment', (), {'id': "segment_1", 'content': "ཨོཾ"})()]
+
+    with patch('pecha_api.texts.segments.segments_service.verify_admin_access', return_value=True), \
+        patch('pecha_api.texts.segments.segments_service.get_text_by_pecha_text_id', new_callable=AsyncMock, return_value=mock_text), \
+        patch('pecha_api.texts.segments.segments_service.update_segment_by_id', new_callable=AsyncMock), \
+        patch('pecha_api.texts.segments.segments_service.get_segments_by_pecha_ids', new_callable=AsyncMock, return_value=segments) as mock_get_segments, \
+        patch('pecha_api.texts.segments.segments_service.store_segments_phonetics', new_callable=AsyncMock) as mock_store:
+        await update_segments_service(token="admin_token", segment_update_request=segment_update_request)
+
+    mock_get_segments.assert_awaited_once_with(pecha_segment_ids=["pecha_segment_123"], text_id="text_123")
+    mock_store.assert_awaited_once_with(segments=segments)
@@ -6,6 +6,7 @@ from uuid import uuid4
 from fastapi import HTTPException
 
 from pecha_api.texts.segments.segments_utils import SegmentUtils
+from pecha_api.texts.segments.segments_phonetics import word_to_phonetics
 
 
 from pecha_api.texts.segments.segments_response_models import (
@@ -858,6 +859,16 @@ async def test_validate_segments_exists_success():
         ]) is True
 
 
+@pytest.fixture(autouse=True)
+def _fresh_phonetics_():
+    # The tokenizer, converter and word memo are process-wide; each test starts without them
+    with patch("pecha_api.texts.segments.segments_phonetics._tokenizer", None), \
+         patch("pecha_api.texts.segments.segments_phonetics._converter", None):
+        word_to_phonetics.cache_clear()
+        yield
+        word_to_phonetics.cache_clear()
+
+
 def test_apply_bophono_with_tibetan_text():
     """Test apply_bophono with Tibetan text input."""
     from unittest.mock import Mock
@@ -871,8 +882,8 @@ def test_apply_bophono_with_tibetan_text():
     mock_converter = Mock()
     mock_converter.get_api.side_effect = ['tra.shi', 'de.legs']
     
-    with patch("pecha_api.texts.segments.segments_utils.WordTokenizer") as mock_tokenizer_class, \
-         patch("pecha_api.texts.segments.segments_utils.bophono.UnicodeToApi") as mock_converter_class:
+    with patch("pecha_api.texts.segments.segments_phonetics.WordTokenizer") as mock_tokenizer_class, \
+         patch("pecha_api.texts.segments.segments_phonetics.bophono.UnicodeToApi") as mock_converter_class:
         
         # Setup mocks
         mock_tokenizer = Mock()
@@ -902,8 +913,8 @@ def test_apply_bophono_with_empty_string():
     mock_tokenizer.tokenize.return_value = []
     mock_converter = Mock()
     
-    with patch("pecha_api.texts.segments.segments_utils.WordTokenizer") as mock_tokenizer_class, \
-         patch("pecha_api.texts.segments.segments_utils.bophono.UnicodeToApi") as mock_converter_class:
+    with patch("pecha_api.texts.segments.segments_phonetics.WordTokenizer") as mock_tokenizer_class, \
+         patch("pecha_api.texts.segments.segments_phonetics.bophono.UnicodeToApi") as mock_converter_class:
         
         mock_tokenizer_class.return_value = mock_tokenizer
         mock_converter_class.return_value = mock_converter
@@ -912,7 +923,8 @@ def test_apply_bophono_with_empty_string():
         
         assert result == ""
         mock_tokenizer.tokenize.assert_called_once_with("")
-        mock_converter_class.assert_called_once_with(schema="KVP", options={'aspirateLowTones': True})
+        # The converter is built on the first word, so empty content never loads it
+        mock_converter_class.assert_not_called()
         mock_converter.get_api.assert_not_called()
 
 
@@ -928,8 +940,8 @@ def test_apply_bophono_with_single_word():
     mock_converter = Mock()
     mock_converter.get_api.return_value = 'om'
     
-    with patch("pecha_api.texts.segments.segments_utils.WordTokenizer") as mock_tokenizer_class, \
-         patch("pecha_api.texts.segments.segments_utils.bophono.UnicodeToApi") as mock_converter_class:
+    with patch("pecha_api.texts.segments.segments_phonetics.WordTokenizer") as mock_tokenizer_class, \
+         patch("pecha_api.texts.segments.segments_phonetics.bophono.UnicodeToApi") as mock_converter_class:
         
         mock_tokenizer_class.return_value = mock_tokenizer
         mock_converter_class.return_value = mock_converter
@@ -955,8 +967,8 @@ def test_apply_bophono_with_mixed_content():
     mock_converter = Mock()
     mock_converter.get_api.side_effect = ['chö', '།', 'ten']
     
-    with patch("pecha_api.texts.segments.segments_utils.WordTokenizer") as mock_tokenizer_class, \
-         patch("pecha_api.texts.segments.segments_utils.bophono.UnicodeToApi") as mock_converter_class:
+    with patch("pecha_api.texts.segments.segments_phonetics.WordTokenizer") as mock_tokenizer_class, \
+         patch("pecha_api.texts.segments.segments_phonetics.bophono.UnicodeToApi") as mock_converter_class:
         
         mock_tokenizer_class.return_value = mock_tokenizer
         mock_converter_class.return_value = mock_converter
@@ -983,8 +995,8 @@ def test_apply_bophono_converter_options():
     mock_converter = Mock()
     mock_converter.get_api.return_value = 'kar'
     
-    with patch("pecha_api.texts.segments.segments_utils.WordTokenizer") as mock_tokenizer_class, \
-         patch("pecha_api.texts.segments.segments_utils.bophono.UnicodeToApi") as mock_converter_class:
+    with patch("pecha_api.texts.segments.segments_phonetics.WordTokenizer") as mock_tokenizer_class, \
+         patch("pecha_api.texts.segments.segments_phonetics.bophono.UnicodeToApi") as mock_converter_class:
         
         mock_tokenizer_class.return_value = mock_tokenizer
         mock_converter_class.return_value = mock_converter
@@ -1006,8 +1018,8 @@ def test_apply_bophono_with_whitespace_only():
     mock_tokenizer.tokenize.return_value = []
     mock_converter = Mock()
     
-    with patch("pecha_api.texts.segments.segments_utils.WordTokenizer") as mock_tokenizer_class, \
-         patch("pecha_api.texts.segments.segments_utils.bophono.UnicodeToApi") as mock_converter_class:
+    with patch("pecha_api.texts.segments.segments_phonetics.WordTokenizer") as mock_tokenizer_class, \
+         patch("pecha_api.texts.segments.segments_phonetics.bophono.UnicodeToApi") as mock_converter_class:
         
         mock_tokenizer_class.return_value = mock_tokenizer
         mock_converter_class.return_value = mock_converter
@@ -1294,4 +1306,48 @@ async def test_filter_segment_mapping_uses_grouped_segments():
         
         # Verify segments are merged in correct order (sorted by pecha_segment_id)
         assert len(result) == 1
-        assert result[0].segments[0].content == "content 1 content 2"
\ No newline at end of file
+        assert result[0].segments[0].content == "content 1 content 2"
+
+def test_filter_version_segments_uses_resolved_texts():
+    def text(text_id: str, type: str, language: str) -> TextDTO:
+        return TextDTO(
+            id=text_id, title=f"title {text_id}", language=language, group_id="group_id", type=type, is_published=True,
+            created_date="created_date", updated_date="updated_date", published_date="published_date", published_by="pecha"
+        )
+    segments = [
+        SegmentDTO(id="segment_1", text_id="version_text", content="version", type=SegmentType.SOURCE),
+        SegmentDTO(id="segment_2", text_id="commentary_text", content="commentary", type=SegmentType.SOURCE),
+        SegmentDTO(id="segment_3", text_id="unknown_text", content="unknown", type=SegmentType.SOURCE)
+    ]
+    text_details_dict = {
+        "version_text": text("version_text", "version", "en"),
+        "commentary_text": text("commentary_text", "commentary", "bo")
+    }
+
+    response = SegmentUtils.filter_version_segments(segments=segments, text_details_dict=text_details_dict)
+
+    assert response == [
+        SegmentTranslation(
+            segment_id="segment_1", text_id="version_text", title="title version_text", source="pecha", language="en", content="version"
+        )
+    ]
+
+
+def test_apply_bophono_builds_tokenizer_and_converter_once():
+    from unittest.mock import Mock
+
+    mock_tokenizer = Mock()
+    mock_tokenizer.tokenize.return_value = [type('Token', (), {'text': 'ཨོཾ'})()]
+    mock_converter = Mock()
+    mock_converter.get_api.return_value = 'om'
+
+    with patch("pecha_api.texts.segments.segments_phonetics.WordTokenizer", return_value=mock_tokenizer) as mock_tokenizer_class, \
+         patch("pecha_api.texts.segments.segments_phonetics.bophono.UnicodeToApi", return_value=mock_converter) as mock_converter_class:
+
+        assert SegmentUtils.apply_bophono("ཨོཾ") == "om"
+        assert SegmentUtils.apply_bophono("ཨོཾ") == "om"
+
+        mock_tokenizer_class.assert_called_once()
+        mock_converter_class.assert_called_once()
+        # The word is memoized after its first conversion
+        mock_converter.get_api.assert_called_once_with('ཨོཾ')
@@ -1,17 +1,27 @@
-from unittest.mock import patch, AsyncMock, mock_open
+from unittest.mock import patch, AsyncMock
 import pytest
 import io
+import os
+import time
 from fastapi import HTTPException
-from starlette.responses import StreamingResponse
+from starlette.responses import FileResponse
 
 from pecha_api.share.share_service import (
     generate_short_url,
     get_generated_image,
     _generate_short_url_payload_,
     _generate_url_,
-    _generate_logo_image_,
-    _generate_segment_content_image_
+    _generate_share_image_key_,
+    _generate_segment_content_image_,
+    _get_share_image_content_
 )
+from pecha_api.share.share_image_renderer import (
+    generate_share_image_key,
+    get_cached_share_image,
+    store_share_image,
+    prune_share_images
+)
+from pecha_api.share.pecha_text_image_generator import render_segment_image
 from pecha_api.share.share_response_models import (
     ShortUrlResponse,
     ShareRequest
@@ -21,29 +31,118 @@ from pecha_api.texts.segments.segments_service import SegmentDTO
 from pecha_api.texts.texts_response_models import TextDTO
 from pecha_api.texts.segments.segments_enum import SegmentType
 
+SEGMENT_IMAGE_CONTENT = {"text": "segment content", "ref_str": "Text Title", "language": "en"}
 
 @pytest.mark.asyncio
-async def test_get_generated_image_success():
-    mock_image_data = b"fake_image_data"
-    
-    with patch("anyio.open_file", new_callable=AsyncMock) as mock_open_file:
-        mock_file = AsyncMock()
-        mock_file.read.return_value = mock_image_data
-        cm = AsyncMock()
-        cm.__aenter__.return_value = mock_file
-        mock_open_file.return_value = cm
-        
-        response = await get_generated_image()
-        
-        assert isinstance(response, StreamingResponse)
+async def test_get_generated_image_from_cache(tmp_path):
+    share_request = ShareRequest(segment_id="seg_1", language="en")
+    image_key = _generate_share_image_key_(share_request=share_request, **SEGMENT_IMAGE_CONTENT)
+    (tmp_path / f"{image_key}.png").write_bytes(b"fake_image_data")
+
+    with patch("pecha_api.share.share_image_renderer.get", return_value=str(tmp_path)), \
+         patch("pecha_api.share.share_service._get_share_image_content_", new_callable=AsyncMock, return_value=tuple(SEGMENT_IMAGE_CONTENT.values())), \
+         patch("pecha_api.share.share_service.render_share_image", new_callable=AsyncMock) as mock_render:
+
+        response = await get_generated_image(share_request=share_request)
+
+        assert isinstance(response, FileResponse)
         assert response.media_type == "image/png"
+        assert response.headers["etag"].startswith(f'"{image_key}-')
+        assert response.headers["cache-control"] == "public, max-age=86400"
+        assert "last-modified" in response.headers
+        mock_render.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_generated_image_not_modified_by_etag(tmp_path):
+    share_request = ShareRequest(segment_id="seg_1", language="en")
+    image_key = _generate_share_image_key_(share_request=share_request, **SEGMENT_IMAGE_CONTENT)
+    (tmp_path / f"{image_key}.png").write_bytes(b"fake_image_data")
+
+    with patch("pecha_api.share.share_image_renderer.get", return_value=str(tmp_path)), \
+         patch("pecha_api.share.share_service._get_share_image_content_", new_callable=AsyncMock, return_value=tuple(SEGMENT_IMAGE_CONTENT.values())):
+        first_response = await get_generated_image(share_request=share_request)
+
+        response = await get_generated_image(
+            share_request=share_request,
+            if_none_match=first_response.headers["etag"]
+        )
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == first_response.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_get_generated_image_not_modified_since(tmp_path):
+    share_request = ShareRequest(segment_id="seg_1", language="en")
+    image_key = _generate_share_image_key_(share_request=share_request, **SEGMENT_IMAGE_CONTENT)
+    (tmp_path / f"{image_key}.png").write_bytes(b"fake_image_data")
+
+    with patch("pecha_api.share.share_image_renderer.get", return_value=str(tmp_path)), \
+         patch("pecha_api.share.share_service._get_share_image_content_", new_callable=AsyncMock, return_value=tuple(SEGMENT_IMAGE_CONTENT.values())):
+        first_response = await get_generated_image(share_request=share_request)
+
+        not_modified = await get_generated_image(
+            share_request=share_request,
+            if_modified_since=first_response.headers["last-modified"]
+        )
+        modified = await get_generated_image(
+            share_request=share_request,
+            if_modified_since="Mon, 01 Jan 2001 00:00:00 GMT"
+        )
+
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_get_generated_image_renders_on_cache_miss(tmp_path):
+    share_request = ShareRequest(text_id="text_1", language="en")
+    image_key = _generate_share_image_key_(share_request=share_request, text="Test Title", ref_str="Pecha", language="en")
+    mock_text_detail = TextDTO(
+        id="text_1",
+        title="Test Title",
+        language="en",
+        type="version",
+        group_id="group_1",
+        is_published=True,
+        created_date="2021-01-01",
+        updated_date="2021-01-01",
+        published_date="2021-01-01",
+        published_by="user_1",
+        categories=[],
+        views=0
+    )
+
+    async def _render_(image_key: str, **kwargs):
+        await store_share_image(image_key=image_key, image_bytes=b"png")
+        return b"png"
+
+    with patch("pecha_api.share.share_image_renderer.get", return_value=str(tmp_path)), \
+         patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
+         patch("pecha_api.share.share_service.render_share_image", new_callable=AsyncMock, side_effect=_render_) as mock_render:
+
+        response = await get_generated_image(share_request=share_request)
+
+        assert isinstance(response, FileResponse)
+        mock_render.assert_awaited_once()
+        assert mock_render.call_args.kwargs["image_key"] == image_key
 
 
 @pytest.mark.asyncio
-async def test_get_generated_image_file_not_found():
-    with patch("anyio.open_file", new_callable=AsyncMock, side_effect=FileNotFoundError()):
-        with pytest.raises(FileNotFoundError):
-            await get_generated_image()
+async def test_get_generated_image_uncached_render(tmp_path):
+    share_request = ShareRequest(text_id="text_1", language="en")
+
+    with patch("pecha_api.share.share_image_renderer.get", return_value=str(tmp_path)), \
+         patch("pecha_api.share.share_service._get_share_image_content_", new_callable=AsyncMock, return_value=("Test Title", "Pecha", "en")), \
+         patch("pecha_api.share.share_service._generate_segment_content_image_", new_callable=AsyncMock, return_value=b"png"):
+
+        response = await get_generated_image(share_request=share_request)
+
+        assert response.status_code == 200
+        assert response.body == b"png"
+        assert response.headers["cache-control"] == "no-cache"
 
 
 @pytest.mark.asyncio
@@ -72,8 +171,9 @@ async def test_generate_short_url_with_logo():
     )
     
     with patch("pecha_api.share.share_service.get_short_url", new_callable=AsyncMock) as mock_short_url, \
+         patch("pecha_api.share.share_service.get_cached_share_image", new_callable=AsyncMock, return_value=None), \
          patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
-         patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
+         patch("pecha_api.share.share_service.render_share_image", new_callable=AsyncMock, return_value=b"png") as mock_render:
         
         mock_short_url.return_value = mock_short_url_response
         
@@ -82,8 +182,7 @@ async def test_generate_short_url_with_logo():
         assert response is not None
         assert isinstance(response, ShortUrlResponse)
         assert response.shortUrl == "https://pecha.io/share/123"
-        # Verify logo image generation was called
-        assert mock_generate_image.call_count == 2  # Once for logo, once for content
+        mock_render.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -119,22 +218,22 @@ async def test_generate_short_url_for_segment_content_success():
     )
     
     with patch("pecha_api.share.share_service.get_short_url", new_callable=AsyncMock, return_value=mock_short_url_response), \
+         patch("pecha_api.share.share_service.get_cached_share_image", new_callable=AsyncMock, return_value=None), \
          patch("pecha_api.share.share_service.SegmentUtils.validate_segment_exists", new_callable=AsyncMock, return_value=True), \
          patch("pecha_api.share.share_service.get_segment_details_by_id", new_callable=AsyncMock, return_value=mock_segment_details), \
          patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
-         patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
+         patch("pecha_api.share.share_service.render_share_image", new_callable=AsyncMock, return_value=b"png") as mock_render:
         
         response = await generate_short_url(share_request=share_request)
         
         assert response is not None
         assert isinstance(response, ShortUrlResponse)
         assert response.shortUrl == "https://pecha.io/share/123"
-        # Verify image generation was called for segment content
-        mock_generate_image.assert_called()
+        mock_render.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_generate_short_url_without_segment_id():
+async def test_generate_short_url_skips_render_when_cached():
     share_request = ShareRequest(
         text_id="text_1",
         language="en",
@@ -143,49 +242,30 @@ async def test_generate_short_url_without_segment_id():
     mock_short_url_response = ShortUrlResponse(
         shortUrl="https://pecha.io/share/123"
     )
-    mock_text_detail = TextDTO(
-        id="text_1",
-        title="Test Title",
-        language="en",
-        type="version",
-        group_id="group_1",
-        is_published=True,
-        created_date="2021-01-01",
-        updated_date="2021-01-01",
-        published_date="2021-01-01",
-        published_by="user_1",
-        categories=[],
-        views=0
-    )
     
     with patch("pecha_api.share.share_service.get_short_url", new_callable=AsyncMock, return_value=mock_short_url_response), \
-         patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
-         patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
+         patch("pecha_api.share.share_service.get_cached_share_image", new_callable=AsyncMock, return_value=b"png"), \
+         patch("pecha_api.share.share_service._get_share_image_content_", new_callable=AsyncMock, return_value=("Test Title", "Pecha", "en")), \
+         patch("pecha_api.share.share_service.render_share_image", new_callable=AsyncMock) as mock_render:
         
         response = await generate_short_url(share_request=share_request)
         
-        assert response is not None
-        assert isinstance(response, ShortUrlResponse)
         assert response.shortUrl == "https://pecha.io/share/123"
-        # Verify image generation was called with default "PECHA" text
-        mock_generate_image.assert_called()
+        mock_render.assert_not_called()
 
 
-def test_generate_logo_image():
-    share_request = ShareRequest(
-        text_id="text_123",
-        text_color=TextColor.BLACK,
-        bg_color=BgColor.DEFAULT
-    )
-    
-    with patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
-        _generate_logo_image_(share_request)
-        
-        mock_generate_image.assert_called_once_with(
-            text_color=TextColor.BLACK,
-            bg_color=BgColor.DEFAULT,
-            logo_path="pecha_api/share/static/img/pecha-logo.png"
-        )
+def test_generate_share_image_key_depends_on_colors_and_content():
+    base_request = ShareRequest(segment_id="seg_1", language="en")
+    black_request = ShareRequest(segment_id="seg_1", language="en", bg_color=BgColor.BLACK)
+    logo_request = ShareRequest(segment_id="seg_1", language="en", logo=True)
+    base_key = _generate_share_image_key_(base_request, **SEGMENT_IMAGE_CONTENT)
+
+    assert base_key == _generate_share_image_key_(ShareRequest(segment_id="seg_1", language="en"), **SEGMENT_IMAGE_CONTENT)
+    assert base_key != _generate_share_image_key_(black_request, **SEGMENT_IMAGE_CONTENT)
+    # Every image is rendered with the logo, so the flag does not name a different image
+    assert base_key == _generate_share_image_key_(logo_request, **SEGMENT_IMAGE_CONTENT)
+    assert base_key != _generate_share_image_key_(base_request, **{**SEGMENT_IMAGE_CONTENT, "text": "edited content"})
+    assert base_key != _generate_share_image_key_(base_request, **{**SEGMENT_IMAGE_CONTENT, "ref_str": "Renamed Title"})
 
 
 @pytest.mark.asyncio
@@ -222,16 +302,19 @@ async def test_generate_segment_content_image_with_segment():
     with patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
          patch("pecha_api.share.share_service.SegmentUtils.validate_segment_exists", new_callable=AsyncMock), \
          patch("pecha_api.share.share_service.get_segment_details_by_id", new_callable=AsyncMock, return_value=mock_segment), \
-         patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
+         patch("pecha_api.share.share_service.render_share_image", new_callable=AsyncMock, return_value=b"png") as mock_render:
         
-        await _generate_segment_content_image_(share_request)
+        text, ref_str, language = await _get_share_image_content_(share_request)
+        response = await _generate_segment_content_image_(share_request, image_key="image_key", text=text, ref_str=ref_str, language=language)
         
-        mock_generate_image.assert_called_once_with(
+        assert response == b"png"
+        mock_render.assert_awaited_once_with(
+            image_key="image_key",
             text="Test segment content",
             ref_str="Test Title",
             lang="en",
-            text_color=TextColor.BLACK,
-            bg_color=BgColor.DEFAULT,
+            text_color="black",
+            bg_color="DEFAULT",
             logo_path="pecha_api/share/static/img/pecha-logo.png"
         )
 
@@ -260,20 +343,66 @@ async def test_generate_segment_content_image_without_segment():
     )
     
     with patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
-         patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
+         patch("pecha_api.share.share_service.render_share_image", new_callable=AsyncMock, return_value=b"png") as mock_render:
         
-        await _generate_segment_content_image_(share_request)
+        text, ref_str, language = await _get_share_image_content_(share_request)
+        await _generate_segment_content_image_(share_request, image_key="image_key", text=text, ref_str=ref_str, language=language)
         
-        mock_generate_image.assert_called_once_with(
+        mock_render.assert_awaited_once_with(
+            image_key="image_key",
             text="Test Title",
             ref_str="Pecha",
             lang="en",
-            text_color=TextColor.BLACK,
-            bg_color=BgColor.DEFAULT,
+            text_color="black",
+            bg_color="DEFAULT",
             logo_path="pecha_api/share/static/img/pecha-logo.png"
         )
 
 
+@pytest.mark.asyncio
+async def test_store_and_get_cached_share_image(tmp_path):
+    image_key = generate_share_image_key(segment_id="seg_1", language="en")
+
+    with patch("pecha_api.share.share_image_renderer.get", return_value=str(tmp_path)):
+        assert await get_cached_share_image(image_key=image_key) is None
+
+        await store_share_image(image_key=image_key, image_bytes=b"png")
+
+        assert await get_cached_share_image(image_key=image_key) == b"png"
+        assert [path.name for path in tmp_path.iterdir()] == [f"{image_key}.png"]
+
+
+def test_prune_share_images_deletes_only_old_images_and_temp_files(tmp_path):
+    old_time = time.time() - 7200
+    for name in ["old.png", "old.png.abc.tmp", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"data")
+        os.utime(tmp_path / name, (old_time, old_time))
+    (tmp_path / "recent.png").write_bytes(b"png")
+
+    with patch("pecha_api.share.share_image_renderer.get", return_value=str(tmp_path)):
+        assert prune_share_images(max_age=3600) == 2
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["notes.txt", "recent.png"]
+
+
+def test_prune_share_images_without_cache_dir(tmp_path):
+    with patch("pecha_api.share.share_image_renderer.get", return_value=str(tmp_path / "missing")):
+        assert prune_share_images(max_age=3600) == 0
+
+
+def test_render_segment_image_returns_png_bytes():
+    image_bytes = render_segment_image(
+        text="May all beings be happy",
+        ref_str="Pecha",
+        lang="en",
+        bg_color="black",
+        text_color="DEFAULT",
+        logo_path="pecha_api/share/static/img/pecha-logo.png"
+    )
+
+    assert image_bytes.startswith(b"\x89PNG")
+
+
 def test_generate_short_url_payload_with_provided_url():
     share_request = ShareRequest(
         url="https://pecha.io/share/123",
@@ -346,6 +475,23 @@ def test_generate_short_url_payload_without_segment_id():
         assert payload["tags"] == "tag1"
 
 
+def test_generate_short_url_payload_with_colors():
+    share_request = ShareRequest(
+        url="https://pecha.io/share/123",
+        segment_id="seg_123",
+        language="en",
+        text_color=TextColor.BLACK,
+        bg_color=BgColor.BLACK
+    )
+
+    with patch("pecha_api.share.share_service.get") as mock_get:
+        mock_get.return_value = "https://backend.example.com"
+
+        payload = _generate_short_url_payload_(share_request, "Test description")
+
+        assert payload["og_image"] == "https://backend.example.com/share/image?segment_id=seg_123&language=en&logo=False&text_color=black&bg_color=black"
+
+
 def test_generate_url_with_segment_id():
     segment_id = "seg_123"
     content_id = "content_456"
@@ -0,0 +1,50 @@
+import uuid
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
+
+from pecha_api.sheets.sheets_backfill import backfill_sheet_summaries
+from pecha_api.texts.segments.segments_enum import SegmentType
+from pecha_api.texts.texts_response_models import TableOfContent, TableOfContentType, Section, TextSegment
+
+
+def _table_of_content(sheet_id: str, segment_ids):
+    return TableOfContent(
+        text_id=sheet_id,
+        type=TableOfContentType.SHEET,
+        sections=[Section(id="section_id", section_number=1, segments=[
+            TextSegment(segment_id=segment_id, segment_number=number) for number, segment_id in enumerate(segment_ids, start=1)
+        ])]
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_sheet_summaries_stores_fields_of_each_sheet_in_batches():
+    sheet_id = str(uuid.uuid4())
+    empty_sheet_id = str(uuid.uuid4())
+    source_id, image_id, content_id = (str(uuid.uuid4()) for _ in range(3))
+    segments = [
+        SimpleNamespace(id=uuid.UUID(source_id), text_id="other_text", type=SegmentType.CONTENT, content="<p>Quoted text</p>"),
+        SimpleNamespace(id=uuid.UUID(image_id), text_id=sheet_id, type=SegmentType.IMAGE, content="images/first.png"),
+        SimpleNamespace(id=uuid.UUID(content_id), text_id=sheet_id, type=SegmentType.CONTENT, content="<p>Own words</p>"),
+    ]
+
+    with patch("pecha_api.sheets.sheets_backfill.get_sheets_without_summary", new_callable=AsyncMock,
+               side_effect=[[SimpleNamespace(id=uuid.UUID(sheet_id)), SimpleNamespace(id=uuid.UUID(empty_sheet_id))], []]) as mock_get_sheets, \
+         patch("pecha_api.sheets.sheets_backfill.get_contents_by_text_ids", new_callable=AsyncMock,
+               return_value={sheet_id: _table_of_content(sheet_id, [source_id, image_id, content_id])}), \
+         patch("pecha_api.sheets.sheets_backfill.get_segments_by_ids", new_callable=AsyncMock, return_value=segments) as mock_get_segments, \
+         patch("pecha_api.sheets.sheets_backfill.update_sheet_summary_by_id", new_callable=AsyncMock) as mock_update:
+
+        backfilled = await backfill_sheet_summaries(batch_size=2)
+
+    assert backfilled == 2
+    assert mock_get_sheets.await_count == 2
+    mock_get_segments.assert_awaited_once_with(segment_ids=[source_id, image_id, content_id])
+    assert mock_update.await_args_list[0].kwargs == {
+        "sheet_id": sheet_id, "summary": "Own words", "word_count": 2, "first_image": "images/first.png"
+    }
+    # Sheets without a table of content still get an empty summary so they are not picked up again
+    assert mock_update.await_args_list[1].kwargs == {
+        "sheet_id": empty_sheet_id, "summary": "", "word_count": 0, "first_image": None
+    }
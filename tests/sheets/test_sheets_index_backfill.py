@@ -0,0 +1,73 @@
+import uuid
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from pecha_api.sheets.sheets_index_backfill import backfill_sheet_index
+from pecha_api.texts.segments.segments_enum import SegmentType
+from pecha_api.texts.texts_response_models import TableOfContent, TableOfContentType, Section, TextSegment, TextDTO
+
+
+def _sheet(sheet_id: str, published_by: str) -> TextDTO:
+    return TextDTO(
+        id=sheet_id,
+        title="Sheet title",
+        language="en",
+        group_id="group_id",
+        type="sheet",
+        is_published=True,
+        created_date="2021-01-01",
+        updated_date="2021-01-01",
+        published_date="2021-01-01",
+        published_by=published_by
+    )
+
+
+def _table_of_content(sheet_id: str, segment_ids):
+    return TableOfContent(
+        text_id=sheet_id,
+        type=TableOfContentType.SHEET,
+        sections=[Section(id="section_id", section_number=1, segments=[
+            TextSegment(segment_id=segment_id, segment_number=number) for number, segment_id in enumerate(segment_ids, start=1)
+        ])]
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_sheet_index_indexes_each_page_of_sheets():
+    sheet_id = str(uuid.uuid4())
+    orphan_sheet_id = str(uuid.uuid4())
+    source_id, content_id = str(uuid.uuid4()), str(uuid.uuid4())
+    segments = [
+        SimpleNamespace(id=uuid.UUID(source_id), text_id="other_text", type=SegmentType.CONTENT, content="<p>Quoted text</p>"),
+        SimpleNamespace(id=uuid.UUID(content_id), text_id=sheet_id, type=SegmentType.CONTENT, content="<p>Own words</p>"),
+    ]
+    publisher = SimpleNamespace(
+        id=uuid.uuid4(), email="author@gmail.com", firstname="First", lastname="Last", username="author",
+        title=None, organization=None, avatar_url=None
+    )
+    mock_session = MagicMock()
+    mock_session.__enter__.return_value = mock_session
+
+    with patch("pecha_api.sheets.sheets_index_backfill.get_sheet_ids", new_callable=AsyncMock,
+               side_effect=[[sheet_id, orphan_sheet_id], []]) as mock_get_sheet_ids, \
+         patch("pecha_api.sheets.sheets_index_backfill.get_texts_by_ids", new_callable=AsyncMock, return_value={
+             sheet_id: _sheet(sheet_id, "author@gmail.com"),
+             orphan_sheet_id: _sheet(orphan_sheet_id, "removed@gmail.com")
+         }), \
+         patch("pecha_api.sheets.sheets_index_backfill.get_contents_by_text_ids", new_callable=AsyncMock,
+               return_value={sheet_id: _table_of_content(sheet_id, [source_id, content_id])}), \
+         patch("pecha_api.sheets.sheets_index_backfill.get_segments_by_ids", new_callable=AsyncMock, return_value=segments), \
+         patch("pecha_api.sheets.sheets_index_backfill.SessionLocal", return_value=mock_session), \
+         patch("pecha_api.sheets.sheets_index_backfill.get_users_by_emails", return_value=[publisher]), \
+         patch("pecha_api.sheets.sheets_index_backfill.index_sheets", new_callable=AsyncMock) as mock_index_sheets:
+
+        indexed = await backfill_sheet_index(batch_size=2)
+
+    assert indexed == 1
+    assert mock_get_sheet_ids.await_args_list[1].kwargs == {"limit": 2, "after": orphan_sheet_id}
+    sheet_indexes = mock_index_sheets.await_args_list[0].kwargs["sheet_indexes"]
+    # Sheets of removed publishers are skipped and quoted segments are not the sheet's own content
+    assert [sheet_index.id for sheet_index in sheet_indexes] == [sheet_id]
+    assert sheet_indexes[0].content == ["Own words"]
+    assert sheet_indexes[0].publisher_name == "First Last"
@@ -2,6 +2,7 @@ import io
 import pytest
 import uuid
 from unittest.mock import patch, MagicMock, AsyncMock
+from types import SimpleNamespace
 from fastapi import UploadFile, HTTPException, status
 from pecha_api.error_contants import ErrorConstants
 from pecha_api.image_utils import ImageUtils
@@ -39,13 +40,14 @@ from pecha_api.sheets.sheets_service import (
     get_sheet_by_id,
     delete_sheet_by_id,
     fetch_sheets,
-    _generate_sheet_summary_,
+    _generate_sheet_summaries_,
+    _diff_sheet_segments_,
+    build_sheet_summary,
     _strip_html_tags_,
     _generate_sheet_detail_dto_,
     upload_sheet_image_request,
     _fetch_user_sheets_,
     _generate_sheet_dto_response_,
-    _create_publisher_object_,
     _generate_sheet_section_,
     _get_all_segment_ids_in_table_of_content_,
     _update_text_details_,
@@ -56,6 +58,7 @@ from pecha_api.sheets.sheets_service import (
     _generate_segment_creation_request_payload_,
     _create_sheet_text_,
     _create_sheet_group_,
+    _generate_sheet_index_,
     clean_text
 )
 
@@ -72,6 +75,12 @@ from pecha_api.users.user_response_models import UserInfoResponse
 from pecha_api.texts.texts_enums import TextType
 
 
+@pytest.fixture(autouse=True)
+def _mock_segments_cache_deletion_():
+    with patch("pecha_api.sheets.sheets_service.delete_segments_by_ids_cache", new_callable=AsyncMock) as mock_delete:
+        yield mock_delete
+
+
 def test_validate_and_compress_image_success():
     file_content = io.BytesIO(b"fake_image_data")
     file = UploadFile(filename="test.jpg", file=file_content)
@@ -218,7 +227,10 @@ async def test_create_new_sheet_success():
         patch("pecha_api.sheets.sheets_service.create_new_text", new_callable=AsyncMock, return_value=mock_text_response), \
         patch("pecha_api.sheets.sheets_service.validate_and_extract_user_details", return_value=mock_user_details), \
         patch("pecha_api.sheets.sheets_service.create_new_segment", new_callable=AsyncMock, return_value=mock_segment_response), \
-        patch("pecha_api.sheets.sheets_service.create_table_of_content", new_callable=AsyncMock, return_value=mock_table_of_content_response):
+        patch("pecha_api.sheets.sheets_service.create_table_of_content", new_callable=AsyncMock, return_value=mock_table_of_content_response), \
+        patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_response), \
+        patch("pecha_api.sheets.sheets_service.update_sheet_summary", new_callable=AsyncMock) as mock_update_summary, \
+        patch("pecha_api.sheets.sheets_service._index_sheet_", new_callable=AsyncMock) as mock_index_sheet:
 
         response = await create_new_sheet(
             create_sheet_request=mock_create_sheet_request,
@@ -228,6 +240,8 @@ async def test_create_new_sheet_success():
         assert response is not None
         assert isinstance(response, SheetIdResponse)
         assert response.sheet_id == "text_id"
+        mock_index_sheet.assert_awaited_once()
+        mock_update_summary.assert_awaited_once_with(sheet_id="text_id", summary="content", word_count=1, first_image="image_url")
 
 @pytest.mark.asyncio
 async def test_create_sheet_invalid_token():
@@ -309,18 +323,19 @@ async def test_update_sheet_success():
         views=10
     )
     
-    with patch("pecha_api.sheets.sheets_service.remove_segments_by_text_id", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
-        patch("pecha_api.sheets.sheets_service.remove_table_of_content_by_text_id", new_callable=AsyncMock), \
+    with patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
+        patch("pecha_api.sheets.sheets_service.SegmentUtils.validate_segments_exists", new_callable=AsyncMock, return_value=True) as mock_validate_segments, \
         patch("pecha_api.sheets.sheets_service.delete_text_details_by_id_cache", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=None), \
         patch("pecha_api.sheets.sheets_service.delete_table_of_content_by_sheet_id_cache", new_callable=AsyncMock), \
         patch("pecha_api.sheets.sheets_service.delete_segments_details_by_ids_cache", new_callable=AsyncMock), \
         patch("pecha_api.sheets.sheets_service.update_text_details", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.create_new_segment", new_callable=AsyncMock, return_value=mock_segment_response), \
-        patch("pecha_api.sheets.sheets_service.create_table_of_content", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.apply_segment_changes", new_callable=AsyncMock) as mock_apply_changes, \
+        patch("pecha_api.sheets.sheets_service.replace_table_of_content", new_callable=AsyncMock) as mock_replace_toc, \
         patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
-        patch("pecha_api.sheets.sheets_service.update_text_details_cache", new_callable=AsyncMock):
+        patch("pecha_api.sheets.sheets_service.update_text_details_cache", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.update_sheet_summary", new_callable=AsyncMock) as mock_update_summary, \
+        patch("pecha_api.sheets.sheets_service._index_sheet_", new_callable=AsyncMock) as mock_index_sheet:
 
         response = await update_sheet_by_id(
             sheet_id=sheet_id,
@@ -331,6 +346,12 @@ async def test_update_sheet_success():
         assert response is not None
         assert isinstance(response, SheetIdResponse)
         assert response.sheet_id == sheet_id
+        mock_validate_segments.assert_awaited_once_with(segment_ids=["source_segment_id"])
+        mock_index_sheet.assert_awaited_once()
+        assert mock_update_summary.await_args.kwargs["sheet_id"] == sheet_id
+        # Without an existing table of content every own block is inserted
+        assert [segment.content for segment in mock_apply_changes.await_args.kwargs["inserted"]] == ["content", "image_url"]
+        mock_replace_toc.assert_awaited_once()
 
 @pytest.mark.asyncio
 async def test_update_sheet_invalid_token():
@@ -436,6 +457,49 @@ async def test_get_sheet_by_id_success():
         assert response.content.segments[1].content == "image_url"
         assert response.content.segments[1].key == "image_key"
 
+@pytest.mark.asyncio
+async def test_get_sheet_by_id_records_view_and_adds_buffered_views():
+    sheet_id = "text_id"
+    mock_sheet_details = TextDTO(
+        id=sheet_id,
+        title="sheet_title",
+        language="language",
+        group_id="group_id",
+        type=TextType.SHEET,
+        is_published=True,
+        created_date="2021-01-01",
+        updated_date="2021-01-01",
+        published_date="2021-01-01",
+        published_by="test_user",
+        categories=[],
+        views=10
+    )
+    mock_user_details = UserInfoResponse(
+        firstname="firstname",
+        lastname="lastname",
+        username="username",
+        email="test_user@gmail.com",
+        educations=[],
+        followers=0,
+        following=0,
+        social_profiles=[]
+    )
+    mock_table_of_content_response = TableOfContent(text_id=sheet_id, type=TableOfContentType.SHEET, sections=[])
+    with patch("pecha_api.sheets.sheets_service.fetch_user_by_email", new_callable=MagicMock, return_value=mock_user_details), \
+        patch("pecha_api.sheets.sheets_service.get_segments_details_by_ids", new_callable=AsyncMock, return_value={}), \
+        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content_response), \
+        patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_sheet_details), \
+        patch("pecha_api.sheets.sheets_service.record_text_view", new_callable=AsyncMock) as mock_record_view, \
+        patch("pecha_api.sheets.sheets_service.get_pending_views", new_callable=AsyncMock, return_value={sheet_id: 3}), \
+        patch("pecha_api.sheets.sheets_service.get_unique_viewers", new_callable=AsyncMock, return_value=2):
+
+        first_page = await get_sheet_by_id(sheet_id=sheet_id, skip=0, limit=10, viewer="203.0.113.7")
+        await get_sheet_by_id(sheet_id=sheet_id, skip=1, limit=10, viewer="203.0.113.7")
+
+        assert first_page.views == 13
+        assert first_page.unique_viewers == 2
+        mock_record_view.assert_awaited_once_with(text_id=sheet_id, viewer="203.0.113.7")
+
 @pytest.mark.asyncio
 async def test_get_sheet_by_id_invalid_sheet_id():
     sheet_id="invalid_sheet_id"
@@ -531,7 +595,8 @@ async def test_delete_sheet_success():
         patch("pecha_api.sheets.sheets_service.delete_group_by_group_id", new_callable=AsyncMock), \
         patch("pecha_api.sheets.sheets_service.remove_segments_by_text_id", new_callable=AsyncMock), \
         patch("pecha_api.sheets.sheets_service.remove_table_of_content_by_text_id", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.delete_text_by_text_id", new_callable=AsyncMock):
+        patch("pecha_api.sheets.sheets_service.delete_text_by_text_id", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.remove_sheet_from_index", new_callable=AsyncMock) as mock_remove_sheet_from_index:
 
         response = await delete_sheet_by_id(
             sheet_id=mock_sheet_id,
@@ -539,6 +604,7 @@ async def test_delete_sheet_success():
         )
 
         assert response is None
+        mock_remove_sheet_from_index.assert_awaited_once_with(sheet_id=mock_sheet_id)
     
 @pytest.mark.asyncio
 async def test_delete_sheet_invalid_token():
@@ -587,7 +653,8 @@ async def test_fetch_sheets_community_page_all_published():
     
     with patch("pecha_api.sheets.sheets_service.get_sheet", new_callable=AsyncMock, return_value=mock_sheets), \
         patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="time passed"), \
-        patch("pecha_api.sheets.sheets_service.fetch_user_by_email", new_callable=MagicMock, return_value=mock_user):
+        patch("pecha_api.sheets.sheets_service._generate_sheet_summaries_", new_callable=AsyncMock, return_value={}), \
+        patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=_mock_users_by_email_(mock_user.email)):
         
         result = await fetch_sheets(
             token="valid_token",
@@ -627,7 +694,8 @@ async def test_fetch_sheets_user_own_sheets():
     
     with patch("pecha_api.sheets.sheets_service.validate_and_extract_user_details", return_value=mock_user_details), \
         patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="time passed"), \
-        patch("pecha_api.sheets.sheets_service.fetch_user_by_email", new_callable=MagicMock, return_value=mock_publisher_details), \
+        patch("pecha_api.sheets.sheets_service._generate_sheet_summaries_", new_callable=AsyncMock, return_value={}), \
+        patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=_mock_users_by_email_(mock_publisher_details.email)), \
         patch("pecha_api.sheets.sheets_service.get_sheet", new_callable=AsyncMock, return_value=mock_sheets):
         
         result = await fetch_sheets(
@@ -667,7 +735,8 @@ async def test_fetch_sheets_user_viewing_other_users_sheets_status_logged_in():
     
     with patch("pecha_api.sheets.sheets_service.validate_and_extract_user_details", return_value=mock_user_details), \
         patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="time passed"), \
-        patch("pecha_api.sheets.sheets_service.fetch_user_by_email", new_callable=MagicMock, return_value=mock_publisher_details), \
+        patch("pecha_api.sheets.sheets_service._generate_sheet_summaries_", new_callable=AsyncMock, return_value={}), \
+        patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=_mock_users_by_email_(mock_publisher_details.email)), \
         patch("pecha_api.sheets.sheets_service.get_sheet", new_callable=AsyncMock, return_value=mock_sheets):
         
         result = await fetch_sheets(
@@ -704,6 +773,9 @@ async def test_fetch_sheets_invalid_token():
         assert exc_info.value.detail == ErrorConstants.TOKEN_ERROR_MESSAGE
 
 
+def _mock_users_by_email_(email: str):
+    return {email: Users(email=email, firstname="Test", lastname="User", username="testuser", avatar_url="avatars/test.png")}
+
 def _generate_mock_sheets_response_():
     return [
             TextDTO(
@@ -718,320 +790,12 @@ def _generate_mock_sheets_response_():
                 published_date="2021-01-01",
                 published_by="test_user",
                 categories=[],
-                views=10
+                views=10,
+                summary=None
             )
             for i in range(1,6)
         ]
     
-# Test cases for _generate_sheet_summary_ function
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_success():
-    #Test normal case with content segments#
-    sheet_id = "test_sheet_id"
-    
-    # Mock table of content with sections and segments
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1),
-                    TextSegment(segment_id="content_segment_2", segment_number=2),
-                    TextSegment(segment_id="image_segment_1", segment_number=3)
-                ]
-            )
-        ]
-    )
-    
-    # Mock the first content segment that will be returned
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content="This is the first content segment.",
-        type=SegmentType.CONTENT
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        expected = "This is the first content segment."
-        assert result == expected
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_with_html_tags():
-    #Test HTML tag stripping functionality
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1)
-                ]
-            )
-        ]
-    )
-    
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content="<p>This is <strong>bold text</strong> with <em>italics</em> and <a href='#'>links</a>.</p>",
-        type=SegmentType.CONTENT
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        expected = "This is bold text with italics and links."
-        assert result == expected
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_exceeds_max_words():
-    #Test content that exceeds max_words limit
-    sheet_id = "test_sheet_id"
-    
-    # Create content with more than 30 words (default max_words)
-    long_content = " ".join([f"word{i}" for i in range(1, 41)])  # 40 words
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1)
-                ]
-            )
-        ]
-    )
-    
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content=long_content,
-        type=SegmentType.CONTENT
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        # Should contain exactly 30 words plus "..."
-        words = result.split()
-        assert len(words) == 30  # 30 words (the last word has "..." appended)
-        assert result.endswith("...")
-        assert "word1" in result
-        assert "word30" in result
-        assert "word31" not in result.replace("...", "")
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_custom_max_words():
-    #Test with limited content (less than default 30 words)
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1)
-                ]
-            )
-        ]
-    )
-    
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content="This is a test content with only a few words.",
-        type=SegmentType.CONTENT
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        expected = "This is a test content with only a few words."
-        assert result == expected
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_no_table_of_content():
-    #Test when table of content doesn't exist
-    sheet_id = "test_sheet_id"
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=None):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_empty_sections():
-    #Test when table of content exists but has no sections
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_no_segments():
-    #Test when no segments exist in the table of content
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[]
-            )
-        ]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_no_content_segments():
-    #Test when no content type segments exist (only images, sources, etc.)
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="image_segment_1", segment_number=1),
-                    TextSegment(segment_id="source_segment_1", segment_number=2)
-                ]
-            )
-        ]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=None):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_empty_content():
-    #Test when content segments exist but have empty content
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1),
-                    TextSegment(segment_id="content_segment_2", segment_number=2)
-                ]
-            )
-        ]
-    )
-    
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content="",  # Empty string instead of None
-        type=SegmentType.CONTENT
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_error_handling():
-    #Test error handling - should return empty string when exceptions occurd
-    sheet_id = "test_sheet_id"
-    
-    # Simulate an exception in get_table_of_content_by_sheet_id
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, side_effect=Exception("Database error")):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
-
-
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_segment_not_found():
-    #Test when segment IDs in table of content don't exist in segments dictionaryx1
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="missing_segment", segment_number=1)
-                ]
-            )
-        ]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=None):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == "" 
-
 # Test cases for _strip_html_tags_ function
 def test_strip_html_tags_simple_tags():
     #Test stripping simple HTML tags#
@@ -1184,20 +948,11 @@ async def test_fetch_user_sheets_other_user():
 async def test_generate_sheet_dto_response():
     #Test _generate_sheet_dto_response_#
     mock_sheets = _generate_mock_sheets_response_()
-    mock_user = UserInfoResponse(
-        firstname="Test",
-        lastname="User",
-        username="testuser",
-        email="test@example.com",
-        educations=[],
-        followers=0,
-        following=0,
-        social_profiles=[]
-    )
     
-    with patch("pecha_api.sheets.sheets_service._generate_sheet_summary_", new_callable=AsyncMock, return_value="Test summary"), \
+    with patch("pecha_api.sheets.sheets_service._generate_sheet_summaries_", new_callable=AsyncMock, return_value={sheet.id: "Test summary" for sheet in mock_sheets}) as mock_summaries, \
          patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="2 days ago"), \
-         patch("pecha_api.sheets.sheets_service.fetch_user_by_email", return_value=mock_user):
+         patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=_mock_users_by_email_("test_user")) as mock_fetch_users, \
+         patch("pecha_api.sheets.sheets_service.generate_presigned_access_url", return_value="https://avatar.url"):
         
         result = await _generate_sheet_dto_response_(sheets=mock_sheets, skip=0, limit=10)
         
@@ -1207,50 +962,111 @@ async def test_generate_sheet_dto_response():
         assert result.limit == 10
         assert result.total == 5
         assert all(sheet.summary == "Test summary" for sheet in result.sheets)
+        assert all(sheet.publisher.name == "Test User" for sheet in result.sheets)
+        # One batched lookup for the whole page instead of one per sheet
+        mock_summaries.assert_awaited_once_with(sheet_ids=[sheet.id for sheet in mock_sheets])
+        mock_fetch_users.assert_called_once_with(emails=["test_user"] * 5)
 
 
-# Test cases for _create_publisher_object_ function
-def test_create_publisher_object():
-    #Test _create_publisher_object_#
-    mock_user = UserInfoResponse(
-        firstname="John",
-        lastname="Doe",
-        username="johndoe",
-        email="john@example.com",
-        avatar_url="https://avatar.url",
-        educations=[],
-        followers=0,
-        following=0,
-        social_profiles=[]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.fetch_user_by_email", return_value=mock_user):
-        result = _create_publisher_object_(published_by="john@example.com")
-        
-        assert isinstance(result, Publisher)
-        assert result.name == "John Doe"
-        assert result.username == "johndoe"
-        assert result.email == "john@example.com"
-        assert result.avatar_url == "https://avatar.url"
-
-def test_create_publisher_object_no_name():
-    #Test _create_publisher_object_ when user has no first/last name#
-    mock_user = UserInfoResponse(
-        firstname="",
-        lastname="",
-        username="johndoe",
-        email="john@example.com",
-        avatar_url="https://avatar.url",
-        educations=[],
-        followers=0,
-        following=0,
-        social_profiles=[]
+@pytest.mark.asyncio
+async def test_generate_sheet_dto_response_reads_precomputed_summary():
+    mock_sheet = SimpleNamespace(
+        id=uuid.uuid4(),
+        title="Test Sheet",
+        language="en",
+        group_id="group_id",
+        type=TextType.SHEET,
+        is_published=True,
+        created_date="2021-01-01",
+        updated_date="2021-01-01",
+        published_date="2021-01-01",
+        published_by="test_user",
+        views=10,
+        likes=[],
+        summary="Stored summary",
+        word_count=42,
+        first_image="images/sheet_images/first.png"
     )
-    
-    with patch("pecha_api.sheets.sheets_service.fetch_user_by_email", return_value=mock_user):
-        result = _create_publisher_object_(published_by="john@example.com")
-        
-        assert result.name == "johndoe"  # Falls back to username
+
+    with patch("pecha_api.sheets.sheets_service._generate_sheet_summaries_", new_callable=AsyncMock) as mock_summaries, \
+         patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="2 days ago"), \
+         patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=_mock_users_by_email_("test_user")), \
+         patch("pecha_api.sheets.sheets_service.generate_presigned_access_url", return_value="https://image.url"):
+
+        result = await _generate_sheet_dto_response_(sheets=[mock_sheet], skip=0, limit=10)
+
+    assert result.sheets[0].summary == "Stored summary"
+    assert result.sheets[0].word_count == 42
+    assert result.sheets[0].first_image_url == "https://image.url"
+    mock_summaries.assert_not_awaited()
+
+
+def test_build_sheet_summary_uses_own_blocks_in_order():
+    blocks = [
+        (SegmentType.SOURCE, "source_segment_id"),
+        (SegmentType.IMAGE, "images/first.png"),
+        (SegmentType.CONTENT, "<p>First&nbsp;paragraph</p><p>second</p>"),
+        (SegmentType.IMAGE, "images/second.png"),
+        (SegmentType.CONTENT, "<p>བཀྲ་ཤིས་བདེ་ལེགས།</p>"),
+    ]
+
+    result = build_sheet_summary(blocks=blocks)
+
+    assert result.summary == "First paragraph second"
+    assert result.word_count == 7
+    assert result.first_image == "images/first.png"
+
+
+def test_build_sheet_summary_without_content():
+    result = build_sheet_summary(blocks=[(SegmentType.SOURCE, "source_segment_id")])
+
+    assert result.summary == ""
+    assert result.word_count == 0
+    assert result.first_image is None
+
+
+@pytest.mark.asyncio
+async def test_generate_sheet_dto_response_unknown_publisher_falls_back_to_email():
+    mock_sheets = _generate_mock_sheets_response_()[:1]
+
+    with patch("pecha_api.sheets.sheets_service._generate_sheet_summaries_", new_callable=AsyncMock, return_value={}), \
+         patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="2 days ago"), \
+         patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value={}):
+
+        result = await _generate_sheet_dto_response_(sheets=mock_sheets, skip=0, limit=10)
+
+        assert result.sheets[0].summary == ""
+        assert result.sheets[0].publisher.email == "test_user"
+        assert result.sheets[0].publisher.name == "test_user"
+
+
+@pytest.mark.asyncio
+async def test_generate_sheet_summaries_uses_first_content_segment_of_each_sheet():
+    first_sheet_segments = [str(uuid.uuid4()) for _ in range(3)]
+    second_sheet_segments = [str(uuid.uuid4())]
+    table_of_contents = {
+        "sheet_1": TableOfContent(text_id="sheet_1", type=TableOfContentType.SHEET, sections=[Section(id="s1", section_number=1, segments=[TextSegment(segment_id=segment_id, segment_number=number) for number, segment_id in enumerate(first_sheet_segments, start=1)])]),
+        "sheet_2": TableOfContent(text_id="sheet_2", type=TableOfContentType.SHEET, sections=[Section(id="s2", section_number=1, segments=[TextSegment(segment_id=second_sheet_segments[0], segment_number=1)])]),
+    }
+    content_segments = [
+        SimpleNamespace(id=uuid.UUID(first_sheet_segments[2]), content="<p>Later content</p>"),
+        SimpleNamespace(id=uuid.UUID(first_sheet_segments[1]), content="<p>First content</p>"),
+    ]
+
+    with patch("pecha_api.sheets.sheets_service.get_table_of_contents_by_sheet_ids", new_callable=AsyncMock, return_value=table_of_contents) as mock_tocs, \
+         patch("pecha_api.sheets.sheets_service.get_sheet_contents_by_ids", new_callable=AsyncMock, return_value=content_segments) as mock_contents:
+
+        result = await _generate_sheet_summaries_(sheet_ids=["sheet_1", "sheet_2", "sheet_3"])
+
+    assert result == {"sheet_1": "First content", "sheet_2": ""}
+    mock_tocs.assert_awaited_once_with(sheet_ids=["sheet_1", "sheet_2", "sheet_3"])
+    mock_contents.assert_awaited_once_with(segment_ids=first_sheet_segments + second_sheet_segments, segment_type=SegmentType.CONTENT)
+
+
+@pytest.mark.asyncio
+async def test_generate_sheet_summaries_error_returns_empty():
+    with patch("pecha_api.sheets.sheets_service.get_table_of_contents_by_sheet_ids", new_callable=AsyncMock, side_effect=Exception("Database error")):
+        assert await _generate_sheet_summaries_(sheet_ids=["sheet_1"]) == {}
 
 
 # Test cases for _generate_sheet_section_ function
@@ -1299,7 +1115,7 @@ async def test_generate_sheet_section():
         views=0
     )
     
-    with patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_source_text), \
+    with patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_ids", new_callable=AsyncMock, return_value={"source_text_id": mock_source_text}) as mock_get_texts, \
          patch("pecha_api.sheets.sheets_service.generate_presigned_access_url", return_value="https://presigned-image-url.com"), \
          patch("pecha_api.sheets.sheets_service.get", return_value="test-bucket"):
         
@@ -1705,41 +1521,6 @@ def test_clean_text_whitespace_only():
     assert result == ""
 
 
-# Test cases for _delete_sheet_table_of_content_cache_ function
-@pytest.mark.asyncio
-async def test_delete_sheet_table_of_content_cache_success():
-    #Test _delete_sheet_table_of_content_cache_ with valid table of content#
-    sheet_id = "test_sheet_id"
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.delete_table_of_content_by_sheet_id_cache", new_callable=AsyncMock) as mock_delete_cache:
-        
-        from pecha_api.sheets.sheets_service import _delete_sheet_table_of_content_cache_
-        result = await _delete_sheet_table_of_content_cache_(sheet_id=sheet_id)
-        
-        assert result == mock_table_of_content
-        mock_delete_cache.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_delete_sheet_table_of_content_cache_no_content():
-    #Test _delete_sheet_table_of_content_cache_ with no table of content#
-    sheet_id = "test_sheet_id"
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=None), \
-         patch("pecha_api.sheets.sheets_service.delete_table_of_content_by_sheet_id_cache", new_callable=AsyncMock) as mock_delete_cache:
-        
-        from pecha_api.sheets.sheets_service import _delete_sheet_table_of_content_cache_
-        result = await _delete_sheet_table_of_content_cache_(sheet_id=sheet_id)
-        
-        assert result is None
-        mock_delete_cache.assert_not_called()
-
-
 # Test cases for _delete_sheet_segments_cache_ function
 @pytest.mark.asyncio
 async def test_delete_sheet_segments_cache_with_content():
@@ -1824,42 +1605,6 @@ async def test_delete_sheet_forbidden_access():
         assert exc_info.value.detail == ErrorConstants.FORBIDDEN_ERROR_MESSAGE
 
 
-# Test cases for _get_sheet_first_content_details_by_type_ function
-@pytest.mark.asyncio
-async def test_get_sheet_first_content_details_by_type_success():
-    #Test _get_sheet_first_content_details_by_type_ with valid segment IDs#
-    segment_ids = ["seg_1", "seg_2", "seg_3"]
-    mock_segment = SegmentDTO(
-        id="seg_1",
-        text_id="text_id",
-        content="first content",
-        type=SegmentType.CONTENT
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_segment):
-        from pecha_api.sheets.sheets_service import _get_sheet_first_content_details_by_type_
-        result = await _get_sheet_first_content_details_by_type_(
-            segment_ids=segment_ids, 
-            segment_type=SegmentType.CONTENT
-        )
-        
-        assert result == mock_segment
-
-@pytest.mark.asyncio
-async def test_get_sheet_first_content_details_by_type_no_result():
-    #Test _get_sheet_first_content_details_by_type_ with no matching segments#
-    segment_ids = ["seg_1", "seg_2", "seg_3"]
-    
-    with patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=None):
-        from pecha_api.sheets.sheets_service import _get_sheet_first_content_details_by_type_
-        result = await _get_sheet_first_content_details_by_type_(
-            segment_ids=segment_ids, 
-            segment_type=SegmentType.CONTENT
-        )
-        
-        assert result is None
-
-
 # Test cases for _get_all_segment_ids_in_table_of_content_ edge cases
 def test_get_all_segment_ids_empty_segments():
     #Test _get_all_segment_ids_in_table_of_content_ with sections containing no segments#
@@ -1922,7 +1667,8 @@ async def test_fetch_sheets_with_sort_parameters():
     
     with patch("pecha_api.sheets.sheets_service.get_sheet", new_callable=AsyncMock, return_value=mock_sheets) as mock_get_sheet, \
          patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="1 day ago"), \
-         patch("pecha_api.sheets.sheets_service.fetch_user_by_email", return_value=mock_user):
+         patch("pecha_api.sheets.sheets_service._generate_sheet_summaries_", new_callable=AsyncMock, return_value={}), \
+         patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=_mock_users_by_email_(mock_user.email)):
         
         result = await fetch_sheets(
             token="valid_token",
@@ -2028,11 +1774,13 @@ async def test_generate_sheet_section_source_segment_error():
         )
     }
     
-    with patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, side_effect=HTTPException(status_code=404, detail="Text not found")):
+    with patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_ids", new_callable=AsyncMock, return_value={}):
         
-        with pytest.raises(HTTPException):
+        with pytest.raises(HTTPException) as exc_info:
             await _generate_sheet_section_(segments=segments, segments_dict=segments_dict)
 
+        assert exc_info.value.status_code == 404
+
 
 # Test case for create_new_sheet with invalid token in internal function
 @pytest.mark.asyncio
@@ -2056,6 +1804,30 @@ async def test_create_new_sheet_group_creation_error():
 
 
 # Test case for update_sheet_by_id cache deletion error handling
+@pytest.mark.asyncio
+async def test_update_sheet_missing_source_segment_writes_nothing():
+    sheet_id = str(uuid.uuid4())
+    request = CreateSheetRequest(
+        title="Updated Title",
+        source=[
+            Source(position=1, type=SegmentType.SOURCE, content=str(uuid.uuid4())),
+            Source(position=2, type=SegmentType.CONTENT, content="content")
+        ]
+    )
+
+    with patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
+        patch("pecha_api.texts.segments.segments_utils.check_all_segment_exists", new_callable=AsyncMock, return_value=False), \
+        patch("pecha_api.sheets.sheets_service.update_text_details", new_callable=AsyncMock) as mock_update_text, \
+        patch("pecha_api.sheets.sheets_service.apply_segment_changes", new_callable=AsyncMock) as mock_apply_changes:
+
+        with pytest.raises(HTTPException) as exc_info:
+            await update_sheet_by_id(sheet_id=sheet_id, update_sheet_request=request, token="valid_token")
+
+    assert exc_info.value.status_code == 404
+    mock_update_text.assert_not_awaited()
+    mock_apply_changes.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_update_sheet_cache_deletion_error():
     #Test update_sheet_by_id when cache deletion fails - should propagate the error#
@@ -2169,4 +1941,224 @@ async def test_create_sheet_group_invalid_token():
         with pytest.raises(HTTPException) as exc_info:
             await _create_sheet_group_(token="invalid_token")
         
-        assert exc_info.value.status_code == 401
\ No newline at end of file
+        assert exc_info.value.status_code == 401
+
+def test_generate_sheet_index_success():
+    sheet_details = TextDTO(
+        id="sheet_id",
+        title="sheet_title",
+        language="en",
+        group_id="group_id",
+        type=TextType.SHEET,
+        is_published=True,
+        created_date="2021-01-01",
+        updated_date="2021-01-01",
+        published_date="2021-01-01",
+        published_by="test_user@gmail.com",
+        categories=[],
+        views=10
+    )
+    sheet_request = CreateSheetRequest(
+        title="sheet_title",
+        source=[
+            Source(position=3, type=SegmentType.CONTENT, content="<p>second block</p>"),
+            Source(position=1, type=SegmentType.SOURCE, content="source_segment_id"),
+            Source(position=2, type=SegmentType.CONTENT, content="<p>first <b>block</b></p>"),
+            Source(position=4, type=SegmentType.IMAGE, content="image_key")
+        ],
+        is_published=True
+    )
+    publisher = Users(
+        id=uuid.uuid4(),
+        email="test_user@gmail.com",
+        firstname="firstname",
+        lastname="lastname",
+        username="username",
+        organization="organization",
+        avatar_url="images/profile_images/avatar.jpg"
+    )
+
+    sheet_index = _generate_sheet_index_(
+        sheet_details=sheet_details,
+        sheet_request=sheet_request,
+        publisher=publisher
+    )
+
+    assert sheet_index.id == "sheet_id"
+    assert sheet_index.summary == "first block"
+    assert sheet_index.content == ["first block", "second block"]
+    assert sheet_index.is_published is True
+    assert sheet_index.published_by == "test_user@gmail.com"
+    assert sheet_index.publisher_id == str(publisher.id)
+    assert sheet_index.publisher_name == "firstname lastname"
+    assert sheet_index.publisher_avatar_key == "images/profile_images/avatar.jpg"
+
+
+def test_generate_sheet_index_publisher_without_first_name():
+    sheet_details = TextDTO(
+        id="sheet_id",
+        title="sheet_title",
+        language="en",
+        group_id="group_id",
+        type=TextType.SHEET,
+        is_published=True,
+        created_date="2021-01-01",
+        updated_date="2021-01-01",
+        published_date="2021-01-01",
+        published_by="test_user@gmail.com",
+        categories=[],
+        views=10
+    )
+    sheet_request = CreateSheetRequest(title="sheet_title", source=[], is_published=True)
+    publisher = Users(id=uuid.uuid4(), email="test_user@gmail.com", firstname=None, lastname=None, username="username")
+
+    sheet_index = _generate_sheet_index_(
+        sheet_details=sheet_details,
+        sheet_request=sheet_request,
+        publisher=publisher
+    )
+
+    assert sheet_index.publisher_name == "username"
+
+
+def test_generate_sheet_index_summary_matches_sheet_listing_summary():
+    sheet_details = TextDTO(
+        id="sheet_id",
+        title="sheet_title",
+        language="en",
+        group_id="group_id",
+        type=TextType.SHEET,
+        is_published=True,
+        created_date="2021-01-01",
+        updated_date="2021-01-01",
+        published_date="2021-01-01",
+        published_by="test_user@gmail.com",
+        categories=[],
+        views=10
+    )
+    sources = [
+        Source(position=1, type=SegmentType.CONTENT, content="<p><br></p>"),
+        Source(position=2, type=SegmentType.CONTENT, content="<p>first words</p>")
+    ]
+    sheet_request = CreateSheetRequest(title="sheet_title", source=sources, is_published=True)
+    publisher = Users(id=uuid.uuid4(), email="test_user@gmail.com", firstname="firstname", lastname="lastname", username="username")
+
+    sheet_index = _generate_sheet_index_(
+        sheet_details=sheet_details,
+        sheet_request=sheet_request,
+        publisher=publisher
+    )
+
+    # A block that strips to nothing is skipped, as in the summary stored for the sheet listing
+    assert sheet_index.summary == "first words"
+    assert sheet_index.summary == build_sheet_summary(blocks=[(source.type, source.content) for source in sources]).summary
+
+
+def _sheet_table_of_content_(sheet_id: str, segments):
+    return TableOfContent(
+        text_id=sheet_id,
+        type=TableOfContentType.SHEET,
+        sections=[Section(id="section_id", section_number=1, created_date="2021-01-01", segments=[
+            TextSegment(segment_id=segment_id, segment_number=number) for number, segment_id in segments
+        ])]
+    )
+
+
+@pytest.mark.asyncio
+async def test_diff_sheet_segments_reuses_unchanged_and_edited_blocks():
+    sheet_id = str(uuid.uuid4())
+    kept_id, edited_id, removed_id, image_id, quoted_id = (str(uuid.uuid4()) for _ in range(5))
+    existing_segments = [
+        SimpleNamespace(id=uuid.UUID(kept_id), text_id=sheet_id, type=SegmentType.CONTENT, content="kept"),
+        SimpleNamespace(id=uuid.UUID(edited_id), text_id=sheet_id, type=SegmentType.CONTENT, content="old words"),
+        SimpleNamespace(id=uuid.UUID(removed_id), text_id=sheet_id, type=SegmentType.CONTENT, content="removed"),
+        SimpleNamespace(id=uuid.UUID(image_id), text_id=sheet_id, type=SegmentType.IMAGE, content="images/a.png"),
+        SimpleNamespace(id=uuid.UUID(quoted_id), text_id="other_text", type=SegmentType.SOURCE, content="quoted"),
+    ]
+    table_of_content = _sheet_table_of_content_(sheet_id, [(1, kept_id), (2, edited_id), (3, removed_id), (4, image_id), (5, quoted_id)])
+    request = CreateSheetRequest(title="title", source=[
+        Source(position=1, type=SegmentType.IMAGE, content="images/a.png"),
+        Source(position=2, type=SegmentType.CONTENT, content="new words"),
+        Source(position=3, type=SegmentType.CONTENT, content="kept"),
+        Source(position=4, type=SegmentType.SOURCE, content=quoted_id),
+        Source(position=5, type=SegmentType.CONTENT, content="brand new"),
+    ])
+
+    with patch("pecha_api.sheets.sheets_service.get_segments_by_ids", new_callable=AsyncMock, return_value=existing_segments):
+        changes = await _diff_sheet_segments_(sheet_id=sheet_id, sheet_table_of_content=table_of_content, update_sheet_request=request)
+
+    assert changes.updated == {edited_id: "new words"}
+    assert [segment.content for segment in changes.inserted] == ["brand new"]
+    assert changes.deleted == [removed_id]
+    assert changes.section.id == "section_id"
+    assert changes.section.created_date == "2021-01-01"
+    assert [(segment.segment_number, segment.segment_id) for segment in changes.section.segments] == [
+        (1, image_id), (2, edited_id), (3, kept_id), (4, quoted_id), (5, changes.inserted[0].id)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_sheet_title_only_leaves_segments_and_table_of_content_alone():
+    sheet_id = str(uuid.uuid4())
+    content_id = str(uuid.uuid4())
+    table_of_content = _sheet_table_of_content_(sheet_id, [(1, content_id)])
+    request = CreateSheetRequest(title="renamed", source=[Source(position=1, type=SegmentType.CONTENT, content="same")])
+
+    with patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
+        patch("pecha_api.sheets.sheets_service.delete_text_details_by_id_cache", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=table_of_content), \
+        patch("pecha_api.sheets.sheets_service.get_segments_by_ids", new_callable=AsyncMock, return_value=[
+            SimpleNamespace(id=uuid.UUID(content_id), text_id=sheet_id, type=SegmentType.CONTENT, content="same")
+        ]), \
+        patch("pecha_api.sheets.sheets_service.update_text_details", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.apply_segment_changes", new_callable=AsyncMock) as mock_apply_changes, \
+        patch("pecha_api.sheets.sheets_service.replace_table_of_content", new_callable=AsyncMock) as mock_replace_toc, \
+        patch("pecha_api.sheets.sheets_service.delete_table_of_content_by_sheet_id_cache", new_callable=AsyncMock) as mock_delete_toc_cache, \
+        patch("pecha_api.sheets.sheets_service.delete_segments_details_by_ids_cache", new_callable=AsyncMock) as mock_delete_segments_cache, \
+        patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=MagicMock()), \
+        patch("pecha_api.sheets.sheets_service.update_text_details_cache", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.update_sheet_summary", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service._index_sheet_", new_callable=AsyncMock):
+
+        await update_sheet_by_id(sheet_id=sheet_id, update_sheet_request=request, token="valid_token")
+
+    mock_apply_changes.assert_awaited_once_with(inserted=[], updated={}, deleted=[])
+    mock_replace_toc.assert_not_awaited()
+    mock_delete_toc_cache.assert_not_awaited()
+    mock_delete_segments_cache.assert_not_awaited()
+
+
+
+@pytest.mark.asyncio
+async def test_update_sheet_drops_cached_entries_of_edited_and_removed_segments(_mock_segments_cache_deletion_):
+    sheet_id = str(uuid.uuid4())
+    edited_id = str(uuid.uuid4())
+    kept_id = str(uuid.uuid4())
+    removed_id = str(uuid.uuid4())
+    table_of_content = _sheet_table_of_content_(sheet_id, [(1, edited_id), (2, kept_id), (3, removed_id)])
+    request = CreateSheetRequest(title="title", source=[
+        Source(position=1, type=SegmentType.CONTENT, content="new words"),
+        Source(position=2, type=SegmentType.CONTENT, content="kept"),
+    ])
+
+    with patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
+        patch("pecha_api.sheets.sheets_service.delete_text_details_by_id_cache", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=table_of_content), \
+        patch("pecha_api.sheets.sheets_service.get_segments_by_ids", new_callable=AsyncMock, return_value=[
+            SimpleNamespace(id=uuid.UUID(edited_id), text_id=sheet_id, type=SegmentType.CONTENT, content="old words"),
+            SimpleNamespace(id=uuid.UUID(kept_id), text_id=sheet_id, type=SegmentType.CONTENT, content="kept"),
+            SimpleNamespace(id=uuid.UUID(removed_id), text_id=sheet_id, type=SegmentType.CONTENT, content="gone"),
+        ]), \
+        patch("pecha_api.sheets.sheets_service.update_text_details", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.apply_segment_changes", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.replace_table_of_content", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.delete_table_of_content_by_sheet_id_cache", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.delete_segments_details_by_ids_cache", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=MagicMock()), \
+        patch("pecha_api.sheets.sheets_service.update_text_details_cache", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.update_sheet_summary", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service._index_sheet_", new_callable=AsyncMock):
+
+        await update_sheet_by_id(sheet_id=sheet_id, update_sheet_request=request, token="valid_token")
+
+    _mock_segments_cache_deletion_.assert_awaited_once_with(segment_ids=[edited_id, removed_id])
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, AsyncMock
+from starlette.requests import Request
 
 
 from pecha_api.sheets.sheets_views import (
@@ -15,6 +16,14 @@ from pecha_api.sheets.sheets_response_models import (
 
 from pecha_api.texts.texts_response_models import TableOfContent, TableOfContentType, Section, TextSegment
 
+
+def _request_(headers=None):
+    return Request({
+        "type": "http",
+        "headers": [(name.encode(), value.encode()) for name, value in (headers or {}).items()],
+        "client": ("127.0.0.1", 12345)
+    })
+
 @pytest.mark.asyncio
 async def test_create_sheet_success():
     mock_source = []
@@ -91,6 +100,7 @@ async def test_get_sheet_success():
     with patch("pecha_api.sheets.sheets_views.get_sheet_by_id", new_callable=AsyncMock, return_value=mock_sheet_detail):
         response = await get_sheet(
             sheet_id=sheet_id,
+            request=_request_(),
             skip=skip,
             limit=limit
         )
@@ -135,15 +145,30 @@ async def test_get_sheet_with_custom_pagination():
     with patch("pecha_api.sheets.sheets_views.get_sheet_by_id", new_callable=AsyncMock, return_value=mock_sheet_detail) as mock_service:
         response = await get_sheet(
             sheet_id=sheet_id,
+            request=_request_(),
             skip=skip,
             limit=limit
         )
         
         # Verify the service function was called with correct parameters
-        mock_service.assert_called_once_with(sheet_id=sheet_id, skip=skip, limit=limit)
+        mock_service.assert_called_once_with(sheet_id=sheet_id, skip=skip, limit=limit, viewer="127.0.0.1")
         
         assert response is not None
         assert isinstance(response, SheetDetailDTO)
         assert response.id == sheet_id
         assert response.skip == skip
-        assert response.limit == limit
\ No newline at end of file
+        assert response.limit == limit
+
+
+@pytest.mark.asyncio
+async def test_get_sheet_ignores_forwarded_header_for_viewer():
+    with patch("pecha_api.sheets.sheets_views.get_sheet_by_id", new_callable=AsyncMock) as mock_service:
+        await get_sheet(
+            sheet_id="test_sheet_id",
+            request=_request_(headers={"x-forwarded-for": "203.0.113.7, 10.0.0.1"}),
+            skip=0,
+            limit=10
+        )
+
+        # Forwarded addresses are resolved into request.client by uvicorn for trusted proxies only
+        mock_service.assert_called_once_with(sheet_id="test_sheet_id", skip=0, limit=10, viewer="127.0.0.1")
@@ -2,7 +2,20 @@ import pytest
 from unittest.mock import patch, MagicMock
 from fastapi import UploadFile
 from io import BytesIO
-from pecha_api.uploads.S3_utils import upload_file, upload_bytes, generate_presigned_access_url, delete_file
+from pecha_api.uploads.S3_utils import (
+    upload_file,
+    upload_bytes,
+    generate_presigned_access_url,
+    delete_file,
+    clear_presigned_url_cache
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_presigned_url_cache():
+    clear_presigned_url_cache()
+    yield
+    clear_presigned_url_cache()
 
 
 @pytest.fixture
@@ -54,6 +67,37 @@ def test_generate_presigned_access_url_client_error(mock_s3_client):
         generate_presigned_access_url("test-bucket", "test-key")
 
 
+def test_generate_presigned_access_url_is_cached(mock_s3_client):
+    mock_s3_client.generate_presigned_url.side_effect = ["http://example.com/1", "http://example.com/2"]
+
+    first = generate_presigned_access_url("test-bucket", "test-key")
+    second = generate_presigned_access_url("test-bucket", "test-key")
+    other_key = generate_presigned_access_url("test-bucket", "other-key")
+
+    assert first == second == "http://example.com/1"
+    assert other_key == "http://example.com/2"
+    assert mock_s3_client.generate_presigned_url.call_count == 2
+
+
+def test_generate_presigned_access_url_cache_expires_before_url(mock_s3_client):
+    mock_s3_client.generate_presigned_url.side_effect = ["http://example.com/1", "http://example.com/2"]
+
+    with patch("pecha_api.uploads.S3_utils.time.monotonic", side_effect=[0, 3299, 3301]):
+        first = generate_presigned_access_url("test-bucket", "test-key")
+        still_cached = generate_presigned_access_url("test-bucket", "test-key")
+        refreshed = generate_presigned_access_url("test-bucket", "test-key")
+
+    assert first == still_cached == "http://example.com/1"
+    assert refreshed == "http://example.com/2"
+    assert mock_s3_client.generate_presigned_url.call_args.kwargs["ExpiresIn"] == 3600
+
+
+def test_generate_presigned_access_url_empty_key_not_signed(mock_s3_client):
+    assert generate_presigned_access_url("test-bucket", "") == ""
+    assert generate_presigned_access_url("test-bucket", None) == ""
+    mock_s3_client.generate_presigned_url.assert_not_called()
+
+
 def test_delete_file_success(mock_s3_client):
     mock_s3_client.delete_object.return_value = None
     result = delete_file("test-key")
@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock, patch, MagicMock
 import pytest
 from uuid import uuid4
 
-from pecha_api.texts.texts_repository import fetch_sheets_from_db
+from pecha_api.texts.texts_repository import fetch_sheets_from_db, get_contents_by_text_ids
 from pecha_api.texts.texts_models import Text
 from pecha_api.texts.texts_enums import TextType
 from pecha_api.sheets.sheets_enum import SortBy, SortOrder
@@ -258,4 +258,18 @@ async def test_fetch_sheets_from_db_unpublished_only():
             sort_order=None,
             skip=0,
             limit=10
-        ) 
\ No newline at end of file
+        ) 
+
+
+@pytest.mark.asyncio
+async def test_get_contents_by_text_ids_keeps_first_table_of_content_per_text():
+    """One query returns the tables of content of every requested text, keyed by text id"""
+    first = MagicMock(text_id="sheet_1")
+    duplicate = MagicMock(text_id="sheet_1")
+    second = MagicMock(text_id="sheet_2")
+
+    with patch("pecha_api.texts.texts_repository.TableOfContent.get_table_of_contents_by_text_ids", new_callable=AsyncMock, return_value=[first, duplicate, second]) as mock_find:
+        result = await get_contents_by_text_ids(text_ids=["sheet_1", "sheet_2"])
+
+    assert result == {"sheet_1": first, "sheet_2": second}
+    mock_find.assert_awaited_once_with(text_ids=["sheet_1", "sheet_2"])
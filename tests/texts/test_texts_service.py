@@ -79,6 +79,34 @@ async def test_get_text_by_text_id_or_collection_without_collection_id_success()
         assert isinstance(response, TextDTO)
         assert response.id == text_id
 
+@pytest.mark.asyncio
+async def test_get_text_by_text_id_or_collection_adds_buffered_views_after_caching():
+    text_id = "efb26a06-f373-450b-ba57-e7a8d4dd5b64"
+    text_detail = TextDTO(
+        id=text_id,
+        title="title",
+        language="bo",
+        group_id="group_id_1",
+        type="commentary",
+        is_published=True,
+        created_date="2025-03-21 09:40:34.025024",
+        updated_date="2025-03-21 09:40:34.025035",
+        published_date="2025-03-21 09:40:34.025038",
+        published_by="pecha",
+        categories=[],
+        views=7
+    )
+    with patch("pecha_api.texts.texts_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=text_detail), \
+        patch("pecha_api.texts.texts_service.set_text_by_text_id_or_collection_cache", new_callable=AsyncMock) as mock_set_cache, \
+        patch("pecha_api.texts.texts_service.record_text_view", new_callable=AsyncMock) as mock_record_view, \
+        patch("pecha_api.texts.texts_service.get_pending_views", new_callable=AsyncMock, return_value={text_id: 5}):
+
+        response = await get_text_by_text_id_or_collection(text_id=text_id, viewer="203.0.113.7")
+
+        assert response.views == 12
+        assert mock_set_cache.await_args.kwargs["data"].views == 7
+        mock_record_view.assert_awaited_once_with(text_id=text_id, viewer="203.0.113.7")
+
 @pytest.mark.asyncio
 async def test_get_text_by_collection_id():
     mock_collection = CollectionModel(
@@ -809,6 +837,7 @@ async def test_update_text_details_success():
     with patch("pecha_api.texts.texts_service.TextUtils.validate_text_exists", new_callable=AsyncMock, return_value=True), \
         patch("pecha_api.texts.texts_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock) as mock_get_text_detail_by_id, \
         patch("pecha_api.texts.texts_service.update_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
+        patch("pecha_api.texts.texts_service.refresh_user_recitation_text_details") as mock_refresh, \
         patch("pecha_api.texts.texts_service.update_text_details_cache", new_callable=AsyncMock, return_value=None), \
         patch("pecha_api.texts.texts_service.invalidate_text_cache_on_update", new_callable=AsyncMock, return_value=None):
         mock_get_text_detail_by_id.return_value = mock_text_details
@@ -818,6 +847,7 @@ async def test_update_text_details_success():
         assert response is not None
         assert response.title == "updated_title"
         assert response.is_published == True
+        mock_refresh.assert_called_once_with(text_id="text_id_1", title="updated_title")
 
 @pytest.mark.asyncio
 async def test_update_text_details_invalid_text_id():
@@ -846,9 +876,11 @@ async def test_delete_table_of_content_invalid_text_id():
 @pytest.mark.asyncio
 async def test_delete_text_by_text_id_success():
     with patch("pecha_api.texts.texts_service.TextUtils.validate_text_exists", new_callable=AsyncMock, return_value=True), \
-        patch("pecha_api.texts.texts_service.delete_text_by_id", new_callable=AsyncMock):
+        patch("pecha_api.texts.texts_service.delete_text_by_id", new_callable=AsyncMock), \
+        patch("pecha_api.texts.texts_service.delete_user_recitations_of_text") as mock_delete_recitations:
         response = await delete_text_by_text_id(text_id="text_id_1")
         assert response is None
+        mock_delete_recitations.assert_called_once_with(text_id="text_id_1")
 
 @pytest.mark.asyncio
 async def test_delete_text_by_text_id_invalid_text_id():
@@ -2638,6 +2670,7 @@ async def test_update_text_details_cache_update_fails():
     with patch("pecha_api.texts.texts_service.TextUtils.validate_text_exists", new_callable=AsyncMock, return_value=True), \
         patch("pecha_api.texts.texts_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
         patch("pecha_api.texts.texts_service.update_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
+        patch("pecha_api.texts.texts_service.refresh_user_recitation_text_details"), \
         patch("pecha_api.texts.texts_service.update_text_details_cache", new_callable=AsyncMock, side_effect=Exception("Cache error")), \
         patch("pecha_api.texts.texts_service.invalidate_text_cache_on_update", new_callable=AsyncMock, return_value=None) as mock_invalidate:
         
@@ -2789,6 +2822,7 @@ async def test_update_text_details_with_cache_invalidation():
     with patch("pecha_api.texts.texts_service.TextUtils.validate_text_exists", new_callable=AsyncMock, return_value=True), \
          patch("pecha_api.texts.texts_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=updated_text), \
          patch("pecha_api.texts.texts_service.update_text_details_by_id", new_callable=AsyncMock, return_value=updated_text) as mock_update, \
+         patch("pecha_api.texts.texts_service.refresh_user_recitation_text_details"), \
          patch("pecha_api.texts.texts_service.invalidate_text_cache_on_update", new_callable=AsyncMock):
         
         result = await update_text_details(text_id=text_id, update_text_request=update_request)
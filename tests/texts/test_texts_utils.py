@@ -37,9 +37,29 @@ async def test_get_text_details_by_ids_success():
             views=0
         )
     }
-    with patch("pecha_api.texts.texts_utils.get_texts_by_ids", new_callable=AsyncMock, return_value=text_details_dict):
+    with patch("pecha_api.texts.texts_utils.get_text_details_by_ids_cache", new_callable=AsyncMock, return_value={}), \
+        patch("pecha_api.texts.texts_utils.set_text_details_by_ids_cache", new_callable=AsyncMock) as mock_set_cache, \
+        patch("pecha_api.texts.texts_utils.get_texts_by_ids", new_callable=AsyncMock, return_value=text_details_dict):
         response = await TextUtils.get_text_details_by_ids(text_ids=["efb26a06-f373-450b-ba57-e7a8d4dd5b64"])
         assert response.get("efb26a06-f373-450b-ba57-e7a8d4dd5b64") == text_details_dict.get("efb26a06-f373-450b-ba57-e7a8d4dd5b64")
+        mock_set_cache.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_get_text_details_by_ids_queries_only_cache_misses():
+    cached_text = TextDTO(
+        id="cached_id", title="cached", language="en", group_id="group_id", type="type", is_published=True,
+        created_date="created_date", updated_date="updated_date", published_date="published_date", published_by="published_by"
+    )
+    fetched_text = cached_text.model_copy(update={"id": "missing_id", "title": "fetched"})
+    with patch("pecha_api.texts.texts_utils.get_text_details_by_ids_cache", new_callable=AsyncMock, return_value={"cached_id": cached_text}) as mock_get_cache, \
+        patch("pecha_api.texts.texts_utils.set_text_details_by_ids_cache", new_callable=AsyncMock) as mock_set_cache, \
+        patch("pecha_api.texts.texts_utils.get_texts_by_ids", new_callable=AsyncMock, return_value={"missing_id": fetched_text}) as mock_get_texts:
+        response = await TextUtils.get_text_details_by_ids(text_ids=["cached_id", "missing_id", "cached_id"])
+
+    assert response == {"cached_id": cached_text, "missing_id": fetched_text}
+    assert mock_get_cache.await_args.kwargs["text_ids"] == ["cached_id", "missing_id"]
+    mock_get_texts.assert_awaited_once_with(text_ids=["missing_id"])
+    assert mock_set_cache.await_args.kwargs["data"] == {"missing_id": fetched_text}
 
 @pytest.mark.asyncio
 async def test_get_text_details_by_id_success():
@@ -0,0 +1,239 @@
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from redis.exceptions import ResponseError
+
+from types import SimpleNamespace
+
+from pecha_api.texts.texts_view_counter import (
+    record_text_view,
+    get_pending_views,
+    get_viewer,
+    flush_text_views
+)
+
+
+def _mock_client_(pipeline_results=None):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=pipeline_results or [])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    client.exists = AsyncMock(return_value=0)
+    client.rename = AsyncMock(return_value=True)
+    client.hgetall = AsyncMock(return_value={})
+    client.hsetnx = AsyncMock(return_value=1)
+    client.delete = AsyncMock(return_value=1)
+    return client, pipe
+
+
+@pytest.mark.asyncio
+async def test_record_text_view_buffers_count_and_viewer():
+    client, pipe = _mock_client_()
+    with patch("pecha_api.texts.texts_view_counter.get_client", return_value=client):
+        await record_text_view(text_id="text_id", viewer="203.0.113.7")
+
+    pipe.hincrby.assert_called_once_with("pecha:text_views:pending", "text_id", 1)
+    pipe.pfadd.assert_called_once_with("pecha:text_views:unique:text_id", "203.0.113.7")
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_record_text_view_without_viewer_skips_unique_count():
+    client, pipe = _mock_client_()
+    with patch("pecha_api.texts.texts_view_counter.get_client", return_value=client):
+        await record_text_view(text_id="text_id")
+
+    pipe.hincrby.assert_called_once()
+    pipe.pfadd.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_pending_views_adds_flush_in_progress():
+    client, _ = _mock_client_(pipeline_results=[[b"3", None], [b"2", None]])
+    with patch("pecha_api.texts.texts_view_counter.get_client", return_value=client):
+        response = await get_pending_views(text_ids=["text_1", "text_2"])
+
+    assert response == {"text_1": 5, "text_2": 0}
+
+
+def test_get_viewer_ignores_forwarded_header_sent_by_the_client():
+    request = SimpleNamespace(client=SimpleNamespace(host="198.51.100.4"), headers={"x-forwarded-for": "203.0.113.7"})
+
+    assert get_viewer(request=request) == "198.51.100.4"
+
+
+@pytest.mark.asyncio
+async def test_get_pending_views_when_cache_unavailable():
+    with patch("pecha_api.texts.texts_view_counter.get_client", side_effect=ConnectionError("down")):
+        response = await get_pending_views(text_ids=["text_1"])
+
+    assert response == {}
+
+
+@pytest.mark.asyncio
+async def test_flush_text_views_increments_and_clears_buffer():
+    client, _ = _mock_client_()
+    client.hgetall.return_value = {b"text_1": b"4", b"text_2": b"0", b"_flush_id": b"flush_1"}
+    with patch("pecha_api.texts.texts_view_counter.get_client", return_value=client), \
+        patch("pecha_api.texts.texts_view_counter.increment_text_views", new_callable=AsyncMock) as mock_increment:
+        flushed = await flush_text_views()
+
+    assert flushed == 1
+    client.rename.assert_awaited_once_with("pecha:text_views:pending", "pecha:text_views:flushing")
+    client.hsetnx.assert_awaited_once()
+    mock_increment.assert_awaited_once_with(views={"text_1": 4}, flush_id="flush_1")
+    client.delete.assert_awaited_once_with("pecha:text_views:flushing")
+
+
+@pytest.mark.asyncio
+async def test_flush_text_views_retries_unfinished_flush():
+    client, _ = _mock_client_()
+    client.exists.return_value = 1
+    client.hsetnx.return_value = 0
+    client.hgetall.return_value = {b"text_1": b"2", b"_flush_id": b"flush_1"}
+    with patch("pecha_api.texts.texts_view_counter.get_client", return_value=client), \
+        patch("pecha_api.texts.texts_view_counter.increment_text_views", new_callable=AsyncMock) as mock_increment:
+        await flush_text_views()
+
+    client.rename.assert_not_awaited()
+    # The retry keeps the id of the failed attempt, so texts it already counted are skipped
+    mock_increment.assert_awaited_once_with(views={"text_1": 2}, flush_id="flush_1")
+
+
+@pytest.mark.asyncio
+async def test_flush_text_views_keeps_buffer_when_write_fails():
+    client, _ = _mock_client_()
+    client.hgetall.return_value = {b"text_1": b"2", b"_flush_id": b"flush_1"}
+    with patch("pecha_api.texts.texts_view_counter.get_client", return_value=client), \
+        patch("pecha_api.texts.texts_view_counter.increment_text_views", new_callable=AsyncMock, side_effect=Exception("mongo down")):
+        with pytest.raises(Exception):
+            await flush_text_views()
+
+    client.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_flush_text_views_without_pending_views():
+    client, _ = _mock_client_()
+    client.rename.side_effect = ResponseError("no such key")
+    with patch("pecha_api.texts.texts_view_counter.get_client", return_value=client), \
+        patch("pecha_api.texts.texts_view_counter.increment_text_views", new_callable=AsyncMock) as mock_increment:
+        flushed = await flush_text_views()
+
+    assert flushed == 0
+    mock_increment.assert_not_awaited()
+
+
+class _FakeRedis_:
+    """The hash commands of the view counter, kept in memory"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def pipeline(self, transaction=False):
+        client, commands = self, []
+
+        class _Pipeline_:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return False
+
+            def hincrby(self, key, field, amount):
+                commands.append(lambda: client.hashes.setdefault(key, {}).__setitem__(field, client.hashes.get(key, {}).get(field, 0) + amount))
+
+            def pfadd(self, key, value):
+                commands.append(lambda: None)
+
+            def hmget(self, key, fields):
+                commands.append(lambda: [client.hashes.get(key, {}).get(field) for field in fields])
+
+            async def execute(self):
+                return [command() for command in commands]
+
+        return _Pipeline_()
+
+    async def exists(self, key):
+        return int(key in self.hashes)
+
+    async def rename(self, source, destination):
+        if source not in self.hashes:
+            raise ResponseError("no such key")
+        self.hashes[destination] = self.hashes.pop(source)
+
+    async def hsetnx(self, key, field, value):
+        fields = self.hashes.setdefault(key, {})
+        if field in fields:
+            return 0
+        fields[field] = value
+        return 1
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def delete(self, key):
+        self.hashes.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_shown_views_never_go_down_across_flushes():
+    client = _FakeRedis_()
+    stored_views = {"text_id": 0}
+    text_detail_cache = {}
+
+    async def _increment_(views, flush_id):
+        for text_id, count in views.items():
+            stored_views[text_id] += count
+
+    async def _drop_cached_details_(text_ids, cache_type):
+        for text_id in text_ids:
+            text_detail_cache.pop(text_id, None)
+
+    async def _shown_views_():
+        base = text_detail_cache.setdefault("text_id", stored_views["text_id"])
+        pending = await get_pending_views(text_ids=["text_id"])
+        return base + pending["text_id"]
+
+    with patch("pecha_api.texts.texts_view_counter.get_client", return_value=client), \
+        patch("pecha_api.texts.texts_view_counter.increment_text_views", side_effect=_increment_), \
+        patch("pecha_api.texts.texts_view_counter.delete_text_details_by_ids_cache", side_effect=_drop_cached_details_):
+        shown = []
+        for _ in range(3):
+            await record_text_view(text_id="text_id")
+            shown.append(await _shown_views_())
+            await flush_text_views()
+            shown.append(await _shown_views_())
+
+    assert shown == [1, 1, 2, 2, 3, 3]
+    assert stored_views["text_id"] == 3
+
+
+@pytest.mark.asyncio
+async def test_retried_flush_does_not_count_views_twice():
+    client = _FakeRedis_()
+    stored_views = {"text_1": 0, "text_2": 0}
+    applied_flush_ids = {}
+
+    async def _increment_(views, flush_id):
+        # Mirrors Text.increment_views: a text that already took this flush is skipped
+        for text_id, count in views.items():
+            if applied_flush_ids.get(text_id) != flush_id:
+                stored_views[text_id] += count
+                applied_flush_ids[text_id] = flush_id
+
+    async def _fail_after_write_(text_ids, cache_type):
+        raise ConnectionError("crashed before the buffer was cleared")
+
+    with patch("pecha_api.texts.texts_view_counter.get_client", return_value=client), \
+        patch("pecha_api.texts.texts_view_counter.increment_text_views", side_effect=_increment_):
+        await record_text_view(text_id="text_1")
+        await record_text_view(text_id="text_2")
+        with patch("pecha_api.texts.texts_view_counter.delete_text_details_by_ids_cache", side_effect=_fail_after_write_):
+            with pytest.raises(ConnectionError):
+                await flush_text_views()
+        with patch("pecha_api.texts.texts_view_counter.delete_text_details_by_ids_cache", new_callable=AsyncMock):
+            await flush_text_views()
+
+    assert stored_views == {"text_1": 1, "text_2": 1}
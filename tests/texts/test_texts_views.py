@@ -120,7 +120,8 @@ async def test_get_text_by_text_id(mocker):
         collection_id=None,
         language="bo",
         skip=0,
-        limit=10
+        limit=10,
+        viewer="127.0.0.1"
     )
 
 @pytest.mark.asyncio
@@ -153,7 +154,8 @@ async def test_get_text_by_collection_id(mocker):
         collection_id=test_collection_id,
         language="bo",
         skip=0,
-        limit=10
+        limit=10,
+        viewer="127.0.0.1"
     )
 
 @pytest.mark.asyncio
@@ -8,7 +8,7 @@ from starlette import status
 from pecha_api.auth.auth_enums import RegistrationSource
 from pecha_api.users.users_models import Base, Users, SocialMediaAccount, PasswordReset
 from pecha_api.users.users_repository import save_user, get_user_by_email, get_user_by_username, \
-    get_user_social_account, update_user
+    get_user_social_account, update_user, get_users_by_emails
 
 DATABASE_URL = os.getenv("TEST_DATABASE_URL")
 if not DATABASE_URL:
@@ -88,6 +88,20 @@ def test_get_user_by_email(db):
     assert fetched_user.email == "testuser2@example.com"
 
 
+def test_get_users_by_emails(db):
+    for index in (1, 2):
+        save_user(db, Users(
+            email=f"batchuser{index}@example.com",
+            username=f"batchuser{index}",
+            firstname='firstname',
+            lastname='lastname',
+            password='password',
+            registration_source=RegistrationSource.EMAIL.name
+        ))
+    fetched_users = get_users_by_emails(db, ["batchuser1@example.com", "batchuser2@example.com", "missing@example.com"])
+    assert sorted(user.email for user in fetched_users) == ["batchuser1@example.com", "batchuser2@example.com"]
+
+
 def test_get_user_by_username(db):
     user = Users(
         email="testuser3@example.com",